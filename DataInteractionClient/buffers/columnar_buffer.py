@@ -0,0 +1,266 @@
+import json
+import math
+from array import array
+from typing import Iterable, List, Optional, Union
+
+Column = Union[array, list]
+
+
+def _append(column: Column, value) -> Column:
+    """
+    Добавляет значение в колонку, при необходимости расширяя ее тип:
+    array('q') -> array('d') для дробных чисел, далее -> list для остальных значений.
+    bool — подкласс int, но в array('q') стал бы 1/0, поэтому колонка с bool — list.
+    """
+    if type(value) is not bool:
+        try:
+            column.append(value)
+            return column
+        except (TypeError, OverflowError):
+            pass
+    if isinstance(column, array) and column.typecode == "q" and isinstance(value, float):
+        column = array("d", column)
+    else:
+        column = list(column)
+    column.append(value)
+    return column
+
+
+def _has_bool(values: Union[list, array]) -> bool:
+    """Проверяет, есть ли среди значений списка bool (массивы array их не содержат)."""
+    return not isinstance(values, array) and bool in map(type, values)
+
+
+def _materialize(values: Iterable) -> Column:
+    """Возвращает списки и массивы array как есть, остальные итерируемые объекты — списком."""
+    return values if isinstance(values, (list, array)) else list(values)
+
+
+_POINT = '{{"x":{},"y":{},"q":{}}}'.format
+
+
+def _encode_value(value) -> str:
+    """Кодирует значение в JSON; бесконечности и NaN, недопустимые в JSON, — как null."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return "null"
+    return json.dumps(value)
+
+
+def _encode_column(column: Column) -> Iterable:
+    """
+    Возвращает значения колонки в виде, пригодном для подстановки в JSON:
+    числа из колонок array форматируются как есть, значения колонок list кодируются json.dumps.
+    Бесконечности и NaN заменяются на null, как в кодеках orjson и msgspec.
+    """
+    if isinstance(column, list):
+        return map(_encode_value, column)
+    if column.typecode == "d" and not all(map(math.isfinite, column)):
+        return map(_encode_value, column)
+    return column
+
+
+class ColumnarBuffer:
+    """
+    Класс, представляющий компактный буфер данных тега.
+    Метки времени, значения и качество хранятся в параллельных колонках array
+    с амортизированным ростом вместо списка словарей {"x", "y", "q"}.
+
+    Колонки начинают с типа array('q') (целые 64 бит). При добавлении дробного значения
+    колонка расширяется до array('d'), при добавлении значения другого типа (например, строки
+    с меткой времени или значения bool) — до list. Колонки array поддерживают протокол
+    буфера и могут быть переданы в numpy.frombuffer без копирования.
+
+    Атрибуты
+    ----------
+    xs : Union[array, list]
+        Метки времени.
+    ys : Union[array, list]
+        Значения.
+    qs : Union[array, list]
+        Качество.
+
+    Методы
+    -------
+    append(x: Union[str, int], y: Union[int, float], q: Optional[int] = 0)
+        Добавляет одну точку.
+    extend(xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None)
+        Добавляет несколько точек.
+    concat(other: ColumnarBuffer)
+        Добавляет в конец точки другого буфера.
+    slice(start: int, stop: int)
+        Возвращает новый буфер с точками из указанного диапазона.
+    to_records()
+        Возвращает данные в виде списка словарей {"x", "y", "q"}.
+    to_json()
+        Возвращает данные в виде JSON-массива точек без создания промежуточных словарей.
+    nbytes()
+        Возвращает объем памяти, занимаемый колонками array.
+    """
+
+    __slots__ = ("xs", "ys", "qs")
+
+    def __init__(self) -> None:
+        self.xs: Column = array("q")
+        self.ys: Column = array("q")
+        self.qs: Column = array("q")
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def append(
+        self, x: Union[str, int], y: Union[int, float], q: Optional[int] = 0
+    ) -> None:
+        """
+        Добавляет одну точку в буфер.
+
+        Параметры:
+        ----------
+        x (Union[str, int]): метка времени.
+        y (Union[int, float]): значение.
+        q (Optional[int]): качество. По умолчанию — 0.
+        """
+        try:
+            self.xs.append(x)
+        except (TypeError, OverflowError):
+            self.xs = _append(self.xs, x)
+        if y.__class__ is bool:
+            self.ys = _append(self.ys, y)
+        else:
+            try:
+                self.ys.append(y)
+            except (TypeError, OverflowError):
+                self.ys = _append(self.ys, y)
+        try:
+            self.qs.append(q)
+        except (TypeError, OverflowError):
+            self.qs = _append(self.qs, q)
+
+    def extend(
+        self, xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None
+    ) -> None:
+        """
+        Добавляет несколько точек в буфер.
+
+        Параметры:
+        ----------
+        xs (Iterable): метки времени.
+        ys (Iterable): значения.
+        qs (Optional[Iterable]): качество. По умолчанию — 0 для всех точек.
+
+        Ошибки, исключения:
+        ----------
+        ValueError: Если длины колонок различаются.
+        """
+        xs, ys = _materialize(xs), _materialize(ys)
+        qs = [0] * len(xs) if qs is None else _materialize(qs)
+        if not len(xs) == len(ys) == len(qs):
+            raise ValueError("Длины xs, ys и qs должны совпадать")
+        self.xs = self._extend_fast(self.xs, xs)
+        self.ys = self._extend_values(ys)
+        self.qs = self._extend_fast(self.qs, qs)
+
+    def concat(self, other: "ColumnarBuffer") -> None:
+        """
+        Добавляет в конец буфера точки другого буфера.
+
+        Параметры:
+        ----------
+        other (ColumnarBuffer): буфер, точки которого добавляются.
+        """
+        self.xs = self._extend_fast(self.xs, other.xs)
+        self.ys = self._extend_values(other.ys)
+        self.qs = self._extend_fast(self.qs, other.qs)
+
+    def slice(self, start: int, stop: int) -> "ColumnarBuffer":
+        """
+        Возвращает новый буфер с точками из диапазона [start, stop).
+
+        Параметры:
+        ----------
+        start (int): индекс первой точки.
+        stop (int): индекс, следующий за последней точкой.
+
+        Возвращает:
+        ----------
+        ColumnarBuffer: буфер с копией точек диапазона.
+        """
+        result = ColumnarBuffer()
+        result.xs = self.xs[start:stop]
+        result.ys = self.ys[start:stop]
+        result.qs = self.qs[start:stop]
+        return result
+
+    def _extend_values(self, ys: Union[list, array]) -> Column:
+        """Добавляет значения; колонка array со значениями bool расширяется до list."""
+        if isinstance(self.ys, array) and _has_bool(ys):
+            self.ys = list(self.ys)
+        return self._extend_fast(self.ys, ys)
+
+    @staticmethod
+    def _extend_fast(column: Column, values: Union[list, array]) -> Column:
+        size = len(column)
+        try:
+            column.extend(values)
+            return column
+        except TypeError:
+            # array.extend успевает добавить значения до первого неподходящего.
+            del column[size:]
+            promote = True
+        except OverflowError:
+            del column[size:]
+            promote = False
+        if promote and isinstance(column, array) and column.typecode == "q":
+            promoted = array("d", column)
+            try:
+                promoted.extend(values)
+                return promoted
+            except TypeError:
+                pass
+        column = list(column)
+        column.extend(values)
+        return column
+
+    def to_records(self) -> List[dict]:
+        """
+        Возвращает данные буфера в виде списка словарей.
+
+        Возвращает:
+        ----------
+        List[dict]: точки в формате {"x", "y", "q"}.
+        """
+        return [
+            {"x": x, "y": y, "q": q} for x, y, q in zip(self.xs, self.ys, self.qs)
+        ]
+
+    def to_json(self) -> str:
+        """
+        Кодирует данные буфера в JSON-массив точек напрямую из колонок.
+        Бесконечности и NaN кодируются как null.
+
+        Возвращает:
+        ----------
+        str: JSON-массив точек в формате {"x", "y", "q"}.
+        """
+        points = ",".join(
+            map(
+                _POINT,
+                _encode_column(self.xs),
+                _encode_column(self.ys),
+                _encode_column(self.qs),
+            )
+        )
+        return f"[{points}]"
+
+    def nbytes(self) -> int:
+        """
+        Возвращает объем памяти, занимаемый данными колонок array.
+
+        Возвращает:
+        ----------
+        int: размер данных колонок в байтах.
+        """
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.xs, self.ys, self.qs)
+            if isinstance(column, array)
+        )
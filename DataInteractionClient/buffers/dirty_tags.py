@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class DirtyTags:
+    """
+    Класс, представляющий набор тегов, получивших данные после последнего drain.
+    Тег отмечает себя в наблюдающих наборах (Tag.watch) при первом добавлении точки после
+    drain, поэтому потребителю не нужно перебирать все теги, чтобы найти теги с данными.
+    Тег, данные которого уже отсоединены drain, удаляется из набора при следующем обращении.
+
+    Атрибуты
+    ----------
+    on_mark : Optional[Callable[[], None]]
+        Вызывается в потоке производителя, когда в пустом наборе появляется тег.
+    marked_at : Optional[float]
+        Момент (time.monotonic), когда в пустом наборе появился тег, или None.
+
+    Методы
+    -------
+    mark(tag)
+        Добавляет тег в набор.
+    discard(tag)
+        Удаляет тег из набора.
+    tags()
+        Возвращает теги набора, еще не отсоединенные drain.
+    take()
+        Извлекает все теги набора.
+    """
+
+    __slots__ = ("on_mark", "marked_at", "_tags", "_guard")
+
+    def __init__(self, on_mark: Optional[Callable[[], None]] = None) -> None:
+        self.on_mark = on_mark
+        self.marked_at: Optional[float] = None
+        self._tags: Dict[int, object] = {}
+        self._guard = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._tags)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def mark(self, tag) -> None:
+        """
+        Добавляет тег в набор.
+
+        Параметры:
+        ----------
+        tag (Tag): тег, получивший данные.
+        """
+        with self._guard:
+            first = not self._tags
+            self._tags[id(tag)] = tag
+            if first:
+                self.marked_at = time.monotonic()
+        if first and self.on_mark is not None:
+            self.on_mark()
+
+    def discard(self, tag) -> None:
+        """
+        Удаляет тег из набора, например исключенный из реестра.
+
+        Параметры:
+        ----------
+        tag (Tag): тег.
+        """
+        with self._guard:
+            self._tags.pop(id(tag), None)
+            if not self._tags:
+                self.marked_at = None
+
+    def tags(self) -> List:
+        """
+        Возвращает теги набора в порядке отметки. Теги, данные которых отсоединены drain
+        после отметки, удаляются из набора: новая точка отметит их снова.
+
+        Возвращает:
+        ----------
+        List[Tag]: теги, получившие данные.
+        """
+        with self._guard:
+            for key in [key for key, tag in self._tags.items() if not tag.dirty]:
+                del self._tags[key]
+            if not self._tags:
+                self.marked_at = None
+            return list(self._tags.values())
+
+    def take(self) -> List:
+        """
+        Извлекает все теги набора в порядке отметки. Потребитель должен отсоединить
+        их данные методом drain: до drain тег не отмечается снова.
+
+        Возвращает:
+        ----------
+        List[Tag]: теги, получившие данные.
+        """
+        with self._guard:
+            tags = list(self._tags.values())
+            self._tags.clear()
+            self.marked_at = None
+        return tags
@@ -0,0 +1,120 @@
+import threading
+from typing import Iterable, List, Literal, Tuple
+
+IngestMode = Literal["locked", "sharded"]
+
+
+class IngestShards:
+    """
+    Класс, представляющий набор буферов приема точек по потокам-производителям.
+    Каждый поток добавляет точки в собственную очередь (список) без блокировок: очередь
+    потока создается при первом добавлении и хранится в threading.local, дальше запись
+    в нее не пересекается с другими производителями. Потребитель (drain тега) забирает
+    из каждой очереди столько точек, сколько в ней было на момент сбора, двумя операциями
+    над списком (срез и удаление среза) вместо извлечения по одной точке, поэтому сбор
+    не отдает интерпретатор производителям на каждой точке, а точки, добавленные во время
+    сбора, не теряются и остаются до следующего сбора. Опустевшие
+    очереди завершившихся потоков удаляются при сборе, поэтому набор не растет
+    при смене потоков-производителей. Длительность сбора растет с числом накопленных
+    точек, поэтому при многих производителях и редкой отправке она больше, чем смена
+    буфера тега в режиме "locked".
+
+    Методы
+    -------
+    append(point: dict)
+        Добавляет точку {"x", "y", "q"} в очередь текущего потока.
+    extend(points: Iterable[dict])
+        Добавляет несколько точек в очередь текущего потока.
+    collect()
+        Забирает накопленные точки всех потоков.
+    clear()
+        Удаляет накопленные точки всех потоков.
+    """
+
+    __slots__ = ("_shards", "_local", "_guard")
+
+    def __init__(self) -> None:
+        self._shards: List[Tuple[threading.Thread, list]] = []
+        self._local = threading.local()
+        self._guard = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return any(shard for _, shard in self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for _, shard in self._shards)
+
+    @property
+    def shards(self) -> int:
+        """Количество очередей: потоков, добавлявших точки, без собранных завершившихся."""
+        return len(self._shards)
+
+    def _own(self) -> list:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            # Новый поток с идентификатором завершившегося получает собственную очередь.
+            shard = self._local.shard = []
+            with self._guard:
+                self._shards = self._shards + [(threading.current_thread(), shard)]
+        return shard
+
+    def append(self, point: dict) -> None:
+        """
+        Добавляет точку в очередь текущего потока.
+
+        Параметры:
+        ----------
+        point (dict): точка {"x", "y", "q"}.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._own()
+        shard.append(point)
+
+    def extend(self, points: Iterable[dict]) -> None:
+        """
+        Добавляет несколько точек в очередь текущего потока.
+
+        Параметры:
+        ----------
+        points (Iterable[dict]): точки {"x", "y", "q"}.
+        """
+        self._own().extend(points)
+
+    def collect(self) -> List[dict]:
+        """
+        Забирает точки, накопленные во всех очередях к моменту вызова.
+        Порядок точек одного потока сохраняется, очереди потоков следуют друг за другом.
+        Очереди завершившихся потоков после сбора пусты и удаляются.
+        Вызовы collect не должны выполняться одновременно (тег вызывает его под блокировкой).
+
+        Возвращает:
+        ----------
+        List[dict]: точки {"x", "y", "q"}.
+        """
+        points: List[dict] = []
+        shards = self._shards
+        finished = False
+        for thread, shard in shards:
+            # Завершившийся поток больше не пишет: его очередь забирается целиком.
+            if not thread.is_alive():
+                finished = True
+            # Производитель только добавляет в конец списка: первые count точек
+            # забираются срезом и удаляются, не затрагивая добавленные после подсчета.
+            count = len(shard)
+            if count:
+                points += shard[:count]
+                del shard[:count]
+        if finished:
+            with self._guard:
+                self._shards = [
+                    (thread, shard) for thread, shard in self._shards
+                    if thread.is_alive() or shard
+                ]
+        return points
+
+    def clear(self) -> None:
+        """Удаляет накопленные точки всех очередей."""
+        for _, shard in self._shards:
+            shard.clear()
@@ -0,0 +1,72 @@
+from array import array
+from itertools import islice
+from operator import itemgetter, lt
+from typing import List, Sequence
+
+from buffers.columnar_buffer import Column, ColumnarBuffer
+
+
+def is_increasing(xs: Sequence[int]) -> bool:
+    """Проверяет, что метки времени строго возрастают (упорядочены и без повторов)."""
+    return all(map(lt, xs, islice(xs, 1, None)))
+
+
+def merge_records(records: List[dict]) -> List[dict]:
+    """
+    Упорядочивает точки по метке времени и убирает повторы: из точек с одинаковой
+    меткой остается добавленная последней. Сортировка устойчивая и адаптивная (Timsort):
+    буфер из нескольких упорядоченных участков сливается за время, близкое к линейному.
+
+    Параметры:
+    ----------
+    records (List[dict]): точки {"x", "y", "q"} с целыми метками времени.
+
+    Возвращает:
+    ----------
+    List[dict]: новый список точек.
+    """
+    result: List[dict] = []
+    append = result.append
+    last = None
+    for record in sorted(records, key=itemgetter("x")):
+        x = record["x"]
+        if result and x == last:
+            result[-1] = record
+        else:
+            append(record)
+            last = x
+    return result
+
+
+def _take(column: Column, indices: List[int]) -> Column:
+    values = map(column.__getitem__, indices)
+    if isinstance(column, array):
+        return array(column.typecode, values)
+    return list(values)
+
+
+def merge_columns(buffer: ColumnarBuffer) -> ColumnarBuffer:
+    """
+    Упорядочивает точки колоночного буфера по метке времени и убирает повторы так же,
+    как merge_records. Колонки сохраняют свой тип.
+
+    Параметры:
+    ----------
+    buffer (ColumnarBuffer): буфер с целыми метками времени.
+
+    Возвращает:
+    ----------
+    ColumnarBuffer: новый буфер.
+    """
+    xs = buffer.xs
+    order = sorted(range(len(xs)), key=xs.__getitem__)
+    keep = [
+        i for i, following in zip(order, islice(order, 1, None)) if xs[i] != xs[following]
+    ]
+    if order:
+        keep.append(order[-1])
+    result = ColumnarBuffer()
+    result.xs = _take(xs, keep)
+    result.ys = _take(buffer.ys, keep)
+    result.qs = _take(buffer.qs, keep)
+    return result
@@ -0,0 +1,172 @@
+from datetime import timezone, tzinfo
+from typing import Any, List, Optional, Tuple
+
+from models.compression_config import CompressionConfig
+from serialization.timestamps import to_microseconds
+
+# Точка: (x — исходная метка времени, y, q, t — метка времени в микросекундах).
+Point = Tuple[Any, Any, int, int]
+
+
+def _numeric(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class PointCompressor:
+    """
+    Класс, представляющий потоковое сжатие точек одного тега по настройкам CompressionConfig.
+    Принимает точки в порядке времени и возвращает точки, которые нужно сохранить.
+    Сжатие «вращающейся двери» удерживает последнюю принятую точку до тех пор, пока
+    следующая точка не покажет, нужна ли она; линейная интерполяция между сохраненными
+    точками отклоняется от пропущенных не больше swinging_door. Метод release выдает
+    удерживаемую точку (например, перед отправкой данных), не нарушая этого отклонения.
+    Нечисловые значения сохраняются только при изменении. Не потокобезопасен:
+    вызывается под блокировкой тега.
+
+    Атрибуты
+    ----------
+    config : CompressionConfig
+        Настройки сжатия.
+    naive_timezone : tzinfo
+        Часовой пояс строковых меток времени без смещения. По умолчанию — UTC.
+    points_in : int
+        Количество принятых точек.
+    points_out : int
+        Количество сохраненных точек.
+
+    Методы
+    -------
+    feed(x: Union[str, int], y: Any, q: int)
+        Принимает точку и возвращает точки для сохранения.
+    release()
+        Возвращает удерживаемую точку, если она есть.
+    discard()
+        Отбрасывает удерживаемую точку.
+    """
+
+    __slots__ = (
+        "config", "naive_timezone", "points_in", "points_out", "_archived", "_held",
+        "_reference", "_upper", "_lower",
+    )
+
+    def __init__(self, config: CompressionConfig, naive_timezone: tzinfo = timezone.utc) -> None:
+        self.config = config
+        self.naive_timezone = naive_timezone
+        self.points_in = 0
+        self.points_out = 0
+        self._archived: Optional[Point] = None
+        self._held: Optional[Point] = None
+        self._reference: Optional[Point] = None
+        self._upper = 0.0
+        self._lower = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """Коэффициент сжатия: принятые точки на одну сохраненную. 1.0 — без сжатия."""
+        return self.points_in / self.points_out if self.points_out else 1.0
+
+    @property
+    def holding(self) -> bool:
+        """True, если сжатие удерживает точку, еще не выданную для сохранения."""
+        return self._held is not None
+
+    def _archive(self, out: List[Point], point: Point) -> None:
+        out.append(point)
+        self.points_out += 1
+        self._archived = self._reference = point
+        self._held = None
+
+    def _flush_held(self, out: List[Point]) -> None:
+        if self._held is not None:
+            self._archive(out, self._held)
+
+    def _door(self, out: List[Point], point: Point) -> None:
+        deviation = self.config.swinging_door
+        anchor = self._archived
+        elapsed = point[3] - anchor[3]
+        if elapsed <= 0:
+            self._flush_held(out)
+            self._archive(out, point)
+            return
+        slope = (point[1] - anchor[1]) / elapsed
+        upper = slope + deviation / elapsed
+        lower = slope - deviation / elapsed
+        if self._held is None:
+            self._upper, self._lower = upper, lower
+        elif self._lower <= slope <= self._upper:
+            self._upper, self._lower = min(self._upper, upper), max(self._lower, lower)
+        else:
+            # Дверь закрылась: отрезок до текущей точки отклонился бы от пропущенных точек
+            # больше допустимого, поэтому удерживаемая точка сохраняется и становится опорной.
+            self._flush_held(out)
+            self._door(out, point)
+            return
+        self._held = self._reference = point
+
+    def feed(self, x, y, q: int) -> List[Point]:
+        """
+        Принимает точку и возвращает точки для сохранения (ноль, одну или две:
+        удерживаемую и текущую).
+
+        Параметры:
+        ----------
+        x (Union[str, int]): метка времени.
+        y (Any): значение.
+        q (int): качество.
+
+        Возвращает:
+        ----------
+        List[Point]: точки (x, y, q, t) для сохранения в порядке времени.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если метку времени не удалось разобрать.
+        """
+        self.points_in += 1
+        point = (x, y, q, to_microseconds(x, self.naive_timezone))
+        out: List[Point] = []
+        reference = self._reference
+        if reference is None or q != reference[2]:
+            self._flush_held(out)
+            self._archive(out, point)
+            return out
+        config = self.config
+        elapsed = point[3] - self._archived[3]
+        if config.max_interval is not None and elapsed >= config.max_interval:
+            self._flush_held(out)
+            self._archive(out, point)
+            return out
+        if config.min_interval is not None and point[3] - reference[3] < config.min_interval:
+            return out
+        if not (_numeric(y) and _numeric(reference[1])):
+            if y != reference[1]:
+                self._flush_held(out)
+                self._archive(out, point)
+            return out
+        threshold = max(
+            config.deadband or 0.0, abs(reference[1]) * (config.deadband_percent or 0.0) / 100
+        )
+        if threshold and abs(y - reference[1]) <= threshold:
+            return out
+        if config.swinging_door is None or not _numeric(self._archived[1]):
+            self._archive(out, point)
+        else:
+            self._door(out, point)
+        return out
+
+    def release(self) -> List[Point]:
+        """
+        Возвращает удерживаемую сжатием «вращающейся двери» точку и делает ее опорной.
+
+        Возвращает:
+        ----------
+        List[Point]: удерживаемая точка или пустой список.
+        """
+        out: List[Point] = []
+        self._flush_held(out)
+        return out
+
+    def discard(self) -> None:
+        """Отбрасывает удерживаемую точку; опорной остается последняя сохраненная точка."""
+        self._held = None
+        self._reference = self._archived
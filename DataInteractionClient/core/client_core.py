@@ -0,0 +1,597 @@
+from datetime import timezone, tzinfo
+from typing import Any, Callable, Generator, List, Optional, Tuple, Union
+
+import httpx
+from pydantic import BaseModel, ConfigDict
+
+from buffers.ingest_shards import IngestMode
+from exceptions.chunk_send_exception import ChunkSendException
+from exceptions.circuit_open_exception import CircuitOpenException
+from exceptions.data_source_not_active_exception import \
+    DataSourceNotActiveException
+from exceptions.no_data_to_send_exception import NoDataToSendException
+from exceptions.server_response_error_exception import \
+    ServerResponseErrorException
+from instrumentation.instrumentation import Instrumentation
+from metadata.metadata_cache import MetadataCache, Revalidation
+from models.chunking_config import ChunkingConfig
+from models.circuit_breaker_config import CircuitBreakerConfig
+from models.retry_policy import RetryPolicy
+from models.tag import Tag
+from models.tag_registry import TagRegistry
+from models.transport_config import TransportConfig
+from models.wire_config import WireConfig
+from reading.columnar_result import decode_columnar, load_columnar
+from reading.fan_out import SubQuery, plan_queries, tag_key
+from reading.range_cache import RangeCache, cache_options
+from reading.window_planner import WindowPlanner
+from resilience.circuit_breaker import CircuitBreaker
+from resilience.rate_limiter import RateLimiter
+from resilience.retryer import Retryer
+from serialization.chunking import (make_report, requeue_failed, split_chunks,
+                                   spool_failed)
+from serialization.codecs import get_codec
+from serialization.payload import build_request_kwargs, tag_payload
+from serialization.payload_encoder import PayloadEncoder
+from serialization.timestamps import (TimestampMode, now_microseconds,
+                                      to_microseconds)
+from spool.disk_spool import DiskSpool
+from validation.validated_call import ValidationMode, validated
+
+CONNECT_PATH = "/smt/dataSources/connect"
+SET_DATA_PATH = "/smt/data/set"
+GET_DATA_PATH = "/smt/data/get"
+
+
+class Call:
+    """
+    Класс, представляющий запрос к платформе, который сценарий клиента передает
+    адаптеру ввода-вывода.
+
+    Атрибуты
+    ----------
+    url : str
+        URL-адрес запроса.
+    params : dict
+        Параметры запроса.
+    revalidation : Optional[Revalidation]
+        Условный запрос метаданных или None.
+    columnar : bool
+        True — точки ответа get_data преобразуются в колонки при разборе (load_columnar).
+    """
+
+    __slots__ = ("url", "params", "revalidation", "columnar")
+
+    def __init__(
+        self,
+        url: str,
+        params: dict,
+        revalidation: Optional[Revalidation] = None,
+        columnar: bool = False,
+    ) -> None:
+        self.url = url
+        self.params = params
+        self.revalidation = revalidation
+        self.columnar = columnar
+
+    def args(self) -> tuple:
+        """Аргументы _make_request: (url, params) или (url, params, revalidation)."""
+        if self.revalidation is None:
+            return self.url, self.params
+        return self.url, self.params, self.revalidation
+
+    def kwargs(self) -> dict:
+        """Именованные аргументы _make_request: {} или {"columnar": True}."""
+        return {"columnar": True} if self.columnar else {}
+
+
+class Blocking:
+    """
+    Класс, представляющий блокирующую локальную операцию сценария (например, запись
+    в спул с fsync), которую адаптер ввода-вывода выполняет сам: синхронный клиент —
+    в текущем потоке, асинхронный — в потоке (asyncio.to_thread), не блокируя цикл событий.
+
+    Атрибуты
+    ----------
+    function : Callable[..., Any]
+        Выполняемая функция.
+    args : tuple
+        Аргументы функции.
+    """
+
+    __slots__ = ("function", "args")
+
+    def __init__(self, function: Callable[..., Any], *args: Any) -> None:
+        self.function = function
+        self.args = args
+
+    def __call__(self) -> Any:
+        return self.function(*self.args)
+
+
+# Сценарий операции клиента без ввода-вывода. Сценарий отдает Call и получает разобранный
+# ответ платформы (ошибка запроса выбрасывается в сценарий), отдает список Call
+# и получает список ответов и ошибок по запросам или отдает Blocking и получает результат
+# операции; результат сценария — значение StopIteration.
+Flow = Generator[Union[Call, List[Call], Blocking], Any, Any]
+
+
+class ClientCore(BaseModel):
+    """
+    Класс, представляющий общую часть синхронного и асинхронного клиентов без операций
+    ввода-вывода: настройки, формирование запросов, кодирование параметров, разбор
+    и проверку ответов платформы и сценарии операций connect, set_data и get_data.
+    Клиенты DataInteractionClient и AsyncDataInteractionClient выполняют запросы сценариев
+    своим транспортом (методы _make_request и _make_requests), поэтому логика операций
+    и ее оптимизации у них общие.
+
+    Атрибуты
+    ----------
+    base_url : str
+        Базовый URL платформы.
+    transport : TransportConfig
+        Настройки пула HTTP-соединений: keep-alive, лимиты, HTTP/2, таймауты.
+    wire : WireConfig
+        Настройки кодирования запросов: строка запроса URL или JSON-тело, сжатие тела.
+    chunking : ChunkingConfig
+        Настройки разбиения данных set_data на части и параллельной отправки частей.
+    retry : RetryPolicy
+        Политика повторных запросов: какие ошибки повторять, паузы с разбросом, общее время.
+    circuit_breaker : Optional[CircuitBreakerConfig]
+        Настройки автоматического выключателя. None — выключатель не используется.
+    rate_limiter : Optional[RateLimiter]
+        Ограничитель частоты и адаптивного количества одновременных запросов; один
+        экземпляр можно передать нескольким клиентам. None — без ограничения. По умолчанию — None.
+    spool : Optional[DiskSpool]
+        Спул для данных set_data, не отправленных из-за недоступности платформы.
+        None — данные возвращаются в теги. По умолчанию — None.
+    cache : Optional[RangeCache]
+        Кеш get_data с учетом интервалов времени. None — кеш не используется. По умолчанию — None.
+    metadata_cache : Optional[MetadataCache]
+        Кеш метаданных источников данных для connect. None — кеш не используется.
+        По умолчанию — None.
+    validation : ValidationMode
+        Проверка аргументов методов: "strict", "boundary" или "off". По умолчанию — "boundary".
+    instrumentation : Optional[Instrumentation]
+        Обработчики метрик и трассировки запросов к платформе. None — инструментирование
+        выключено. По умолчанию — None.
+    timestamps : TimestampMode
+        Хранение меток времени тегов, создаваемых connect: "raw" — как переданы,
+        "microseconds" — целые микросекунды, упорядоченные перед отправкой. По умолчанию — "raw".
+    ingest : IngestMode
+        Прием точек тегами, создаваемыми connect: "locked" — под блокировкой,
+        "sharded" — очереди потоков-производителей без блокировок. По умолчанию — "locked".
+    naive_timezone : tzinfo
+        Часовой пояс меток времени ISO 8601 без смещения: в параметрах запросов, тегах,
+        создаваемых connect, и колоночных ответах get_data. По умолчанию — UTC.
+    encoder : Optional[PayloadEncoder]
+        Кодирование больших тел set_data в пуле потоков или процессов. None — тела кодируются
+        в потоке запроса. По умолчанию — None.
+    retryer : Retryer
+        Исполнитель запросов со счетчиками повторов и состоянием выключателя (только чтение).
+
+    Методы
+    -------
+    _connect_flow(data_source_id: str)
+        Сценарий connect.
+    _set_data_flow(tags: List[Tag])
+        Сценарий set_data.
+    _get_data_flow(tag_id, from_time, to_time, max_count, time_step, value, format_param,
+        actual, result_format)
+        Сценарий get_data.
+    _plan_many(tag_ids, from_time, to_time, tags_per_request, window)
+        Разбивает запрос get_data_many на запросы get_data.
+    _window_planner(from_time, to_time, window, max_count)
+        Создает планировщик окон iter_data.
+    _make_tags_list(tags_data: List[dict])
+        Создает реестр тегов из предоставленных данных.
+    _request_kwargs(params: dict, revalidation: Optional[Revalidation] = None)
+        Формирует аргументы httpx для запроса.
+    _offloaded(call: Call)
+        Проверяет, кодируется ли тело запроса в пуле encoder.
+    _parse_response(response: httpx.Response, revalidation: Optional[Revalidation] = None,
+        columnar: bool = False)
+        Проверяет и разбирает ответ платформы.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    base_url: str
+    transport: TransportConfig = TransportConfig()
+    wire: WireConfig = WireConfig()
+    chunking: ChunkingConfig = ChunkingConfig()
+    retry: RetryPolicy = RetryPolicy()
+    circuit_breaker: Optional[CircuitBreakerConfig] = None
+    rate_limiter: Optional[RateLimiter] = None
+    spool: Optional[DiskSpool] = None
+    cache: Optional[RangeCache] = None
+    metadata_cache: Optional[MetadataCache] = None
+    validation: ValidationMode = "boundary"
+    instrumentation: Optional[Instrumentation] = None
+    timestamps: TimestampMode = "raw"
+    ingest: IngestMode = "locked"
+    naive_timezone: tzinfo = timezone.utc
+    encoder: Optional[PayloadEncoder] = None
+    _retryer: Retryer
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._retryer = self._make_retryer()
+        if self.instrumentation is not None:
+            self._retryer.listeners.append(self.instrumentation.retried)
+
+    @property
+    def retryer(self) -> Retryer:
+        """
+        Исполнитель запросов клиента: счетчики попыток и повторов, обработчики повторов
+        (retryer.listeners) и выключатель (retryer.breaker) с обработчиками смены состояния.
+        """
+        return self._retryer
+
+    def _make_retryer(self) -> Retryer:
+        """
+        Создает исполнитель запросов по настройкам retry, circuit_breaker и rate_limiter.
+
+        Возвращает:
+        ----------
+        Retryer: исполнитель запросов.
+        """
+        breaker = None
+        if self.circuit_breaker is not None:
+            breaker = CircuitBreaker(self.circuit_breaker)
+        return Retryer(self.retry, breaker, self.rate_limiter)
+
+    def _should_spool(self, error: BaseException) -> bool:
+        """
+        Проверяет, означает ли ошибка отправки недоступность платформы,
+        при которой данные сохраняются в спул.
+
+        Параметры:
+        ----------
+        error (BaseException): ошибка отправки части.
+
+        Возвращает:
+        ----------
+        bool: True для временных ошибок политики retry и разомкнутого выключателя.
+        """
+        return isinstance(error, CircuitOpenException) or self.retry.is_retryable(error)
+
+    def _connect_flow(self, data_source_id: str) -> Flow:
+        """
+        Сценарий connect: запрос метаданных источника (условный, если задан metadata_cache)
+        и создание реестра тегов.
+
+        Параметры:
+        ----------
+        data_source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        Flow: сценарий, результат которого — TagRegistry.
+
+        Ошибки, исключения:
+        -------
+        DataSourceNotActiveException: Если источник данных неактивен.
+        """
+        url = f"{self.base_url}{CONNECT_PATH}"
+        params = {"id": data_source_id}
+        cache = self.metadata_cache
+        if cache is not None:
+            entry = cache.get(data_source_id)
+            if entry is not None and cache.is_fresh(entry):
+                registry = cache.serve(data_source_id, entry)
+            else:
+                revalidation = Revalidation(None if entry is None else entry.etag)
+                response = yield Call(url, params, revalidation)
+                registry = cache.resolve(data_source_id, entry, response, revalidation)
+            registry.timestamps = self.timestamps
+            registry.ingest = self.ingest
+            registry.naive_timezone = self.naive_timezone
+            return registry
+        response = yield Call(url, params)
+        if not response["attributes"]["smtActive"]:
+            raise DataSourceNotActiveException()
+        return self._make_tags_list(response["tags"])
+
+    def _set_data_flow(self, tags: List[Tag]) -> Flow:
+        """
+        Сценарий set_data: отсоединение данных тегов, разбиение на части, отправка
+        частей одним списком запросов, возврат неотправленных данных в теги или спул.
+
+        Параметры:
+        ----------
+        tags (List[Tag]): теги с данными.
+
+        Возвращает:
+        ----------
+        Flow: сценарий, результат которого — SetDataReport.
+
+        Ошибки, исключения:
+        -------
+        NoDataToSendException: Если отсутствуют данные для запроса.
+        ChunkSendException: Если данные разбиты на несколько частей и часть из них не отправлена.
+            Ошибки отправки единственной части выбрасываются как есть.
+        """
+        url = f"{self.base_url}{SET_DATA_PATH}"
+        snapshots = [(tag, tag.drain()) for tag in tags]
+        snapshots = [(tag, snapshot) for tag, snapshot in snapshots if snapshot]
+        if not snapshots:
+            raise NoDataToSendException()
+        chunks = split_chunks(snapshots, self.chunking)
+        calls = [
+            Call(url, {"data": [tag_payload(tag.id, snapshot, self.wire) for tag, snapshot in chunk]})
+            for chunk in chunks
+        ]
+        try:
+            results = yield calls
+        except BaseException:
+            for tag, snapshot in snapshots:
+                tag.requeue(snapshot)
+            raise
+        errors = [result if isinstance(result, Exception) else None for result in results]
+        spooled = [False] * len(chunks)
+        if self.spool is not None and any(errors):
+            try:
+                spooled = yield Blocking(
+                    spool_failed, chunks, errors, self.spool, self._should_spool
+                )
+            except BaseException:
+                # Прерванная запись в спул: данные возвращаются в теги (повтор вместо потери).
+                requeue_failed(chunks, errors)
+                raise
+        requeue_failed(chunks, [None if s else e for e, s in zip(errors, spooled)])
+        report = make_report(chunks, errors, spooled)
+        if len(chunks) == 1 and errors[0] is not None and not spooled[0]:
+            raise errors[0]
+        if not report.ok:
+            raise ChunkSendException(report)
+        return report
+
+    def _get_data_flow(
+        self,
+        tag_id: Union[str, dict, List[Union[str, dict]]],
+        from_time: Optional[Union[str, int]] = None,
+        to_time: Optional[Union[str, int]] = None,
+        max_count: Optional[int] = None,
+        time_step: Optional[int] = None,
+        value: Optional[Union[type, List[type]]] = None,
+        format_param: Optional[bool] = None,
+        actual: Optional[bool] = None,
+        result_format: str = "records",
+    ) -> Flow:
+        """
+        Сценарий get_data: один запрос или, если задан cache, запросы только недостающих
+        интервалов.
+
+        Возвращает:
+        ----------
+        Flow: сценарий, результат которого — List[dict] или ColumnarResult.
+        """
+        params = {
+            "from": from_time,
+            "to": to_time,
+            "tagId": tag_id,
+            "maxCount": max_count,
+            "timeStep": time_step,
+            "format": format_param,
+            "actual": actual,
+            "value": value,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        # Кеш используется только для записанных точек (actual=True): интерполированные
+        # ответы и точки на сетке time_step зависят от границ запроса, и ответ, собранный
+        # из интервалов, прочитанных с другими границами, отличался бы от ответа платформы.
+        if (
+            self.cache is not None and from_time is not None and actual
+            and max_count is None and time_step is None
+        ):
+            data = yield from self._get_data_cached_flow(
+                params, cache_options(value, format_param, self.naive_timezone)
+            )
+        else:
+            call = Call(
+                f"{self.base_url}{GET_DATA_PATH}", {"params": params},
+                columnar=result_format == "columnar",
+            )
+            data = (yield call)["data"]
+        if result_format == "columnar":
+            return decode_columnar(data, self.naive_timezone)
+        return data
+
+    def _get_data_cached_flow(self, params: dict, options: tuple) -> Flow:
+        """
+        Сценарий чтения через кеш cache: с платформы читаются только интервалы,
+        которых нет в кеше, теги с одинаковыми недостающими интервалами читаются одним запросом.
+
+        Параметры:
+        ----------
+        params (dict): параметры запроса get_data с заданным "from".
+        options (tuple): ключ параметров запроса, влияющих на данные.
+
+        Возвращает:
+        ----------
+        Flow: сценарий, результат которого — List[dict] в формате ответа get_data.
+        """
+        url = f"{self.base_url}{GET_DATA_PATH}"
+        tag_ids = params["tagId"] if isinstance(params["tagId"], list) else [params["tagId"]]
+        tz = self.naive_timezone
+        start = to_microseconds(params["from"], tz)
+        end = to_microseconds(params["to"], tz) if "to" in params else now_microseconds()
+        for gaps, group in self.cache.plan(tag_ids, start, end, options).items():
+            for gap_start, gap_end in gaps:
+                query = {**params, "tagId": group, "from": gap_start, "to": gap_end}
+                response = yield Call(url, {"params": query})
+                received = {
+                    tag_key(entry.get("tagId")): entry.get("data") or []
+                    for entry in response["data"]
+                }
+                for tag_id in group:
+                    self.cache.store(
+                        tag_id, options, gap_start, gap_end, received.get(tag_key(tag_id), []), tz
+                    )
+        return self.cache.assemble(tag_ids, start, end, options)
+
+    def _plan_many(
+        self,
+        tag_ids: List[Union[str, dict]],
+        from_time: Optional[Union[str, int]],
+        to_time: Optional[Union[str, int]],
+        tags_per_request: int,
+        window: Optional[int],
+    ) -> Tuple[List[Union[str, dict]], List[SubQuery]]:
+        """
+        Разбивает запрос get_data_many на запросы get_data по группам тегов и окнам времени.
+
+        Возвращает:
+        ----------
+        Tuple[List[Union[str, dict]], List[SubQuery]]: идентификаторы тегов и запросы.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если задан window, но не задан from_time, или метку времени не удалось разобрать.
+        """
+        if window is not None:
+            if from_time is None:
+                raise ValueError("Для разбиения по окнам времени необходимо задать from_time")
+            tz = self.naive_timezone
+            from_time = to_microseconds(from_time, tz)
+            to_time = now_microseconds() if to_time is None else to_microseconds(to_time, tz)
+        tag_ids = list(tag_ids)
+        return tag_ids, plan_queries(tag_ids, from_time, to_time, tags_per_request, window)
+
+    def _window_planner(
+        self,
+        from_time: Union[str, int],
+        to_time: Optional[Union[str, int]],
+        window: int,
+        max_count: Optional[int],
+    ) -> WindowPlanner:
+        """
+        Создает планировщик окон iter_data.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если метку времени не удалось разобрать.
+        """
+        tz = self.naive_timezone
+        return WindowPlanner(
+            to_microseconds(from_time, tz),
+            now_microseconds() if to_time is None else to_microseconds(to_time, tz),
+            window,
+            max_count,
+        )
+
+    @validated(boundary=False)
+    def _make_tags_list(self, tags_data: List[dict]) -> TagRegistry:
+        """
+        Создает реестр тегов из предоставленных данных.
+
+        Параметры:
+        ----------
+        tags_data : List[dict]
+            Список словарей, каждый из которых представляет данные тега.
+            Каждый словарь должен содержать ключи 'id' и 'attributes'.
+
+        Возвращает:
+        ----------
+        TagRegistry
+            Реестр тегов.
+        """
+        return TagRegistry(
+            tags_data, timestamps=self.timestamps, ingest=self.ingest,
+            naive_timezone=self.naive_timezone,
+        )
+
+    def _request_kwargs(self, params: dict, revalidation: Optional[Revalidation] = None) -> dict:
+        """
+        Формирует аргументы httpx для POST-запроса по настройкам wire
+        и заголовкам условного запроса.
+
+        Параметры:
+        ----------
+        params (dict): параметры запроса.
+        revalidation (Optional[Revalidation]): условный запрос метаданных или None.
+
+        Возвращает:
+        ----------
+        dict: аргументы для httpx.Client.post / httpx.AsyncClient.post.
+        """
+        kwargs = build_request_kwargs(params, self.wire)
+        if revalidation is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **revalidation.headers()}
+        return kwargs
+
+    def _body_wire(self) -> WireConfig:
+        """
+        Возвращает настройки wire с передачей параметров в JSON-теле при любом wire.mode:
+        готовые тела set_data (записи спула) не помещаются в строку запроса URL.
+        """
+        wire = self.wire
+        return wire if wire.mode == "json" else wire.model_copy(update={"mode": "json"})
+
+    def _offloaded(self, call: Call) -> bool:
+        """
+        Проверяет, кодируется ли тело запроса call в пуле encoder (см. PayloadEncoder.wants).
+
+        Параметры:
+        ----------
+        call (Call): запрос.
+
+        Возвращает:
+        ----------
+        bool: True, если тело нужно кодировать в пуле.
+        """
+        encoder = self.encoder
+        return (
+            encoder is not None
+            and call.revalidation is None
+            and encoder.wants(call.params, self.wire)
+        )
+
+    def _parse_response(
+        self,
+        response: httpx.Response,
+        revalidation: Optional[Revalidation] = None,
+        columnar: bool = False,
+    ) -> dict:
+        """
+        Проверяет статус ответа платформы, разбирает тело кодеком wire.codec
+        и проверяет поле error.
+
+        Параметры:
+        ----------
+        response (httpx.Response): ответ платформы.
+        revalidation (Optional[Revalidation]): условный запрос метаданных или None.
+        columnar (bool): True — точки тегов ответа get_data преобразуются в колонки
+            при разборе (load_columnar). По умолчанию — False.
+
+        Возвращает:
+        ----------
+        dict: JSON-ответ платформы, разобранный один раз. Для ответа 304 Not Modified
+            на условный запрос — {"error": {"id": 0}}.
+
+        Ошибки, исключения:
+        ----------
+        httpx.HTTPStatusError: Если в запросе есть ошибка.
+        ServerResponseErrorException: Если в ответе платформы значение error['id] отлично от 0.
+        """
+        if revalidation is not None and revalidation.observe(response):
+            return {"error": {"id": 0}}
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise httpx.HTTPStatusError(
+                f"Ошибка запроса: {e}", request=e.request, response=e.response
+            ) from e
+        codec = get_codec(self.wire.codec)
+        if columnar:
+            payload = load_columnar(response, codec, self.naive_timezone)
+        else:
+            payload = codec.load_response(response)
+        error_response = payload["error"]
+        if error_response["id"] != 0:
+            raise ServerResponseErrorException(
+                message=f"error_id: {error_response['id']} {error_response['message']}",
+                error_id=error_response["id"],
+            )
+        return payload
@@ -1,31 +1,99 @@
-from typing import List, Optional, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterator, List, Literal, Optional, Tuple, Union
 
 import httpx
-from pydantic import BaseModel, validate_call
 
-from exceptions.data_source_not_active_exception import \
-    DataSourceNotActiveException
-from exceptions.no_data_to_send_exception import NoDataToSendException
-from exceptions.server_response_error_exception import \
-    ServerResponseErrorException
+from core.client_core import SET_DATA_PATH, Blocking, Call, ClientCore, Flow
+from models.data_many_result import DataManyResult
+from models.set_data_report import SetDataReport
 from models.tag import Tag
+from models.tag_registry import TagRegistry
+from reading.columnar_result import ColumnarResult
+from reading.fan_out import SubQuery, merge_results
+from reading.window_planner import Window
+from serialization.payload import build_request_kwargs
+from metadata.metadata_cache import Revalidation
+from validation.validated_call import internal_call, validated
 
 
-class DataInteractionClient(BaseModel):
+class DataInteractionClient(ClientCore):
     """
     Класс, представляющий клиент взаимодействия с источниками данных.
+    Сценарии операций, кодирование запросов и разбор ответов общие с асинхронным
+    клиентом (ClientCore); клиент выполняет запросы сценариев через httpx.Client
+    и пул потоков.
 
     Атрибуты
     ----------
     base_url : str
         Базовый URL платформы.
+    transport : TransportConfig
+        Настройки пула HTTP-соединений: keep-alive, лимиты, HTTP/2, таймауты.
+    wire : WireConfig
+        Настройки кодирования запросов: строка запроса URL или JSON-тело, сжатие тела.
+    chunking : ChunkingConfig
+        Настройки разбиения данных set_data на части и параллельной отправки частей.
+    retry : RetryPolicy
+        Политика повторных запросов: какие ошибки повторять, паузы с разбросом, общее время.
+    circuit_breaker : Optional[CircuitBreakerConfig]
+        Настройки автоматического выключателя. None — выключатель не используется.
+    rate_limiter : Optional[RateLimiter]
+        Ограничитель запросов к платформе: «ведро токенов» для частоты попыток и адаптивное
+        (AIMD) ограничение количества одновременных запросов по длительности запросов
+        и ошибкам недоступности. Общий для всех вызовов клиента; один экземпляр можно
+        передать нескольким клиентам. None — без ограничения. По умолчанию — None.
+    spool : Optional[DiskSpool]
+        Спул для данных set_data, не отправленных из-за недоступности платформы.
+        None — данные возвращаются в теги. По умолчанию — None.
+    cache : Optional[RangeCache]
+        Кеш get_data с учетом интервалов времени. Используется для запросов записанных
+        точек (actual=True) с заданным from_time, без max_count и без time_step.
+        None — кеш не используется. По умолчанию — None.
+    metadata_cache : Optional[MetadataCache]
+        Кеш метаданных источников данных для connect: условная проверка, применение
+        изменений состава тегов к прежнему реестру. None — кеш не используется.
+        По умолчанию — None.
+    validation : ValidationMode
+        Проверка аргументов методов pydantic.validate_call: "strict" — всех вызовов,
+        "boundary" — только внешних вызовов публичных методов (connect, set_data, get_data),
+        "off" — без проверки. По умолчанию — "boundary".
+    instrumentation : Optional[Instrumentation]
+        Обработчики метрик и трассировки: события каждой попытки запроса к платформе,
+        повторов и отправок фонового писателя. None — инструментирование выключено
+        и не создает событий. По умолчанию — None.
+    timestamps : TimestampMode
+        Хранение меток времени тегов, создаваемых connect: "raw" — как переданы,
+        "microseconds" — метки приводятся к целым микросекундам при добавлении, а точки,
+        добавленные не по порядку или с повторами, упорядочиваются перед отправкой.
+        По умолчанию — "raw".
+    ingest : IngestMode
+        Прием точек тегами, создаваемыми connect: "locked" — add_data под блокировкой тега,
+        "sharded" — каждый поток-производитель пишет в собственную очередь без блокировок,
+        очереди сливаются при отправке (set_data). По умолчанию — "locked".
+    naive_timezone : tzinfo
+        Часовой пояс меток времени ISO 8601 без смещения: в параметрах запросов, тегах,
+        создаваемых connect, и колоночных ответах get_data. Платформа возвращает метки
+        format_param во времени сервера без смещения, поэтому для такого сервера следует
+        указать его пояс, например ZoneInfo("Europe/Moscow"). По умолчанию — UTC.
+    encoder : Optional[PayloadEncoder]
+        Кодирование больших тел set_data (JSON и сжатие) в пуле потоков или процессов
+        с повторным использованием тела во всех попытках.
+        Тела нескольких частей кодируются параллельно в пуле процессов.
+        None — тела кодируются на месте. По умолчанию — None.
+    retryer : Retryer
+        Исполнитель запросов со счетчиками повторов и состоянием выключателя (только чтение).
 
     Методы
     -------
+    close()
+        Закрывает пул HTTP-соединений клиента.
     connect(data_source_id: str)
-        Подключается к источнику данных с указанным идентификатором.
+        Подключается к источнику данных с указанным идентификатором и возвращает реестр тегов.
     set_data(tags: List[Tag])
         Отправляет данные для указанных тегов.
+    send_set_data_body(params: dict)
+        Отправляет готовое тело запроса set_data, например запись спула, в JSON-теле.
     get_data(tag_id: Union[str, dict, List[Union[str, dict]]],
         from_time: Optional[Union[str, int]] = None,
         to_time: Optional[Union[str, int]] = None,
@@ -33,14 +101,25 @@ class DataInteractionClient(BaseModel):
         time_step: Optional[int] = None,
         value: Optional[Union[type, List[type]]] = None,
         format_param: Optional[bool] = None,
-        actual: Optional[bool] = None,)
+        actual: Optional[bool] = None,
+        result_format: Literal["records", "columnar"] = "records",)
         Получает данные для указанных параметров.
-    _make_tags_list(tags_data: List[dict])
-        Создает экземпляры тегов из предоставленных данных.
-    _make_request(url: str, params: dict)
-        Выполняет HTTP-запрос к указанному URL с указанными параметрами.
-    _async_make_request(url: str, params: dict) -> httpx.Response
-        Асинхронно выполняет HTTP-запрос к указанному URL-адресу с предоставленными параметрами.
+    get_data_many(tag_ids: List[Union[str, dict]], from_time: Optional[Union[str, int]] = None,
+        to_time: Optional[Union[str, int]] = None, tags_per_request: int = 100,
+        window: Optional[int] = None, max_parallel: Optional[int] = None, ...)
+        Параллельно получает данные многих тегов по группам и окнам времени.
+    iter_data(tag_id: Union[str, dict, List[Union[str, dict]]], from_time: Union[str, int],
+        to_time: Optional[Union[str, int]] = None, window: int = 3_600_000_000,
+        max_count: Optional[int] = 10_000, blocks: bool = False, prefetch: bool = False, ...)
+        Постранично читает данные за период окнами по времени с постоянным расходом памяти.
+    _run(flow: Flow)
+        Выполняет сценарий операции клиента.
+    _make_requests(calls: List[Call])
+        Выполняет запросы параллельно, например части данных set_data.
+    _make_request(url: str, params: dict, revalidation: Optional[Revalidation] = None)
+        Выполняет HTTP-запрос к указанному URL с указанными параметрами с повторами.
+    _send_request(url: str, params: dict)
+        Выполняет одну попытку HTTP-запроса.
 
     Ошибки, исключения:
     -------
@@ -53,22 +132,89 @@ class DataInteractionClient(BaseModel):
     DataSourceNotActiveException: Если источник данных неактивен.
     NoDataToSendException: Если отсутствуют данные для запроса.
     ServerResponseErrorException: Если в ответе платформы значение error['id'] отлично от 0.
+    CircuitOpenException: Если выключатель разомкнут и запросы временно не выполняются.
+    RateLimitExceededException: Если ограничитель rate_limiter не выдал разрешение на запрос за max_wait.
     """
 
-    base_url: str
+    _http_client: Optional[httpx.Client]
+    _executor: Optional[ThreadPoolExecutor]
+    _lock: threading.Lock
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._http_client = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "DataInteractionClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает пул HTTP-соединений и пул потоков отправки частей клиента.
+        При следующем запросе пулы будут созданы заново.
+
+        Возвращает
+        -------
+        None
+        """
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Возвращает долгоживущий HTTP-клиент с пулом соединений, создавая его при первом обращении.
+
+        Возвращает:
+        ----------
+        httpx.Client: HTTP-клиент, общий для всех запросов экземпляра.
+        """
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(**self.transport.client_kwargs())
+            return self._http_client
 
-    @validate_call
-    def connect(self, data_source_id: str) -> List[Tag]:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Возвращает пул потоков для параллельной отправки частей set_data,
+        создавая его при первом обращении.
+
+        Возвращает:
+        ----------
+        ThreadPoolExecutor: пул из chunking.max_parallel потоков.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.chunking.max_parallel,
+                    thread_name_prefix="DataInteractionClient",
+                )
+            return self._executor
+
+    @validated()
+    def connect(self, data_source_id: str) -> TagRegistry:
         """
         Подключение к необходимому источнику данных и сбор метаданных источника.
+        Если задан metadata_cache, сохраненные метаданные проверяются условным запросом
+        и при неизменности возвращается прежний реестр тегов; изменения состава тегов
+        применяются к прежнему реестру без потери накопленных данных.
 
         Параметры:
         data_source_id (str): Идентификатор источника данных для подключения.
 
         Возвращает:
         ----------
-        List[Tag]
-            Список тегов.
+        TagRegistry
+            Реестр тегов источника — последовательность тегов, экземпляры Tag
+            создаются при первом обращении.
 
         Ошибки, исключения:
         -------
@@ -80,18 +226,21 @@ class DataInteractionClient(BaseModel):
             Подробнее см. https://www.python-httpx.org/exceptions/
         DataSourceNotActiveException: Если источник данных неактивен.
         """
-        url = f"{self.base_url}/smt/dataSources/connect"
-        params = {"id": data_source_id}
-        response = self._make_request(url, params)
-        if not response["attributes"]["smtActive"]:
-            raise DataSourceNotActiveException()
-        else:
-            return self._make_tags_list(response["tags"])
+        return self._run(self._connect_flow(data_source_id))
 
-    @validate_call
-    def set_data(self, tags: List[Tag]) -> str:
+    @validated()
+    def set_data(self, tags: List[Tag]) -> SetDataReport:
         """
         Отправляет данные тегов на платформу.
+        Данные каждого тега атомарно отсоединяются методом Tag.drain, поэтому точки,
+        добавленные во время запроса, не теряются. При ошибке отправки отсоединенные
+        данные возвращаются в теги перед новыми данными.
+        Если задан chunking.max_points или chunking.max_bytes, данные разбиваются на части,
+        которые отправляются параллельно с ограничением chunking.max_parallel (пул потоков).
+        В теги возвращаются данные только неотправленных частей. Если задан spool,
+        данные частей, не отправленных из-за недоступности платформы (временные ошибки
+        политики retry и разомкнутый выключатель), сохраняются в спул, а не в теги;
+        такие части отмечаются в отчете и не считаются ошибкой.
 
         Параметры:
         -------
@@ -99,8 +248,7 @@ class DataInteractionClient(BaseModel):
 
         Возвращает:
         -------
-        None
-        При успешном добавлении данных ничего не возвращает.
+        SetDataReport: отчет об отправке частей.
 
         Ошибки, исключения:
         -------
@@ -112,19 +260,43 @@ class DataInteractionClient(BaseModel):
             Подробнее см. https://www.python-httpx.org/exceptions/
         NoDataToSendException: Если отсутствуют данные для запроса.
         ServerResponseErrorException: Если в ответе платформы значение error['id'] отлично от 0.
+        ChunkSendException: Если данные разбиты на несколько частей и часть из них не отправлена.
+            Ошибки отправки единственной части выбрасываются как есть.
         """
-        url = f"{self.base_url}/smt/data/set"
-        data = [
-            {"tagId": tag.id, "data": tag.data} for tag in tags if tag.data is not None
-        ]
-        if not data:
-            raise NoDataToSendException()
+        return self._run(self._set_data_flow(tags))
+
+    def send_set_data_body(self, params: dict) -> dict:
+        """
+        Отправляет готовое тело запроса set_data {"data": [{"tagId", "data"}, ...]},
+        например запись спула (DiskSpool.read), в JSON-теле запроса независимо
+        от wire.mode: большие пакеты не помещаются в строку запроса URL.
+        Сжатие тела и кодек — по настройкам wire, большие тела кодируются в пуле encoder.
+
+        Параметры:
+        ----------
+        params (dict): тело запроса set_data.
+
+        Возвращает:
+        ----------
+        dict: JSON-ответ платформы.
+
+        Ошибки, исключения:
+        -------
+        httpx.HTTPStatusError: Если в запросе есть ошибка.
+        httpx.RequestError: Если при выполнении запроса произошла ошибка.
+        ServerResponseErrorException: Если в ответе платформы значение error['id'] отлично от 0.
+        CircuitOpenException: Если выключатель разомкнут.
+        RateLimitExceededException: Если ограничитель не выдал разрешение за max_wait.
+        """
+        wire = self._body_wire()
+        encoder = self.encoder
+        if encoder is not None and encoder.wants(params, wire):
+            prepared = encoder.encode(params, wire)
         else:
-            self._make_request(url, {"data": data})
-            for tag in tags:
-                tag.clear_data()
+            prepared = build_request_kwargs(params, wire)
+        return self._make_request(f"{self.base_url}{SET_DATA_PATH}", params, prepared=prepared)
 
-    @validate_call
+    @validated()
     def get_data(
         self,
         tag_id: Union[str, dict, List[Union[str, dict]]],
@@ -135,9 +307,12 @@ class DataInteractionClient(BaseModel):
         value: Optional[Union[type, List[type]]] = None,
         format_param: Optional[bool] = None,
         actual: Optional[bool] = None,
-    ) -> List[dict]:
+        result_format: Literal["records", "columnar"] = "records",
+    ) -> Union[List[dict], ColumnarResult]:
         """
         Получает исторические данные для указанных параметров.
+        Если задан cache, запрос записанных точек (actual=True) с from_time, без max_count
+        и time_step обслуживается через кеш: с платформы читаются только недостающие интервалы.
 
         Параметры:
         ----------
@@ -161,10 +336,15 @@ class DataInteractionClient(BaseModel):
             платформа. По умолчанию — None.
         actual: Optional[bool]
             Возвращает только реально записанные в базу данных значения, неинтерполированные. По умолчанию — None.
+        result_format: Literal["records", "columnar"]
+            "records" — список элементов {"tagId", "data"} со словарями точек,
+            "columnar" — ColumnarResult: колонки меток времени (микросекунды), значений
+            и качества по тегам без словарей точек. По умолчанию — "records".
 
         Возвращает:
         ----------
-        List[dict]: Массив данных соответствующих запросу.
+        Union[List[dict], ColumnarResult]: Массив данных соответствующих запросу
+            или данные в колоночном виде.
 
         Ошибки, исключения:
         -------
@@ -176,69 +356,319 @@ class DataInteractionClient(BaseModel):
             Подробнее см. https://www.python-httpx.org/exceptions/
         ServerResponseErrorException: Если в ответе платформы значение error['id'] отлично от 0.
         """
-        url = f"{self.base_url}/smt/data/get"
-        params = {
-            "from": from_time,
-            "to": to_time,
-            "tagId": tag_id,
-            "maxCount": max_count,
-            "timeStep": time_step,
-            "format": format_param,
-            "actual": actual,
-            "value": value,
-        }
-        params = {k: v for k, v in params.items() if v is not None}
-        response = self._make_request(url, {"params": params})
-        return response["data"]
-
-    @validate_call
-    def _make_tags_list(self, tags_data: List[dict]) -> List[Tag]:
-        """
-        Создает список тегов из предоставленных данных.
+        return self._run(self._get_data_flow(
+            tag_id, from_time, to_time, max_count, time_step, value, format_param, actual,
+            result_format,
+        ))
+
+    def get_data_many(
+        self,
+        tag_ids: List[Union[str, dict]],
+        from_time: Optional[Union[str, int]] = None,
+        to_time: Optional[Union[str, int]] = None,
+        tags_per_request: int = 100,
+        window: Optional[int] = None,
+        max_count: Optional[int] = None,
+        time_step: Optional[int] = None,
+        value: Optional[Union[type, List[type]]] = None,
+        format_param: Optional[bool] = None,
+        actual: Optional[bool] = None,
+        max_parallel: Optional[int] = None,
+    ) -> DataManyResult:
+        """
+        Получает данные многих тегов: разбивает запрос на запросы get_data по группам
+        из tags_per_request тегов и, если задан window, по окнам времени, выполняет их
+        параллельно в пуле потоков и собирает ответы в ряды тегов в порядке времени.
+        Ошибка запроса не прерывает остальные запросы и относится к тегам его группы.
 
         Параметры:
         ----------
-        tags_data : List[dict]
-            Список словарей, каждый из которых представляет данные тега.
-            Каждый словарь должен содержать ключи 'id' и 'attributes'.
+        tag_ids : List[Union[str, dict]]
+            Идентификаторы тегов.
+        from_time : Optional[Union[str, int]]
+            Начало периода. При заданном window обязательно: микросекунды или строка ISO 8601.
+        to_time : Optional[Union[str, int]]
+            Конец периода. При заданном window по умолчанию — текущее время.
+        tags_per_request : int
+            Максимальное количество тегов в одном запросе. По умолчанию — 100.
+        window : Optional[int]
+            Размер окна по времени, микросекунды. None — без разбиения по времени.
+        max_count, time_step, value, format_param, actual
+            Параметры get_data, передаются в каждый запрос.
+        max_parallel : Optional[int]
+            Максимальное количество одновременных запросов. None — пул потоков клиента
+            из chunking.max_parallel потоков.
 
         Возвращает:
         ----------
-        List[Tag]
-            Список созданных экземпляров тегов.
+        DataManyResult: ряды тегов в порядке tag_ids с ошибками по тегам.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если задан window, но не задан from_time, или метку времени не удалось разобрать.
         """
-        return [Tag(id=item["id"], attributes=item["attributes"]) for item in tags_data]
+        tag_ids, queries = self._plan_many(tag_ids, from_time, to_time, tags_per_request, window)
 
-    @validate_call
-    def _make_request(self, url: str, params: dict) -> httpx.Response:
+        def run(query: SubQuery) -> Union[List[dict], Exception]:
+            try:
+                with internal_call():
+                    return self.get_data(
+                        query.tag_ids, from_time=query.from_time, to_time=query.to_time,
+                        max_count=max_count, time_step=time_step, value=value,
+                        format_param=format_param, actual=actual,
+                    )
+            except Exception as e:
+                return e
+
+        if max_parallel is None:
+            results = list(self._get_executor().map(run, queries))
+        else:
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                results = list(executor.map(run, queries))
+        return merge_results(tag_ids, queries, results)
+
+    def iter_data(
+        self,
+        tag_id: Union[str, dict, List[Union[str, dict]]],
+        from_time: Union[str, int],
+        to_time: Optional[Union[str, int]] = None,
+        window: int = 3_600_000_000,
+        max_count: Optional[int] = 10_000,
+        time_step: Optional[int] = None,
+        value: Optional[Union[type, List[type]]] = None,
+        actual: Optional[bool] = None,
+        blocks: bool = False,
+        prefetch: bool = False,
+    ) -> Iterator[Union[Tuple[Union[str, dict], dict], List[dict]]]:
+        """
+        Постранично читает исторические данные за период окнами по времени и отдает их
+        по мере получения, не накапливая весь период в памяти: в памяти находится ответ
+        не более чем на одно окно (и на одно следующее при prefetch).
+        Размер окна подстраивается под max_count: если ответ по тегу содержит max_count точек,
+        окно уменьшается и чтение продолжается после последней полученной точки,
+        при редких данных окно увеличивается.
+
+        Параметры:
+        ----------
+        tag_id : Union[str, dict, List[Union[str, dict]]]
+            Идентификаторы тегов, для которых запрашиваются данные.
+        from_time : Union[str, int]
+            Начало периода: микросекунды или строка ISO 8601 (без часового пояса — в поясе naive_timezone).
+        to_time : Optional[Union[str, int]]
+            Конец периода включительно. По умолчанию — текущее время.
+        window : int
+            Начальный размер окна, микросекунды. По умолчанию — 1 час.
+        max_count : Optional[int]
+            Максимальное количество точек тега в ответе на одно окно. По умолчанию — 10000.
+        time_step : Optional[int]
+            Шаг времени между соседними возвращаемыми значениями, микросекунды. По умолчанию — None.
+        value : Optional[Union[type, List[type]]]
+            Фильтр по значению. По умолчанию — None.
+        actual : Optional[bool]
+            Возвращать только реально записанные значения. По умолчанию — None.
+        blocks : bool
+            False — отдавать точки по одной парами (идентификатор тега, точка),
+            True — отдавать данные окна целиком списком элементов {"tagId", "data"}.
+            По умолчанию — False.
+        prefetch : bool
+            Запрашивать следующее окно в пуле потоков клиента,
+            пока обрабатывается текущее. По умолчанию — False.
+        Возвращает:
+        ----------
+        Iterator: точки (tag_id, point) или данные окон.
+
+        Ошибки, исключения:
+        -------
+        httpx.HTTPStatusError: Если в запросе есть ошибка.
+        httpx.RequestError: Если при выполнении запроса произошла ошибка.
+        ServerResponseErrorException: Если в ответе платформы значение error['id'] отлично от 0.
+        ValueError: Если метку времени не удалось разобрать.
+        """
+        planner = self._window_planner(from_time, to_time, window, max_count)
+
+        def fetch(bounds: Window) -> List[dict]:
+            with internal_call():
+                return self.get_data(
+                    tag_id, from_time=bounds[0], to_time=bounds[1], max_count=max_count,
+                    time_step=time_step, value=value, actual=actual,
+                )
+
+        ahead: Optional[Tuple[Window, Future]] = None
+        try:
+            while not planner.done():
+                bounds = planner.peek()
+                if ahead is not None and ahead[0] == bounds:
+                    entries = ahead[1].result()
+                else:
+                    if ahead is not None:
+                        ahead[1].cancel()
+                    entries = fetch(bounds)
+                ahead = None
+                entries = planner.accept(bounds, entries)
+                if prefetch and not planner.done():
+                    following = planner.peek()
+                    ahead = (following, self._get_executor().submit(fetch, following))
+                if blocks:
+                    yield entries
+                else:
+                    for entry in entries:
+                        for point in entry.get("data") or []:
+                            yield entry.get("tagId"), point
+        finally:
+            if ahead is not None:
+                ahead[1].cancel()
+
+    def _run(self, flow: Flow) -> Any:
+        """
+        Выполняет сценарий операции клиента (см. ClientCore): запросы сценария
+        выполняются методами _make_request и _make_requests, блокирующие операции
+        (Blocking) — в текущем потоке, ошибки выбрасываются в сценарий.
+
+        Параметры:
+        ----------
+        flow (Flow): сценарий операции.
+
+        Возвращает:
+        ----------
+        Any: результат операции.
+        """
+        result, error = None, None
+        while True:
+            try:
+                step = flow.send(result) if error is None else flow.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            result, error = None, None
+            try:
+                if isinstance(step, Call):
+                    result = self._make_request(*step.args(), **step.kwargs())
+                elif isinstance(step, Blocking):
+                    result = step()
+                else:
+                    result = self._make_requests(step)
+            except BaseException as e:
+                error = e
+
+    def _make_requests(self, calls: List[Call]) -> List[Union[dict, Exception]]:
+        """
+        Выполняет запросы, параллельно в пуле потоков, если запросов несколько.
+        Ошибка запроса не прерывает остальные запросы. Большие тела set_data кодируются
+        в пуле encoder, если он задан.
+
+        Параметры:
+        ----------
+        calls (List[Call]): запросы.
+
+        Возвращает:
+        ----------
+        List[Union[dict, Exception]]: ответы или ошибки запросов в порядке calls.
+        """
+
+        def perform(call: Call) -> Union[dict, Exception]:
+            try:
+                if self._offloaded(call):
+                    prepared = self.encoder.encode(call.params, self.wire)
+                    return self._make_request(
+                        *call.args(), prepared=prepared, **call.kwargs()
+                    )
+                return self._make_request(*call.args(), **call.kwargs())
+            except Exception as e:
+                return e
+
+        if len(calls) == 1:
+            return [perform(calls[0])]
+        executor = self._get_executor()
+        futures = [executor.submit(perform, call) for call in calls]
+        return [future.result() for future in futures]
+
+    @validated(boundary=False)
+    def _make_request(
+        self,
+        url: str,
+        params: dict,
+        revalidation: Optional[Revalidation] = None,
+        prepared: Optional[dict] = None,
+        columnar: bool = False,
+    ) -> dict:
         """
         Выполняет синхронный POST-запрос по указанному URL-адресу с предоставленными параметрами.
+        Запрос повторяется после временных ошибок согласно политике retry
+        и не выполняется, пока выключатель circuit_breaker разомкнут. Каждая попытка
+        ожидает разрешения ограничителя rate_limiter, если он задан.
 
         Параметры:
         ----------
         url (str): URL-адрес для отправки запроса.
         params (dict): параметры, которые нужно отправить вместе с запросом.
+            В зависимости от настроек wire передаются в строке запроса или в JSON-теле.
+        revalidation (Optional[Revalidation]): условный запрос метаданных или None.
+        prepared (Optional[dict]): аргументы httpx с заранее закодированным телом
+            (PayloadEncoder) для всех попыток. None — тело кодируется при каждой попытке.
+        columnar (bool): True — точки ответа get_data преобразуются в колонки при разборе.
+            По умолчанию — False.
 
         Возвращает:
         ----------
-        httpx.Response: ответ от платформы.
+        dict: JSON-ответ платформы, разобранный один раз.
 
         Ошибки, исключения:
         ----------
         httpx.HTTPStatusError: Если в запросе есть ошибка.
         httpx.RequestError: Если при выполнении запроса произошла ошибка.
         ServerResponseErrorException: Если в ответе платформы значение error['id] отлично от 0.
+        CircuitOpenException: Если выключатель разомкнут.
+        RateLimitExceededException: Если ограничитель не выдал разрешение за max_wait.
+        """
+        # Пул создается до первой попытки: создание SSL-контекста занимает десятки
+        # миллисекунд и не должно учитываться в deadline повторов и длительности запроса.
+        self._get_http_client()
+        return self._retryer.call(
+            lambda: self._send_request(url, params, revalidation, prepared, columnar)
+        )
+
+    def _send_request(
+        self,
+        url: str,
+        params: dict,
+        revalidation: Optional[Revalidation] = None,
+        prepared: Optional[dict] = None,
+        columnar: bool = False,
+    ) -> dict:
+        """
+        Выполняет одну попытку POST-запроса к платформе.
+
+        Параметры:
+        ----------
+        url (str): URL-адрес для отправки запроса.
+        params (dict): параметры, которые нужно отправить вместе с запросом.
+        revalidation (Optional[Revalidation]): условный запрос метаданных или None.
+        prepared (Optional[dict]): аргументы httpx с закодированным телом или None.
+        columnar (bool): True — точки ответа get_data преобразуются в колонки при разборе.
+
+        Возвращает:
+        ----------
+        dict: JSON-ответ платформы, разобранный один раз. Для ответа 304 Not Modified
+            на условный запрос — {"error": {"id": 0}}.
+
+        Ошибки, исключения:
+        ----------
+        httpx.HTTPStatusError: Если в запросе есть ошибка.
+        httpx.RequestError: Если при выполнении запроса произошла ошибка. Исключение httpx
+            (ConnectError, ReadTimeout, PoolTimeout и др.) передается без изменений.
+        ServerResponseErrorException: Если в ответе платформы значение error['id] отлично от 0.
         """
+        kwargs = self._request_kwargs(params, revalidation) if prepared is None else prepared
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            response = self._get_http_client().post(url, **kwargs)
+            return self._parse_response(response, revalidation, columnar)
+        event = instrumentation.start(url, kwargs)
+        response = None
         try:
-            response = httpx.post(url, params=params, timeout=5)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise httpx.HTTPStatusError(f"Ошибка запроса: {e}") from e
-        except httpx.RequestError as e:
-            raise httpx.RequestError(f"Ошибка при выполнении запроса: {e}")
-        error_response = response.json()["error"]
-        if error_response["id"] != 0:
-            raise ServerResponseErrorException(
-                message=f"error_id: {error_response['id']} {error_response['message']}"
-            )
-        return response.json()
+            response = self._get_http_client().post(url, **kwargs)
+            payload = self._parse_response(response, revalidation, columnar)
+        except Exception as e:
+            instrumentation.finish(event, params, response, error=e)
+            raise
+        instrumentation.finish(event, params, response, payload)
+        return payload
@@ -0,0 +1,23 @@
+from models.set_data_report import SetDataReport
+
+
+class ChunkSendException(Exception):
+    """
+    Класс исключения, который вызывается, когда часть данных set_data не удалось отправить.
+    Данные неотправленных частей возвращены в теги.
+
+    Атрибуты
+    ----------
+    report : SetDataReport
+        Отчет об отправке частей.
+    message : str
+        Сообщение об ошибке.
+    """
+
+    def __init__(self, report: SetDataReport):
+        self.report = report
+        self.message = (
+            f"Не удалось отправить {len(report.failed_chunks)} из {len(report.chunks)} "
+            f"частей данных ({report.points_failed} точек)."
+        )
+        super().__init__(self.message)
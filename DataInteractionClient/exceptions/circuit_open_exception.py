@@ -0,0 +1,20 @@
+from typing import Optional
+
+
+class CircuitOpenException(Exception):
+    """
+    Класс исключения, который вызывается, когда выключатель разомкнут
+    и запрос к платформе не выполняется.
+
+    Атрибуты
+    ----------
+    message : str
+        Сообщение об ошибке, по умолчанию "Платформа недоступна, запросы временно не выполняются."
+    """
+
+    def __init__(
+        self,
+        message: Optional[str] = "Платформа недоступна, запросы временно не выполняются.",
+    ):
+        self.message = message
+        super().__init__(self.message)
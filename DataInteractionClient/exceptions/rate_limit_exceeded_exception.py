@@ -0,0 +1,20 @@
+from typing import Optional
+
+
+class RateLimitExceededException(Exception):
+    """
+    Класс исключения, который вызывается, когда ограничитель запросов не выдал разрешение
+    на запрос к платформе за время max_wait.
+
+    Атрибуты
+    ----------
+    message : str
+        Сообщение об ошибке, по умолчанию "Превышено время ожидания разрешения на запрос к платформе."
+    """
+
+    def __init__(
+        self,
+        message: Optional[str] = "Превышено время ожидания разрешения на запрос к платформе.",
+    ):
+        self.message = message
+        super().__init__(self.message)
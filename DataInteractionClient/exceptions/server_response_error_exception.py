@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class ServerResponseErrorException(Exception):
     """
     Класс исключения, который вызывается при получении от сервера id ошибки отличном от "0".
@@ -6,9 +9,12 @@ class ServerResponseErrorException(Exception):
     ----------
     message : str
         Сообщение об ошибке.
+    error_id : Optional[int]
+        Значение error['id'] из ответа платформы.
 
     """
 
-    def __init__(self, message: str):
+    def __init__(self, message: str, error_id: Optional[int] = None):
         self.message = f"Сервер вернул внутреннюю ошибку: {message}"
+        self.error_id = error_id
         super().__init__(self.message)
@@ -0,0 +1,261 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from instrumentation.instrumentation import InstrumentationListener, RequestEvent
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+POINTS_BUCKETS = (1, 10, 100, 1000, 10_000, 100_000, 1_000_000)
+
+Labels = Tuple[str, ...]
+
+
+class Counter:
+    """
+    Класс, представляющий потокобезопасный счетчик с метками.
+
+    Атрибуты
+    ----------
+    name : str
+        Имя метрики.
+    help : str
+        Описание метрики.
+    labels : Tuple[str, ...]
+        Имена меток.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values: Labels = (), amount: float = 1) -> None:
+        """Увеличивает значение счетчика для значений меток label_values."""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, label_values: Labels = ()) -> float:
+        """Возвращает значение счетчика для значений меток label_values."""
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def samples(self) -> List[Tuple[Labels, float]]:
+        """Возвращает значения счетчика: [(значения меток, значение)]."""
+        with self._lock:
+            return sorted(self._values.items())
+
+
+class Gauge(Counter):
+    """
+    Класс, представляющий потокобезопасный показатель с метками: текущее значение,
+    которое может как расти, так и уменьшаться.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, label_values: Labels = ()) -> None:
+        """Устанавливает значение показателя для значений меток label_values."""
+        with self._lock:
+            self._values[label_values] = value
+
+
+class HistogramSample:
+    """
+    Класс, представляющий значения гистограммы для одного набора значений меток.
+
+    Атрибуты
+    ----------
+    buckets : List[int]
+        Количество наблюдений в каждом интервале (не накопленное), последний — +Inf.
+    sum : float
+        Сумма наблюдений.
+    count : int
+        Количество наблюдений.
+    """
+
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """
+    Класс, представляющий потокобезопасную гистограмму с фиксированными границами интервалов.
+
+    Атрибуты
+    ----------
+    name : str
+        Имя метрики.
+    help : str
+        Описание метрики.
+    bounds : Tuple[float, ...]
+        Верхние границы интервалов по возрастанию, без +Inf.
+    labels : Tuple[str, ...]
+        Имена меток.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, bounds: Sequence[float], labels: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.bounds = tuple(bounds)
+        self.labels = tuple(labels)
+        self._samples: Dict[Labels, HistogramSample] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, label_values: Labels = ()) -> None:
+        """Добавляет наблюдение для значений меток label_values."""
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            sample = self._samples.get(label_values)
+            if sample is None:
+                sample = self._samples[label_values] = HistogramSample(len(self.bounds) + 1)
+            sample.buckets[index] += 1
+            sample.sum += value
+            sample.count += 1
+
+    def count(self, label_values: Labels = ()) -> int:
+        """Возвращает количество наблюдений для значений меток label_values."""
+        with self._lock:
+            sample = self._samples.get(label_values)
+            return 0 if sample is None else sample.count
+
+    def quantile(self, q: float, label_values: Labels = ()) -> Optional[float]:
+        """
+        Возвращает оценку квантиля q (0..1) по интервалам: верхнюю границу интервала,
+        в который попадает квантиль, или None, если наблюдений нет.
+        """
+        with self._lock:
+            sample = self._samples.get(label_values)
+            if sample is None or not sample.count:
+                return None
+            rank = q * sample.count
+            seen = 0
+            for bound, observed in zip(self.bounds + (float("inf"),), sample.buckets):
+                seen += observed
+                if seen >= rank:
+                    return bound
+            return float("inf")
+
+    def samples(self) -> List[Tuple[Labels, HistogramSample]]:
+        """Возвращает копии значений гистограммы: [(значения меток, значения)]."""
+        with self._lock:
+            result = []
+            for label_values, sample in sorted(self._samples.items()):
+                copy = HistogramSample(len(sample.buckets))
+                copy.buckets = list(sample.buckets)
+                copy.sum = sample.sum
+                copy.count = sample.count
+                result.append((label_values, copy))
+            return result
+
+
+class ClientMetrics(InstrumentationListener):
+    """
+    Класс, представляющий готовый набор метрик клиента, заполняемый событиями
+    инструментирования. Подключается как обработчик Instrumentation; значения
+    выводятся в формате Prometheus функцией render_prometheus.
+
+    Атрибуты
+    ----------
+    requests : Counter
+        Попытки запросов по операции и результату ("ok" или "error").
+    errors : Counter
+        Ошибки попыток по операции и типу ошибки.
+    latency : Histogram
+        Длительность попыток по операции, секунды.
+    request_bytes : Histogram
+        Размер запросов по операции, байты.
+    response_bytes : Histogram
+        Размер ответов по операции, байты.
+    points : Histogram
+        Количество отправленных (set_data) и полученных (get_data) точек на запрос.
+    retries : Counter
+        Повторы запросов по типу ошибки.
+    batches : Counter
+        Пакеты фоновых писателей по результату ("ok" или "error").
+    buffer_depth : Gauge
+        Количество неотправленных точек фонового писателя после последней отправки.
+    queue_age : Histogram
+        Время от добавления первой точки пакета писателя до его отправки, секунды.
+    """
+
+    def __init__(self, namespace: str = "data_interaction_client") -> None:
+        prefix = f"{namespace}_" if namespace else ""
+        self.requests = Counter(
+            f"{prefix}requests_total", "Попытки запросов к платформе.", ("operation", "outcome")
+        )
+        self.errors = Counter(
+            f"{prefix}errors_total", "Ошибки попыток запросов к платформе.", ("operation", "error")
+        )
+        self.latency = Histogram(
+            f"{prefix}request_duration_seconds", "Длительность попыток запросов, секунды.",
+            LATENCY_BUCKETS, ("operation",),
+        )
+        self.request_bytes = Histogram(
+            f"{prefix}request_bytes", "Размер запросов, байты.", BYTES_BUCKETS, ("operation",)
+        )
+        self.response_bytes = Histogram(
+            f"{prefix}response_bytes", "Размер ответов, байты.", BYTES_BUCKETS, ("operation",)
+        )
+        self.points = Histogram(
+            f"{prefix}points_per_request", "Количество точек в запросе или ответе.",
+            POINTS_BUCKETS, ("operation",),
+        )
+        self.retries = Counter(f"{prefix}retries_total", "Повторы запросов.", ("error",))
+        self.batches = Counter(
+            f"{prefix}writer_batches_total", "Пакеты фоновых писателей.", ("outcome",)
+        )
+        self.buffer_depth = Gauge(
+            f"{prefix}writer_pending_points", "Неотправленные точки фонового писателя."
+        )
+        self.queue_age = Histogram(
+            f"{prefix}writer_queue_age_seconds",
+            "Время от добавления первой точки пакета до отправки, секунды.",
+            LATENCY_BUCKETS,
+        )
+
+    @property
+    def metrics(self) -> list:
+        """Все метрики набора в порядке вывода."""
+        return [
+            self.requests, self.errors, self.latency, self.request_bytes, self.response_bytes,
+            self.points, self.retries, self.batches, self.buffer_depth, self.queue_age,
+        ]
+
+    def request_finished(self, event: RequestEvent) -> None:
+        operation = (event.operation,)
+        if event.error is None:
+            self.requests.inc((event.operation, "ok"))
+        else:
+            self.requests.inc((event.operation, "error"))
+            self.errors.inc((event.operation, type(event.error).__name__))
+        self.latency.observe(event.duration, operation)
+        if event.request_bytes is not None:
+            self.request_bytes.observe(event.request_bytes, operation)
+        if event.response_bytes is not None:
+            self.response_bytes.observe(event.response_bytes, operation)
+        if event.points is not None:
+            self.points.observe(event.points, operation)
+
+    def retried(self, attempt: int, error: BaseException, delay: float) -> None:
+        self.retries.inc((type(error).__name__,))
+
+    def batch_sent(
+        self, points: int, pending_points: int, age: Optional[float], error: Optional[BaseException]
+    ) -> None:
+        self.batches.inc(("ok" if error is None else "error",))
+        self.buffer_depth.set(pending_points)
+        if age is not None:
+            self.queue_age.observe(age)
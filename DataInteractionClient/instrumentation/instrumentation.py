@@ -0,0 +1,210 @@
+import time
+from typing import Any, Iterable, List, Optional
+
+import httpx
+
+# Операции платформы по окончанию пути URL.
+OPERATIONS = (
+    ("/smt/dataSources/connect", "connect"),
+    ("/smt/data/set", "set_data"),
+    ("/smt/data/get", "get_data"),
+)
+
+
+def operation_for(url: str) -> str:
+    """Возвращает имя операции платформы по URL запроса или "other"."""
+    for path, operation in OPERATIONS:
+        if url.endswith(path):
+            return operation
+    return "other"
+
+
+class RequestEvent:
+    """
+    Класс, представляющий одну попытку запроса к платформе для обработчиков инструментирования.
+
+    Атрибуты
+    ----------
+    operation : str
+        Операция: "connect", "set_data", "get_data" или "other".
+    url : str
+        URL-адрес запроса.
+    started : float
+        Момент начала попытки, time.perf_counter().
+    duration : Optional[float]
+        Длительность попытки, секунды. None до завершения.
+    request_bytes : Optional[int]
+        Размер тела запроса (или строки запроса URL), байты.
+    response_bytes : Optional[int]
+        Размер тела ответа, байты. None, если ответ не получен.
+    points : Optional[int]
+        Количество точек: отправленных (set_data) или полученных (get_data).
+    status_code : Optional[int]
+        HTTP-статус ответа. None, если ответ не получен.
+    error : Optional[BaseException]
+        Ошибка попытки или None.
+    span : Any
+        Место для данных обработчиков трассировки (например, span OpenTelemetry).
+    """
+
+    __slots__ = (
+        "operation", "url", "started", "duration", "request_bytes", "response_bytes",
+        "points", "status_code", "error", "span",
+    )
+
+    def __init__(self, operation: str, url: str, request_bytes: Optional[int] = None) -> None:
+        self.operation = operation
+        self.url = url
+        self.started = 0.0
+        self.duration: Optional[float] = None
+        self.request_bytes = request_bytes
+        self.response_bytes: Optional[int] = None
+        self.points: Optional[int] = None
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.span: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """True, если попытка завершилась без ошибки."""
+        return self.error is None
+
+
+class InstrumentationListener:
+    """
+    Класс, представляющий обработчик событий инструментирования. Методы по умолчанию
+    ничего не делают; наследники переопределяют нужные.
+
+    Методы
+    -------
+    request_started(event: RequestEvent)
+        Вызывается перед попыткой запроса.
+    request_finished(event: RequestEvent)
+        Вызывается после попытки запроса, успешной или нет.
+    retried(attempt: int, error: BaseException, delay: float)
+        Вызывается перед повтором запроса.
+    batch_sent(points: int, pending_points: int, age: Optional[float], error: Optional[BaseException])
+        Вызывается фоновым писателем после отправки пакета.
+    """
+
+    def request_started(self, event: RequestEvent) -> None:
+        pass
+
+    def request_finished(self, event: RequestEvent) -> None:
+        pass
+
+    def retried(self, attempt: int, error: BaseException, delay: float) -> None:
+        pass
+
+    def batch_sent(
+        self, points: int, pending_points: int, age: Optional[float], error: Optional[BaseException]
+    ) -> None:
+        pass
+
+
+class Instrumentation:
+    """
+    Класс, представляющий точку подключения метрик и трассировки клиента.
+    Клиент с instrumentation=None не создает событий и не измеряет размеры запросов,
+    поэтому выключенное инструментирование стоит одну проверку на запрос.
+    Обработчики вызываются в потоке запроса; исключения обработчиков не перехватываются.
+
+    Атрибуты
+    ----------
+    listeners : List[InstrumentationListener]
+        Обработчики событий, например ClientMetrics и OpenTelemetryTracer.
+
+    Методы
+    -------
+    start(url: str, kwargs: dict)
+        Создает событие попытки запроса и уведомляет обработчики.
+    finish(event: RequestEvent, params: dict, response: Optional[httpx.Response] = None,
+        payload: Optional[dict] = None, error: Optional[BaseException] = None)
+        Дополняет событие результатом попытки и уведомляет обработчики.
+    retried(attempt: int, error: BaseException, delay: float)
+        Уведомляет обработчики о повторе запроса.
+    batch_sent(points: int, pending_points: int, age: Optional[float], error: Optional[BaseException] = None)
+        Уведомляет обработчики об отправке пакета фонового писателя.
+    """
+
+    def __init__(self, listeners: Iterable[InstrumentationListener] = ()) -> None:
+        self.listeners: List[InstrumentationListener] = list(listeners)
+
+    def start(self, url: str, kwargs: dict) -> RequestEvent:
+        """
+        Создает событие попытки запроса и уведомляет обработчики.
+
+        Параметры:
+        ----------
+        url (str): URL-адрес запроса.
+        kwargs (dict): аргументы httpx запроса.
+
+        Возвращает:
+        ----------
+        RequestEvent: событие попытки.
+        """
+        content = kwargs.get("content")
+        event = RequestEvent(operation_for(url), url, None if content is None else len(content))
+        for listener in self.listeners:
+            listener.request_started(event)
+        event.started = time.perf_counter()
+        return event
+
+    def finish(
+        self,
+        event: RequestEvent,
+        params: dict,
+        response: Optional[httpx.Response] = None,
+        payload: Optional[dict] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Дополняет событие длительностью, размерами, количеством точек и ошибкой
+        и уведомляет обработчики.
+
+        Параметры:
+        ----------
+        event (RequestEvent): событие попытки.
+        params (dict): параметры запроса.
+        response (Optional[httpx.Response]): ответ платформы или None.
+        payload (Optional[dict]): разобранный ответ или None.
+        error (Optional[BaseException]): ошибка попытки или None.
+        """
+        event.duration = time.perf_counter() - event.started
+        event.error = error
+        if isinstance(response, httpx.Response):
+            event.status_code = response.status_code
+            event.response_bytes = len(response.content)
+            if event.request_bytes is None:
+                event.request_bytes = len(response.request.url.query)
+        if event.operation == "set_data":
+            event.points = sum(len(item["data"]) for item in params.get("data") or ())
+        elif event.operation == "get_data" and payload is not None and "data" in payload:
+            event.points = sum(len(entry.get("data") or ()) for entry in payload["data"])
+        for listener in self.listeners:
+            listener.request_finished(event)
+
+    def retried(self, attempt: int, error: BaseException, delay: float) -> None:
+        """Уведомляет обработчики о повторе запроса: (номер неудачной попытки, ошибка, пауза)."""
+        for listener in self.listeners:
+            listener.retried(attempt, error, delay)
+
+    def batch_sent(
+        self,
+        points: int,
+        pending_points: int,
+        age: Optional[float],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Уведомляет обработчики об отправке пакета фонового писателя.
+
+        Параметры:
+        ----------
+        points (int): количество точек пакета.
+        pending_points (int): количество неотправленных точек писателя после отправки.
+        age (Optional[float]): время от добавления первой точки пакета до отправки, секунды.
+        error (Optional[BaseException]): ошибка отправки или None.
+        """
+        for listener in self.listeners:
+            listener.batch_sent(points, pending_points, age, error)
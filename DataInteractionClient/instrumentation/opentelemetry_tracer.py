@@ -0,0 +1,59 @@
+from typing import Any, Optional
+
+from instrumentation.instrumentation import InstrumentationListener, RequestEvent
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - зависит от окружения
+    trace = None
+
+
+class OpenTelemetryTracer(InstrumentationListener):
+    """
+    Класс, представляющий обработчик инструментирования, создающий span OpenTelemetry
+    для каждой попытки запроса к платформе. Требует пакет opentelemetry-api
+    (pip install "data_interaction_client[opentelemetry]"), если трассировщик не передан явно.
+
+    Атрибуты
+    ----------
+    tracer : Any
+        Трассировщик OpenTelemetry. По умолчанию — trace.get_tracer("data_interaction_client").
+
+    Ошибки, исключения:
+    -------
+    ImportError: Если трассировщик не передан и пакет opentelemetry-api не установлен.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        if tracer is None:
+            if trace is None:
+                raise ImportError(
+                    "Для OpenTelemetryTracer необходим пакет opentelemetry-api"
+                )
+            tracer = trace.get_tracer("data_interaction_client")
+        self.tracer = tracer
+
+    def request_started(self, event: RequestEvent) -> None:
+        event.span = self.tracer.start_span(
+            f"platform.{event.operation}",
+            attributes={"http.request.method": "POST", "url.full": event.url},
+        )
+
+    def request_finished(self, event: RequestEvent) -> None:
+        span, event.span = event.span, None
+        if span is None:
+            return
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.request_bytes is not None:
+            span.set_attribute("http.request.body.size", event.request_bytes)
+        if event.response_bytes is not None:
+            span.set_attribute("http.response.body.size", event.response_bytes)
+        if event.points is not None:
+            span.set_attribute("platform.points", event.points)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_attribute("error.type", type(event.error).__name__)
+            if trace is not None:
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(event.error)))
+        span.end()
@@ -0,0 +1,58 @@
+from typing import Iterable, List, Tuple
+
+from instrumentation.client_metrics import ClientMetrics, Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: Tuple[str, str] = None) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(metrics: ClientMetrics) -> str:
+    """
+    Выводит значения метрик клиента в текстовом формате Prometheus (exposition format 0.0.4).
+    Не требует пакета prometheus_client: результат отдается HTTP-обработчиком
+    с заголовком Content-Type, равным CONTENT_TYPE.
+
+    Параметры:
+    ----------
+    metrics (ClientMetrics): метрики клиента.
+
+    Возвращает:
+    ----------
+    str: текст метрик.
+    """
+    lines: List[str] = []
+    for metric in metrics.metrics:
+        lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        if isinstance(metric, Histogram):
+            for label_values, sample in metric.samples():
+                cumulative = 0
+                for bound, observed in zip(metric.bounds + (float("inf"),), sample.buckets):
+                    cumulative += observed
+                    labels = _labels(metric.labels, label_values, ("le", _number(bound)))
+                    lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+                labels = _labels(metric.labels, label_values)
+                lines.append(f"{metric.name}_sum{labels} {_number(sample.sum)}")
+                lines.append(f"{metric.name}_count{labels} {sample.count}")
+        else:
+            for label_values, value in metric.samples():
+                lines.append(f"{metric.name}{_labels(metric.labels, label_values)} {_number(value)}")
+    return "\n".join(lines) + "\n"
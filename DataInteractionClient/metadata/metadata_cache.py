@@ -0,0 +1,340 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from exceptions.data_source_not_active_exception import \
+    DataSourceNotActiveException
+from models.tag_registry import TagRegistry
+from reading.fan_out import TagId
+from serialization.codecs import get_codec
+
+NOT_MODIFIED = 304
+
+
+class MetadataEntry:
+    """
+    Класс, представляющий сохраненные метаданные источника данных — ответ connect.
+
+    Атрибуты
+    ----------
+    etag : Optional[str]
+        Версия метаданных из заголовка ETag ответа платформы или None.
+    digest : str
+        Хеш SHA-1 тела ответа, по которому определяется, изменились ли метаданные.
+    attributes : dict
+        Атрибуты источника данных.
+    tags : List[dict]
+        Данные тегов — словари с ключами 'id' и 'attributes'.
+    fetched_at : float
+        Момент последней проверки метаданных на платформе, секунды Unix.
+    registry : Optional[TagRegistry]
+        Реестр тегов, выданный connect в этом процессе. Не сохраняется на диск.
+    """
+
+    __slots__ = ("etag", "digest", "attributes", "tags", "fetched_at", "registry")
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        digest: str,
+        attributes: dict,
+        tags: List[dict],
+        fetched_at: float,
+        registry: Optional[TagRegistry] = None,
+    ) -> None:
+        self.etag = etag
+        self.digest = digest
+        self.attributes = attributes
+        self.tags = tags
+        self.fetched_at = fetched_at
+        self.registry = registry
+
+
+class Revalidation:
+    """
+    Класс, представляющий условный запрос connect: передает сохраненную версию
+    в заголовке If-None-Match и запоминает версию и хеш полученного ответа.
+
+    Атрибуты
+    ----------
+    etag : Optional[str]
+        Сохраненная версия метаданных или None.
+    not_modified : bool
+        True, если платформа ответила 304 Not Modified.
+    response_etag : Optional[str]
+        Заголовок ETag ответа.
+    digest : Optional[str]
+        Хеш SHA-1 тела ответа. None для ответа 304.
+    """
+
+    __slots__ = ("etag", "not_modified", "response_etag", "digest")
+
+    def __init__(self, etag: Optional[str] = None) -> None:
+        self.etag = etag
+        self.not_modified = False
+        self.response_etag = None
+        self.digest = None
+
+    def headers(self) -> Dict[str, str]:
+        """Возвращает заголовки условного запроса."""
+        return {} if self.etag is None else {"If-None-Match": self.etag}
+
+    def observe(self, response: httpx.Response) -> bool:
+        """
+        Запоминает версию и хеш ответа.
+
+        Параметры:
+        ----------
+        response (httpx.Response): ответ платформы.
+
+        Возвращает:
+        ----------
+        bool: True, если метаданные не изменились (ответ 304).
+        """
+        self.not_modified = response.status_code == NOT_MODIFIED
+        self.response_etag = response.headers.get("ETag")
+        self.digest = None if self.not_modified else hashlib.sha1(response.content).hexdigest()
+        return self.not_modified
+
+
+class MetadataCache:
+    """
+    Класс, представляющий кеш метаданных источников данных (ответов connect)
+    в памяти и, если задан directory, на диске. Повторный connect проверяет метаданные
+    условным запросом (If-None-Match с ETag платформы) или по хешу тела ответа;
+    неизменные метаданные не разбираются повторно и connect возвращает прежний реестр тегов.
+    Изменения применяются к прежнему реестру (TagRegistry.apply): экземпляры Tag
+    сохранившихся тегов и их накопленные данные остаются прежними.
+    Если задан max_age, метаданные моложе max_age секунд используются без запроса
+    к платформе, в том числе после перезапуска процесса при хранении на диске.
+    Потокобезопасен.
+
+    Атрибуты
+    ----------
+    directory : Optional[str]
+        Каталог для хранения метаданных на диске. None — только в памяти. По умолчанию — None.
+    max_age : float
+        Время, в течение которого метаданные используются без проверки, секунды.
+        0 — проверять при каждом connect. По умолчанию — 0.
+    on_change : Optional[Callable[[str, List[TagId], List[TagId]], None]]
+        Обработчик изменения состава тегов: (идентификатор источника,
+        добавленные теги, удаленные теги). По умолчанию — None.
+    hits : int
+        Количество connect, обслуженных без запроса к платформе.
+    revalidated : int
+        Количество connect, для которых платформа подтвердила неизменность метаданных.
+    refreshed : int
+        Количество connect, получивших измененные метаданные.
+    misses : int
+        Количество connect без сохраненных метаданных.
+
+    Методы
+    -------
+    get(source_id: str)
+        Возвращает сохраненные метаданные источника.
+    is_fresh(entry: MetadataEntry)
+        Проверяет, можно ли использовать метаданные без запроса к платформе.
+    serve(source_id: str, entry: MetadataEntry)
+        Возвращает реестр тегов из сохраненных метаданных без запроса к платформе.
+    resolve(source_id: str, entry: Optional[MetadataEntry], payload: dict, revalidation: Revalidation)
+        Обрабатывает ответ connect и возвращает реестр тегов.
+    invalidate(source_id: Optional[str] = None)
+        Удаляет сохраненные метаданные источника или всех источников.
+
+    Ошибки, исключения:
+    -------
+    DataSourceNotActiveException: Если источник данных неактивен.
+    OSError: При ошибках записи на диск.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_age: float = 0.0,
+        on_change: Optional[Callable[[str, List[TagId], List[TagId]], None]] = None,
+    ) -> None:
+        self.directory = directory
+        self.max_age = max_age
+        self.on_change = on_change
+        self.hits = 0
+        self.revalidated = 0
+        self.refreshed = 0
+        self.misses = 0
+        self._entries: Dict[str, MetadataEntry] = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, source_id: str) -> str:
+        name = hashlib.sha1(source_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _load(self, source_id: str) -> Optional[MetadataEntry]:
+        path = self._path(source_id)
+        try:
+            with open(path, "rb") as f:
+                stored = get_codec().loads(f.read())
+            # Момент последней проверки — время изменения файла (см. _touch).
+            return MetadataEntry(
+                stored["etag"], stored["digest"], stored["attributes"], stored["tags"],
+                os.path.getmtime(path),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            # Отсутствующий или поврежденный файл равносилен отсутствию метаданных.
+            return None
+
+    def _save(self, source_id: str, entry: MetadataEntry) -> None:
+        path = self._path(source_id)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(get_codec().dumps({
+                "source": source_id, "etag": entry.etag, "digest": entry.digest,
+                "attributes": entry.attributes, "tags": entry.tags,
+            }))
+        os.replace(temporary, path)
+        os.utime(path, (entry.fetched_at, entry.fetched_at))
+
+    def _touch(self, source_id: str, entry: MetadataEntry) -> None:
+        try:
+            os.utime(self._path(source_id), (entry.fetched_at, entry.fetched_at))
+        except FileNotFoundError:
+            self._save(source_id, entry)
+
+    def get(self, source_id: str) -> Optional[MetadataEntry]:
+        """
+        Возвращает сохраненные метаданные источника из памяти или с диска.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        Optional[MetadataEntry]: метаданные или None.
+        """
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry is None and self.directory is not None:
+                entry = self._load(source_id)
+                if entry is not None:
+                    self._entries[source_id] = entry
+            return entry
+
+    def is_fresh(self, entry: MetadataEntry) -> bool:
+        """Проверяет, моложе ли метаданные max_age секунд."""
+        return self.max_age > 0 and time.time() - entry.fetched_at < self.max_age
+
+    def _registry(self, entry: MetadataEntry) -> TagRegistry:
+        if entry.registry is None:
+            entry.registry = TagRegistry(entry.tags)
+        return entry.registry
+
+    def serve(self, source_id: str, entry: MetadataEntry) -> TagRegistry:
+        """
+        Возвращает реестр тегов из сохраненных метаданных без запроса к платформе.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+        entry (MetadataEntry): сохраненные метаданные.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника.
+        """
+        with self._lock:
+            self.hits += 1
+            return self._registry(entry)
+
+    def resolve(
+        self,
+        source_id: str,
+        entry: Optional[MetadataEntry],
+        payload: dict,
+        revalidation: Revalidation,
+    ) -> TagRegistry:
+        """
+        Обрабатывает ответ connect: при неизменных метаданных возвращает прежний реестр,
+        при измененных применяет их к прежнему реестру, сохраняет метаданные.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+        entry (Optional[MetadataEntry]): сохраненные метаданные или None.
+        payload (dict): ответ платформы. Не используется для ответа 304.
+        revalidation (Revalidation): условный запрос, по которому получен ответ.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника.
+
+        Ошибки, исключения:
+        -------
+        DataSourceNotActiveException: Если источник данных неактивен.
+        """
+        now = time.time()
+        unchanged = entry is not None and (
+            revalidation.not_modified or revalidation.digest == entry.digest
+        )
+        if not unchanged and not payload["attributes"]["smtActive"]:
+            self.invalidate(source_id)
+            raise DataSourceNotActiveException()
+        changes = None
+        with self._lock:
+            if unchanged:
+                self.revalidated += 1
+                entry.fetched_at = now
+                entry.etag = revalidation.response_etag or entry.etag
+            else:
+                registry = None
+                if entry is not None:
+                    self.refreshed += 1
+                    registry = entry.registry
+                    if registry is not None:
+                        changes = registry.apply(payload["tags"])
+                else:
+                    self.misses += 1
+                entry = MetadataEntry(
+                    revalidation.response_etag, revalidation.digest, payload["attributes"],
+                    payload["tags"], now, registry,
+                )
+            self._entries[source_id] = entry
+            registry = self._registry(entry)
+        if self.directory is not None:
+            if unchanged:
+                self._touch(source_id, entry)
+            else:
+                self._save(source_id, entry)
+        if changes is not None and self.on_change is not None and (changes[0] or changes[1]):
+            self.on_change(source_id, *changes)
+        return registry
+
+    def invalidate(self, source_id: Optional[str] = None) -> None:
+        """
+        Удаляет сохраненные метаданные источника или, если source_id не задан, всех источников.
+
+        Параметры:
+        ----------
+        source_id (Optional[str]): идентификатор источника данных. По умолчанию — None.
+        """
+        with self._lock:
+            if source_id is None:
+                self._entries.clear()
+                paths = []
+                if self.directory is not None:
+                    paths = [
+                        os.path.join(self.directory, name)
+                        for name in os.listdir(self.directory) if name.endswith(".json")
+                    ]
+            else:
+                self._entries.pop(source_id, None)
+                paths = [] if self.directory is None else [self._path(source_id)]
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
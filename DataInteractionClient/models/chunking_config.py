@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ChunkingConfig(BaseModel):
+    """
+    Класс, представляющий настройки разбиения данных set_data на части.
+
+    Атрибуты
+    ----------
+    max_points : Optional[int]
+        Максимальное количество точек в одном запросе. None — без ограничения.
+        По умолчанию — None.
+    max_bytes : Optional[int]
+        Максимальный оценочный объем JSON-представления точек одного запроса, байты.
+        None — без ограничения. По умолчанию — None.
+    max_parallel : int
+        Максимальное количество частей, отправляемых одновременно. По умолчанию — 4.
+    """
+
+    max_points: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_parallel: int = 4
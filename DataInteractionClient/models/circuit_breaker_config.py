@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+class CircuitBreakerConfig(BaseModel):
+    """
+    Класс, представляющий настройки автоматического выключателя запросов к платформе.
+
+    Атрибуты
+    ----------
+    failure_threshold : int
+        Количество подряд идущих ошибок недоступности платформы, после которого
+        выключатель размыкается. По умолчанию — 5.
+    reset_timeout : float
+        Время в разомкнутом состоянии, после которого разрешаются пробные запросы, секунды.
+        По умолчанию — 30.
+    half_open_max_calls : int
+        Количество одновременных пробных запросов в полуразомкнутом состоянии. По умолчанию — 1.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+ATTRIBUTE_KEY = "compression"
+
+
+class CompressionConfig(BaseModel):
+    """
+    Класс, представляющий настройки сжатия данных тега перед отправкой.
+    Точка со сменой качества q проходит всегда. Фильтры применяются по порядку:
+    max_interval, min_interval, зона нечувствительности (deadband, deadband_percent),
+    сжатие «вращающейся двери» (swinging_door).
+
+    Атрибуты
+    ----------
+    deadband : Optional[float]
+        Абсолютная зона нечувствительности: точка отбрасывается, если значение отличается
+        от последнего принятого не больше чем на deadband. None — не используется.
+        По умолчанию — None.
+    deadband_percent : Optional[float]
+        Зона нечувствительности в процентах от модуля последнего принятого значения.
+        При заданных deadband и deadband_percent используется большая из зон.
+        None — не используется. По умолчанию — None.
+    swinging_door : Optional[float]
+        Допустимое отклонение сжатия «вращающейся двери»: сохраняются только точки,
+        без которых линейная интерполяция между сохраненными точками отклонится
+        от исходных значений больше чем на swinging_door. None — не используется.
+        По умолчанию — None.
+    min_interval : Optional[int]
+        Минимальный интервал между сохраняемыми точками, микросекунды. Более частые
+        точки отбрасываются. None — не используется. По умолчанию — None.
+    max_interval : Optional[int]
+        Максимальный интервал между сохраняемыми точками, микросекунды: точка сохраняется
+        независимо от фильтров, если с последней сохраненной прошло не меньше max_interval.
+        None — не используется. По умолчанию — None.
+
+    Методы
+    -------
+    from_attributes(attributes: dict)
+        Создает настройки из атрибутов тега.
+    """
+
+    deadband: Optional[float] = None
+    deadband_percent: Optional[float] = None
+    swinging_door: Optional[float] = None
+    min_interval: Optional[int] = None
+    max_interval: Optional[int] = None
+
+    @classmethod
+    def from_attributes(cls, attributes: Optional[dict]) -> Optional["CompressionConfig"]:
+        """
+        Создает настройки из атрибута тега "compression" — словаря с полями настроек,
+        например {"deadband": 0.5, "min_interval": 1000000}.
+
+        Параметры:
+        ----------
+        attributes (Optional[dict]): атрибуты тега.
+
+        Возвращает:
+        ----------
+        Optional[CompressionConfig]: настройки или None, если атрибут не задан.
+
+        Ошибки, исключения:
+        -------
+        pydantic_core._pydantic_core.ValidationError: При несоответствии типов настроек.
+        """
+        settings = (attributes or {}).get(ATTRIBUTE_KEY)
+        return None if settings is None else cls(**settings)
@@ -0,0 +1,70 @@
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TagSeries(BaseModel):
+    """
+    Класс, представляющий ряд данных одного тега, полученный get_data_many.
+
+    Атрибуты
+    ----------
+    tag_id : Union[str, dict]
+        Идентификатор тега.
+    data : List[dict]
+        Точки тега в порядке времени.
+    error : Optional[BaseException]
+        Ошибка запроса, в который входил тег, или None. При ошибке data содержит
+        только точки из успешно прочитанных окон.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    tag_id: Union[str, dict]
+    data: List[dict] = []
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True, если все запросы тега выполнены успешно."""
+        return self.error is None
+
+
+class DataManyResult(BaseModel):
+    """
+    Класс, представляющий результат get_data_many: ряды тегов в порядке запроса.
+
+    Атрибуты
+    ----------
+    series : List[TagSeries]
+        Ряды данных тегов.
+    """
+
+    series: List[TagSeries]
+
+    @property
+    def ok(self) -> bool:
+        """True, если данные всех тегов получены без ошибок."""
+        return all(series.ok for series in self.series)
+
+    @property
+    def failed(self) -> List[TagSeries]:
+        """Ряды тегов, запросы которых завершились ошибкой."""
+        return [series for series in self.series if not series.ok]
+
+    def get(self, tag_id: Union[str, dict]) -> Optional[TagSeries]:
+        """
+        Возвращает ряд тега по идентификатору.
+
+        Параметры:
+        ----------
+        tag_id (Union[str, dict]): идентификатор тега.
+
+        Возвращает:
+        ----------
+        Optional[TagSeries]: ряд тега или None, если тег не запрашивался.
+        """
+        for series in self.series:
+            if series.tag_id == tag_id:
+                return series
+        return None
@@ -0,0 +1,51 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class RateLimitConfig(BaseModel):
+    """
+    Класс, представляющий настройки ограничения частоты и адаптивного ограничения
+    количества одновременных запросов к платформе (RateLimiter).
+
+    Атрибуты
+    ----------
+    rate : Optional[float]
+        Средняя частота запросов (попыток), запросов в секунду — «ведро токенов».
+        None — частота не ограничивается. По умолчанию — None.
+    burst : int
+        Емкость «ведра»: количество запросов, которое можно выполнить подряд без ожидания
+        после простоя. По умолчанию — 10.
+    initial_concurrency : int
+        Начальное ограничение количества одновременных запросов. По умолчанию — 4.
+    min_concurrency : int
+        Нижняя граница ограничения. По умолчанию — 1.
+    max_concurrency : int
+        Верхняя граница ограничения. По умолчанию — 64.
+    increase : float
+        Аддитивный рост: ограничение увеличивается на increase за каждые «ограничение»
+        успешных запросов, выполненных при полной загрузке. По умолчанию — 1.
+    decrease : float
+        Мультипликативное снижение ограничения при перегрузке. По умолчанию — 0.5.
+    latency_target : Optional[float]
+        Длительность запроса, секунды, выше которой запрос считается признаком перегрузки.
+        None — порог вычисляется как latency_tolerance, умноженный на наименьшую наблюдаемую
+        длительность. По умолчанию — None.
+    latency_tolerance : float
+        Допустимый рост длительности запроса относительно наименьшей наблюдаемой
+        при latency_target=None. По умолчанию — 3.
+    max_wait : Optional[float]
+        Наибольшее время ожидания разрешения на запрос, секунды; при превышении
+        выбрасывается RateLimitExceededException. None — без ограничения. По умолчанию — None.
+    """
+
+    rate: Optional[float] = None
+    burst: int = 10
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    increase: float = 1.0
+    decrease: float = 0.5
+    latency_target: Optional[float] = None
+    latency_tolerance: float = 3.0
+    max_wait: Optional[float] = None
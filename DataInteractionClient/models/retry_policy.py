@@ -0,0 +1,97 @@
+import random
+from typing import List, Literal, Optional
+
+import httpx
+from pydantic import BaseModel
+
+from exceptions.server_response_error_exception import \
+    ServerResponseErrorException
+
+
+class RetryPolicy(BaseModel):
+    """
+    Класс, представляющий политику повторных запросов к платформе.
+
+    Атрибуты
+    ----------
+    max_attempts : int
+        Максимальное количество попыток, включая первую. 1 — без повторов. По умолчанию — 1.
+    backoff_initial : float
+        Пауза перед первым повтором, секунды. По умолчанию — 0.1.
+    backoff_multiplier : float
+        Множитель паузы для каждого следующего повтора. По умолчанию — 2.
+    backoff_max : float
+        Максимальная пауза между попытками, секунды. По умолчанию — 10.
+    jitter : Literal["full", "equal", "none"]
+        Случайный разброс паузы: "full" — от 0 до паузы, "equal" — от половины паузы до паузы,
+        "none" — без разброса. По умолчанию — "full".
+    deadline : Optional[float]
+        Общее время на все попытки, секунды. None — без ограничения. По умолчанию — None.
+    retry_on_request_error : bool
+        Повторять запрос при ошибках соединения и таймаутах (httpx.RequestError).
+        По умолчанию — True.
+    retry_statuses : List[int]
+        HTTP-статусы ответа, при которых запрос повторяется. По умолчанию — 429, 502, 503, 504.
+    retry_error_ids : List[int]
+        Значения error['id'] ответа платформы, при которых запрос повторяется.
+        По умолчанию — пустой список.
+
+    Методы
+    -------
+    is_retryable(error: BaseException)
+        Проверяет, можно ли повторить запрос после указанной ошибки.
+    backoff(attempt: int)
+        Возвращает паузу перед повтором после указанной попытки.
+    """
+
+    max_attempts: int = 1
+    backoff_initial: float = 0.1
+    backoff_multiplier: float = 2.0
+    backoff_max: float = 10.0
+    jitter: Literal["full", "equal", "none"] = "full"
+    deadline: Optional[float] = None
+    retry_on_request_error: bool = True
+    retry_statuses: List[int] = [429, 502, 503, 504]
+    retry_error_ids: List[int] = []
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Проверяет, относится ли ошибка к временной недоступности платформы.
+
+        Параметры:
+        ----------
+        error (BaseException): ошибка запроса.
+
+        Возвращает:
+        ----------
+        bool: True, если запрос можно повторить.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        if isinstance(error, httpx.RequestError):
+            return self.retry_on_request_error
+        if isinstance(error, ServerResponseErrorException):
+            return error.error_id in self.retry_error_ids
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Возвращает паузу перед повтором с экспоненциальным ростом и случайным разбросом.
+
+        Параметры:
+        ----------
+        attempt (int): номер завершившейся неудачей попытки, начиная с 1.
+
+        Возвращает:
+        ----------
+        float: пауза, секунды.
+        """
+        delay = min(
+            self.backoff_initial * self.backoff_multiplier ** (attempt - 1),
+            self.backoff_max,
+        )
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        if self.jitter == "equal":
+            return random.uniform(delay / 2, delay)
+        return delay
@@ -0,0 +1,100 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SourceHealth(BaseModel):
+    """
+    Класс, представляющий состояние отправки данных одного источника менеджера сессий.
+
+    Атрибуты
+    ----------
+    source_id : str
+        Идентификатор источника данных.
+    tags : int
+        Количество тегов источника.
+    pending_tags : int
+        Количество тегов с неотправленными данными.
+    flushes : int
+        Количество успешных отправок.
+    points_sent : int
+        Количество отправленных точек.
+    failures : int
+        Количество отправок, завершившихся ошибкой.
+    consecutive_failures : int
+        Количество ошибок отправки подряд после последней успешной отправки.
+    last_flush_at : Optional[float]
+        Момент последней успешной отправки, секунды Unix, или None.
+    last_error : Optional[BaseException]
+        Последняя ошибка отправки или None.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    source_id: str
+    tags: int
+    pending_tags: int
+    flushes: int = 0
+    points_sent: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_flush_at: Optional[float] = None
+    last_error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True, если последняя отправка данных источника не завершилась ошибкой."""
+        return self.consecutive_failures == 0
+
+
+class SessionHealth(BaseModel):
+    """
+    Класс, представляющий сводное состояние менеджера сессий.
+
+    Атрибуты
+    ----------
+    sources : List[SourceHealth]
+        Состояние источников в порядке подключения.
+    circuit_state : Optional[str]
+        Состояние автоматического выключателя клиента или None, если выключатель не используется.
+    """
+
+    sources: List[SourceHealth]
+    circuit_state: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True, если у всех источников нет ошибок отправки и выключатель не разомкнут."""
+        return self.circuit_state != "open" and not self.failing
+
+    @property
+    def failing(self) -> List[SourceHealth]:
+        """Источники, последняя отправка данных которых завершилась ошибкой."""
+        return [source for source in self.sources if not source.ok]
+
+    @property
+    def points_sent(self) -> int:
+        """Количество точек, отправленных всеми источниками."""
+        return sum(source.points_sent for source in self.sources)
+
+    @property
+    def pending_tags(self) -> int:
+        """Количество тегов с неотправленными данными во всех источниках."""
+        return sum(source.pending_tags for source in self.sources)
+
+    def get(self, source_id: str) -> Optional[SourceHealth]:
+        """
+        Возвращает состояние источника по идентификатору.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        Optional[SourceHealth]: состояние источника или None.
+        """
+        for source in self.sources:
+            if source.source_id == source_id:
+                return source
+        return None
@@ -0,0 +1,76 @@
+from typing import List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ChunkResult(BaseModel):
+    """
+    Класс, представляющий результат отправки одной части данных set_data.
+
+    Атрибуты
+    ----------
+    index : int
+        Порядковый номер части.
+    tag_ids : List[Union[str, dict]]
+        Идентификаторы тегов, данные которых вошли в часть.
+    points : int
+        Количество точек в части.
+    error : Optional[BaseException]
+        Ошибка отправки или None, если часть отправлена успешно.
+    spooled : bool
+        True, если часть не отправлена из-за недоступности платформы и сохранена в спул.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    tag_ids: List[Union[str, dict]]
+    points: int
+    error: Optional[BaseException] = None
+    spooled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True, если часть отправлена успешно."""
+        return self.error is None
+
+
+class SetDataReport(BaseModel):
+    """
+    Класс, представляющий отчет об отправке данных set_data по частям.
+    Данные неотправленных частей возвращаются в теги и будут отправлены
+    при следующем вызове set_data либо, если у клиента задан спул и платформа
+    недоступна, сохраняются в спул.
+
+    Атрибуты
+    ----------
+    chunks : List[ChunkResult]
+        Результаты отправки частей.
+    """
+
+    chunks: List[ChunkResult]
+
+    @property
+    def ok(self) -> bool:
+        """True, если все части отправлены успешно или сохранены в спул."""
+        return not self.failed_chunks
+
+    @property
+    def failed_chunks(self) -> List[ChunkResult]:
+        """Части, отправка которых завершилась ошибкой и которые не сохранены в спул."""
+        return [chunk for chunk in self.chunks if not chunk.ok and not chunk.spooled]
+
+    @property
+    def points_sent(self) -> int:
+        """Количество успешно отправленных точек."""
+        return sum(chunk.points for chunk in self.chunks if chunk.ok)
+
+    @property
+    def points_failed(self) -> int:
+        """Количество неотправленных точек, возвращенных в теги."""
+        return sum(chunk.points for chunk in self.failed_chunks)
+
+    @property
+    def points_spooled(self) -> int:
+        """Количество точек, сохраненных в спул."""
+        return sum(chunk.points for chunk in self.chunks if chunk.spooled)
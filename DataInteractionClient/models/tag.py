@@ -1,7 +1,18 @@
 import threading
-from typing import Dict, List, Optional, Union
+from datetime import timezone, tzinfo
+from operator import itemgetter
+from typing import Dict, Iterable, List, Literal, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from buffers.columnar_buffer import ColumnarBuffer
+from buffers.dirty_tags import DirtyTags
+from buffers.ingest_shards import IngestMode, IngestShards
+from buffers.point_order import is_increasing, merge_columns, merge_records
+from compression.point_compressor import PointCompressor
+from models.compression_config import CompressionConfig
+from serialization.timestamps import (TimestampMode, parse_iso,
+                                      parse_iso_many)
 
 
 class Tag(BaseModel):
@@ -24,11 +35,59 @@ class Tag(BaseModel):
         Атрибуты тега.
     data : list
         Массив данных тега
+    buffer_mode : Literal["list", "columnar"]
+        Способ хранения данных. "list" — список словарей в атрибуте data,
+        "columnar" — компактный колоночный буфер ColumnarBuffer (атрибут buffer),
+        атрибут data при этом остается None. По умолчанию — "list".
+    compression : Optional[CompressionConfig]
+        Настройки сжатия точек перед помещением в буфер тега (зона нечувствительности,
+        «вращающаяся дверь», ограничение частоты). None — настройки берутся из атрибута
+        тега "compression", если он задан, иначе сжатие не используется. По умолчанию — None.
+    timestamps : TimestampMode
+        Хранение меток времени: "raw" — как переданы, "microseconds" — метки приводятся
+        к целым микросекундам при добавлении, точки перед отправкой упорядочиваются
+        по времени без повторов. По умолчанию — "raw".
+    naive_timezone : tzinfo
+        Часовой пояс строк ISO 8601 без смещения при приведении меток к микросекундам
+        (timestamps="microseconds", сжатие). По умолчанию — UTC.
+    ingest : IngestMode
+        Прием точек: "locked" — add_data и add_many пишут в буфер тега под блокировкой,
+        "sharded" — каждый поток-производитель пишет в собственную очередь без блокировок
+        (IngestShards), очереди сливаются в буфер тега при drain. В режиме "sharded" сжатие
+        применяется к точкам при drain, а порядок точек разных потоков восстанавливается
+        только при timestamps="microseconds". По умолчанию — "locked".
+    ordered : bool
+        True, если накопленные точки упорядочены по времени без повторов (только для
+        timestamps="microseconds"; для "raw" всегда True).
+    dirty : bool
+        True, если тег получил данные после последнего drain.
 
     Методы
     -------
+    trusted(id: Union[str, dict], attributes: dict, buffer_mode: str = "list",
+        lock: Optional[threading.Lock] = None, compression: Optional[CompressionConfig] = None,
+        timestamps: TimestampMode = "raw", ingest: IngestMode = "locked",
+        naive_timezone: tzinfo = timezone.utc)
+        Создает тег из уже проверенных данных без проверки pydantic.
+    set_compression(config: Optional[CompressionConfig])
+        Задает настройки сжатия точек тега.
+    watch(dirty: DirtyTags)
+        Отмечает тег в наборе dirty при появлении данных.
+    unwatch(dirty: DirtyTags)
+        Прекращает отмечать тег в наборе dirty.
+    compress(x: Union[str, int], y: int, q: Optional[int] = 0)
+        Пропускает точку через сжатие тега и возвращает точки для сохранения.
     add_data(x: Union[str, int], y: int, q: Optional[int] = 0)
         Добавляет данные к тегу.
+    add_many(xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None)
+        Добавляет несколько точек данных к тегу.
+    has_data
+        Проверяет наличие накопленных данных.
+    drain
+        Атомарно отсоединяет накопленные данные для отправки, при необходимости
+        упорядочивая их по времени.
+    requeue(snapshot: Union[List[dict], ColumnarBuffer])
+        Возвращает неотправленные данные перед данными, добавленными после drain.
     clear_data
         Очищает данные тега.
 
@@ -37,10 +96,24 @@ class Tag(BaseModel):
     ValueError: Если структура id отличается от ожидаемой.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: Union[str, Dict[str, str]]
     attributes: dict
     data: Optional[List[dict]] = None
+    buffer_mode: Literal["list", "columnar"] = "list"
+    compression: Optional[CompressionConfig] = None
+    timestamps: TimestampMode = "raw"
+    ingest: IngestMode = "locked"
+    naive_timezone: tzinfo = timezone.utc
     _lock: threading.Lock
+    _buffer: Optional[ColumnarBuffer]
+    _compressor: Optional[PointCompressor]
+    _last_x: Optional[int]
+    _ordered: bool
+    _shards: Optional[IngestShards]
+    _dirty: bool
+    _watchers: tuple
 
     def __init__(self, **kwargs: Union[str, dict]) -> None:
         if isinstance(kwargs.get("id"), dict):
@@ -50,21 +123,396 @@ class Tag(BaseModel):
                 )
         super().__init__(**kwargs)
         self._lock = threading.Lock()
+        self._buffer = None
+        self._compressor = None
+        self._last_x = None
+        self._ordered = True
+        self._shards = IngestShards() if self.ingest == "sharded" else None
+        self._dirty = False
+        self._watchers = ()
+        self.set_compression(self.compression or CompressionConfig.from_attributes(self.attributes))
+
+    @classmethod
+    def trusted(
+        cls,
+        id: Union[str, Dict[str, str]],
+        attributes: dict,
+        buffer_mode: Literal["list", "columnar"] = "list",
+        lock: Optional[threading.Lock] = None,
+        compression: Optional[CompressionConfig] = None,
+        timestamps: TimestampMode = "raw",
+        ingest: IngestMode = "locked",
+        naive_timezone: tzinfo = timezone.utc,
+    ) -> "Tag":
+        """
+        Создает тег из уже проверенных данных (ответ платформы, копия существующего тега)
+        без проверки pydantic.
+
+        Параметры:
+        ----------
+        id (Union[str, Dict[str, str]]): идентификатор тега.
+        attributes (dict): атрибуты тега.
+        buffer_mode (Literal["list", "columnar"]): способ хранения данных. По умолчанию — "list".
+        lock (Optional[threading.Lock]): блокировка данных тега, например общая для группы
+            тегов блокировка реестра. None — собственная блокировка. По умолчанию — None.
+        compression (Optional[CompressionConfig]): настройки сжатия. Атрибут "compression"
+            не читается. None — без сжатия. По умолчанию — None.
+        timestamps (TimestampMode): хранение меток времени. По умолчанию — "raw".
+        ingest (IngestMode): прием точек. По умолчанию — "locked".
+        naive_timezone (tzinfo): часовой пояс строк без смещения. По умолчанию — UTC.
+
+        Возвращает:
+        ----------
+        Tag: новый тег без данных.
+        """
+        tag = cls.model_construct(
+            id=id, attributes=attributes, buffer_mode=buffer_mode, timestamps=timestamps,
+            ingest=ingest, naive_timezone=naive_timezone,
+        )
+        tag._lock = threading.Lock() if lock is None else lock
+        tag._buffer = None
+        tag._compressor = None
+        tag._last_x = None
+        tag._ordered = True
+        tag._shards = IngestShards() if ingest == "sharded" else None
+        tag._dirty = False
+        tag._watchers = ()
+        tag.set_compression(compression)
+        return tag
+
+    @property
+    def compressor(self) -> Optional[PointCompressor]:
+        """
+        Сжатие точек тега со счетчиками принятых и сохраненных точек (compressor.ratio)
+        или None, если сжатие не используется.
+        """
+        return self._compressor
+
+    @property
+    def ordered(self) -> bool:
+        """
+        True, если накопленные точки упорядочены по времени без повторов и drain
+        отсоединит их без сортировки.
+        """
+        return self._ordered
+
+    @property
+    def dirty(self) -> bool:
+        """True, если тег получил данные после последнего drain."""
+        return self._dirty
+
+    def watch(self, dirty: DirtyTags) -> None:
+        """
+        Отмечает тег в наборе dirty при первом добавлении данных после drain
+        (add_data, add_many, requeue). Если данные уже есть, тег отмечается сразу.
+
+        Параметры:
+        ----------
+        dirty (DirtyTags): набор тегов с данными, например реестра или писателя.
+        """
+        with self._lock:
+            if dirty not in self._watchers:
+                self._watchers += (dirty,)
+        if self._dirty or self.has_data():
+            self._dirty = True
+            dirty.mark(self)
+
+    def unwatch(self, dirty: DirtyTags) -> None:
+        """
+        Прекращает отмечать тег в наборе dirty. Уже сделанная отметка остается в наборе.
+
+        Параметры:
+        ----------
+        dirty (DirtyTags): набор, переданный watch.
+        """
+        with self._lock:
+            self._watchers = tuple(watcher for watcher in self._watchers if watcher is not dirty)
+
+    def _touch(self) -> None:
+        """Отмечает тег в наблюдающих наборах при первом добавлении данных после drain."""
+        if not self._dirty:
+            self._dirty = True
+            for watcher in self._watchers:
+                watcher.mark(self)
+
+    def set_compression(self, config: Optional[CompressionConfig]) -> None:
+        """
+        Задает настройки сжатия точек тега. Удерживаемая сжатием точка предыдущих
+        настроек сохраняется в буфер тега, счетчики сжатия начинаются заново.
+
+        Параметры:
+        ----------
+        config (Optional[CompressionConfig]): настройки сжатия. None — отключить сжатие.
+        """
+        released = []
+        with self._lock:
+            if self._compressor is not None:
+                released = self._compressor.release()
+                self._store_points(released)
+            self.compression = config
+            self._compressor = None if config is None else PointCompressor(config, self.naive_timezone)
+        if released:
+            self._touch()
+
+    def compress(self, x: Union[str, int], y: int, q: Optional[int] = 0) -> List[tuple]:
+        """
+        Пропускает точку через сжатие тега, не сохраняя ее в буфер тега.
+        Используется писателями, которые накапливают точки в собственном буфере.
+
+        Параметры:
+        ----------
+        x (Union[str, int]): метка времени.
+        y (int): значение.
+        q (Optional[int]): качество. По умолчанию — 0.
+
+        Возвращает:
+        ----------
+        List[tuple]: точки (x, y, q), которые нужно сохранить.
+        """
+        if self.timestamps == "microseconds" and type(x) is not int:
+            x = parse_iso(x, self.naive_timezone)
+        with self._lock:
+            if self._compressor is None:
+                return [(x, y, q)]
+            return [point[:3] for point in self._compressor.feed(x, y, q)]
+
+    def _store(self, x: Union[str, int], y: int, q: Optional[int]) -> None:
+        if self.timestamps == "microseconds":
+            # x уже приведена к микросекундам: добавление по порядку — одно сравнение.
+            last = self._last_x
+            if last is None or x > last:
+                self._last_x = x
+            else:
+                self._ordered = False
+        if self.buffer_mode == "columnar":
+            if self._buffer is None:
+                self._buffer = ColumnarBuffer()
+            self._buffer.append(x, y, q)
+            return
+        if self.data is None:
+            self.data = []
+        self.data.append({"x": x, "y": y, "q": q})
+
+    def _store_points(self, points: Iterable[tuple]) -> None:
+        for point in points:
+            self._store(point[0], point[1], point[2])
+
+    def _track_many(self, xs) -> None:
+        """Обновляет признак упорядоченности после добавления меток xs (микросекунды)."""
+        if not len(xs):
+            return
+        last = self._last_x
+        if self._ordered:
+            self._ordered = (last is None or xs[0] > last) and is_increasing(xs)
+        if self._ordered:
+            self._last_x = xs[-1]
+        else:
+            self._last_x = max(xs) if last is None else max(last, max(xs))
+
+    @property
+    def buffer(self) -> Optional[ColumnarBuffer]:
+        """
+        Колоночный буфер данных тега в режиме "columnar" или None, если данных нет.
+        """
+        return self._buffer
 
     def add_data(self, x: Union[str, int], y: int, q: Optional[int] = 0) -> None:
         """
-        Добавляет данные тега.
+        Добавляет данные тега. Если задано сжатие, точка сохраняется только когда
+        этого требуют настройки сжатия.
+        В режиме ingest="sharded" точка добавляется в очередь текущего потока без блокировки.
 
         Возвращает
         -------
         None
             Не возвращает никаких значений. Она изменяет атрибут 'data' экземпляра класса.
         """
+        if self.timestamps == "microseconds" and type(x) is not int:
+            x = parse_iso(x, self.naive_timezone)
+        if self._shards is None:
+            with self._lock:
+                if self._compressor is None:
+                    self._store(x, y, q)
+                else:
+                    self._store_points(self._compressor.feed(x, y, q))
+        else:
+            self._shards.append({"x": x, "y": y, "q": q})
+        if not self._dirty:
+            self._touch()
+
+    def add_many(
+        self, xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None
+    ) -> None:
+        """
+        Добавляет несколько точек данных тега за один захват блокировки.
+        При timestamps="microseconds" метки разбираются пакетно функцией parse_iso_many.
+        В режиме ingest="sharded" точки добавляются в очередь текущего потока без блокировки.
+
+        Параметры:
+        ----------
+        xs (Iterable): метки времени.
+        ys (Iterable): значения.
+        qs (Optional[Iterable]): качество. По умолчанию — 0 для всех точек.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если длины xs, ys и qs различаются.
+        """
+        normalize = self.timestamps == "microseconds"
+        if normalize:
+            xs = parse_iso_many(xs, self.naive_timezone)
+        if self._shards is not None:
+            xs, ys = list(xs), list(ys)
+            qs = [0] * len(xs) if qs is None else list(qs)
+            if not len(xs) == len(ys) == len(qs):
+                raise ValueError("Длины xs, ys и qs должны совпадать")
+            self._shards.extend({"x": x, "y": y, "q": q} for x, y, q in zip(xs, ys, qs))
+            self._touch()
+            return
+        self._add_many_locked(xs, ys, qs, normalize)
+        self._touch()
+
+    def _add_many_locked(
+        self, xs: Iterable, ys: Iterable, qs: Optional[Iterable], normalize: bool
+    ) -> None:
         with self._lock:
+            if self.buffer_mode == "columnar" and self._compressor is None:
+                if self._buffer is None:
+                    self._buffer = ColumnarBuffer()
+                self._buffer.extend(xs, ys, qs)
+                if normalize:
+                    self._track_many(xs)
+                return
+            xs, ys = list(xs), list(ys)
+            qs = [0] * len(xs) if qs is None else list(qs)
+            if not len(xs) == len(ys) == len(qs):
+                raise ValueError("Длины xs, ys и qs должны совпадать")
+            if not xs:
+                return
+            if self._compressor is not None:
+                feed = self._compressor.feed
+                for x, y, q in zip(xs, ys, qs):
+                    self._store_points(feed(x, y, q))
+                return
             if self.data is None:
                 self.data = []
-            data = {"x": x, "y": y, "q": q}
-            self.data.append(data)
+            self.data.extend({"x": x, "y": y, "q": q} for x, y, q in zip(xs, ys, qs))
+            if normalize:
+                self._track_many(xs)
+
+    def _absorb_shards(self) -> None:
+        """Переносит точки очередей потоков в буфер тега (вызывается под блокировкой)."""
+        points = self._shards.collect()
+        if not points:
+            return
+        normalize = self.timestamps == "microseconds"
+        if self._compressor is not None:
+            if normalize:
+                # Сжатию нужны точки по порядку времени, а очереди потоков следуют друг за другом.
+                points.sort(key=itemgetter("x"))
+            feed = self._compressor.feed
+            for point in points:
+                self._store_points(feed(point["x"], point["y"], point["q"]))
+            return
+        xs = list(map(itemgetter("x"), points)) if normalize else None
+        if self.buffer_mode == "columnar":
+            if self._buffer is None:
+                self._buffer = ColumnarBuffer()
+            self._buffer.extend(
+                xs if normalize else list(map(itemgetter("x"), points)),
+                list(map(itemgetter("y"), points)), list(map(itemgetter("q"), points)),
+            )
+        elif self.data is None:
+            self.data = points
+        else:
+            self.data.extend(points)
+        if normalize:
+            self._track_many(xs)
+
+    def has_data(self) -> bool:
+        """
+        Проверяет, накоплены ли у тега данные для отправки.
+
+        Возвращает
+        -------
+        bool
+            True, если у тега есть данные.
+        """
+        return (
+            self.data is not None
+            or bool(self._buffer)
+            or (self._compressor is not None and self._compressor.holding)
+            or bool(self._shards)
+        )
+
+    def drain(self) -> Optional[Union[List[dict], ColumnarBuffer]]:
+        """
+        Атомарно отсоединяет накопленные данные тега под блокировкой.
+        Следующие вызовы add_data пишут в новый буфер и не затрагивают отсоединенные данные.
+        В режиме ingest="sharded" предварительно сливает в буфер очереди потоков.
+        Точка, удерживаемая сжатием «вращающейся двери», предварительно сохраняется в буфер.
+        Если точки добавлялись не по порядку или с повторами (ordered == False), отсоединенные
+        данные упорядочиваются по времени без повторов вне блокировки.
+
+        Возвращает
+        -------
+        Optional[Union[List[dict], ColumnarBuffer]]
+            Отсоединенные данные (список словарей или колоночный буфер) или None, если данных нет.
+        """
+        with self._lock:
+            # Сброс до сбора очередей: точка, добавленная после сбора, отметит тег снова.
+            self._dirty = False
+            if self._shards is not None:
+                self._absorb_shards()
+            if self._compressor is not None:
+                self._store_points(self._compressor.release())
+            ordered = self._ordered
+            self._ordered = True
+            self._last_x = None
+            if self._buffer:
+                snapshot, self._buffer = self._buffer, None
+            else:
+                snapshot, self.data = self.data, None
+        if ordered or not snapshot:
+            return snapshot
+        if isinstance(snapshot, ColumnarBuffer):
+            return merge_columns(snapshot)
+        return merge_records(snapshot)
+
+    def requeue(self, snapshot: Union[List[dict], ColumnarBuffer]) -> None:
+        """
+        Возвращает отсоединенные методом drain данные, которые не удалось отправить.
+        Данные помещаются перед данными, добавленными после drain, сохраняя порядок точек.
+
+        Параметры:
+        ----------
+        snapshot (Union[List[dict], ColumnarBuffer]): данные, полученные от drain.
+        """
+        with self._lock:
+            if self.timestamps == "microseconds" and snapshot:
+                self._track_requeued(snapshot)
+            if isinstance(snapshot, ColumnarBuffer):
+                if self._buffer:
+                    snapshot.concat(self._buffer)
+                self._buffer = snapshot
+            else:
+                self.data = snapshot + (self.data or [])
+        if snapshot:
+            self._touch()
+
+    def _track_requeued(self, snapshot: Union[List[dict], ColumnarBuffer]) -> None:
+        if isinstance(snapshot, ColumnarBuffer):
+            xs = snapshot.xs
+            first = self._buffer.xs[0] if self._buffer else None
+        else:
+            xs = [point["x"] for point in snapshot]
+            first = self.data[0]["x"] if self.data else None
+        if first is None:
+            self._ordered = is_increasing(xs)
+            self._last_x = xs[-1] if self._ordered else max(xs)
+            return
+        self._ordered = self._ordered and xs[-1] < first and is_increasing(xs)
+        self._last_x = max(self._last_x, max(xs))
 
     def clear_data(self) -> None:
         """
@@ -76,4 +524,12 @@ class Tag(BaseModel):
             Не возвращает никаких значений. Он изменяет атрибут 'data' экземпляра класса.
         """
         with self._lock:
+            self._dirty = False
             self.data = None
+            self._buffer = None
+            self._ordered = True
+            self._last_x = None
+            if self._shards is not None:
+                self._shards.clear()
+            if self._compressor is not None:
+                self._compressor.discard()
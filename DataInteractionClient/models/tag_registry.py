@@ -0,0 +1,293 @@
+import threading
+from collections.abc import Sequence
+from datetime import timezone, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from buffers.dirty_tags import DirtyTags
+from buffers.ingest_shards import IngestMode
+from models.compression_config import CompressionConfig
+from models.tag import Tag
+from reading.fan_out import TagId, tag_key
+from serialization.timestamps import TimestampMode
+
+DEFAULT_STRIPES = 64
+
+
+class TagRegistry(Sequence):
+    """
+    Класс, представляющий компактный реестр тегов источника данных, возвращаемый connect.
+    Идентификаторы и атрибуты тегов хранятся параллельными списками (по индексу тега),
+    экземпляр Tag создается при первом обращении к тегу. Блокировки данных тегов
+    общие для групп тегов (stripes блокировок на весь реестр) вместо блокировки на тег.
+    Реестр — последовательность тегов: поддерживает len, индексы, срезы и итерацию,
+    поэтому совместим с кодом, ожидающим List[Tag].
+    Созданные теги отмечают себя в наборе реестра при добавлении данных (Tag.watch),
+    поэтому active и pending перебирают только теги с данными, а не весь реестр.
+
+    Атрибуты
+    ----------
+    stripes : int
+        Количество блокировок данных тегов. По умолчанию — 64.
+    timestamps : TimestampMode
+        Хранение меток времени тегов (см. Tag.timestamps); применяется к тегам,
+        создаваемым после изменения. По умолчанию — "raw".
+    ingest : IngestMode
+        Прием точек тегами (см. Tag.ingest); применяется к тегам, создаваемым после
+        изменения. "sharded" убирает соперничество потоков-производителей за общие
+        блокировки групп тегов. По умолчанию — "locked".
+    naive_timezone : tzinfo
+        Часовой пояс меток времени без смещения (см. Tag.naive_timezone); применяется
+        к тегам, создаваемым после изменения. По умолчанию — UTC.
+
+    Методы
+    -------
+    get(tag_id: TagId, default: Optional[Tag] = None)
+        Возвращает тег по идентификатору.
+    index(tag_id: Union[TagId, Tag])
+        Возвращает индекс тега по идентификатору.
+    attributes(tag_id: TagId)
+        Возвращает атрибуты тега без создания экземпляра Tag.
+    active()
+        Возвращает созданные теги с накопленными данными.
+    pending()
+        Возвращает количество тегов с накопленными данными.
+    apply(tags_data: Iterable[dict])
+        Приводит реестр к новому списку тегов, сохраняя существующие экземпляры Tag.
+    compression_ratio()
+        Возвращает общий коэффициент сжатия точек созданных тегов.
+    clear_data()
+        Очищает данные всех созданных тегов.
+
+    Ошибки, исключения:
+    -------
+    KeyError: Если тег с указанным идентификатором не найден.
+    """
+
+    def __init__(
+        self,
+        tags_data: Iterable[dict] = (),
+        stripes: int = DEFAULT_STRIPES,
+        timestamps: TimestampMode = "raw",
+        ingest: IngestMode = "locked",
+        naive_timezone: tzinfo = timezone.utc,
+    ) -> None:
+        self.stripes = stripes
+        self.timestamps = timestamps
+        self.ingest = ingest
+        self.naive_timezone = naive_timezone
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._guard = threading.Lock()
+        self._dirty = DirtyTags()
+        self._ids: List[TagId] = []
+        self._attributes: List[dict] = []
+        self._index: Dict[str, int] = {}
+        for item in tags_data:
+            self._index[tag_key(item["id"])] = len(self._ids)
+            self._ids.append(item["id"])
+            self._attributes.append(item["attributes"])
+        self._tags: List[Optional[Tag]] = [None] * len(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[Tag, List[Tag]]:
+        if isinstance(position, slice):
+            return [self._tag(i) for i in range(*position.indices(len(self._ids)))]
+        if position < 0:
+            position += len(self._ids)
+        if not 0 <= position < len(self._ids):
+            raise IndexError("Индекс тега вне диапазона")
+        return self._tag(position)
+
+    def __iter__(self) -> Iterator[Tag]:
+        for i in range(len(self._ids)):
+            yield self._tag(i)
+
+    def __contains__(self, item: Union[TagId, Tag]) -> bool:
+        if isinstance(item, Tag):
+            item = item.id
+        return tag_key(item) in self._index
+
+    def __repr__(self) -> str:
+        return f"TagRegistry(tags={len(self)}, materialized={self.materialized})"
+
+    @property
+    def ids(self) -> List[TagId]:
+        """Идентификаторы тегов в порядке реестра."""
+        return list(self._ids)
+
+    @property
+    def materialized(self) -> int:
+        """Количество созданных экземпляров Tag."""
+        return sum(tag is not None for tag in self._tags)
+
+    def _tag(self, i: int) -> Tag:
+        tag = self._tags[i]
+        if tag is None:
+            with self._guard:
+                tag = self._tags[i]
+                if tag is None:
+                    attributes = self._attributes[i]
+                    tag = Tag.trusted(
+                        self._ids[i], attributes, lock=self._locks[i % self.stripes],
+                        compression=CompressionConfig.from_attributes(attributes),
+                        timestamps=self.timestamps, ingest=self.ingest,
+                        naive_timezone=self.naive_timezone,
+                    )
+                    tag.watch(self._dirty)
+                    self._tags[i] = tag
+        return tag
+
+    def index(self, tag_id: Union[TagId, Tag]) -> int:
+        """
+        Возвращает индекс тега по идентификатору. Идентификаторы-словари
+        сравниваются по содержимому.
+
+        Параметры:
+        ----------
+        tag_id (Union[TagId, Tag]): идентификатор тега или тег.
+
+        Возвращает:
+        ----------
+        int: индекс тега в реестре.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если тег не найден.
+        """
+        if isinstance(tag_id, Tag):
+            tag_id = tag_id.id
+        return self._index[tag_key(tag_id)]
+
+    def get(self, tag_id: TagId, default: Optional[Tag] = None) -> Optional[Tag]:
+        """
+        Возвращает тег по идентификатору, создавая экземпляр Tag при первом обращении.
+
+        Параметры:
+        ----------
+        tag_id (TagId): идентификатор тега.
+        default (Optional[Tag]): значение, если тег не найден. По умолчанию — None.
+
+        Возвращает:
+        ----------
+        Optional[Tag]: тег или default.
+        """
+        i = self._index.get(tag_key(tag_id))
+        return default if i is None else self._tag(i)
+
+    def attributes(self, tag_id: TagId) -> dict:
+        """
+        Возвращает атрибуты тега без создания экземпляра Tag.
+
+        Параметры:
+        ----------
+        tag_id (TagId): идентификатор тега.
+
+        Возвращает:
+        ----------
+        dict: атрибуты тега.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если тег не найден.
+        """
+        return self._attributes[self.index(tag_id)]
+
+    def active(self) -> List[Tag]:
+        """
+        Возвращает созданные теги с накопленными данными — аргумент для set_data,
+        не создающий экземпляры Tag для остальных тегов реестра. Перебираются только
+        теги, получившие данные после последней отправки.
+
+        Возвращает:
+        ----------
+        List[Tag]: теги с данными в порядке реестра.
+        """
+        with self._guard:
+            positions = []
+            for tag in self._dirty.tags():
+                i = self._index.get(tag_key(tag.id))
+                if i is not None and self._tags[i] is tag and tag.has_data():
+                    positions.append((i, tag))
+        positions.sort(key=lambda position: position[0])
+        return [tag for _, tag in positions]
+
+    def pending(self) -> int:
+        """
+        Возвращает количество тегов с накопленными данными без упорядочивания
+        и без перебора остальных тегов реестра.
+
+        Возвращает:
+        ----------
+        int: количество тегов с данными.
+        """
+        return sum(tag.has_data() for tag in self._dirty.tags())
+
+    def apply(self, tags_data: Iterable[dict]) -> Tuple[List[TagId], List[TagId]]:
+        """
+        Приводит реестр к новому списку тегов источника (изменения метаданных).
+        Экземпляры Tag сохранившихся тегов остаются прежними вместе с накопленными
+        данными, их атрибуты обновляются; при изменении атрибута "compression" сжатие
+        тега пересоздается по новым настройкам (Tag.set_compression). Добавленные теги
+        создаются при первом обращении, удаленные исключаются из реестра.
+
+        Параметры:
+        ----------
+        tags_data (Iterable[dict]): новые данные тегов — словари с ключами 'id' и 'attributes'.
+
+        Возвращает:
+        ----------
+        Tuple[List[TagId], List[TagId]]: идентификаторы добавленных и удаленных тегов.
+        """
+        ids: List[TagId] = []
+        attributes: List[dict] = []
+        tags: List[Optional[Tag]] = []
+        index: Dict[str, int] = {}
+        added: List[TagId] = []
+        recompressed: List[Tuple[Tag, Optional[CompressionConfig]]] = []
+        with self._guard:
+            for item in tags_data:
+                key = tag_key(item["id"])
+                old = self._index.get(key)
+                tag = None
+                if old is None:
+                    added.append(item["id"])
+                else:
+                    tag = self._tags[old]
+                    if tag is not None:
+                        tag.attributes = item["attributes"]
+                        compression = CompressionConfig.from_attributes(item["attributes"])
+                        if compression != CompressionConfig.from_attributes(self._attributes[old]):
+                            recompressed.append((tag, compression))
+                index[key] = len(ids)
+                ids.append(item["id"])
+                attributes.append(item["attributes"])
+                tags.append(tag)
+            removed = [tag_id for tag_id in self._ids if tag_key(tag_id) not in index]
+            for tag in self._tags:
+                if tag is not None and tag_key(tag.id) not in index:
+                    tag.unwatch(self._dirty)
+                    self._dirty.discard(tag)
+            self._ids, self._attributes, self._tags, self._index = ids, attributes, tags, index
+        for tag, compression in recompressed:
+            tag.set_compression(compression)
+        return added, removed
+
+    def compression_ratio(self) -> float:
+        """
+        Возвращает общий коэффициент сжатия точек созданных тегов со сжатием:
+        принятые точки на одну сохраненную. 1.0 — точки не сжимались.
+        """
+        compressors = [
+            tag.compressor for tag in self._tags if tag is not None and tag.compressor is not None
+        ]
+        points_out = sum(compressor.points_out for compressor in compressors)
+        if not points_out:
+            return 1.0
+        return sum(compressor.points_in for compressor in compressors) / points_out
+
+    def clear_data(self) -> None:
+        """Очищает данные всех созданных тегов."""
+        for tag in self._tags:
+            if tag is not None:
+                tag.clear_data()
@@ -0,0 +1,91 @@
+from typing import Optional
+
+import httpx
+from pydantic import BaseModel
+
+
+class TransportConfig(BaseModel):
+    """
+    Класс, представляющий настройки пула HTTP-соединений клиента.
+
+    Атрибуты
+    ----------
+    connect_timeout : Optional[float]
+        Таймаут установки соединения, секунды. По умолчанию — 5.
+    read_timeout : Optional[float]
+        Таймаут чтения ответа, секунды. По умолчанию — 5.
+    write_timeout : Optional[float]
+        Таймаут отправки запроса, секунды. По умолчанию — 5.
+    pool_timeout : Optional[float]
+        Таймаут ожидания свободного соединения в пуле, секунды. По умолчанию — 5.
+    max_connections : Optional[int]
+        Максимальное количество одновременных соединений. По умолчанию — 100.
+    max_keepalive_connections : Optional[int]
+        Максимальное количество простаивающих keep-alive соединений. По умолчанию — 20.
+    keepalive_expiry : Optional[float]
+        Время жизни простаивающего соединения, секунды. По умолчанию — 5.
+    http2 : bool
+        Использовать HTTP/2. Требует установленного пакета h2 (httpx[http2]).
+        По умолчанию — False.
+
+    Методы
+    -------
+    timeout()
+        Возвращает таймауты в виде httpx.Timeout.
+    limits()
+        Возвращает ограничения пула в виде httpx.Limits.
+    client_kwargs()
+        Возвращает параметры для создания httpx.Client и httpx.AsyncClient.
+    """
+
+    connect_timeout: Optional[float] = 5
+    read_timeout: Optional[float] = 5
+    write_timeout: Optional[float] = 5
+    pool_timeout: Optional[float] = 5
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+
+    def timeout(self) -> httpx.Timeout:
+        """
+        Возвращает таймауты по фазам запроса.
+
+        Возвращает:
+        ----------
+        httpx.Timeout: таймауты соединения, чтения, записи и ожидания пула.
+        """
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def limits(self) -> httpx.Limits:
+        """
+        Возвращает ограничения пула соединений.
+
+        Возвращает:
+        ----------
+        httpx.Limits: ограничения количества соединений и время жизни keep-alive.
+        """
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def client_kwargs(self) -> dict:
+        """
+        Возвращает параметры для создания HTTP-клиента httpx.
+
+        Возвращает:
+        ----------
+        dict: именованные аргументы для httpx.Client и httpx.AsyncClient.
+        """
+        return {
+            "timeout": self.timeout(),
+            "limits": self.limits(),
+            "http2": self.http2,
+        }
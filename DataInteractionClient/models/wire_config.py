@@ -0,0 +1,29 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class WireConfig(BaseModel):
+    """
+    Класс, представляющий настройки кодирования запросов к платформе.
+
+    Атрибуты
+    ----------
+    mode : Literal["query", "json"]
+        Способ передачи параметров запроса. "query" — в строке запроса URL
+        (совместимо со старыми версиями платформы), "json" — в теле запроса в формате JSON.
+        По умолчанию — "query".
+    compress_threshold : Optional[int]
+        Минимальный размер тела запроса в байтах, начиная с которого тело сжимается.
+        Применяется только в режиме "json". None — не сжимать. По умолчанию — None.
+    compress_encoding : Literal["gzip", "deflate"]
+        Алгоритм сжатия тела запроса. По умолчанию — "gzip".
+    codec : Literal["auto", "json", "orjson", "msgspec"]
+        Кодек JSON для тела запроса и разбора ответов. "auto" — orjson, если установлен,
+        иначе msgspec, иначе стандартный json. По умолчанию — "auto".
+    """
+
+    mode: Literal["query", "json"] = "query"
+    compress_threshold: Optional[int] = None
+    compress_encoding: Literal["gzip", "deflate"] = "gzip"
+    codec: Literal["auto", "json", "orjson", "msgspec"] = "auto"
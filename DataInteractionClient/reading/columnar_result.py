@@ -0,0 +1,281 @@
+import json
+from datetime import timezone, tzinfo
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from buffers.columnar_buffer import ColumnarBuffer
+from reading.fan_out import TagId, tag_key
+from serialization.codecs import Codec
+from serialization.timestamps import parse_iso_many
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def _require(module, name: str):
+    if module is None:
+        raise ImportError(f"Для экспорта требуется пакет {name}")
+    return module
+
+
+class ColumnarResult:
+    """
+    Класс, представляющий ответ get_data в колоночном виде: для каждого тега
+    метки времени (целые микросекунды), значения и качество хранятся в колонках
+    ColumnarBuffer вместо списка словарей.
+
+    Атрибуты
+    ----------
+    tag_ids : List[TagId]
+        Идентификаторы тегов в порядке ответа.
+    series : List[ColumnarBuffer]
+        Колонки данных тегов в том же порядке.
+
+    Методы
+    -------
+    items()
+        Возвращает пары (идентификатор тега, колонки).
+    to_numpy()
+        Возвращает колонки тегов массивами numpy.
+    to_pandas()
+        Возвращает данные всех тегов таблицей pandas.DataFrame.
+    to_arrow()
+        Возвращает данные всех тегов таблицей pyarrow.Table.
+    """
+
+    __slots__ = ("tag_ids", "series", "_index")
+
+    def __init__(self, tag_ids: List[TagId], series: List[ColumnarBuffer]) -> None:
+        self.tag_ids = tag_ids
+        self.series = series
+        self._index = {tag_key(tag_id): i for i, tag_id in enumerate(tag_ids)}
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def __getitem__(self, tag_id: TagId) -> ColumnarBuffer:
+        return self.series[self._index[tag_key(tag_id)]]
+
+    def __contains__(self, tag_id: TagId) -> bool:
+        return tag_key(tag_id) in self._index
+
+    @property
+    def points(self) -> int:
+        """Общее количество точек."""
+        return sum(len(buffer) for buffer in self.series)
+
+    def items(self) -> Iterator[Tuple[TagId, ColumnarBuffer]]:
+        """Возвращает пары (идентификатор тега, колонки) в порядке ответа."""
+        return zip(self.tag_ids, self.series)
+
+    def to_numpy(self) -> Dict[str, Dict[str, "numpy.ndarray"]]:
+        """
+        Возвращает колонки тегов массивами numpy. Колонки array передаются
+        без копирования через протокол буфера.
+
+        Возвращает:
+        ----------
+        Dict[str, Dict[str, numpy.ndarray]]: {ключ тега: {"x", "y", "q"}}.
+            Ключ тега — идентификатор или JSON идентификатора-словаря.
+
+        Ошибки, исключения:
+        -------
+        ImportError: Если numpy не установлен.
+        """
+        np = _require(numpy, "numpy")
+        return {
+            tag_key(tag_id): {
+                name: np.asarray(getattr(buffer, column))
+                for name, column in (("x", "xs"), ("y", "ys"), ("q", "qs"))
+            }
+            for tag_id, buffer in self.items()
+        }
+
+    def _long_columns(self) -> Tuple[list, list, list, list]:
+        tag_column, xs, ys, qs = [], [], [], []
+        for tag_id, buffer in self.items():
+            key = tag_id if isinstance(tag_id, str) else json.dumps(tag_id, sort_keys=True)
+            tag_column.extend([key] * len(buffer))
+            xs.extend(buffer.xs)
+            ys.extend(buffer.ys)
+            qs.extend(buffer.qs)
+        return tag_column, xs, ys, qs
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """
+        Возвращает данные всех тегов таблицей в длинном формате:
+        колонки tagId, x (время UTC), y, q.
+
+        Возвращает:
+        ----------
+        pandas.DataFrame: таблица данных.
+
+        Ошибки, исключения:
+        -------
+        ImportError: Если pandas не установлен.
+        """
+        pd = _require(pandas, "pandas")
+        tag_column, xs, ys, qs = self._long_columns()
+        return pd.DataFrame({
+            "tagId": pd.Categorical(tag_column),
+            "x": pd.to_datetime(xs, unit="us", utc=True),
+            "y": ys,
+            "q": qs,
+        })
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Возвращает данные всех тегов таблицей Arrow в длинном формате:
+        колонки tagId (словарная строка), x (timestamp[us, UTC]), y, q.
+
+        Возвращает:
+        ----------
+        pyarrow.Table: таблица данных.
+
+        Ошибки, исключения:
+        -------
+        ImportError: Если pyarrow не установлен.
+        """
+        pa = _require(pyarrow, "pyarrow")
+        tag_column, xs, ys, qs = self._long_columns()
+        return pa.table({
+            "tagId": pa.array(tag_column).dictionary_encode(),
+            "x": pa.array(xs, type=pa.timestamp("us", tz="UTC")),
+            "y": pa.array(ys),
+            "q": pa.array(qs),
+        })
+
+
+def _columns(xs: list, ys: list, qs: list, naive_timezone: tzinfo) -> ColumnarBuffer:
+    buffer = ColumnarBuffer()
+    if xs:
+        if isinstance(xs[0], str):
+            xs = parse_iso_many(xs, naive_timezone)
+        buffer.extend(xs, ys, qs)
+    return buffer
+
+
+def _points_columns(points: List[dict], naive_timezone: tzinfo) -> ColumnarBuffer:
+    return _columns(
+        [point["x"] for point in points], [point["y"] for point in points],
+        [point.get("q", 0) for point in points], naive_timezone,
+    )
+
+
+def decode_columnar(
+    entries: List[dict], naive_timezone: tzinfo = timezone.utc
+) -> ColumnarResult:
+    """
+    Преобразует данные ответа get_data в колоночный вид. Списки точек каждого тега
+    освобождаются сразу после преобразования, строковые метки времени (format_param)
+    разбираются в микросекунды функцией parse_iso_many. Элементы, уже преобразованные
+    при разборе ответа (load_columnar), передаются без копирования.
+
+    Параметры:
+    ----------
+    entries (List[dict]): данные ответа — элементы {"tagId", "data"}.
+    naive_timezone (tzinfo): часовой пояс строковых меток времени без смещения.
+        По умолчанию — UTC.
+
+    Возвращает:
+    ----------
+    ColumnarResult: колонки данных тегов.
+    """
+    tag_ids, series = [], []
+    for entry in entries:
+        points = entry.pop("data", None) or []
+        if not isinstance(points, ColumnarBuffer):
+            points = _points_columns(points, naive_timezone)
+        tag_ids.append(entry.get("tagId"))
+        series.append(points)
+    return ColumnarResult(tag_ids, series)
+
+
+if msgspec is not None:
+
+    class _Point(msgspec.Struct, gc=False):
+        x: Any
+        y: Any
+        q: Any = 0
+
+    class _Entry(msgspec.Struct):
+        tagId: Any = None
+        data: Optional[List[_Point]] = None
+
+        def __post_init__(self) -> None:
+            # Вызывается при разборе сразу после точек тега: объекты точек освобождаются
+            # до разбора следующего тега, остаются только колонки.
+            points = self.data or ()
+            self.data = (
+                [point.x for point in points], [point.y for point in points],
+                [point.q for point in points],
+            )
+
+    class _Response(msgspec.Struct):
+        error: Any
+        data: Optional[List[_Entry]] = None
+
+    _DECODER = msgspec.json.Decoder(_Response)
+
+
+def load_columnar(
+    response: httpx.Response, codec: Codec, naive_timezone: tzinfo = timezone.utc
+) -> dict:
+    """
+    Разбирает тело ответа get_data, преобразуя точки каждого тега в колонки
+    ColumnarBuffer по ходу разбора: кодеки "json" (object_hook) и "msgspec" (типизированный
+    разбор) не создают словари точек всего ответа одновременно, поэтому пиковая память
+    ограничена точками одного тега. Кодек "orjson" не поддерживает обработку объектов
+    при разборе: ответ разбирается целиком и преобразуется после разбора.
+
+    Параметры:
+    ----------
+    response (httpx.Response): ответ платформы.
+    codec (Codec): кодек JSON клиента.
+    naive_timezone (tzinfo): часовой пояс строковых меток времени без смещения.
+        По умолчанию — UTC.
+
+    Возвращает:
+    ----------
+    dict: ответ платформы, в элементах "data" которого точки тегов заменены на ColumnarBuffer.
+    """
+    if codec.name == "msgspec":
+        decoded = _DECODER.decode(response.content)
+        payload = {"error": decoded.error}
+        if decoded.data is not None:
+            payload["data"] = entries = []
+            for entry in decoded.data:
+                columns, entry.data = entry.data, None
+                entries.append({"tagId": entry.tagId, "data": _columns(*columns, naive_timezone)})
+        return payload
+    if codec.name == "json":
+
+        def entry_hook(obj: dict) -> dict:
+            points = obj.get("data")
+            if type(points) is list and "tagId" in obj:
+                obj["data"] = _points_columns(points, naive_timezone)
+            return obj
+
+        return response.json(object_hook=entry_hook)
+    payload = codec.load_response(response)
+    for entry in payload.get("data") or ():
+        entry["data"] = _points_columns(entry.get("data") or [], naive_timezone)
+    return payload
@@ -0,0 +1,131 @@
+import json
+from typing import Dict, List, Optional, Union
+
+from models.data_many_result import DataManyResult, TagSeries
+
+TagId = Union[str, dict]
+
+
+class SubQuery:
+    """
+    Класс, представляющий один запрос get_data, на которые разбит get_data_many.
+
+    Атрибуты
+    ----------
+    tag_ids : List[TagId]
+        Группа тегов запроса.
+    from_time : Optional[Union[str, int]]
+        Начало окна.
+    to_time : Optional[Union[str, int]]
+        Конец окна.
+    window_index : int
+        Порядковый номер окна по времени.
+    """
+
+    __slots__ = ("tag_ids", "from_time", "to_time", "window_index")
+
+    def __init__(
+        self,
+        tag_ids: List[TagId],
+        from_time: Optional[Union[str, int]],
+        to_time: Optional[Union[str, int]],
+        window_index: int = 0,
+    ) -> None:
+        self.tag_ids = tag_ids
+        self.from_time = from_time
+        self.to_time = to_time
+        self.window_index = window_index
+
+
+def tag_key(tag_id: TagId) -> str:
+    """
+    Возвращает ключ тега для сопоставления ответа с запросом.
+    Идентификаторы-словари сравниваются по содержимому.
+    """
+    if isinstance(tag_id, dict):
+        return json.dumps(tag_id, sort_keys=True)
+    return tag_id
+
+
+def plan_queries(
+    tag_ids: List[TagId],
+    from_time: Optional[Union[str, int]],
+    to_time: Optional[Union[str, int]],
+    tags_per_request: int,
+    window: Optional[int] = None,
+) -> List[SubQuery]:
+    """
+    Разбивает запрос данных многих тегов на запросы по группам тегов и окнам по времени.
+
+    Параметры:
+    ----------
+    tag_ids (List[TagId]): идентификаторы тегов.
+    from_time (Optional[Union[str, int]]): начало периода; при заданном window — микросекунды.
+    to_time (Optional[Union[str, int]]): конец периода включительно; при заданном window — микросекунды.
+    tags_per_request (int): максимальное количество тегов в одном запросе.
+    window (Optional[int]): размер окна по времени, микросекунды. None — без разбиения по времени.
+
+    Возвращает:
+    ----------
+    List[SubQuery]: запросы.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если tags_per_request или window не положительны.
+    """
+    if tags_per_request <= 0:
+        raise ValueError("tags_per_request должен быть положительным")
+    windows = [(from_time, to_time)]
+    if window is not None:
+        if window <= 0:
+            raise ValueError("Размер окна должен быть положительным")
+        windows = [
+            (start, min(start + window - 1, to_time))
+            for start in range(from_time, to_time + 1, window)
+        ]
+    return [
+        SubQuery(tag_ids[i:i + tags_per_request], start, end, index)
+        for index, (start, end) in enumerate(windows)
+        for i in range(0, len(tag_ids), tags_per_request)
+    ]
+
+
+def merge_results(
+    tag_ids: List[TagId],
+    queries: List[SubQuery],
+    results: List[Union[List[dict], BaseException]],
+) -> DataManyResult:
+    """
+    Собирает ответы запросов в ряды тегов: точки каждого тега объединяются в порядке окон,
+    ошибка запроса относится ко всем тегам его группы.
+
+    Параметры:
+    ----------
+    tag_ids (List[TagId]): идентификаторы тегов в порядке запроса.
+    queries (List[SubQuery]): выполненные запросы.
+    results (List[Union[List[dict], BaseException]]): данные ответа или ошибка каждого запроса.
+
+    Возвращает:
+    ----------
+    DataManyResult: ряды тегов в порядке tag_ids.
+    """
+    parts: Dict[str, List[tuple]] = {tag_key(tag_id): [] for tag_id in tag_ids}
+    errors: Dict[str, BaseException] = {}
+    for query, result in zip(queries, results):
+        if isinstance(result, BaseException):
+            for tag_id in query.tag_ids:
+                errors.setdefault(tag_key(tag_id), result)
+            continue
+        for entry in result:
+            key = tag_key(entry.get("tagId"))
+            if key in parts:
+                parts[key].append((query.window_index, entry.get("data") or []))
+    series = []
+    for tag_id in tag_ids:
+        key = tag_key(tag_id)
+        windows = sorted(parts[key], key=lambda part: part[0])
+        data = windows[0][1] if len(windows) == 1 else [
+            point for _, points in windows for point in points
+        ]
+        series.append(TagSeries.model_construct(tag_id=tag_id, data=data, error=errors.get(key)))
+    return DataManyResult.model_construct(series=series)
@@ -0,0 +1,297 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import timezone, tzinfo
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+from reading.fan_out import TagId, tag_key
+from serialization.chunking import estimate_point_bytes
+from serialization.timestamps import to_microseconds
+
+Interval = Tuple[int, int]
+
+# Оценка объема точки-словаря {"x", "y", "q"} в памяти интерпретатора, байты.
+POINT_MEMORY_BYTES = 240
+
+
+class CachedSegment:
+    """
+    Класс, представляющий прочитанный с платформы интервал данных одного тега.
+
+    Атрибуты
+    ----------
+    start : int
+        Начало интервала включительно, микросекунды.
+    end : int
+        Конец интервала включительно, микросекунды.
+    points : List[dict]
+        Точки интервала в порядке времени.
+    xs : List[int]
+        Метки времени точек в микросекундах для поиска по интервалу.
+    expires_at : Optional[float]
+        Момент time.monotonic(), после которого интервал устаревает. None — не устаревает.
+    point_bytes : float
+        Оценочный объем JSON-представления одной точки, байты.
+    """
+
+    __slots__ = ("start", "end", "points", "xs", "expires_at", "point_bytes")
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        points: List[dict],
+        xs: List[int],
+        expires_at: Optional[float],
+    ) -> None:
+        self.start = start
+        self.end = end
+        self.points = points
+        self.xs = xs
+        self.expires_at = expires_at
+        self.point_bytes = estimate_point_bytes(points) if points else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Оценочный объем интервала в памяти, байты."""
+        return len(self.points) * POINT_MEMORY_BYTES
+
+    def count(self, start: int, end: int) -> int:
+        """Возвращает количество точек интервала в пределах [start, end]."""
+        return bisect_right(self.xs, end) - bisect_left(self.xs, start)
+
+    def slice(self, start: int, end: int) -> List[dict]:
+        """Возвращает точки интервала в пределах [start, end]."""
+        return self.points[bisect_left(self.xs, start):bisect_right(self.xs, end)]
+
+
+class RangeCache:
+    """
+    Класс, представляющий локальный кеш get_data с учетом интервалов времени.
+    Для каждого тега и набора параметров запроса (format_param, value) хранит
+    прочитанные интервалы записанных точек (запросы actual=True): полностью покрытый
+    запрос обслуживается локально, для частично покрытого с платформы читаются только
+    недостающие интервалы.
+    Последние recent_window микросекунд прочитанного интервала («хвост», который еще
+    может измениться) устаревают через recent_ttl секунд. При превышении max_bytes
+    вытесняются ряды тегов, к которым дольше всего не обращались. Потокобезопасен.
+
+    Атрибуты
+    ----------
+    max_bytes : int
+        Максимальный оценочный объем кеша в памяти, байты. По умолчанию — 64 МиБ.
+    recent_window : int
+        Длительность «хвоста» перед моментом чтения, микросекунды. По умолчанию — 60 секунд.
+    recent_ttl : float
+        Время жизни «хвоста», секунды. По умолчанию — 5.
+    hits : int
+        Количество запросов тегов, полностью обслуженных из кеша.
+    partial_hits : int
+        Количество запросов тегов, для которых прочитаны только недостающие интервалы.
+    misses : int
+        Количество запросов тегов, полностью прочитанных с платформы.
+    bytes_saved : int
+        Оценочный объем данных, не запрошенных с платформы благодаря кешу, байты.
+    evictions : int
+        Количество вытесненных рядов тегов.
+
+    Методы
+    -------
+    plan(tag_ids: List[TagId], start: int, end: int, options: Hashable)
+        Определяет недостающие интервалы и группирует теги с одинаковыми интервалами.
+    store(tag_id: TagId, options: Hashable, start: int, end: int, points: List[dict])
+        Сохраняет прочитанный интервал тега.
+    assemble(tag_ids: List[TagId], start: int, end: int, options: Hashable)
+        Собирает ответ get_data из кеша и вытесняет ряды сверх max_bytes.
+    clear()
+        Очищает кеш.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 << 20,
+        recent_window: int = 60_000_000,
+        recent_ttl: float = 5.0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.recent_window = recent_window
+        self.recent_ttl = recent_ttl
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self._series: "OrderedDict[Hashable, List[CachedSegment]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Текущий оценочный объем кеша в памяти, байты."""
+        return self._bytes
+
+    def clear(self) -> None:
+        """Очищает кеш. Счетчики сохраняются."""
+        with self._lock:
+            self._series.clear()
+            self._bytes = 0
+
+    def _segments(self, key: Hashable) -> List[CachedSegment]:
+        segments = self._series.get(key)
+        if segments is None:
+            return []
+        self._series.move_to_end(key)
+        now = time.monotonic()
+        fresh = [s for s in segments if s.expires_at is None or s.expires_at > now]
+        if len(fresh) != len(segments):
+            self._bytes -= sum(s.nbytes for s in segments) - sum(s.nbytes for s in fresh)
+            self._series[key] = fresh
+        return fresh
+
+    def plan(
+        self, tag_ids: List[TagId], start: int, end: int, options: Hashable
+    ) -> Dict[Tuple[Interval, ...], List[TagId]]:
+        """
+        Определяет интервалы [start, end], которых нет в кеше, и группирует теги
+        с одинаковыми недостающими интервалами, чтобы читать их одним запросом.
+        Обновляет счетчики попаданий.
+
+        Параметры:
+        ----------
+        tag_ids (List[TagId]): идентификаторы тегов.
+        start (int): начало периода включительно, микросекунды.
+        end (int): конец периода включительно, микросекунды.
+        options (Hashable): параметры запроса, влияющие на данные.
+
+        Возвращает:
+        ----------
+        Dict[Tuple[Interval, ...], List[TagId]]: теги по недостающим интервалам.
+            Теги, полностью покрытые кешем, не возвращаются.
+        """
+        groups: Dict[Tuple[Interval, ...], List[TagId]] = {}
+        with self._lock:
+            for tag_id in tag_ids:
+                gaps, cursor = [], start
+                for segment in self._segments((tag_key(tag_id), options)):
+                    if segment.end < cursor or segment.start > end:
+                        continue
+                    if segment.start > cursor:
+                        gaps.append((cursor, segment.start - 1))
+                    self.bytes_saved += int(
+                        segment.count(max(cursor, segment.start), min(end, segment.end))
+                        * segment.point_bytes
+                    )
+                    cursor = segment.end + 1
+                    if cursor > end:
+                        break
+                if cursor <= end:
+                    gaps.append((cursor, end))
+                if not gaps:
+                    self.hits += 1
+                    continue
+                if gaps == [(start, end)]:
+                    self.misses += 1
+                else:
+                    self.partial_hits += 1
+                groups.setdefault(tuple(gaps), []).append(tag_id)
+        return groups
+
+    def store(
+        self,
+        tag_id: TagId,
+        options: Hashable,
+        start: int,
+        end: int,
+        points: List[dict],
+        naive_timezone: tzinfo = timezone.utc,
+    ) -> None:
+        """
+        Сохраняет прочитанный интервал тега. Часть интервала позже
+        «момент чтения − recent_window» устаревает через recent_ttl секунд.
+        Вытеснение по max_bytes выполняется при следующем вызове assemble.
+
+        Параметры:
+        ----------
+        tag_id (TagId): идентификатор тега.
+        options (Hashable): параметры запроса, влияющие на данные.
+        start (int): начало интервала включительно, микросекунды.
+        end (int): конец интервала включительно, микросекунды.
+        points (List[dict]): точки интервала в порядке времени.
+        naive_timezone (tzinfo): часовой пояс строковых меток времени без смещения.
+            По умолчанию — UTC.
+        """
+        xs = [to_microseconds(point["x"], naive_timezone) for point in points]
+        boundary = time.time_ns() // 1000 - self.recent_window
+        split = bisect_left(xs, boundary)
+        segments = []
+        if start < boundary:
+            segments.append(
+                CachedSegment(start, min(end, boundary - 1), points[:split], xs[:split], None)
+            )
+        if end >= boundary:
+            expires_at = time.monotonic() + self.recent_ttl
+            segments.append(
+                CachedSegment(max(start, boundary), end, points[split:], xs[split:], expires_at)
+            )
+        key = (tag_key(tag_id), options)
+        with self._lock:
+            current = self._segments(key)
+            kept = [s for s in current if s.end < start or s.start > end]
+            self._bytes -= sum(s.nbytes for s in current) - sum(s.nbytes for s in kept)
+            kept.extend(segments)
+            kept.sort(key=lambda s: s.start)
+            self._series[key] = kept
+            self._series.move_to_end(key)
+            self._bytes += sum(s.nbytes for s in segments)
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._series:
+            key, segments = next(iter(self._series.items()))
+            del self._series[key]
+            self._bytes -= sum(s.nbytes for s in segments)
+            self.evictions += 1
+
+    def assemble(
+        self, tag_ids: List[TagId], start: int, end: int, options: Hashable
+    ) -> List[dict]:
+        """
+        Собирает ответ get_data из кеша и вытесняет ряды сверх max_bytes.
+
+        Параметры:
+        ----------
+        tag_ids (List[TagId]): идентификаторы тегов.
+        start (int): начало периода включительно, микросекунды.
+        end (int): конец периода включительно, микросекунды.
+        options (Hashable): параметры запроса, влияющие на данные.
+
+        Возвращает:
+        ----------
+        List[dict]: элементы {"tagId", "data"} в порядке tag_ids.
+        """
+        result = []
+        with self._lock:
+            for tag_id in tag_ids:
+                segments = self._series.get((tag_key(tag_id), options), [])
+                data = [
+                    point
+                    for segment in segments
+                    if segment.end >= start and segment.start <= end
+                    for point in segment.slice(start, end)
+                ]
+                result.append({"tagId": tag_id, "data": data})
+            # Вытеснение после сборки ответа: ряды текущего запроса уже прочитаны.
+            self._evict()
+        return result
+
+
+def cache_options(
+    value: Optional[Union[type, List[type]]],
+    format_param: Optional[bool],
+    naive_timezone: tzinfo,
+) -> Hashable:
+    """
+    Возвращает ключ параметров запроса get_data, влияющих на возвращаемые данные
+    и на разбор их меток времени.
+    """
+    return repr(value), format_param, naive_timezone
@@ -0,0 +1,93 @@
+from typing import List, Optional, Tuple
+
+Window = Tuple[int, int]
+
+
+class WindowPlanner:
+    """
+    Класс, представляющий план постраничного чтения истории окнами по времени без операций
+    ввода-вывода. Выдает очередное окно [start, end] и по ответу платформы решает,
+    какие точки окна приняты и где начинается следующее окно.
+    Если для какого-либо тега в окне вернулось max_count точек, ответ мог быть усечен:
+    принимаются только точки не позже последней точки такого тега, следующее окно
+    начинается сразу после нее, а размер окна уменьшается до фактически покрытого.
+    Если окна заполнены меньше чем наполовину, размер окна удваивается.
+
+    Атрибуты
+    ----------
+    start : int
+        Начало следующего окна, микросекунды.
+    to_time : int
+        Конец запрашиваемого периода включительно, микросекунды.
+    window : int
+        Текущий размер окна, микросекунды.
+    max_count : Optional[int]
+        Максимальное количество точек тега в ответе. None — ответы не усекаются
+        и размер окна не меняется.
+    max_window : Optional[int]
+        Максимальный размер окна при увеличении, микросекунды. None — без ограничения.
+    """
+
+    def __init__(
+        self,
+        from_time: int,
+        to_time: int,
+        window: int,
+        max_count: Optional[int] = None,
+        max_window: Optional[int] = None,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("Размер окна должен быть положительным")
+        self.start = from_time
+        self.to_time = to_time
+        self.window = window
+        self.max_count = max_count
+        self.max_window = max_window
+
+    def done(self) -> bool:
+        """Проверяет, что весь период прочитан."""
+        return self.start > self.to_time
+
+    def peek(self) -> Window:
+        """
+        Возвращает следующее окно, не продвигая план.
+
+        Возвращает:
+        ----------
+        Window: границы окна (start, end) включительно, микросекунды.
+        """
+        return self.start, min(self.start + self.window - 1, self.to_time)
+
+    def accept(self, window: Window, entries: List[dict]) -> List[dict]:
+        """
+        Принимает ответ платформы на окно и продвигает план.
+
+        Параметры:
+        ----------
+        window (Window): окно, для которого получен ответ.
+        entries (List[dict]): данные ответа — элементы {"tagId", "data"}.
+
+        Возвращает:
+        ----------
+        List[dict]: элементы ответа с точками, принятыми в этом окне.
+        """
+        start, end = window
+        cutoff, saturated, fullest = end, False, 0
+        for entry in entries:
+            points = entry.get("data") or []
+            fullest = max(fullest, len(points))
+            if self.max_count is not None and len(points) >= self.max_count:
+                saturated = True
+                cutoff = min(cutoff, max(points[-1]["x"], start))
+        if saturated:
+            entries = [
+                {**entry, "data": [point for point in entry.get("data") or [] if point["x"] <= cutoff]}
+                for entry in entries
+            ]
+            self.window = cutoff - start + 1
+        elif self.max_count is not None and fullest * 2 < self.max_count and end < self.to_time:
+            self.window *= 2
+            if self.max_window is not None:
+                self.window = min(self.window, self.max_window)
+        self.start = cutoff + 1
+        return entries
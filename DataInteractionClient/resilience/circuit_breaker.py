@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Callable, List, Literal
+
+from exceptions.circuit_open_exception import CircuitOpenException
+from models.circuit_breaker_config import CircuitBreakerConfig
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """
+    Класс, представляющий автоматический выключатель запросов к платформе.
+    Пока платформа доступна, выключатель замкнут ("closed"). После failure_threshold
+    ошибок недоступности подряд он размыкается ("open") и сразу отклоняет запросы.
+    Через reset_timeout выключатель переходит в полуразомкнутое состояние ("half_open")
+    и пропускает ограниченное количество пробных запросов: успех замыкает его, ошибка
+    снова размыкает. Потокобезопасен.
+
+    Атрибуты
+    ----------
+    config : CircuitBreakerConfig
+        Настройки выключателя.
+    state : CircuitState
+        Текущее состояние.
+    listeners : List[Callable[[CircuitState, CircuitState], None]]
+        Обработчики смены состояния, принимают (старое состояние, новое состояние).
+
+    Методы
+    -------
+    before_call()
+        Проверяет, можно ли выполнить запрос.
+    record_success()
+        Учитывает успешный запрос.
+    record_failure()
+        Учитывает ошибку недоступности платформы.
+    release_probe()
+        Возвращает место пробного запроса, прерванного без ответа.
+
+    Ошибки, исключения:
+    -------
+    CircuitOpenException: Если выключатель разомкнут.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig) -> None:
+        self.config = config
+        self.state: CircuitState = "closed"
+        self.listeners: List[Callable[[CircuitState, CircuitState], None]] = []
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Проверяет, можно ли выполнить запрос, и учитывает пробный запрос
+        в полуразомкнутом состоянии.
+
+        Ошибки, исключения:
+        -------
+        CircuitOpenException: Если выключатель разомкнут или лимит пробных запросов исчерпан.
+        """
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.config.reset_timeout:
+                    raise CircuitOpenException()
+                self._set_state("half_open")
+                self._half_open_calls = 0
+            if self.state == "half_open":
+                if self._half_open_calls >= self.config.half_open_max_calls:
+                    raise CircuitOpenException()
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Учитывает запрос, на который платформа ответила."""
+        with self._lock:
+            self._failures = 0
+            if self.state != "closed":
+                self._set_state("closed")
+
+    def record_failure(self) -> None:
+        """Учитывает ошибку недоступности платформы."""
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self._failures >= self.config.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._set_state("open")
+
+    def release_probe(self) -> None:
+        """
+        Возвращает место пробного запроса, учтенного before_call, если запрос прерван
+        без результата (отмена задачи, таймаут asyncio.wait_for): иначе выключатель
+        остался бы полуразомкнутым без свободных мест для пробных запросов.
+        """
+        with self._lock:
+            if self.state == "half_open" and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def _set_state(self, state: CircuitState) -> None:
+        previous, self.state = self.state, state
+        for listener in self.listeners:
+            listener(previous, state)
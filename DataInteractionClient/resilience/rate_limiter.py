@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from exceptions.rate_limit_exceeded_exception import RateLimitExceededException
+from models.rate_limit_config import RateLimitConfig
+
+# Доля разницы, на которую наименьшая наблюдаемая длительность запроса смещается к более
+# долгим запросам: порог длительности следует за устойчивым ростом задержки сети.
+BASELINE_DRIFT = 0.01
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """
+    Класс, представляющий ограничитель запросов к платформе: «ведро токенов» ограничивает
+    среднюю частоту попыток, а адаптивное ограничение количества одновременных запросов (AIMD)
+    подстраивается под состояние платформы. Успешный запрос при полной загрузке увеличивает
+    ограничение аддитивно, признак перегрузки — ошибка недоступности (см. RetryPolicy.is_retryable)
+    или запрос дольше порога длительности — уменьшает его мультипликативно, не чаще
+    одного раза за длительность запроса.
+
+    Потокобезопасен; один экземпляр можно передать нескольким клиентам, синхронным
+    и асинхронным, чтобы они делили общий лимит.
+
+    Атрибуты
+    ----------
+    config : RateLimitConfig
+        Настройки ограничителя.
+    limit : float
+        Текущее ограничение количества одновременных запросов.
+    in_flight : int
+        Количество выполняющихся запросов.
+    min_latency : Optional[float]
+        Наименьшая наблюдаемая длительность успешного запроса, секунды.
+    throttled : int
+        Количество запросов, ожидавших разрешения.
+    rejected : int
+        Количество запросов, не получивших разрешения за max_wait.
+    overloads : int
+        Количество запросов с признаком перегрузки.
+
+    Методы
+    -------
+    acquire()
+        Ожидает разрешения на запрос.
+    aacquire()
+        Асинхронно ожидает разрешения на запрос.
+    release(latency: Optional[float] = None, overloaded: bool = False)
+        Возвращает разрешение и учитывает результат запроса.
+
+    Ошибки, исключения:
+    -------
+    RateLimitExceededException: Если разрешение не получено за config.max_wait.
+    """
+
+    def __init__(self, config: Optional[RateLimitConfig] = None) -> None:
+        self.config = config or RateLimitConfig()
+        self.limit = float(self.config.initial_concurrency)
+        self.in_flight = 0
+        self.min_latency: Optional[float] = None
+        self.throttled = 0
+        self.rejected = 0
+        self.overloads = 0
+        self._tokens = float(self.config.burst)
+        self._refilled_at = time.monotonic()
+        self._decreased_at = float("-inf")
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(concurrency={self.concurrency}, in_flight={self.in_flight})"
+
+    @property
+    def concurrency(self) -> int:
+        """Текущее целое ограничение количества одновременных запросов."""
+        return max(self.config.min_concurrency, int(self.limit))
+
+    def acquire(self) -> None:
+        """
+        Ожидает токен частоты и свободное место среди одновременных запросов.
+
+        Ошибки, исключения:
+        -------
+        RateLimitExceededException: Если разрешение не получено за config.max_wait.
+        """
+        deadline = self._deadline()
+        wait = self._reserve_token(deadline)
+        if wait:
+            time.sleep(wait)
+        with self._lock:
+            counted = wait > 0
+            while self.in_flight >= self.concurrency or self._waiters:
+                if not counted:
+                    self.throttled += 1
+                    counted = True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.rejected += 1
+                    raise RateLimitExceededException()
+                self._released.wait(remaining)
+            self.in_flight += 1
+
+    async def aacquire(self) -> None:
+        """
+        Асинхронно ожидает токен частоты и свободное место среди одновременных запросов,
+        не блокируя цикл событий.
+
+        Ошибки, исключения:
+        -------
+        RateLimitExceededException: Если разрешение не получено за config.max_wait.
+        """
+        deadline = self._deadline()
+        wait = self._reserve_token(deadline)
+        if wait:
+            await asyncio.sleep(wait)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self.in_flight < self.concurrency and not self._waiters:
+                self.in_flight += 1
+                return
+            if not wait:
+                self.throttled += 1
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self.rejected += 1
+                raise RateLimitExceededException()
+            # Ожидания обслуживаются по очереди: release передает место первому из них.
+            entry = (loop, loop.create_future())
+            self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(entry[1], remaining)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if entry in self._waiters:
+                    # Ожидания и потоки за снятым ожиданием проверяют свободные места заново.
+                    self._waiters.remove(entry)
+                    self.rejected += 1
+                    self._grant()
+                    raise RateLimitExceededException()
+            # Место передано одновременно с истечением времени ожидания.
+        except BaseException:
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                else:
+                    self.in_flight -= 1
+                self._grant()
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Возвращает разрешение, полученное acquire или aacquire, и подстраивает ограничение
+        по результату запроса.
+
+        Параметры:
+        ----------
+        latency (Optional[float]): длительность запроса, секунды. None — запрос не выполнялся,
+            ограничение не меняется.
+        overloaded (bool): запрос завершился ошибкой недоступности платформы.
+            По умолчанию — False.
+        """
+        with self._lock:
+            full = self.in_flight >= self.concurrency
+            self.in_flight -= 1
+            if latency is not None:
+                self._adapt(latency, overloaded, full)
+            self._grant()
+
+    def _deadline(self) -> Optional[float]:
+        max_wait = self.config.max_wait
+        return None if max_wait is None else time.monotonic() + max_wait
+
+    def _reserve_token(self, deadline: Optional[float]) -> float:
+        """Резервирует токен частоты и возвращает время ожидания до него, секунды."""
+        rate = self.config.rate
+        if rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.config.burst), self._tokens + (now - self._refilled_at) * rate
+            )
+            self._refilled_at = now
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / rate
+            if deadline is not None and now + wait > deadline:
+                self.rejected += 1
+                raise RateLimitExceededException()
+            self._tokens -= 1
+            if wait:
+                self.throttled += 1
+            return wait
+
+    def _adapt(self, latency: float, overloaded: bool, full: bool) -> None:
+        config = self.config
+        if not overloaded:
+            if self.min_latency is None or latency < self.min_latency:
+                self.min_latency = latency
+            else:
+                self.min_latency += (latency - self.min_latency) * BASELINE_DRIFT
+        target = config.latency_target
+        if target is None and self.min_latency is not None:
+            target = self.min_latency * config.latency_tolerance
+        if overloaded or (target is not None and latency > target):
+            self.overloads += 1
+            now = time.monotonic()
+            # Запросы, начатые до снижения, не снижают ограничение повторно.
+            if now - self._decreased_at > latency:
+                self.limit = max(float(config.min_concurrency), self.limit * config.decrease)
+                self._decreased_at = now
+        elif full:
+            self.limit = min(float(config.max_concurrency), self.limit + config.increase / self.limit)
+
+    def _grant(self) -> None:
+        """
+        Передает свободные места асинхронным ожиданиям по очереди, остальные —
+        ожидающим потокам (вызывается под блокировкой).
+        """
+        while self._waiters and self.in_flight < self.concurrency:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                # Цикл событий ожидания уже закрыт.
+                continue
+            self.in_flight += 1
+        free = self.concurrency - self.in_flight
+        if free > 0:
+            self._released.notify(free)
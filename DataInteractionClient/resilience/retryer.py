@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+from models.retry_policy import RetryPolicy
+from resilience.circuit_breaker import CircuitBreaker
+from resilience.rate_limiter import RateLimiter
+
+T = TypeVar("T")
+
+
+class Retryer:
+    """
+    Класс, выполняющий запросы к платформе согласно политике повторов
+    и, при наличии, через автоматический выключатель и ограничитель запросов.
+    Каждая попытка получает разрешение ограничителя; ошибки, которые политика считает
+    временной недоступностью платформы, сообщаются ограничителю как перегрузка.
+
+    Атрибуты
+    ----------
+    policy : RetryPolicy
+        Политика повторных запросов.
+    breaker : Optional[CircuitBreaker]
+        Автоматический выключатель или None.
+    limiter : Optional[RateLimiter]
+        Ограничитель частоты и количества одновременных запросов или None.
+    attempts : int
+        Общее количество выполненных попыток.
+    retries : int
+        Количество повторных попыток.
+    exhausted : int
+        Количество запросов, завершившихся ошибкой после исчерпания попыток или времени.
+    listeners : List[Callable[[int, BaseException, float], None]]
+        Обработчики повторов, принимают (номер неудачной попытки, ошибку, паузу перед повтором).
+
+    Методы
+    -------
+    call(fn: Callable[[], T])
+        Выполняет синхронный запрос с повторами.
+    acall(fn: Callable[[], Awaitable[T]])
+        Выполняет асинхронный запрос с повторами.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self.policy = policy
+        self.breaker = breaker
+        self.limiter = limiter
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.listeners: List[Callable[[int, BaseException, float], None]] = []
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Выполняет синхронный запрос, повторяя его после временных ошибок.
+
+        Параметры:
+        ----------
+        fn (Callable[[], T]): функция, выполняющая запрос.
+
+        Возвращает:
+        ----------
+        T: результат fn.
+
+        Ошибки, исключения:
+        ----------
+        CircuitOpenException: Если выключатель разомкнут.
+        RateLimitExceededException: Если ограничитель не выдал разрешение за max_wait.
+        Exception: Последняя ошибка fn, если запрос нельзя повторить.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            limiter = self.limiter
+            if limiter is not None:
+                limiter.acquire()
+            sent = self._before_attempt()
+            try:
+                result = fn()
+            except Exception as e:
+                self._release(sent, e)
+                delay = self._after_failure(attempt, started, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except BaseException:
+                self._release(None)
+                self._interrupted()
+                raise
+            else:
+                self._release(sent)
+                self._after_success()
+                return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Выполняет асинхронный запрос, повторяя его после временных ошибок.
+
+        Параметры:
+        ----------
+        fn (Callable[[], Awaitable[T]]): функция, возвращающая корутину запроса.
+
+        Возвращает:
+        ----------
+        T: результат fn.
+
+        Ошибки, исключения:
+        ----------
+        CircuitOpenException: Если выключатель разомкнут.
+        RateLimitExceededException: Если ограничитель не выдал разрешение за max_wait.
+        Exception: Последняя ошибка fn, если запрос нельзя повторить.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            limiter = self.limiter
+            if limiter is not None:
+                await limiter.aacquire()
+            sent = self._before_attempt()
+            try:
+                result = await fn()
+            except Exception as e:
+                self._release(sent, e)
+                delay = self._after_failure(attempt, started, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:
+                self._release(None)
+                self._interrupted()
+                raise
+            else:
+                self._release(sent)
+                self._after_success()
+                return result
+
+    def _before_attempt(self) -> float:
+        """Проверяет выключатель, учитывает попытку и возвращает время ее начала."""
+        if self.breaker is not None:
+            try:
+                self.breaker.before_call()
+            except BaseException:
+                self._release(None)
+                raise
+        with self._lock:
+            self.attempts += 1
+        return time.monotonic()
+
+    def _interrupted(self) -> None:
+        """Возвращает выключателю место пробного запроса прерванной попытки."""
+        if self.breaker is not None:
+            self.breaker.release_probe()
+
+    def _release(self, sent: Optional[float], error: Optional[Exception] = None) -> None:
+        """
+        Возвращает разрешение ограничителя с длительностью попытки, начатой в sent
+        (None — попытка не выполнялась).
+        """
+        limiter = self.limiter
+        if limiter is None:
+            return
+        if sent is None:
+            limiter.release()
+            return
+        overloaded = error is not None and self.policy.is_retryable(error)
+        limiter.release(time.monotonic() - sent, overloaded)
+
+    def _after_success(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def _after_failure(
+        self, attempt: int, started: float, error: Exception
+    ) -> Optional[float]:
+        """
+        Учитывает неудачную попытку и возвращает паузу перед повтором
+        или None, если запрос повторять не нужно.
+        """
+        retryable = self.policy.is_retryable(error)
+        if self.breaker is not None:
+            # Ответ платформы с ошибкой, не связанной с недоступностью, означает, что она работает.
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        if not retryable:
+            return None
+        delay = self.policy.backoff(attempt)
+        deadline = self.policy.deadline
+        if attempt >= self.policy.max_attempts or (
+            deadline is not None and time.monotonic() - started + delay > deadline
+        ):
+            with self._lock:
+                self.exhausted += 1
+            return None
+        with self._lock:
+            self.retries += 1
+        for listener in self.listeners:
+            listener(attempt, error, delay)
+        return delay
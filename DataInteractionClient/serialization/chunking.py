@@ -0,0 +1,173 @@
+import json
+from typing import Callable, List, Optional, Tuple, Union
+
+from buffers.columnar_buffer import ColumnarBuffer
+from models.chunking_config import ChunkingConfig
+from models.set_data_report import ChunkResult, SetDataReport
+from models.tag import Tag
+from spool.disk_spool import DiskSpool
+
+TagData = Union[List[dict], ColumnarBuffer]
+Chunk = List[Tuple[Tag, TagData]]
+
+SAMPLE_POINTS = 64
+
+
+def estimate_point_bytes(data: TagData) -> float:
+    """
+    Оценивает средний объем JSON-представления одной точки по первым точкам данных.
+
+    Параметры:
+    ----------
+    data (TagData): данные тега.
+
+    Возвращает:
+    ----------
+    float: оценочный объем одной точки в байтах.
+    """
+    if isinstance(data, ColumnarBuffer):
+        sample = data.slice(0, SAMPLE_POINTS)
+        return len(sample.to_json()) / max(len(sample), 1)
+    sample = data[:SAMPLE_POINTS]
+    return len(json.dumps(sample, separators=(",", ":"))) / max(len(sample), 1)
+
+
+def _slice(data: TagData, start: int, stop: int) -> TagData:
+    if isinstance(data, ColumnarBuffer):
+        return data.slice(start, stop)
+    return data[start:stop]
+
+
+def split_chunks(snapshots: List[Tuple[Tag, TagData]], chunking: ChunkingConfig) -> List[Chunk]:
+    """
+    Разбивает данные тегов на части, ограниченные количеством точек и оценочным объемом.
+    Данные одного тега при необходимости делятся между несколькими частями
+    с сохранением порядка точек.
+
+    Параметры:
+    ----------
+    snapshots (List[Tuple[Tag, TagData]]): теги и их отсоединенные данные.
+    chunking (ChunkingConfig): настройки разбиения.
+
+    Возвращает:
+    ----------
+    List[Chunk]: части, каждая — список пар (тег, срез данных тега).
+    """
+    if chunking.max_points is None and chunking.max_bytes is None:
+        return [snapshots]
+    chunks: List[Chunk] = []
+    chunk: Chunk = []
+    points_left: Optional[int] = chunking.max_points
+    bytes_left: Optional[float] = chunking.max_bytes
+    for tag, data in snapshots:
+        size = len(data)
+        point_bytes = estimate_point_bytes(data) if chunking.max_bytes is not None else 0
+        start = 0
+        while start < size:
+            take = size - start
+            if points_left is not None:
+                take = min(take, points_left)
+            if bytes_left is not None:
+                take = min(take, int(bytes_left // point_bytes))
+            if take <= 0:
+                if not chunk:
+                    # Точка больше лимита объема: отправляем ее отдельной частью.
+                    take = 1
+                else:
+                    chunks.append(chunk)
+                    chunk = []
+                    points_left = chunking.max_points
+                    bytes_left = chunking.max_bytes
+                    continue
+            chunk.append((tag, _slice(data, start, start + take) if take != size else data))
+            start += take
+            if points_left is not None:
+                points_left -= take
+            if bytes_left is not None:
+                bytes_left -= take * point_bytes
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def make_report(
+    chunks: List[Chunk],
+    errors: List[Optional[BaseException]],
+    spooled: Optional[List[bool]] = None,
+) -> SetDataReport:
+    """
+    Формирует отчет об отправке частей.
+
+    Параметры:
+    ----------
+    chunks (List[Chunk]): отправленные части.
+    errors (List[Optional[BaseException]]): ошибки отправки частей (None — успешно).
+    spooled (Optional[List[bool]]): признаки сохранения частей в спул. По умолчанию — нет.
+
+    Возвращает:
+    ----------
+    SetDataReport: отчет об отправке.
+    """
+    return SetDataReport(
+        chunks=[
+            ChunkResult(
+                index=index,
+                tag_ids=[tag.id for tag, _ in chunk],
+                points=sum(len(data) for _, data in chunk),
+                error=error,
+                spooled=bool(spooled and spooled[index]),
+            )
+            for index, (chunk, error) in enumerate(zip(chunks, errors))
+        ]
+    )
+
+
+def requeue_failed(chunks: List[Chunk], errors: List[Optional[BaseException]]) -> None:
+    """
+    Возвращает данные неотправленных частей в теги перед новыми данными,
+    сохраняя исходный порядок точек каждого тега.
+
+    Параметры:
+    ----------
+    chunks (List[Chunk]): отправленные части.
+    errors (List[Optional[BaseException]]): ошибки отправки частей (None — успешно).
+    """
+    for chunk, error in reversed(list(zip(chunks, errors))):
+        if error is not None:
+            for tag, data in reversed(chunk):
+                tag.requeue(data)
+
+
+def spool_failed(
+    chunks: List[Chunk],
+    errors: List[Optional[BaseException]],
+    spool: Optional[DiskSpool],
+    should_spool: Callable[[BaseException], bool],
+) -> List[bool]:
+    """
+    Сохраняет в спул данные неотправленных частей, ошибка которых означает
+    недоступность платформы. Если запись в спул не удалась, данные части
+    остаются для возврата в теги.
+
+    Параметры:
+    ----------
+    chunks (List[Chunk]): отправленные части.
+    errors (List[Optional[BaseException]]): ошибки отправки частей (None — успешно).
+    spool (Optional[DiskSpool]): спул или None, если спул не используется.
+    should_spool (Callable[[BaseException], bool]): проверяет, сохранять ли часть с ошибкой в спул.
+
+    Возвращает:
+    ----------
+    List[bool]: признаки сохранения частей в спул.
+    """
+    spooled = [False] * len(chunks)
+    if spool is None:
+        return spooled
+    for index, (chunk, error) in enumerate(zip(chunks, errors)):
+        if error is not None and should_spool(error):
+            try:
+                spool.append_snapshots(chunk)
+            except Exception:
+                continue
+            spooled[index] = True
+    return spooled
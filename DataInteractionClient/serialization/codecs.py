@@ -0,0 +1,204 @@
+import json
+from functools import lru_cache
+from typing import Any, List, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+class _FragmentFound(Exception):
+    """Поддерево содержит объект с методом to_json() и кодируется по частям."""
+
+
+def _reject(obj) -> Any:
+    if getattr(obj, "to_json", None) is not None:
+        raise _FragmentFound()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_reject)
+
+
+def _encode_parts(obj: Any, parts: List[str]) -> None:
+    """
+    Кодирует объект в части JSON-текста. Поддерево без объектов с методом to_json()
+    кодируется одним вызовом json.dumps, объекты с to_json() подставляются готовым
+    JSON-фрагментом, а словари и списки, содержащие их, собираются по элементам.
+    """
+    try:
+        parts.append(_dumps(obj))
+        return
+    except _FragmentFound:
+        pass
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        parts.append(to_json())
+    elif isinstance(obj, dict):
+        parts.append("{")
+        for i, (key, value) in enumerate(obj.items()):
+            if i:
+                parts.append(",")
+            # Ключ приводится к строке JSON так же, как в json.dumps: {"ключ":0} -> "ключ":
+            parts.append(_dumps({key: 0})[1:-2])
+            _encode_parts(value, parts)
+        parts.append("}")
+    else:
+        parts.append("[")
+        for i, value in enumerate(obj):
+            if i:
+                parts.append(",")
+            _encode_parts(value, parts)
+        parts.append("]")
+
+
+class JsonCodec:
+    """
+    Класс, представляющий кодек JSON на основе стандартной библиотеки json.
+    Объекты с методом to_json() (например, ColumnarBuffer) встраиваются в тело
+    готовым JSON-фрагментом: тело собирается из частей, а поддеревья без таких
+    объектов кодируются json.dumps целиком.
+
+    Методы
+    -------
+    dumps(obj: Any)
+        Кодирует объект в компактный JSON в кодировке UTF-8.
+    loads(data: bytes)
+        Разбирает JSON.
+    load_response(response: httpx.Response)
+        Разбирает тело ответа с учетом его кодировки (response.json()).
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        parts: List[str] = []
+        _encode_parts(obj, parts)
+        return "".join(parts).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def load_response(self, response: httpx.Response) -> Any:
+        return response.json()
+
+
+class OrjsonCodec:
+    """
+    Класс, представляющий кодек JSON на основе orjson.
+    Объекты с методом to_json() встраиваются через orjson.Fragment.
+
+    Методы
+    -------
+    dumps(obj: Any)
+        Кодирует объект в компактный JSON в кодировке UTF-8.
+    loads(data: bytes)
+        Разбирает JSON.
+    load_response(response: httpx.Response)
+        Разбирает тело ответа в UTF-8.
+    """
+
+    name = "orjson"
+
+    @staticmethod
+    def _default(obj) -> Any:
+        to_json = getattr(obj, "to_json", None)
+        if to_json is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return orjson.Fragment(to_json())
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self._default)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def load_response(self, response: httpx.Response) -> Any:
+        return orjson.loads(response.content)
+
+
+class MsgspecCodec:
+    """
+    Класс, представляющий кодек JSON на основе msgspec.
+    Объекты с методом to_json() встраиваются через msgspec.Raw.
+
+    Методы
+    -------
+    dumps(obj: Any)
+        Кодирует объект в компактный JSON в кодировке UTF-8.
+    loads(data: bytes)
+        Разбирает JSON.
+    load_response(response: httpx.Response)
+        Разбирает тело ответа в UTF-8.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self._encoder = msgspec.json.Encoder(enc_hook=self._enc_hook)
+        self._decoder = msgspec.json.Decoder()
+
+    @staticmethod
+    def _enc_hook(obj) -> Any:
+        to_json = getattr(obj, "to_json", None)
+        if to_json is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return msgspec.Raw(to_json().encode("utf-8"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def load_response(self, response: httpx.Response) -> Any:
+        return self._decoder.decode(response.content)
+
+
+Codec = Union[JsonCodec, OrjsonCodec, MsgspecCodec]
+
+
+@lru_cache(maxsize=None)
+def get_codec(name: str = "auto") -> Codec:
+    """
+    Возвращает кодек JSON по имени.
+
+    Параметры:
+    ----------
+    name (str): "json", "orjson", "msgspec" или "auto" — orjson, если установлен,
+        иначе msgspec, иначе json. По умолчанию — "auto".
+
+    Возвращает:
+    ----------
+    Codec: кодек, общий для всех вызовов.
+
+    Ошибки, исключения:
+    -------
+    ImportError: Если пакет указанного кодека не установлен.
+    ValueError: Если имя кодека неизвестно.
+    """
+    if name == "auto":
+        if orjson is not None and hasattr(orjson, "Fragment"):
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JsonCodec()
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson":
+        if orjson is None or not hasattr(orjson, "Fragment"):
+            raise ImportError("Для кодека 'orjson' требуется пакет orjson>=3.9.16")
+        return OrjsonCodec()
+    if name == "msgspec":
+        if msgspec is None:
+            raise ImportError("Для кодека 'msgspec' требуется пакет msgspec")
+        return MsgspecCodec()
+    raise ValueError(f"Неизвестный кодек: {name}")
@@ -0,0 +1,98 @@
+import gzip
+import zlib
+from typing import List, Optional, Union
+
+from buffers.columnar_buffer import ColumnarBuffer
+from models.wire_config import WireConfig
+from serialization.codecs import Codec, get_codec
+
+COMPRESS_LEVEL = 6
+
+
+def tag_payload(
+    tag_id: Union[str, dict], data: Union[List[dict], ColumnarBuffer], wire: WireConfig
+) -> dict:
+    """
+    Формирует элемент запроса set_data для данных тега.
+    Колоночный буфер в режиме "json" передается кодировщику как есть и кодируется
+    напрямую из колонок, без построения промежуточных словарей.
+
+    Параметры:
+    ----------
+    tag_id (Union[str, dict]): идентификатор тега.
+    data (Union[List[dict], ColumnarBuffer]): данные тега, например полученные от Tag.drain.
+    wire (WireConfig): настройки кодирования запросов.
+
+    Возвращает:
+    ----------
+    dict: элемент запроса {"tagId", "data"}.
+    """
+    if isinstance(data, ColumnarBuffer) and wire.mode != "json":
+        data = data.to_records()
+    return {"tagId": tag_id, "data": data}
+
+
+def encode_json_body(params: dict, codec: Optional[Codec] = None) -> bytes:
+    """
+    Кодирует параметры запроса в компактное JSON-тело.
+    Объекты с методом to_json() (например, ColumnarBuffer) встраиваются
+    в тело готовым JSON-фрагментом.
+
+    Параметры:
+    ----------
+    params (dict): параметры запроса.
+    codec (Optional[Codec]): кодек JSON. По умолчанию — get_codec("auto").
+
+    Возвращает:
+    ----------
+    bytes: JSON-представление параметров в кодировке UTF-8.
+    """
+    return (codec or get_codec()).dumps(params)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Сжимает тело запроса указанным алгоритмом.
+
+    Параметры:
+    ----------
+    body (bytes): тело запроса.
+    encoding (str): "gzip" или "deflate".
+
+    Возвращает:
+    ----------
+    bytes: сжатое тело запроса.
+
+    Ошибки, исключения:
+    ----------
+    ValueError: Если алгоритм сжатия не поддерживается.
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+    if encoding == "deflate":
+        return zlib.compress(body, COMPRESS_LEVEL)
+    raise ValueError(f"Неподдерживаемый алгоритм сжатия: {encoding}")
+
+
+def build_request_kwargs(params: dict, wire: WireConfig) -> dict:
+    """
+    Формирует именованные аргументы httpx для отправки параметров запроса
+    в соответствии с настройками кодирования.
+
+    Параметры:
+    ----------
+    params (dict): параметры запроса.
+    wire (WireConfig): настройки кодирования запросов.
+
+    Возвращает:
+    ----------
+    dict: аргументы для httpx.Client.post / httpx.AsyncClient.post.
+    """
+    if wire.mode == "query":
+        return {"params": params}
+    body = encode_json_body(params, get_codec(wire.codec))
+    headers = {"Content-Type": "application/json"}
+    if wire.compress_threshold is not None and len(body) >= wire.compress_threshold:
+        body = compress_body(body, wire.compress_encoding)
+        headers["Content-Encoding"] = wire.compress_encoding
+    return {"content": body, "headers": headers}
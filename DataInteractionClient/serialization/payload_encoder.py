@@ -0,0 +1,128 @@
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional
+
+from models.wire_config import WireConfig
+from serialization.payload import build_request_kwargs
+
+DEFAULT_MIN_POINTS = 10_000
+
+
+def count_points(params: dict) -> int:
+    """
+    Возвращает количество точек в параметрах запроса set_data ({"data": [{"tagId", "data"}]}).
+
+    Параметры:
+    ----------
+    params (dict): параметры запроса.
+
+    Возвращает:
+    ----------
+    int: количество точек; 0 для остальных запросов.
+    """
+    items = params.get("data")
+    if not isinstance(items, list):
+        return 0
+    return sum(len(item.get("data") or ()) for item in items if isinstance(item, dict))
+
+
+class PayloadEncoder:
+    """
+    Класс, представляющий кодирование тел запросов set_data (JSON и сжатие) в пуле
+    потоков или процессов, чтобы подготовка больших пакетов не занимала поток вызывающего
+    кода и цикл событий асинхронного клиента. Тело кодируется один раз на запрос
+    и используется во всех повторах.
+
+    Пул потоков передает данные тегов без копирования; сжатие gzip и deflate освобождает GIL
+    и выполняется параллельно. Пул процессов (concurrent.futures.ProcessPoolExecutor)
+    кодирует JSON параллельно, но данные передаются в процесс сериализацией pickle:
+    колонки array буфера ColumnarBuffer передаются одним блоком байтов, а список словарей —
+    поточечно, поэтому пул процессов выгоден с buffer_mode="columnar".
+
+    Атрибуты
+    ----------
+    executor : concurrent.futures.Executor
+        Пул, в котором кодируются тела. По умолчанию — собственный пул из одного потока.
+    min_points : int
+        Минимальное количество точек в запросе, начиная с которого тело кодируется в пуле;
+        меньшие запросы кодируются на месте. По умолчанию — 10000.
+
+    Методы
+    -------
+    wants(params: dict, wire: WireConfig)
+        Проверяет, кодируется ли тело запроса в пуле.
+    encode(params: dict, wire: WireConfig)
+        Кодирует тело в пуле и ожидает результат.
+    aencode(params: dict, wire: WireConfig)
+        Кодирует тело в пуле, не блокируя цикл событий.
+    close()
+        Останавливает собственный пул.
+    """
+
+    __slots__ = ("executor", "min_points", "_owned")
+
+    def __init__(
+        self, executor: Optional[Executor] = None, min_points: int = DEFAULT_MIN_POINTS
+    ) -> None:
+        self._owned = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="payload-encoder"
+        )
+        self.min_points = min_points
+
+    def __repr__(self) -> str:
+        return f"PayloadEncoder(executor={type(self.executor).__name__}, min_points={self.min_points})"
+
+    def wants(self, params: dict, wire: WireConfig) -> bool:
+        """
+        Проверяет, кодируется ли тело запроса в пуле: только JSON-тела запросов
+        set_data не менее чем с min_points точками.
+
+        Параметры:
+        ----------
+        params (dict): параметры запроса.
+        wire (WireConfig): настройки кодирования запросов.
+
+        Возвращает:
+        ----------
+        bool: True, если тело нужно кодировать в пуле.
+        """
+        return wire.mode == "json" and count_points(params) >= self.min_points
+
+    def _submit(self, params: dict, wire: WireConfig) -> Future:
+        return self.executor.submit(build_request_kwargs, params, wire)
+
+    def encode(self, params: dict, wire: WireConfig) -> dict:
+        """
+        Кодирует тело запроса в пуле и ожидает результат.
+
+        Параметры:
+        ----------
+        params (dict): параметры запроса.
+        wire (WireConfig): настройки кодирования запросов.
+
+        Возвращает:
+        ----------
+        dict: аргументы для httpx.Client.post (см. build_request_kwargs).
+        """
+        return self._submit(params, wire).result()
+
+    async def aencode(self, params: dict, wire: WireConfig) -> dict:
+        """
+        Кодирует тело запроса в пуле; цикл событий в это время выполняет другие задачи.
+
+        Параметры:
+        ----------
+        params (dict): параметры запроса.
+        wire (WireConfig): настройки кодирования запросов.
+
+        Возвращает:
+        ----------
+        dict: аргументы для httpx.AsyncClient.post (см. build_request_kwargs).
+        """
+        return await asyncio.wrap_future(self._submit(params, wire))
+
+    def close(self) -> None:
+        """Останавливает собственный пул. Переданный пул executor не останавливается."""
+        if self._owned:
+            self.executor.shutdown(wait=True)
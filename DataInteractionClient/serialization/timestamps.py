@@ -0,0 +1,129 @@
+import time
+from array import array
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, Iterable, Literal, Tuple, Union
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Хранение меток времени в буфере тега: "raw" — как переданы, "microseconds" — целые
+# микросекунды от начала эпохи Unix (единица time_step).
+TimestampMode = Literal["raw", "microseconds"]
+
+
+def to_microseconds(value: Union[str, int], naive_timezone: tzinfo = timezone.utc) -> int:
+    """
+    Приводит метку времени к целому числу микросекунд от начала эпохи Unix.
+
+    Параметры:
+    ----------
+    value (Union[str, int]): метка времени — целое число микросекунд, строка с целым числом
+        или строка в формате ISO 8601.
+    naive_timezone (tzinfo): часовой пояс строк без смещения. По умолчанию — UTC.
+
+    Возвращает:
+    ----------
+    int: метка времени в микросекундах.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если строку не удалось разобрать.
+    """
+    if isinstance(value, int):
+        return value
+    text = value.strip()
+    if text.lstrip("-").isdigit():
+        return int(text)
+    moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=naive_timezone)
+    delta = moment - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def now_microseconds() -> int:
+    """Возвращает текущее время в микросекундах от начала эпохи Unix."""
+    return time.time_ns() // 1000
+
+
+# Кеш начала строки до минут для parse_iso по часовым поясам строк без смещения:
+# очищается при переполнении.
+_MINUTES: Dict[tzinfo, Dict[Tuple[str, str], int]] = {}
+_MINUTES_LIMIT = 65_536
+_DIGITS = "0123456789"
+
+
+def _parse_cached(
+    value: Union[str, int], minutes: Dict[Tuple[str, str], int], naive_timezone: tzinfo
+) -> int:
+    if type(value) is int:
+        return value
+    # Ожидаемый вид: YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM], вместо "T" допускается пробел.
+    if isinstance(value, str) and len(value) >= 19 and value[16] == ":" and value[17:19].isdigit():
+        rest = value[19:]
+        fraction = 0
+        if rest[:1] == ".":
+            tail = rest[1:].lstrip(_DIGITS)
+            digits = rest[1:len(rest) - len(tail)][:6]
+            fraction = int(digits.ljust(6, "0")) if digits else 0
+            rest = tail
+        key = (value[:16], rest)
+        base = minutes.get(key)
+        if base is None:
+            base = minutes[key] = to_microseconds(value[:16] + rest, naive_timezone)
+        return base + int(value[17:19]) * 1_000_000 + fraction
+    return to_microseconds(value, naive_timezone)
+
+
+def parse_iso(value: Union[str, int], naive_timezone: tzinfo = timezone.utc) -> int:
+    """
+    Приводит одну метку времени к микросекундам, как parse_iso_many: начало строки
+    до минут разбирается один раз и кешируется между вызовами, поэтому метки, поступающие
+    по одной (Tag.add_data), разбираются без datetime.fromisoformat для каждой точки.
+
+    Параметры:
+    ----------
+    value (Union[str, int]): метка времени.
+    naive_timezone (tzinfo): часовой пояс строк без смещения. По умолчанию — UTC.
+
+    Возвращает:
+    ----------
+    int: метка времени в микросекундах.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если строку не удалось разобрать.
+    """
+    minutes = _MINUTES.get(naive_timezone)
+    if minutes is None or len(minutes) >= _MINUTES_LIMIT:
+        minutes = _MINUTES[naive_timezone] = {}
+    return _parse_cached(value, minutes, naive_timezone)
+
+
+def parse_iso_many(
+    values: Iterable[Union[str, int]], naive_timezone: tzinfo = timezone.utc
+) -> array:
+    """
+    Разбирает последовательность меток времени в микросекунды.
+    Метки одного ответа обычно отличаются только секундами и долями секунды, поэтому
+    начало строки до минут вместе с часовым поясом разбирается один раз и кешируется,
+    а секунды и доли секунды складываются арифметически. Строки нестандартного вида
+    разбираются функцией to_microseconds, целые числа добавляются как есть.
+
+    Параметры:
+    ----------
+    values (Iterable[Union[str, int]]): метки времени. Дата и время в строке разделяются
+        символом "T" или пробелом.
+    naive_timezone (tzinfo): часовой пояс строк без смещения. По умолчанию — UTC.
+
+    Возвращает:
+    ----------
+    array: метки времени в микросекундах, array('q').
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если строку не удалось разобрать.
+    """
+    if isinstance(values, array) and values.typecode == "q":
+        return array("q", values)
+    minutes: Dict[Tuple[str, str], int] = {}
+    return array("q", [_parse_cached(value, minutes, naive_timezone) for value in values])
@@ -0,0 +1,332 @@
+import asyncio
+import time
+from typing import Callable, List, Optional, Set
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from exceptions.no_data_to_send_exception import NoDataToSendException
+from models.session_health import SessionHealth
+from models.tag_registry import TagRegistry
+from sessions.flush_scheduler import FlushScheduler, SourceState
+from validation.validated_call import internal_call
+
+
+class AsyncSessionManager:
+    """
+    Класс, представляющий асинхронный менеджер сессий многих источников данных
+    поверх одного AsyncDataInteractionClient. Отправку выполняет фоновая задача asyncio;
+    очередность, ограничение частоты и повторы совпадают с SessionManager.
+
+    Атрибуты
+    ----------
+    client : AsyncDataInteractionClient
+        Клиент, через который подключаются источники и отправляются данные.
+    min_interval : float
+        Минимальный интервал между отправками данных одного источника по умолчанию,
+        секунды. По умолчанию — 1.
+    max_parallel : int
+        Максимальное количество источников, данные которых отправляются одновременно.
+        По умолчанию — 4.
+    retry_interval : float
+        Пауза перед повторной отправкой после первой ошибки, секунды; удваивается
+        при ошибках подряд до max_retry_interval. По умолчанию — 1.
+    max_retry_interval : float
+        Максимальная пауза перед повторной отправкой, секунды. По умолчанию — 60.
+    poll_interval : float
+        Интервал проверки новых данных источников, секунды. По умолчанию — 0.1.
+    on_error : Optional[Callable[[str, Exception], None]]
+        Вызывается при ошибке отправки данных источника: (идентификатор источника, ошибка).
+
+    Методы
+    -------
+    start()
+        Запускает фоновую задачу отправки. Вызывается автоматически при добавлении источника.
+    add_source(data_source_id: str, min_interval: Optional[float] = None)
+        Подключается к источнику данных и возвращает его реестр тегов.
+    refresh(data_source_id: str)
+        Повторно подключается к источнику данных и возвращает его реестр тегов.
+    remove_source(data_source_id: str, flush: bool = True)
+        Прекращает отправку данных источника.
+    tags(data_source_id: str)
+        Возвращает реестр тегов источника.
+    flush(timeout: Optional[float] = None)
+        Отправляет накопленные данные всех источников и ждет завершения отправки.
+    health()
+        Возвращает сводное состояние источников.
+    aclose(timeout: Optional[float] = None)
+        Отправляет накопленные данные и останавливает фоновую задачу.
+
+    Ошибки, исключения:
+    -------
+    KeyError: Если источник не найден.
+    ValueError: Если источник уже добавлен.
+    RuntimeError: При добавлении источника в закрытый менеджер.
+    """
+
+    def __init__(
+        self,
+        client: AsyncDataInteractionClient,
+        min_interval: float = 1.0,
+        max_parallel: int = 4,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 60.0,
+        poll_interval: float = 0.1,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> None:
+        self.client = client
+        self.max_parallel = max_parallel
+        self.on_error = on_error
+        self._scheduler = FlushScheduler(
+            min_interval=min_interval,
+            retry_interval=retry_interval,
+            max_retry_interval=max_retry_interval,
+            poll_interval=poll_interval,
+        )
+        self._condition: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+        self._sends: Set[asyncio.Task] = set()
+        self._closed = False
+        self._stopped = False
+
+    async def __aenter__(self) -> "AsyncSessionManager":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def sources(self) -> List[str]:
+        """Идентификаторы источников в порядке добавления."""
+        return [state.source_id for state in self._scheduler.sources]
+
+    def start(self) -> None:
+        """
+        Запускает фоновую задачу отправки в текущем цикле событий.
+        """
+        if self._task is None:
+            self._condition = asyncio.Condition()
+            self._task = asyncio.create_task(self._run())
+
+    async def add_source(
+        self, data_source_id: str, min_interval: Optional[float] = None
+    ) -> TagRegistry:
+        """
+        Асинхронно подключается к источнику данных и начинает отправку данных его тегов.
+
+        Параметры:
+        ----------
+        data_source_id (str): идентификатор источника данных.
+        min_interval (Optional[float]): минимальный интервал между отправками данных
+            источника, секунды. По умолчанию — min_interval менеджера.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если источник уже добавлен.
+        RuntimeError: Если менеджер закрыт.
+        DataSourceNotActiveException: Если источник данных неактивен.
+        """
+        if self._closed:
+            raise RuntimeError("Менеджер сессий закрыт")
+        if data_source_id in self._scheduler:
+            raise ValueError(f"Источник {data_source_id} уже добавлен")
+        self.start()
+        registry = await self.client.connect(data_source_id)
+        async with self._condition:
+            self._scheduler.add(data_source_id, registry, min_interval)
+            self._condition.notify_all()
+        return registry
+
+    async def refresh(self, data_source_id: str) -> TagRegistry:
+        """
+        Асинхронно повторно подключается к источнику данных. Если у клиента задан
+        metadata_cache, изменения состава тегов применяются к прежнему реестру. Иначе
+        накопленные данные тегов прежнего реестра переносятся в одноименные теги нового
+        реестра, данные тегов, удаленных из источника, отбрасываются.
+
+        Параметры:
+        ----------
+        data_source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если источник не найден.
+        DataSourceNotActiveException: Если источник данных неактивен.
+        """
+        self._scheduler.get(data_source_id)
+        self.start()
+        registry = await self.client.connect(data_source_id)
+        async with self._condition:
+            state = self._scheduler.get(data_source_id)
+            if registry is not state.registry:
+                await self._condition.wait_for(lambda: not state.in_flight)
+                for tag in state.registry.active():
+                    target = registry.get(tag.id)
+                    snapshot = tag.drain()
+                    if target is not None and snapshot:
+                        target.requeue(snapshot)
+                state.registry = registry
+        return registry
+
+    async def remove_source(self, data_source_id: str, flush: bool = True) -> TagRegistry:
+        """
+        Асинхронно прекращает отправку данных источника.
+
+        Параметры:
+        ----------
+        data_source_id (str): идентификатор источника данных.
+        flush (bool): отправить накопленные данные перед удалением. По умолчанию — True.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника. Неотправленные данные остаются в тегах.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если источник не найден.
+        Ошибки set_data при flush=True выбрасываются как есть, данные остаются в тегах.
+        """
+        state = self._scheduler.get(data_source_id)
+        if self._condition is not None:
+            async with self._condition:
+                await self._condition.wait_for(lambda: not state.in_flight)
+        self._scheduler.remove(data_source_id)
+        if flush and state.registry.active():
+            try:
+                with internal_call():
+                    await self.client.set_data(state.registry.active())
+            except NoDataToSendException:
+                pass
+        return state.registry
+
+    def tags(self, data_source_id: str) -> TagRegistry:
+        """
+        Возвращает реестр тегов источника.
+
+        Параметры:
+        ----------
+        data_source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        TagRegistry: реестр тегов источника.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если источник не найден.
+        """
+        return self._scheduler.get(data_source_id).registry
+
+    def health(self) -> SessionHealth:
+        """
+        Возвращает сводное состояние источников и выключателя клиента.
+
+        Возвращает:
+        ----------
+        SessionHealth: состояние менеджера.
+        """
+        breaker = self.client.retryer.breaker
+        return self._scheduler.health(None if breaker is None else breaker.state)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Отправляет накопленные данные всех источников без учета ограничения частоты
+        и ждет завершения отправки.
+
+        Параметры:
+        ----------
+        timeout (Optional[float]): максимальное время ожидания, секунды. По умолчанию — без ограничения.
+
+        Возвращает:
+        ----------
+        bool: True, если данные всех источников отправлены без ошибок.
+        """
+        self.start()
+        async with self._condition:
+            self._scheduler.request_flush()
+            self._condition.notify_all()
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: not self._scheduler.flush_pending()),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                return False
+        return all(state.consecutive_failures == 0 for state in self._scheduler.sources)
+
+    async def aclose(self, timeout: Optional[float] = None) -> bool:
+        """
+        Отправляет накопленные данные и останавливает фоновую задачу.
+        Клиент не закрывается.
+
+        Параметры:
+        ----------
+        timeout (Optional[float]): максимальное время ожидания отправки, секунды.
+            По умолчанию — без ограничения.
+
+        Возвращает:
+        ----------
+        bool: True, если данные всех источников отправлены до остановки.
+        """
+        self._closed = True
+        if self._task is None:
+            return not any(state.registry.active() for state in self._scheduler.sources)
+        sent = await self.flush(timeout)
+        async with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        await self._task
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+        return sent
+
+    async def _run(self) -> None:
+        while True:
+            async with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    taken = self._scheduler.take(
+                        now, self.max_parallel - self._scheduler.in_flight
+                    )
+                    if taken:
+                        break
+                    if not self._scheduler.flush_pending():
+                        # Запрошенная отправка завершена без запросов: у источников нет данных.
+                        self._condition.notify_all()
+                    try:
+                        await asyncio.wait_for(
+                            self._condition.wait(), self._scheduler.wait_timeout(now)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                if self._stopped:
+                    return
+            for state in taken:
+                task = asyncio.create_task(self._send(state))
+                self._sends.add(task)
+                task.add_done_callback(self._sends.discard)
+
+    async def _send(self, state: SourceState) -> None:
+        points = 0
+        try:
+            with internal_call():
+                points = (await self.client.set_data(state.registry.active())).points_sent
+        except NoDataToSendException:
+            pass
+        except Exception as e:
+            async with self._condition:
+                self._scheduler.fail(state, e, time.monotonic())
+                self._condition.notify_all()
+            if self.on_error is not None:
+                self.on_error(state.source_id, e)
+            return
+        async with self._condition:
+            self._scheduler.complete(state, points, time.monotonic())
+            self._condition.notify_all()
@@ -0,0 +1,305 @@
+import time
+from typing import Dict, List, Optional
+
+from models.session_health import SessionHealth, SourceHealth
+from models.tag_registry import TagRegistry
+
+
+class SourceState:
+    """
+    Класс, представляющий источник данных менеджера сессий: реестр тегов,
+    ограничение частоты отправки и счетчики отправок.
+
+    Атрибуты
+    ----------
+    source_id : str
+        Идентификатор источника данных.
+    registry : TagRegistry
+        Реестр тегов источника.
+    min_interval : float
+        Минимальный интервал между отправками данных источника, секунды.
+    next_at : float
+        Момент (time.monotonic), раньше которого данные источника не отправляются.
+    in_flight : bool
+        True, пока данные источника отправляются.
+    flush_requested : bool
+        True, если запрошена отправка без учета ограничения частоты (flush).
+    """
+
+    __slots__ = (
+        "source_id", "registry", "min_interval", "next_at", "in_flight", "flush_requested",
+        "flushes", "points_sent", "failures", "consecutive_failures", "last_flush_at",
+        "last_error",
+    )
+
+    def __init__(self, source_id: str, registry: TagRegistry, min_interval: float) -> None:
+        self.source_id = source_id
+        self.registry = registry
+        self.min_interval = min_interval
+        self.next_at = 0.0
+        self.in_flight = False
+        self.flush_requested = False
+        self.flushes = 0
+        self.points_sent = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_flush_at: Optional[float] = None
+        self.last_error: Optional[BaseException] = None
+
+    def health(self) -> SourceHealth:
+        """Возвращает состояние отправки данных источника."""
+        return SourceHealth(
+            source_id=self.source_id,
+            tags=len(self.registry),
+            pending_tags=self.registry.pending(),
+            flushes=self.flushes,
+            points_sent=self.points_sent,
+            failures=self.failures,
+            consecutive_failures=self.consecutive_failures,
+            last_flush_at=self.last_flush_at,
+            last_error=self.last_error,
+        )
+
+
+class FlushScheduler:
+    """
+    Класс, представляющий планировщик отправки данных многих источников без операций
+    ввода-вывода. Источники с накопленными данными отправляются по очереди: первым —
+    источник, дольше всех ожидающий своей очереди, поэтому частые записи одного источника
+    не задерживают остальные. Данные источника отправляются не чаще одного раза
+    за min_interval; после ошибки пауза удваивается до max_retry_interval.
+    Не потокобезопасен: синхронизацию обеспечивает менеджер сессий.
+
+    Атрибуты
+    ----------
+    min_interval : float
+        Минимальный интервал между отправками данных одного источника по умолчанию, секунды.
+    retry_interval : float
+        Пауза перед повторной отправкой после первой ошибки, секунды.
+    max_retry_interval : float
+        Максимальная пауза перед повторной отправкой, секунды.
+    poll_interval : float
+        Интервал проверки новых данных источников, секунды.
+
+    Методы
+    -------
+    add(source_id: str, registry: TagRegistry, min_interval: Optional[float] = None)
+        Добавляет источник.
+    remove(source_id: str)
+        Удаляет источник.
+    take(now: float, limit: int)
+        Выбирает источники для отправки и отмечает их как отправляемые.
+    complete(state: SourceState, points: int, now: float)
+        Учитывает успешную отправку.
+    fail(state: SourceState, error: BaseException, now: float)
+        Учитывает ошибку отправки.
+    request_flush()
+        Запрашивает отправку данных всех источников без учета ограничения частоты.
+    flush_pending()
+        Проверяет, выполнена ли запрошенная отправка.
+    wait_timeout(now: float)
+        Возвращает время ожидания до следующей проверки.
+    health(circuit_state: Optional[str] = None)
+        Возвращает сводное состояние источников.
+
+    Ошибки, исключения:
+    -------
+    KeyError: Если источник не найден.
+    ValueError: Если источник уже добавлен.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 60.0,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self.min_interval = min_interval
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self.poll_interval = poll_interval
+        self._sources: Dict[str, SourceState] = {}
+
+    def __contains__(self, source_id: str) -> bool:
+        return source_id in self._sources
+
+    @property
+    def sources(self) -> List[SourceState]:
+        """Источники в порядке добавления."""
+        return list(self._sources.values())
+
+    @property
+    def in_flight(self) -> int:
+        """Количество отправляемых источников."""
+        return sum(state.in_flight for state in self._sources.values())
+
+    def get(self, source_id: str) -> SourceState:
+        """Возвращает источник по идентификатору. KeyError, если источник не найден."""
+        return self._sources[source_id]
+
+    def add(
+        self, source_id: str, registry: TagRegistry, min_interval: Optional[float] = None
+    ) -> SourceState:
+        """
+        Добавляет источник.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+        registry (TagRegistry): реестр тегов источника.
+        min_interval (Optional[float]): минимальный интервал между отправками, секунды.
+            По умолчанию — min_interval планировщика.
+
+        Возвращает:
+        ----------
+        SourceState: добавленный источник.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если источник уже добавлен.
+        """
+        if source_id in self._sources:
+            raise ValueError(f"Источник {source_id} уже добавлен")
+        state = SourceState(
+            source_id, registry, self.min_interval if min_interval is None else min_interval
+        )
+        self._sources[source_id] = state
+        return state
+
+    def remove(self, source_id: str) -> SourceState:
+        """
+        Удаляет источник. Накопленные данные остаются в тегах реестра.
+
+        Параметры:
+        ----------
+        source_id (str): идентификатор источника данных.
+
+        Возвращает:
+        ----------
+        SourceState: удаленный источник.
+
+        Ошибки, исключения:
+        -------
+        KeyError: Если источник не найден.
+        """
+        return self._sources.pop(source_id)
+
+    def take(self, now: float, limit: int) -> List[SourceState]:
+        """
+        Выбирает не более limit источников с накопленными данными, очередь которых
+        наступила, и отмечает их как отправляемые. Источники без данных, для которых
+        запрошена отправка, считаются отправленными. Данные проверяются по набору тегов,
+        получивших данные (TagRegistry.pending), без перебора всех тегов реестров.
+
+        Параметры:
+        ----------
+        now (float): текущий момент time.monotonic.
+        limit (int): максимальное количество источников.
+
+        Возвращает:
+        ----------
+        List[SourceState]: источники для отправки.
+        """
+        ready = []
+        for state in self._sources.values():
+            if state.in_flight or (state.next_at > now and not state.flush_requested):
+                continue
+            if not state.registry.pending():
+                state.flush_requested = False
+                continue
+            ready.append(state)
+        ready.sort(key=lambda state: (not state.flush_requested, state.next_at))
+        taken = ready[:max(limit, 0)]
+        for state in taken:
+            state.in_flight = True
+        return taken
+
+    def complete(self, state: SourceState, points: int, now: float) -> None:
+        """
+        Учитывает успешную отправку данных источника.
+
+        Параметры:
+        ----------
+        state (SourceState): источник.
+        points (int): количество отправленных точек.
+        now (float): текущий момент time.monotonic.
+        """
+        state.in_flight = False
+        state.flush_requested = False
+        state.next_at = now + state.min_interval
+        state.consecutive_failures = 0
+        state.last_flush_at = time.time()
+        if points:
+            state.flushes += 1
+            state.points_sent += points
+
+    def fail(self, state: SourceState, error: BaseException, now: float) -> None:
+        """
+        Учитывает ошибку отправки данных источника. Данные остаются в тегах
+        и отправляются повторно после паузы.
+
+        Параметры:
+        ----------
+        state (SourceState): источник.
+        error (BaseException): ошибка отправки.
+        now (float): текущий момент time.monotonic.
+        """
+        state.in_flight = False
+        state.flush_requested = False
+        state.failures += 1
+        state.consecutive_failures += 1
+        state.last_error = error
+        pause = min(
+            self.max_retry_interval,
+            self.retry_interval * 2 ** (state.consecutive_failures - 1),
+        )
+        state.next_at = now + max(pause, state.min_interval)
+
+    def request_flush(self) -> None:
+        """Запрашивает отправку данных всех источников без учета ограничения частоты."""
+        for state in self._sources.values():
+            state.flush_requested = True
+
+    def flush_pending(self) -> bool:
+        """True, пока запрошенная отправка не выполнена для всех источников."""
+        return any(
+            state.flush_requested or state.in_flight for state in self._sources.values()
+        )
+
+    def wait_timeout(self, now: float) -> float:
+        """
+        Возвращает время ожидания до наступления очереди ближайшего источника,
+        но не больше poll_interval: данные в теги добавляются без уведомления.
+
+        Параметры:
+        ----------
+        now (float): текущий момент time.monotonic.
+
+        Возвращает:
+        ----------
+        float: время ожидания, секунды.
+        """
+        waits = [
+            state.next_at - now for state in self._sources.values()
+            if not state.in_flight and state.next_at > now
+        ]
+        return min([self.poll_interval] + waits)
+
+    def health(self, circuit_state: Optional[str] = None) -> SessionHealth:
+        """
+        Возвращает сводное состояние источников.
+
+        Параметры:
+        ----------
+        circuit_state (Optional[str]): состояние выключателя клиента. По умолчанию — None.
+
+        Возвращает:
+        ----------
+        SessionHealth: состояние источников и выключателя.
+        """
+        return SessionHealth(
+            sources=[state.health() for state in self._sources.values()],
+            circuit_state=circuit_state,
+        )
+
@@ -0,0 +1,513 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from buffers.columnar_buffer import ColumnarBuffer
+from models.tag import Tag
+from models.wire_config import WireConfig
+from serialization.codecs import get_codec
+from serialization.payload import encode_json_body, tag_payload
+
+# Заголовок записи: сигнатура, длина тела, CRC32, ключ сортировки, количество точек.
+HEADER = struct.Struct("<2sIIqI")
+MAGIC = b"SP"
+# Поля заголовка, входящие в контрольную сумму вместе с телом записи.
+CHECKED_FIELDS = struct.Struct("<qI")
+ACK = struct.Struct("<Q")
+SEGMENT_SUFFIX = ".seg"
+ACK_SUFFIX = ".ack"
+JSON_WIRE = WireConfig(mode="json")
+
+TagData = Union[List[dict], ColumnarBuffer]
+
+
+class SpoolRecord:
+    """
+    Класс, представляющий запись спула — тело одного запроса set_data.
+
+    Атрибуты
+    ----------
+    segment : int
+        Номер файла-сегмента, содержащего запись.
+    offset : int
+        Смещение заголовка записи в сегменте, байты.
+    length : int
+        Длина тела записи, байты.
+    sort_key : int
+        Ключ порядка воспроизведения.
+    points : int
+        Количество точек в записи.
+    """
+
+    __slots__ = ("segment", "offset", "length", "sort_key", "points")
+
+    def __init__(self, segment: int, offset: int, length: int, sort_key: int, points: int) -> None:
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+        self.sort_key = sort_key
+        self.points = points
+
+    @property
+    def size(self) -> int:
+        """Размер записи в сегменте вместе с заголовком, байты."""
+        return HEADER.size + self.length
+
+
+def _min_timestamp(data: TagData) -> Optional[int]:
+    if isinstance(data, ColumnarBuffer):
+        xs = data.xs
+        if isinstance(xs, list) and not all(isinstance(x, int) for x in xs):
+            return None
+        return min(xs) if len(xs) else None
+    xs = [point["x"] for point in data]
+    if not xs or not all(isinstance(x, int) for x in xs):
+        return None
+    return min(xs)
+
+
+def sort_key(snapshots: List[Tuple[Tag, TagData]]) -> int:
+    """
+    Вычисляет ключ порядка воспроизведения данных: наименьшую целочисленную метку времени
+    точек. Если метки времени строковые, ключом служит текущее время в микросекундах.
+
+    Параметры:
+    ----------
+    snapshots (List[Tuple[Tag, TagData]]): теги и их отсоединенные данные.
+
+    Возвращает:
+    ----------
+    int: ключ сортировки.
+    """
+    keys = [_min_timestamp(data) for _, data in snapshots]
+    if not keys or None in keys:
+        return time.time_ns() // 1000
+    return min(keys)
+
+
+class DiskSpool:
+    """
+    Класс, представляющий долговременное хранилище неотправленных данных на диске (спул).
+    Данные пишутся только в конец файлов-сегментов; каждая запись содержит тело
+    запроса set_data и снабжена контрольной суммой CRC32, поэтому запись, оборванная
+    аварийным завершением процесса, обнаруживается и отбрасывается при открытии спула.
+    Сегменты читаются через mmap. Подтвержденные (отправленные) записи отмечаются
+    в файлах подтверждений рядом с сегментами и удаляются при уплотнении.
+    Потокобезопасен.
+
+    Атрибуты
+    ----------
+    directory : str
+        Каталог сегментов. Создается при необходимости.
+    max_bytes : int
+        Максимальный суммарный размер сегментов, байты. При превышении сначала выполняется
+        уплотнение, затем удаляются самые старые сегменты. По умолчанию — 1 ГиБ.
+    segment_bytes : int
+        Размер сегмента, после которого запись продолжается в новом сегменте, байты.
+        По умолчанию — 16 МиБ.
+    fsync : bool
+        Сбрасывать ли каждую запись на диск вызовом os.fsync. По умолчанию — False.
+    dropped_records : int
+        Количество неотправленных записей, удаленных из-за ограничения max_bytes.
+    dropped_points : int
+        Количество точек в удаленных записях.
+
+    Методы
+    -------
+    append(params: dict, points: int, key: Optional[int] = None)
+        Добавляет тело запроса set_data в спул.
+    append_snapshots(snapshots: List[Tuple[Tag, TagData]])
+        Добавляет отсоединенные данные тегов в спул.
+    append_tags(tags: List[Tag])
+        Отсоединяет данные тегов и добавляет их в спул. Подходит как обработчик spill писателя.
+    pending()
+        Возвращает неподтвержденные записи в порядке воспроизведения.
+    read(record: SpoolRecord)
+        Читает тело запроса из записи.
+    ack(record: SpoolRecord)
+        Подтверждает отправку записи.
+    compact()
+        Удаляет подтвержденные записи с диска.
+    close()
+        Закрывает текущий сегмент.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если запись больше max_bytes или повреждена.
+    OSError: При ошибках файловой системы.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1 << 30,
+        segment_bytes: int = 16 << 20,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self.dropped_records = 0
+        self.dropped_points = 0
+        self._lock = threading.RLock()
+        self._records: Dict[int, List[SpoolRecord]] = {}
+        self._sizes: Dict[int, int] = {}
+        self._acked: Dict[int, Set[int]] = {}
+        self._active: Optional[int] = None
+        self._file = None
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    def __enter__(self) -> "DiskSpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер сегментов на диске, байты."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    @property
+    def pending_records(self) -> int:
+        """Количество неподтвержденных записей."""
+        with self._lock:
+            return sum(
+                len(records) - len(self._acked.get(segment, ()))
+                for segment, records in self._records.items()
+            )
+
+    @property
+    def pending_points(self) -> int:
+        """Количество точек в неподтвержденных записях."""
+        return sum(record.points for record in self.pending())
+
+    def _path(self, segment: int, suffix: str = SEGMENT_SUFFIX) -> str:
+        return os.path.join(self.directory, f"{segment:012d}{suffix}")
+
+    def _recover(self) -> None:
+        """Загружает сегменты каталога, отбрасывая оборванные и поврежденные записи в конце."""
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            segment = int(name[: -len(SEGMENT_SUFFIX)])
+            records, valid = self._scan(segment)
+            if valid < os.path.getsize(self._path(segment)):
+                os.truncate(self._path(segment), valid)
+            self._records[segment] = records
+            self._sizes[segment] = valid
+            self._acked[segment] = self._load_acks(segment)
+            self._drop_if_done(segment)
+
+    def _scan(self, segment: int) -> Tuple[List[SpoolRecord], int]:
+        records: List[SpoolRecord] = []
+        with open(self._path(segment), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return records, 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                offset = 0
+                while offset + HEADER.size <= size:
+                    magic, length, crc, key, points = HEADER.unpack_from(view, offset)
+                    start = offset + HEADER.size
+                    if magic != MAGIC or start + length > size:
+                        break
+                    if _checksum(key, points, view[start:start + length]) != crc:
+                        break
+                    records.append(SpoolRecord(segment, offset, length, key, points))
+                    offset = start + length
+        return records, offset
+
+    def _load_acks(self, segment: int) -> Set[int]:
+        try:
+            with open(self._path(segment, ACK_SUFFIX), "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return set()
+        usable = len(raw) - len(raw) % ACK.size
+        return {offset for (offset,) in ACK.iter_unpack(raw[:usable])}
+
+    def append(self, params: dict, points: int, key: Optional[int] = None) -> SpoolRecord:
+        """
+        Добавляет тело запроса set_data в конец текущего сегмента.
+
+        Параметры:
+        ----------
+        params (dict): тело запроса {"data": [{"tagId", "data"}, ...]}.
+        points (int): количество точек в запросе.
+        key (Optional[int]): ключ порядка воспроизведения. По умолчанию — текущее время
+            в микросекундах.
+
+        Возвращает:
+        ----------
+        SpoolRecord: добавленная запись.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если запись больше max_bytes.
+        """
+        body = encode_json_body(params)
+        if key is None:
+            key = time.time_ns() // 1000
+        with self._lock:
+            return self._write(body, key, points)
+
+    def append_snapshots(self, snapshots: List[Tuple[Tag, TagData]]) -> Optional[SpoolRecord]:
+        """
+        Добавляет отсоединенные данные тегов в спул одной записью.
+
+        Параметры:
+        ----------
+        snapshots (List[Tuple[Tag, TagData]]): теги и их данные, например полученные от Tag.drain.
+
+        Возвращает:
+        ----------
+        Optional[SpoolRecord]: добавленная запись или None, если данных нет.
+        """
+        snapshots = [(tag, data) for tag, data in snapshots if data]
+        if not snapshots:
+            return None
+        params = {"data": [tag_payload(tag.id, data, JSON_WIRE) for tag, data in snapshots]}
+        points = sum(len(data) for _, data in snapshots)
+        return self.append(params, points, sort_key(snapshots))
+
+    def append_tags(self, tags: List[Tag]) -> Optional[SpoolRecord]:
+        """
+        Отсоединяет данные тегов методом Tag.drain и добавляет их в спул.
+        Подходит как обработчик spill для BufferedWriter и AsyncBufferedWriter.
+
+        Параметры:
+        ----------
+        tags (List[Tag]): теги с данными.
+
+        Возвращает:
+        ----------
+        Optional[SpoolRecord]: добавленная запись или None, если данных нет.
+        """
+        return self.append_snapshots([(tag, tag.drain()) for tag in tags])
+
+    def _write(self, body: bytes, key: int, points: int) -> SpoolRecord:
+        size = HEADER.size + len(body)
+        if size > self.max_bytes:
+            raise ValueError(f"Запись размером {size} байт больше max_bytes спула")
+        self._make_room(size)
+        if self._file is None or self._sizes[self._active] + size > self.segment_bytes:
+            self._rotate()
+        return self._write_record(body, key, points)
+
+    def _write_record(self, body: bytes, key: int, points: int) -> SpoolRecord:
+        segment, offset = self._active, self._sizes[self._active]
+        self._file.write(HEADER.pack(MAGIC, len(body), _checksum(key, points, body), key, points))
+        self._file.write(body)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        record = SpoolRecord(segment, offset, len(body), key, points)
+        self._records[segment].append(record)
+        self._sizes[segment] += HEADER.size + len(body)
+        return record
+
+    def _rotate(self, sync: bool = False) -> None:
+        """Закрывает текущий сегмент (при sync — после сброса на диск) и начинает новый."""
+        previous = self._active
+        if self._file is not None:
+            if sync:
+                self._sync()
+            self._file.close()
+            self._file = None
+        segment = max(self._records, default=0) + 1
+        self._file = open(self._path(segment), "ab")
+        self._records[segment] = []
+        self._sizes[segment] = 0
+        self._acked[segment] = set()
+        self._active = segment
+        if previous is not None:
+            self._drop_if_done(previous)
+
+    def _make_room(self, size: int) -> None:
+        if sum(self._sizes.values()) + size <= self.max_bytes:
+            return
+        self._compact()
+        while sum(self._sizes.values()) + size > self.max_bytes:
+            oldest = min(self._records)
+            if oldest == self._active:
+                self._rotate()
+                if oldest not in self._records:
+                    continue
+            records = self._records[oldest]
+            acked = self._acked[oldest]
+            lost = [record for record in records if record.offset not in acked]
+            self.dropped_records += len(lost)
+            self.dropped_points += sum(record.points for record in lost)
+            self._remove(oldest)
+
+    def pending(self) -> List[SpoolRecord]:
+        """
+        Возвращает неподтвержденные записи в порядке воспроизведения:
+        по ключу сортировки, затем в порядке добавления.
+
+        Возвращает:
+        ----------
+        List[SpoolRecord]: записи.
+        """
+        with self._lock:
+            records = [
+                record
+                for segment, segment_records in self._records.items()
+                for record in segment_records
+                if record.offset not in self._acked[segment]
+            ]
+        records.sort(key=lambda record: (record.sort_key, record.segment, record.offset))
+        return records
+
+    def read(self, record: SpoolRecord) -> dict:
+        """
+        Читает тело запроса set_data из записи через mmap и проверяет контрольную сумму.
+
+        Параметры:
+        ----------
+        record (SpoolRecord): запись, полученная от pending.
+
+        Возвращает:
+        ----------
+        dict: тело запроса {"data": [{"tagId", "data"}, ...]}.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если контрольная сумма записи не совпадает.
+        """
+        with open(self._path(record.segment), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                start = record.offset + HEADER.size
+                body = view[start:start + record.length]
+                crc = HEADER.unpack_from(view, record.offset)[2]
+        if _checksum(record.sort_key, record.points, body) != crc:
+            raise ValueError(f"Запись спула {record.segment}:{record.offset} повреждена")
+        return get_codec().loads(body)
+
+    def ack(self, record: SpoolRecord) -> None:
+        """
+        Подтверждает отправку записи. Сегмент, все записи которого подтверждены,
+        удаляется сразу, остальные подтвержденные записи — при уплотнении.
+
+        Параметры:
+        ----------
+        record (SpoolRecord): отправленная запись.
+        """
+        with self._lock:
+            acked = self._acked.get(record.segment)
+            if acked is None or record.offset in acked:
+                return
+            with open(self._path(record.segment, ACK_SUFFIX), "ab") as f:
+                f.write(ACK.pack(record.offset))
+            acked.add(record.offset)
+            self._drop_if_done(record.segment)
+
+    def compact(self) -> int:
+        """
+        Уплотняет спул: неподтвержденные записи сегментов, содержащих подтвержденные
+        записи, переписываются в текущий сегмент, старые сегменты удаляются.
+
+        Возвращает:
+        ----------
+        int: количество освобожденных байт.
+        """
+        with self._lock:
+            return self._compact()
+
+    def _compact(self) -> int:
+        before = sum(self._sizes.values())
+        if self._active is not None and self._acked[self._active]:
+            self._rotate()
+        for segment in sorted(self._records):
+            if segment == self._active or not self._acked[segment]:
+                continue
+            acked = self._acked[segment]
+            survivors = [record for record in self._records[segment] if record.offset not in acked]
+            if survivors:
+                self._rewrite(segment, survivors)
+            self._remove(segment)
+        return before - sum(self._sizes.values())
+
+    def _rewrite(self, segment: int, survivors: List[SpoolRecord]) -> None:
+        """
+        Переписывает неподтвержденные записи сегмента в текущий сегмент и сбрасывает их
+        на диск (os.fsync) независимо от настройки fsync: старый сегмент удаляется только
+        после этого. При ошибке записи старый сегмент остается, а уже записанные копии
+        отмечаются подтвержденными, чтобы не воспроизводиться повторно.
+        """
+        with open(self._path(segment), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                bodies = [
+                    view[record.offset + HEADER.size:record.offset + record.size]
+                    for record in survivors
+                ]
+        copies: List[SpoolRecord] = []
+        try:
+            for record, body in zip(survivors, bodies):
+                if self._file is None or self._sizes[self._active] + record.size > self.segment_bytes:
+                    self._rotate(sync=True)
+                copies.append(self._write_record(body, record.sort_key, record.points))
+            self._sync()
+        except OSError:
+            self._abandon(copies)
+            raise
+
+    def _sync(self) -> None:
+        """Сбрасывает текущий сегмент и запись о нем в каталоге на диск."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        if os.name == "posix":
+            directory = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def _abandon(self, copies: List[SpoolRecord]) -> None:
+        """Отбрасывает копии записей неудавшегося уплотнения и оборванный хвост сегмента."""
+        try:
+            if self._file is not None:
+                self._file.truncate(self._sizes[self._active])
+            for copy in copies:
+                self.ack(copy)
+        except OSError:
+            # Копии, оставшиеся неподтвержденными, будут отправлены повторно, но не потеряны.
+            for copy in copies:
+                acked = self._acked.get(copy.segment)
+                if acked is not None:
+                    acked.add(copy.offset)
+
+    def _drop_if_done(self, segment: int) -> None:
+        if segment != self._active and len(self._acked[segment]) >= len(self._records[segment]):
+            self._remove(segment)
+
+    def _remove(self, segment: int) -> None:
+        del self._records[segment], self._sizes[segment], self._acked[segment]
+        for suffix in (SEGMENT_SUFFIX, ACK_SUFFIX):
+            try:
+                os.remove(self._path(segment, suffix))
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """
+        Закрывает текущий сегмент. Следующая запись начнет новый сегмент.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                previous, self._active = self._active, None
+                self._drop_if_done(previous)
+
+
+def _checksum(key: int, points: int, body: bytes) -> int:
+    return zlib.crc32(body, zlib.crc32(CHECKED_FIELDS.pack(key, points)))
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from spool.disk_spool import DiskSpool
+
+
+class SpoolReplayer:
+    """
+    Класс, представляющий воспроизведение спула: отправку сохраненных на диске данных
+    на платформу после восстановления связи. Записи отправляются по одной в порядке
+    меток времени в JSON-теле запроса (send_set_data_body) при любом wire.mode клиента
+    и подтверждаются в спуле после успешной отправки. Скорость отправки
+    ограничивается max_points_per_second, чтобы воспроизведение не вытесняло текущие данные.
+
+    Атрибуты
+    ----------
+    spool : DiskSpool
+        Воспроизводимый спул.
+    client : Union[DataInteractionClient, AsyncDataInteractionClient]
+        Клиент, через который отправляются данные.
+    max_points_per_second : Optional[float]
+        Ограничение скорости отправки, точки в секунду. None — без ограничения.
+        По умолчанию — None.
+    interval : float
+        Пауза между попытками воспроизведения фонового потока, секунды. По умолчанию — 5.
+    on_error : Optional[Callable[[Exception], None]]
+        Вызывается фоновым потоком при ошибке отправки.
+    replayed_points : int
+        Количество отправленных точек.
+
+    Методы
+    -------
+    replay(max_records: Optional[int] = None)
+        Отправляет записи спула через синхронный клиент.
+    areplay(max_records: Optional[int] = None)
+        Асинхронно отправляет записи спула через асинхронный клиент.
+    start()
+        Запускает фоновый поток воспроизведения (синхронный клиент).
+    stop(timeout: Optional[float] = None)
+        Останавливает воспроизведение: фоновый поток и выполняющиеся replay/areplay.
+    """
+
+    def __init__(
+        self,
+        spool: DiskSpool,
+        client: Union[DataInteractionClient, AsyncDataInteractionClient],
+        max_points_per_second: Optional[float] = None,
+        interval: float = 5.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.spool = spool
+        self.client = client
+        self.max_points_per_second = max_points_per_second
+        self.interval = interval
+        self.on_error = on_error
+        self.last_error: Optional[Exception] = None
+        self.replayed_points = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _pause(self, started: float, points: int) -> float:
+        """Возвращает паузу до следующей записи, при которой скорость не превышает ограничение."""
+        if self.max_points_per_second is None:
+            return 0.0
+        return max(started + points / self.max_points_per_second - time.monotonic(), 0.0)
+
+    def replay(self, max_records: Optional[int] = None) -> int:
+        """
+        Отправляет записи спула через синхронный клиент до первой ошибки
+        или остановки (stop).
+
+        Параметры:
+        ----------
+        max_records (Optional[int]): максимальное количество записей. По умолчанию — все.
+
+        Возвращает:
+        ----------
+        int: количество отправленных точек.
+
+        Ошибки, исключения:
+        -------
+        Ошибки отправки клиента. Записи, отправленные до ошибки, подтверждены в спуле.
+        """
+        started, sent = time.monotonic(), 0
+        for record in self.spool.pending()[:max_records]:
+            if self._stop.wait(self._pause(started, sent)):
+                break
+            self.client.send_set_data_body(self.spool.read(record))
+            self.spool.ack(record)
+            sent += record.points
+            self.replayed_points += record.points
+        return sent
+
+    async def areplay(self, max_records: Optional[int] = None) -> int:
+        """
+        Асинхронно отправляет записи спула через асинхронный клиент до первой ошибки
+        или остановки (stop).
+
+        Параметры:
+        ----------
+        max_records (Optional[int]): максимальное количество записей. По умолчанию — все.
+
+        Возвращает:
+        ----------
+        int: количество отправленных точек.
+
+        Ошибки, исключения:
+        -------
+        Ошибки отправки клиента. Записи, отправленные до ошибки, подтверждены в спуле.
+        """
+        started, sent = time.monotonic(), 0
+        for record in self.spool.pending()[:max_records]:
+            await asyncio.sleep(self._pause(started, sent))
+            if self._stop.is_set():
+                break
+            await self.client.send_set_data_body(self.spool.read(record))
+            self.spool.ack(record)
+            sent += record.points
+            self.replayed_points += record.points
+        return sent
+
+    def start(self) -> None:
+        """
+        Запускает фоновый поток, который воспроизводит спул каждые interval секунд.
+        Ошибки отправки сохраняются в last_error и передаются в on_error.
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="SpoolReplayer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Останавливает фоновый поток воспроизведения.
+
+        Параметры:
+        ----------
+        timeout (Optional[float]): максимальное время ожидания остановки, секунды.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.replay()
+                self.spool.compact()
+            except Exception as e:
+                self.last_error = e
+                if self.on_error is not None:
+                    self.on_error(e)
+            self._stop.wait(self.interval)
@@ -0,0 +1,69 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Literal
+
+from pydantic import ConfigDict, validate_call
+
+ValidationMode = Literal["strict", "boundary", "off"]
+
+_INTERNAL: ContextVar[bool] = ContextVar("internal_call", default=False)
+
+
+@contextmanager
+def internal_call() -> Iterator[None]:
+    """
+    Отмечает вызовы методов клиента внутри блока как внутренние: в режиме "boundary"
+    их аргументы уже проверены и повторно не проверяются. Используется писателями
+    и составными методами клиента (get_data_many, iter_data).
+    """
+    token = _INTERNAL.set(True)
+    try:
+        yield
+    finally:
+        _INTERNAL.reset(token)
+
+
+def validated(boundary: bool = True) -> Callable[[Callable], Callable]:
+    """
+    Декоратор метода клиента: проверяет аргументы pydantic.validate_call
+    в зависимости от атрибута validation экземпляра.
+
+    "strict" — проверяются все вызовы; "boundary" — только внешние вызовы публичных
+    методов (boundary=True), внутренние методы и вызовы внутри internal_call()
+    не проверяются; "off" — проверка отключена. Экземпляры моделей (Tag) в любом
+    режиме повторно не валидируются.
+
+    Параметры:
+    ----------
+    boundary (bool): True — публичный метод, False — внутренний. По умолчанию — True.
+
+    Возвращает:
+    ----------
+    Callable[[Callable], Callable]: декоратор.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        checked = validate_call(func, config=ConfigDict(arbitrary_types_allowed=True))
+
+        def select(self) -> Callable:
+            mode = self.validation
+            if mode == "strict" or (mode == "boundary" and boundary and not _INTERNAL.get()):
+                return checked
+            return func
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                return await select(self)(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            return select(self)(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,294 @@
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Union
+
+from data_interaction_client import DataInteractionClient
+from models.tag import Tag
+from validation.validated_call import internal_call
+from writers.write_buffer import OverflowPolicy, WriteBuffer
+
+
+class BufferedWriter:
+    """
+    Класс, представляющий фоновый писатель данных тегов поверх DataInteractionClient.set_data.
+    Производители добавляют точки через add_data писателя или через Tag.add_data тегов,
+    подключенных методом attach, и никогда не ждут сетевого ввода-вывода: отправку выполняет
+    фоновый поток, объединяя все теги с новыми данными в один запрос.
+    Данные отправляются при достижении порога количества точек, оценочного объема
+    или возраста самой старой точки. Объем неотправленных данных ограничен max_pending_points.
+    Точки подключенных тегов хранятся в самих тегах до отправки: они не ограничиваются
+    max_pending_points и не учитываются в порогах количества и объема, а отправляются
+    по возрасту (max_age), при flush или вместе с очередным пакетом.
+
+    Атрибуты
+    ----------
+    client : DataInteractionClient
+        Клиент, через который отправляются данные.
+    max_batch_points : int
+        Количество накопленных точек, при котором данные отправляются. По умолчанию — 10000.
+    max_batch_bytes : Optional[int]
+        Оценочный объем накопленных данных в байтах, при котором данные отправляются.
+        По умолчанию — None.
+    max_age : float
+        Максимальное время хранения точки до отправки, секунды. По умолчанию — 1.
+    max_pending_points : int
+        Максимальное количество неотправленных точек. По умолчанию — 100000.
+    overflow : OverflowPolicy
+        Поведение при переполнении: "block", "drop_oldest" или "spill". По умолчанию — "block".
+    spill : Optional[Callable[[List[Tag]], None]]
+        Обработчик вытесненных данных для политики "spill".
+    retry_interval : float
+        Пауза перед повторной отправкой пакета после ошибки, секунды. По умолчанию — 1.
+    on_error : Optional[Callable[[Exception], None]]
+        Вызывается при ошибке отправки пакета.
+
+    Методы
+    -------
+    attach(tags: Iterable[Tag])
+        Подключает теги: данные, добавленные через Tag.add_data, отправляются писателем.
+    add_data(tag: Tag, x: Union[str, int], y: int, q: Optional[int] = 0)
+        Добавляет точку тега в очередь на отправку.
+    add_many(tag: Tag, xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None)
+        Добавляет несколько точек тега в очередь на отправку.
+    flush(timeout: Optional[float] = None)
+        Отправляет накопленные данные и ждет завершения отправки.
+    close(timeout: Optional[float] = None)
+        Отправляет накопленные данные и останавливает фоновый поток.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если политика переполнения неизвестна или для "spill" не задан обработчик.
+    RuntimeError: При добавлении данных в закрытый писатель.
+    """
+
+    def __init__(
+        self,
+        client: DataInteractionClient,
+        max_batch_points: int = 10_000,
+        max_batch_bytes: Optional[int] = None,
+        max_age: float = 1.0,
+        max_pending_points: int = 100_000,
+        overflow: OverflowPolicy = "block",
+        spill: Optional[Callable[[List[Tag]], None]] = None,
+        retry_interval: float = 1.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.client = client
+        self.on_error = on_error
+        self.last_error: Optional[Exception] = None
+        self._buffer = WriteBuffer(
+            max_batch_points=max_batch_points,
+            max_batch_bytes=max_batch_bytes,
+            max_age=max_age,
+            max_pending_points=max_pending_points,
+            overflow=overflow,
+            spill=spill,
+            retry_interval=retry_interval,
+        )
+        self._condition = threading.Condition()
+        self._buffer.dirty.on_mark = self._wake
+        self._attached: List[Tag] = []
+        self._closed = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="BufferedWriter", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def pending_points(self) -> int:
+        """Количество неотправленных точек."""
+        return self._buffer.pending_points
+
+    @property
+    def dropped_points(self) -> int:
+        """Количество точек, отброшенных политикой "drop_oldest"."""
+        return self._buffer.dropped_points
+
+    @property
+    def spilled_points(self) -> int:
+        """Количество точек, переданных в обработчик spill."""
+        return self._buffer.spilled_points
+
+    def attach(self, tags: Iterable[Tag]) -> None:
+        """
+        Подключает теги к писателю: точки, добавленные через Tag.add_data и Tag.add_many,
+        отсоединяются методом Tag.drain и отправляются фоновым потоком. Тег отмечается
+        при первом добавлении точки после drain, поэтому писатель не перебирает все
+        подключенные теги. Данные, уже накопленные тегом, отправляются с ближайшим пакетом.
+
+        Параметры:
+        ----------
+        tags (Iterable[Tag]): теги, например реестр тегов TagRegistry.
+
+        Ошибки, исключения:
+        -------
+        RuntimeError: Если писатель закрыт.
+        """
+        tags = list(tags)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Писатель закрыт")
+            self._attached.extend(tags)
+        for tag in tags:
+            tag.watch(self._buffer.dirty)
+
+    def _wake(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def add_data(
+        self, tag: Tag, x: Union[str, int], y: int, q: Optional[int] = 0
+    ) -> None:
+        """
+        Добавляет точку тега в очередь на отправку.
+        При переполнении и политике "block" ожидает освобождения места.
+        Если у тега задано сжатие, в очередь попадают только точки, сохраненные сжатием.
+
+        Параметры:
+        ----------
+        tag (Tag): тег, к которому относится точка.
+        x (Union[str, int]): метка времени.
+        y (int): значение.
+        q (Optional[int]): качество. По умолчанию — 0.
+
+        Ошибки, исключения:
+        -------
+        RuntimeError: Если писатель закрыт.
+        """
+        points = tag.compress(x, y, q)
+        with self._condition:
+            for point in points:
+                self._reserve()
+                if self._buffer.stage(tag, *point):
+                    self._condition.notify_all()
+
+    def add_many(
+        self, tag: Tag, xs: Iterable, ys: Iterable, qs: Optional[Iterable] = None
+    ) -> None:
+        """
+        Добавляет несколько точек тега в очередь на отправку.
+
+        Параметры:
+        ----------
+        tag (Tag): тег, к которому относятся точки.
+        xs (Iterable): метки времени.
+        ys (Iterable): значения.
+        qs (Optional[Iterable]): качество. По умолчанию — 0 для всех точек.
+
+        Ошибки, исключения:
+        -------
+        ValueError: Если длины xs, ys и qs различаются.
+        RuntimeError: Если писатель закрыт.
+        """
+        xs, ys = list(xs), list(ys)
+        qs = [0] * len(xs) if qs is None else list(qs)
+        if not len(xs) == len(ys) == len(qs):
+            raise ValueError("Длины xs, ys и qs должны совпадать")
+        for x, y, q in zip(xs, ys, qs):
+            self.add_data(tag, x, y, q)
+
+    def _reserve(self) -> None:
+        while True:
+            if self._closed:
+                raise RuntimeError("Писатель закрыт")
+            if self._buffer.has_room():
+                return
+            if self._buffer.overflow != "block" and self._buffer.make_room():
+                continue
+            # Место освободится только после отправки: не ждем порогов.
+            self._buffer.request_flush()
+            self._condition.notify_all()
+            self._condition.wait()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Отправляет накопленные данные, не дожидаясь порогов, и ждет завершения отправки.
+
+        Параметры:
+        ----------
+        timeout (Optional[float]): максимальное время ожидания, секунды. По умолчанию — без ограничения.
+
+        Возвращает:
+        ----------
+        bool: True, если все данные отправлены.
+        """
+        with self._condition:
+            self._buffer.request_flush()
+            self._condition.notify_all()
+            return self._condition.wait_for(self._buffer.is_empty, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Отправляет накопленные данные и останавливает фоновый поток.
+        Новые данные после вызова не принимаются: подключенные теги отключаются,
+        отправляются только данные, накопленные ими до вызова.
+
+        Параметры:
+        ----------
+        timeout (Optional[float]): максимальное время ожидания отправки, секунды.
+            По умолчанию — без ограничения.
+
+        Возвращает:
+        ----------
+        bool: True, если все данные отправлены до остановки.
+        """
+        with self._condition:
+            self._closed = True
+        self._detach()
+        with self._condition:
+            self._buffer.request_flush()
+            self._condition.notify_all()
+            sent = self._condition.wait_for(self._buffer.is_empty, timeout)
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join()
+        return sent
+
+    def _detach(self) -> None:
+        with self._condition:
+            attached, self._attached = self._attached, []
+        for tag in attached:
+            tag.unwatch(self._buffer.dirty)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    if self._buffer.should_flush(now):
+                        break
+                    self._condition.wait(self._buffer.wait_timeout(now))
+                if self._stopped:
+                    return
+                batch = self._buffer.take_batch()
+            if batch is None:
+                continue
+            error = None
+            try:
+                with internal_call():
+                    self.client.set_data(batch.tags)
+            except Exception as e:
+                error = e
+                with self._condition:
+                    self.last_error = e
+                    self._buffer.retain(batch)
+                    pending_points = self._buffer.pending_points
+                    self._condition.notify_all()
+                if self.on_error is not None:
+                    self.on_error(e)
+            else:
+                with self._condition:
+                    self._buffer.complete(batch)
+                    pending_points = self._buffer.pending_points
+                    self._condition.notify_all()
+            instrumentation = self.client.instrumentation
+            if instrumentation is not None:
+                age = None if batch.staged_at is None else time.monotonic() - batch.staged_at
+                instrumentation.batch_sent(batch.points, pending_points, age, error)
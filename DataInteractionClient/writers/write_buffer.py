@@ -0,0 +1,295 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Literal, Optional, Tuple, Union
+
+from buffers.dirty_tags import DirtyTags
+from models.tag import Tag
+
+OverflowPolicy = Literal["block", "drop_oldest", "spill"]
+
+# Служебные символы JSON-точки: {"x":,"y":,"q":} и разделитель.
+POINT_OVERHEAD_BYTES = 17
+
+
+class Batch:
+    """
+    Класс, представляющий пакет данных, отправляемый одним вызовом set_data.
+
+    Атрибуты
+    ----------
+    tags : List[Tag]
+        Отсоединенные от производителей теги с данными пакета.
+    points : int
+        Количество точек в пакете.
+    staged_at : Optional[float]
+        Момент (time.monotonic) добавления первой точки пакета.
+    """
+
+    __slots__ = ("tags", "points", "staged_at")
+
+    def __init__(self, tags: List[Tag], points: int, staged_at: Optional[float] = None) -> None:
+        self.tags = tags
+        self.points = points
+        self.staged_at = staged_at
+
+
+class WriteBuffer:
+    """
+    Класс, представляющий ограниченный по памяти буфер фонового писателя без операций ввода-вывода.
+    Накапливает точки по тегам, решает, когда пора отправлять данные, формирует пакеты
+    и хранит пакеты, отправка которых завершилась ошибкой. Кроме собственных точек
+    в пакет попадают данные тегов, отмеченных в наборе dirty (Tag.add_data тегов,
+    подключенных к писателю): они отсоединяются методом Tag.drain при формировании пакета.
+    Не потокобезопасен: синхронизацию обеспечивает писатель.
+
+    Атрибуты
+    ----------
+    max_batch_points : int
+        Количество накопленных точек, при котором данные отправляются.
+    max_batch_bytes : Optional[int]
+        Оценочный объем накопленных данных в байтах, при котором данные отправляются.
+    max_age : float
+        Максимальное время хранения точки до отправки, секунды.
+    max_pending_points : int
+        Максимальное количество неотправленных точек (накопленных и ожидающих повтора).
+    overflow : OverflowPolicy
+        Поведение при переполнении: "block" — ждать освобождения места,
+        "drop_oldest" — отбрасывать самые старые данные, "spill" — передавать самые
+        старые данные в обработчик spill.
+    spill : Optional[Callable[[List[Tag]], None]]
+        Обработчик вытесненных данных для политики "spill".
+    retry_interval : float
+        Пауза перед повторной отправкой пакета после ошибки, секунды.
+    pending_points : int
+        Текущее количество неотправленных точек.
+    dropped_points : int
+        Количество отброшенных точек.
+    spilled_points : int
+        Количество вытесненных в spill точек.
+    dirty : DirtyTags
+        Подключенные теги, получившие данные через Tag.add_data. Их точки не учитываются
+        в порогах количества и объема и в max_pending_points до формирования пакета:
+        они хранятся в самих тегах и отправляются по возрасту или при flush.
+
+    Ошибки, исключения:
+    -------
+    ValueError: Если политика переполнения неизвестна или для "spill" не задан обработчик.
+    """
+
+    def __init__(
+        self,
+        max_batch_points: int = 10_000,
+        max_batch_bytes: Optional[int] = None,
+        max_age: float = 1.0,
+        max_pending_points: int = 100_000,
+        overflow: OverflowPolicy = "block",
+        spill: Optional[Callable[[List[Tag]], None]] = None,
+        retry_interval: float = 1.0,
+    ) -> None:
+        if overflow not in ("block", "drop_oldest", "spill"):
+            raise ValueError(f"Неизвестная политика переполнения: {overflow}")
+        if overflow == "spill" and spill is None:
+            raise ValueError("Для политики 'spill' необходимо задать обработчик spill")
+        self.max_batch_points = max_batch_points
+        self.max_batch_bytes = max_batch_bytes
+        self.max_age = max_age
+        self.max_pending_points = max_pending_points
+        self.overflow = overflow
+        self.spill = spill
+        self.retry_interval = retry_interval
+        self.pending_points = 0
+        self.dropped_points = 0
+        self.spilled_points = 0
+        self._staged: Dict[int, Tuple[Tag, Deque[tuple]]] = {}
+        self._order: Deque[int] = deque()
+        self._staged_points = 0
+        self._staged_bytes = 0
+        self._first_staged_at: Optional[float] = None
+        self._retained: Deque[Batch] = deque()
+        self._retry_at = 0.0
+        self._force = False
+        self.dirty = DirtyTags()
+
+    def is_empty(self) -> bool:
+        """Проверяет, что неотправленных данных нет."""
+        return self.pending_points == 0 and not self.dirty
+
+    def _oldest(self) -> Optional[float]:
+        """Момент появления самых старых неотправленных данных (точки или подключенного тега)."""
+        marked_at = self.dirty.marked_at
+        if self._first_staged_at is None:
+            return marked_at
+        if marked_at is None:
+            return self._first_staged_at
+        return min(self._first_staged_at, marked_at)
+
+    def has_room(self, points: int = 1) -> bool:
+        """Проверяет, можно ли принять указанное количество точек без переполнения."""
+        return self.pending_points + points <= self.max_pending_points
+
+    def stage(self, tag: Tag, x: Union[str, int], y: int, q: Optional[int] = 0) -> bool:
+        """
+        Добавляет точку тега в буфер.
+
+        Параметры:
+        ----------
+        tag (Tag): тег, к которому относится точка.
+        x (Union[str, int]): метка времени.
+        y (int): значение.
+        q (Optional[int]): качество. По умолчанию — 0.
+
+        Возвращает:
+        ----------
+        bool: True, если данные нужно отправить сейчас или изменился срок отправки по возрасту.
+        """
+        key = id(tag)
+        entry = self._staged.get(key)
+        if entry is None:
+            entry = self._staged[key] = (tag, deque())
+        entry[1].append((x, y, q))
+        self._order.append(key)
+        self._staged_points += 1
+        self._staged_bytes += len(str(x)) + len(str(y)) + len(str(q)) + POINT_OVERHEAD_BYTES
+        self.pending_points += 1
+        if self._first_staged_at is None:
+            self._first_staged_at = time.monotonic()
+            return True
+        return self.should_flush(time.monotonic())
+
+    def make_room(self) -> bool:
+        """
+        Освобождает место согласно политике "drop_oldest" или "spill".
+        Сначала вытесняются пакеты, ожидающие повторной отправки, затем накопленные точки.
+
+        Возвращает:
+        ----------
+        bool: False, если вытеснять нечего и место занято пакетом, который сейчас отправляется.
+        """
+        if self._retained:
+            batch = self._retained.popleft()
+            self.pending_points -= batch.points
+            self._discard(batch)
+        elif not self._staged_points:
+            return False
+        elif self.overflow == "drop_oldest":
+            key = self._order.popleft()
+            points = self._staged[key][1]
+            points.popleft()
+            if not points:
+                del self._staged[key]
+            self._staged_points -= 1
+            self.pending_points -= 1
+            self.dropped_points += 1
+        else:
+            batch = self._take_staged()
+            self.pending_points -= batch.points
+            self._discard(batch)
+        return True
+
+    def _discard(self, batch: Batch) -> None:
+        if self.overflow == "spill":
+            self.spill(batch.tags)
+            self.spilled_points += batch.points
+        else:
+            self.dropped_points += batch.points
+
+    def request_flush(self) -> None:
+        """Требует отправить накопленные данные, не дожидаясь порогов."""
+        self._force = True
+
+    def should_flush(self, now: float) -> bool:
+        """
+        Проверяет, пора ли отправлять данные.
+
+        Параметры:
+        ----------
+        now (float): текущее время time.monotonic().
+
+        Возвращает:
+        ----------
+        bool: True, если есть пакет к отправке.
+        """
+        if self._retained:
+            return now >= self._retry_at
+        if not self._staged_points and not self.dirty:
+            return False
+        oldest = self._oldest()
+        return (
+            self._force
+            or self._staged_points >= self.max_batch_points
+            or (
+                self.max_batch_bytes is not None
+                and self._staged_bytes >= self.max_batch_bytes
+            )
+            or (oldest is not None and now - oldest >= self.max_age)
+        )
+
+    def wait_timeout(self, now: float) -> Optional[float]:
+        """
+        Возвращает время до ближайшей отправки по возрасту или повтору, секунды,
+        либо None, если данных нет.
+        """
+        if self._retained:
+            return max(self._retry_at - now, 0.0)
+        oldest = self._oldest()
+        if oldest is None:
+            return None
+        return max(oldest + self.max_age - now, 0.0)
+
+    def take_batch(self) -> Optional[Batch]:
+        """
+        Извлекает следующий пакет к отправке: сначала самый старый пакет, ожидающий повтора,
+        затем все накопленные точки и данные подключенных тегов, объединенные в один пакет.
+
+        Возвращает:
+        ----------
+        Optional[Batch]: пакет или None, если данных нет.
+        """
+        if self._retained:
+            return self._retained.popleft()
+        batch = self._take_staged() if self._staged_points or self.dirty else None
+        if batch is None or not batch.points:
+            self._force = False
+            return None
+        return batch
+
+    def _take_staged(self) -> Batch:
+        staged, points = self._staged, self._staged_points
+        staged_at = self._oldest()
+        self._staged = {}
+        self._order.clear()
+        self._staged_points = 0
+        self._staged_bytes = 0
+        self._first_staged_at = None
+        outgoing: Dict[int, Tag] = {}
+        for tag, tag_points in staged.values():
+            copy = outgoing[id(tag)] = Tag.trusted(
+                tag.id, tag.attributes, buffer_mode=tag.buffer_mode, timestamps=tag.timestamps,
+                naive_timezone=tag.naive_timezone,
+            )
+            copy.add_many(*zip(*tag_points))
+        for tag in self.dirty.take():
+            snapshot = tag.drain()
+            if not snapshot:
+                continue
+            copy = outgoing.get(id(tag))
+            if copy is None:
+                copy = outgoing[id(tag)] = Tag.trusted(
+                    tag.id, tag.attributes, buffer_mode=tag.buffer_mode,
+                    timestamps=tag.timestamps, naive_timezone=tag.naive_timezone,
+                )
+            copy.requeue(snapshot)
+            points += len(snapshot)
+            self.pending_points += len(snapshot)
+        return Batch(list(outgoing.values()), points, staged_at)
+
+    def complete(self, batch: Batch) -> None:
+        """Отмечает пакет как успешно отправленный."""
+        self.pending_points -= batch.points
+        if not self._retained and not self._staged_points:
+            self._force = False
+
+    def retain(self, batch: Batch) -> None:
+        """Возвращает пакет, отправка которого завершилась ошибкой, в начало очереди повтора."""
+        self._retained.appendleft(batch)
+        self._retry_at = time.monotonic() + self.retry_interval
@@ -0,0 +1,72 @@
+"""
+Сравнение кодеков JSON (WireConfig.codec): время построения тела set_data из списка
+словарей и из колоночного буфера и время разбора ответа get_data. Измеряются только
+установленные кодеки.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_codec [количество точек] [количество тегов]
+"""
+import sys
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from buffers.columnar_buffer import ColumnarBuffer
+from serialization import codecs
+from serialization.codecs import get_codec
+from serialization.payload import encode_json_body
+
+REPEATS = 3
+
+
+def make_records(points: int, tags: int) -> dict:
+    per_tag = points // tags
+    return {"data": [
+        {"tagId": f"tag{tag}", "data": [
+            {"x": 1704056400000000 + i * 1_000_000, "y": i % 1000 + 0.5, "q": 0}
+            for i in range(per_tag)
+        ]}
+        for tag in range(tags)
+    ]}
+
+
+def make_columnar(records: dict) -> dict:
+    data = []
+    for entry in records["data"]:
+        buffer = ColumnarBuffer()
+        points = entry["data"]
+        buffer.extend(
+            [p["x"] for p in points], [p["y"] for p in points], [p["q"] for p in points]
+        )
+        data.append({"tagId": entry["tagId"], "data": buffer})
+    return {"data": data}
+
+
+def best_of(func) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tags = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    records = make_records(points, tags)
+    columnar = make_columnar(records)
+    response = get_codec("json").dumps({"error": {"id": 0}, **records})
+    names = ["json"] + [name for name in ("orjson", "msgspec") if getattr(codecs, name) is not None]
+    print(f"{'кодек':>8} {'set_data словари, с':>20} {'set_data колонки, с':>20} {'get_data, с':>12}")
+    for name in names:
+        codec = get_codec(name)
+        print(
+            f"{name:>8} {best_of(lambda: encode_json_body(records, codec)):>20.3f}"
+            f" {best_of(lambda: encode_json_body(columnar, codec)):>20.3f}"
+            f" {best_of(lambda: codec.loads(response)):>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Коэффициент сжатия и объем тела set_data для зашумленной синусоиды и медленно меняющегося
+значения без сжатия, с зоной нечувствительности и со сжатием «вращающейся двери».
+Также приводится время добавления точки.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_compression [точек]
+"""
+import math
+import random
+import sys
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from models.compression_config import CompressionConfig
+from models.tag import Tag
+from serialization.payload import encode_json_body
+
+CONFIGS = {
+    "нет": None,
+    "deadband=0.5": CompressionConfig(deadband=0.5),
+    "swinging_door=0.5": CompressionConfig(swinging_door=0.5),
+    "door+max_interval": CompressionConfig(swinging_door=0.5, max_interval=60_000_000),
+}
+
+
+def signals(points: int) -> dict:
+    rng = random.Random(1)
+    return {
+        "синусоида с шумом": [math.sin(i / 200) * 20 + rng.gauss(0, 0.1) for i in range(points)],
+        "медленный дрейф": [50 + i * 1e-4 + rng.gauss(0, 0.05) for i in range(points)],
+    }
+
+
+def measure(values: list, config) -> tuple:
+    tag = Tag(id="tag", attributes={}, compression=config)
+    xs = range(0, len(values) * 1_000_000, 1_000_000)
+    started = time.perf_counter()
+    for x, y in zip(xs, values):
+        tag.add_data(x, y)
+    elapsed = time.perf_counter() - started
+    ratio = tag.compressor.ratio if tag.compressor is not None else 1.0
+    data = [{"tagId": tag.id, "data": tag.drain()}]
+    body = encode_json_body({"tags": data})
+    return ratio, len(body), elapsed / len(values)
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'сигнал':>18} {'сжатие':>18} {'коэфф.':>8} {'тело, КБ':>9} {'мкс/точку':>10}")
+    for signal, values in signals(points).items():
+        for name, config in CONFIGS.items():
+            ratio, size, per_point = measure(values, config)
+            print(f"{signal:>18} {name:>18} {ratio:>8.1f} {size / 1024:>9.1f} {per_point * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Сравнение разбора ответа connect для источника с большим числом тегов: список
+экземпляров Tag (прежний способ) и реестр TagRegistry — время и удерживаемая память
+сразу после connect и после обращения к 1% тегов.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_connect [количество тегов]
+"""
+import sys
+import time
+import tracemalloc
+
+sys.path.append("DataInteractionClient/")
+
+from models.tag import Tag
+from models.tag_registry import TagRegistry
+
+
+def make_tags_data(count: int) -> list:
+    return [
+        {
+            "id": f"tag{i}",
+            "attributes": {"smtTagValueTypeCode": 1, "smtTagValueScale": 1, "smtTagMaxDev": 1},
+        }
+        for i in range(count)
+    ]
+
+
+def tag_list(tags_data: list):
+    return [Tag(id=item["id"], attributes=item["attributes"]) for item in tags_data]
+
+
+def touch(tags, count: int) -> None:
+    for i in range(0, count, 100):
+        tags[i].add_data(i, i)
+
+
+def measure(build, tags_data: list) -> dict:
+    started = time.perf_counter()
+    build(tags_data)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    tags = build(tags_data)
+    retained = tracemalloc.get_traced_memory()[0]
+    touch(tags, len(tags_data))
+    touched = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {"seconds": elapsed, "retained": retained, "touched": touched}
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    tags_data = make_tags_data(count)
+    print(f"{'способ':>12} {'время, мс':>10} {'память, МБ':>11} {'после 1%, МБ':>13}")
+    for name, build in (("List[Tag]", tag_list), ("TagRegistry", TagRegistry)):
+        result = measure(build, tags_data)
+        print(
+            f"{name:>12} {result['seconds'] * 1e3:>10.1f} {result['retained'] / 2**20:>11.2f}"
+            f" {result['touched'] / 2**20:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Задержка цикла событий во время AsyncDataInteractionClient.set_data большого пакета
+(JSON-тело со сжатием gzip): кодирование на месте, в пуле потоков и в пуле процессов
+(PayloadEncoder). Параллельно сопрограмма-монитор каждую миллисекунду измеряет, на сколько
+позже назначенного она просыпается. HTTP-запрос заменен заглушкой httpx.AsyncClient.post.
+Приводятся медиана длительности set_data и p99/максимум задержки цикла событий.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_event_loop_lag [тегов] [точек на тег] [повторы]
+"""
+import asyncio
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+from unittest.mock import patch
+
+import httpx
+
+sys.path.append("DataInteractionClient/")
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from models.tag import Tag
+from models.wire_config import WireConfig
+from serialization.payload_encoder import PayloadEncoder
+
+OK = json.dumps({"error": {"id": 0}}).encode()
+WIRE = WireConfig(mode="json", compress_threshold=0)
+TICK = 0.001
+
+
+async def fake_post(self, url, **kwargs):
+    request = httpx.Request("POST", url, **kwargs)
+    return httpx.Response(200, content=OK, request=request)
+
+
+async def monitor(lags: List[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def fill(tags: List[Tag], points: int, round_index: int) -> None:
+    start = round_index * points
+    for tag in tags:
+        tag.add_many(range(start, start + points), [i * 0.5 for i in range(start, start + points)])
+
+
+async def run(
+    encoder: Optional[PayloadEncoder], buffer_mode: str, tag_count: int, points: int, repeats: int
+) -> dict:
+    tags = [Tag(id=f"tag{i}", attributes={}, buffer_mode=buffer_mode) for i in range(tag_count)]
+    durations, lags = [], []
+    async with AsyncDataInteractionClient(
+        base_url="http://localhost", wire=WIRE, encoder=encoder
+    ) as client:
+        for round_index in range(repeats):
+            fill(tags, points, round_index)
+            stop = asyncio.Event()
+            watcher = asyncio.create_task(monitor(lags, stop))
+            await asyncio.sleep(TICK)
+            started = time.perf_counter()
+            await client.set_data(tags)
+            durations.append(time.perf_counter() - started)
+            stop.set()
+            await watcher
+    lags.sort()
+    return {
+        "set_data_ms": statistics.median(durations) * 1e3,
+        "lag_p99_ms": lags[min(int(0.99 * len(lags)), len(lags) - 1)] * 1e3,
+        "lag_max_ms": lags[-1] * 1e3,
+    }
+
+
+def main() -> None:
+    tag_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    points = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    print(f"тегов: {tag_count}, точек на тег: {points}, повторов: {repeats}")
+    print(f"{'буфер':>9} {'кодирование':>12} {'set_data, мс':>13} {'лаг p99, мс':>12} {'лаг max, мс':>12}")
+    with patch.object(httpx.AsyncClient, "post", fake_post), ProcessPoolExecutor(2) as pool:
+        # Прогрев процессов пула: запуск интерпретатора не относится к кодированию.
+        list(pool.map(abs, range(2)))
+        for buffer_mode in ("list", "columnar"):
+            threads = PayloadEncoder()
+            variants = {
+                "на месте": None,
+                "потоки": threads,
+                "процессы": PayloadEncoder(pool),
+            }
+            for name, encoder in variants.items():
+                result = asyncio.run(run(encoder, buffer_mode, tag_count, points, repeats))
+                print(
+                    f"{buffer_mode:>9} {name:>12} {result['set_data_ms']:>13.1f}"
+                    f" {result['lag_p99_ms']:>12.1f} {result['lag_max_ms']:>12.1f}"
+                )
+            threads.close()
+
+
+if __name__ == "__main__":
+    main()
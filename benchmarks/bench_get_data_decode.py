@@ -0,0 +1,91 @@
+"""
+Сравнение разбора ответа get_data в список словарей и в колоночный вид (result_format="columnar")
+установленными кодеками: время разбора, пиковая и удерживаемая память. Метки времени — целые
+микросекунды и строки ISO 8601 (format_param).
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_get_data_decode [количество точек] [количество тегов]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+sys.path.append("DataInteractionClient/")
+
+from reading.columnar_result import decode_columnar, load_columnar
+from serialization.codecs import get_codec
+
+START = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=3)))
+
+
+def make_body(points: int, tags: int, iso: bool) -> bytes:
+    per_tag = points // tags
+    data = []
+    for tag in range(tags):
+        xs = [1704056400000000 + i * 1_000_000 for i in range(per_tag)]
+        if iso:
+            xs = [(START + timedelta(microseconds=x - xs[0])).isoformat() for x in xs]
+        data.append({
+            "tagId": f"tag{tag}",
+            "data": [{"x": x, "y": i % 1000 + 0.5, "q": 0} for i, x in enumerate(xs)],
+        })
+    return json.dumps({"error": {"id": 0}, "data": data}).encode()
+
+
+def decode(body: bytes, codec_name: str, columnar: bool):
+    response = httpx.Response(200, content=body)
+    codec = get_codec(codec_name)
+    if columnar:
+        return decode_columnar(load_columnar(response, codec)["data"])
+    return codec.load_response(response)["data"]
+
+
+def installed_codecs() -> list:
+    names = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def measure(body: bytes, codec_name: str, columnar: bool) -> dict:
+    started = time.perf_counter()
+    decode(body, codec_name, columnar)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    data = decode(body, codec_name, columnar)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return {"seconds": elapsed, "peak": peak, "retained": retained}
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tags = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print(
+        f"{'метки':>6} {'кодек':>8} {'формат':>9} {'время, с':>9} {'пик, МБ':>9}"
+        f" {'удерж., МБ':>11}"
+    )
+    for iso in (False, True):
+        body = make_body(points, tags, iso)
+        for codec_name in installed_codecs():
+            for columnar in (False, True):
+                result = measure(body, codec_name, columnar)
+                print(
+                    f"{'iso' if iso else 'int':>6} {codec_name:>8}"
+                    f" {'columnar' if columnar else 'records':>9}"
+                    f" {result['seconds']:>9.2f} {result['peak'] / 2**20:>9.1f}"
+                    f" {result['retained'] / 2**20:>11.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
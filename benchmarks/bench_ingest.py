@@ -0,0 +1,104 @@
+"""
+Соперничество потоков-производителей за горячие теги: скорость add_data при 1–64 потоках,
+пишущих в несколько тегов реестра, для ingest="locked" (блокировки групп тегов реестра)
+и ingest="sharded" (очереди потоков без блокировок). Параллельно поток отправки раз
+в интервал вызывает drain всех тегов, как set_data. Приводятся точки в секунду,
+число потерянных точек (должно быть 0), p99 длительности drain и процессорное время
+потока отправки на drain. При включенном GIL длительность drain в основном — ожидание GIL:
+в режиме "sharded" производители не засыпают на блокировках и занимают интерпретатор.
+Строки, в которых p99 drain превышает порог, отмечаются, и код возврата равен 1.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_ingest [точек на поток] [горячих тегов] [порог p99 drain, мс]
+"""
+import sys
+import threading
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from models.tag_registry import TagRegistry
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+FLUSH_INTERVAL = 0.01
+DRAIN_P99_LIMIT_MS = 250.0
+
+
+def measure(mode: str, threads: int, points: int, hot_tags: int) -> dict:
+    registry = TagRegistry(
+        [{"id": f"tag{i}", "attributes": {}} for i in range(hot_tags)], ingest=mode
+    )
+    tags = list(registry)
+    start = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    drained = [0]
+    drain_times = []
+    drain_cpu = [0.0]
+
+    def produce(offset: int) -> None:
+        start.wait()
+        for i in range(points):
+            tags[(i + offset) % hot_tags].add_data(i, i, 0)
+
+    def flush() -> None:
+        while True:
+            stopping = stop.wait(FLUSH_INTERVAL)
+            started = time.perf_counter()
+            cpu_started = time.thread_time()
+            for tag in tags:
+                snapshot = tag.drain()
+                if snapshot:
+                    drained[0] += len(snapshot)
+            drain_times.append(time.perf_counter() - started)
+            drain_cpu[0] += time.thread_time() - cpu_started
+            if stopping:
+                return
+
+    producers = [threading.Thread(target=produce, args=(n,)) for n in range(threads)]
+    flusher = threading.Thread(target=flush)
+    for producer in producers:
+        producer.start()
+    flusher.start()
+    start.wait()
+    started = time.perf_counter()
+    for producer in producers:
+        producer.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    flusher.join()
+    drain_times.sort()
+    return {
+        "points_per_s": threads * points / elapsed,
+        "lost": threads * points - drained[0],
+        "drain_p99_ms": drain_times[min(int(0.99 * len(drain_times)), len(drain_times) - 1)] * 1e3,
+        "drain_cpu_ms": drain_cpu[0] / len(drain_times) * 1e3,
+    }
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    hot_tags = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    limit_ms = float(sys.argv[3]) if len(sys.argv) > 3 else DRAIN_P99_LIMIT_MS
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL: {'включен' if gil else 'выключен'}, горячих тегов: {hot_tags}, точек на поток: {points}")
+    print(f"{'потоков':>8} {'режим':>8} {'точек/с':>12} {'потеряно':>9} {'drain p99, мс':>14} {'CPU drain, мс':>14}")
+    exceeded = []
+    for threads in THREADS:
+        for mode in ("locked", "sharded"):
+            result = measure(mode, threads, points, hot_tags)
+            over = result["drain_p99_ms"] > limit_ms
+            if over:
+                exceeded.append((threads, mode))
+            print(
+                f"{threads:>8} {mode:>8} {result['points_per_s']:>12.0f} {result['lost']:>9}"
+                f" {result['drain_p99_ms']:>14.2f} {result['drain_cpu_ms']:>14.3f}"
+                f"{'  > порога' if over else ''}"
+            )
+    if exceeded:
+        rows = ", ".join(f"{mode}/{threads}" for threads, mode in exceeded)
+        print(f"p99 drain выше {limit_ms:.0f} мс: {rows}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Затраты на инструментирование одного запроса get_data и set_data: без instrumentation,
+с пустым Instrumentation (без обработчиков) и с ClientMetrics. HTTP-запрос заменен
+заглушкой httpx.Client.post, поэтому время вызова — это подготовка запроса, разбор ответа
+и обработчики событий. Приводятся медианы по повторам.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_instrumentation [количество тегов] [повторы]
+"""
+import json
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+
+sys.path.append("DataInteractionClient/")
+
+from data_interaction_client import DataInteractionClient
+from instrumentation.client_metrics import ClientMetrics
+from instrumentation.instrumentation import Instrumentation
+from models.tag import Tag
+
+OK = json.dumps({"error": {"id": 0}, "data": []}).encode()
+
+
+def fake_post(self, url, **kwargs):
+    request = httpx.Request("POST", url, **kwargs)
+    return httpx.Response(200, content=OK, request=request)
+
+
+def measure(tag_count: int, repeats: int) -> dict:
+    clients = {
+        "выключено": DataInteractionClient(base_url="http://localhost"),
+        "без обработчиков": DataInteractionClient(
+            base_url="http://localhost", instrumentation=Instrumentation()
+        ),
+        "ClientMetrics": DataInteractionClient(
+            base_url="http://localhost", instrumentation=Instrumentation([ClientMetrics()])
+        ),
+    }
+    tags = [Tag(id=f"tag{i}", attributes={}) for i in range(tag_count)]
+    times = {name: {"get_data": [], "set_data": []} for name in clients}
+    with patch.object(httpx.Client, "post", fake_post):
+        # Варианты чередуются в каждом повторе, чтобы прогрев и сборка мусора влияли одинаково.
+        for _ in range(repeats):
+            for name, client in clients.items():
+                started = time.perf_counter()
+                client.get_data(tag_id="tag1")
+                times[name]["get_data"].append(time.perf_counter() - started)
+                for tag in tags:
+                    tag.add_data(1, 1.5)
+                started = time.perf_counter()
+                client.set_data(tags)
+                times[name]["set_data"].append(time.perf_counter() - started)
+    for client in clients.values():
+        client.close()
+    return {
+        name: {call: statistics.median(values) for call, values in calls.items()}
+        for name, calls in times.items()
+    }
+
+
+def main() -> None:
+    tag_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    results = measure(tag_count, repeats)
+    base = results["выключено"]
+    print(f"{'вариант':>17} {'get_data, мкс':>14} {'издержки, мкс':>14} {'set_data, мкс':>14} {'издержки, мкс':>14}")
+    for name, result in results.items():
+        print(
+            f"{name:>17} {result['get_data'] * 1e6:>14.1f}"
+            f" {(result['get_data'] - base['get_data']) * 1e6:>14.1f}"
+            f" {result['set_data'] * 1e6:>14.1f}"
+            f" {(result['set_data'] - base['set_data']) * 1e6:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
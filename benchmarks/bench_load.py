@@ -0,0 +1,221 @@
+"""
+Нагрузочные сценарии клиента против локальной заглушки платформы (tests/stub_platform.py)
+с настраиваемой задержкой ответа и долей ошибок:
+
+    write — много тегов: add_data с высокой частотой и set_data раз в раунд;
+    read  — чтение больших ответов get_data;
+    async — одновременная отправка данных многими AsyncDataInteractionClient.
+
+Заглушка работает в отдельном процессе, каждый сценарий — в новом процессе, поэтому
+процессорное время и пиковый объем памяти (RSS) относятся только к клиенту.
+Приводятся p50/p99 длительности вызова, точек в секунду, процессорное время клиента
+и заглушки и пиковый RSS клиента. Флаг --json сохраняет результаты для сравнения между версиями.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_load [write] [read] [async] [--latency 0.002] [--error-rate 0.01]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+sys.path.append("DataInteractionClient/")
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.retry_policy import RetryPolicy
+from models.wire_config import WireConfig
+from tests.stub_platform import StubPlatform, load_routes
+
+SCENARIOS = ("write", "read", "async")
+WIRE = WireConfig(mode="json")
+# Внесенные ошибки 503 повторяются: длительность вызова включает повторы.
+RETRY = RetryPolicy(max_attempts=5, backoff_initial=0.01, backoff_max=0.1)
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def serve(options: dict, connection, stop) -> None:
+    routes = load_routes(options["tags"], options["points"])
+    with StubPlatform(
+        routes, latency=options["latency"], error_rate=options["error_rate"], seed=1
+    ) as platform:
+        connection.send(platform.base_url)
+        stop.wait()
+    connection.send(time.process_time())
+
+
+def fill(tags, round_index: int, points: int) -> None:
+    start = round_index * points
+    for tag in tags:
+        tag.add_many(range(start, start + points), [i * 0.5 for i in range(start, start + points)])
+
+
+def run_write(base_url: str, options: dict) -> dict:
+    latencies, points, failures = [], 0, 0
+    with DataInteractionClient(base_url=base_url, wire=WIRE, retry=RETRY) as client:
+        tags = list(client.connect("source"))
+        for round_index in range(options["rounds"]):
+            fill(tags, round_index, options["points_per_round"])
+            started = time.perf_counter()
+            try:
+                points += client.set_data(tags).points_sent
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+    return {"latencies": latencies, "points": points, "failures": failures}
+
+
+def run_read(base_url: str, options: dict) -> dict:
+    latencies, points, failures = [], 0, 0
+    tag_ids = [f"tag{i + 1}" for i in range(options["tags_per_read"])]
+    with DataInteractionClient(base_url=base_url, wire=WIRE, retry=RETRY) as client:
+        for _ in range(options["rounds"]):
+            started = time.perf_counter()
+            try:
+                data = client.get_data(tag_id=tag_ids, from_time=0)
+            except Exception:
+                failures += 1
+            else:
+                points += sum(len(entry["data"]) for entry in data)
+            latencies.append(time.perf_counter() - started)
+    return {"latencies": latencies, "points": points, "failures": failures}
+
+
+async def _async_writer(base_url: str, options: dict, index: int, result: dict) -> None:
+    async with AsyncDataInteractionClient(base_url=base_url, wire=WIRE, retry=RETRY) as client:
+        tags = list(await client.connect(f"source{index}"))
+        for round_index in range(options["rounds"]):
+            fill(tags, round_index, options["points_per_round"])
+            started = time.perf_counter()
+            try:
+                report = await client.set_data(tags)
+            except Exception:
+                result["failures"] += 1
+            else:
+                result["points"] += report.points_sent
+            result["latencies"].append(time.perf_counter() - started)
+
+
+def run_async(base_url: str, options: dict) -> dict:
+    result = {"latencies": [], "points": 0, "failures": 0}
+
+    async def main() -> None:
+        await asyncio.gather(*(
+            _async_writer(base_url, options, index, result) for index in range(options["clients"])
+        ))
+
+    asyncio.run(main())
+    return result
+
+
+RUNNERS: Dict[str, Callable[[str, dict], dict]] = {
+    "write": run_write,
+    "read": run_read,
+    "async": run_async,
+}
+
+
+def run_scenario(name: str, base_url: str, options: dict) -> dict:
+    """Выполняется в отдельном процессе: результат сценария, процессорное время и пиковый RSS."""
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    result = RUNNERS[name](base_url, options)
+    elapsed = time.perf_counter() - started
+    latencies = result.pop("latencies")
+    return {
+        "scenario": name,
+        "calls": len(latencies),
+        "failures": result["failures"],
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "points": result["points"],
+        "points_per_s": result["points"] / elapsed if elapsed else 0.0,
+        "elapsed_s": elapsed,
+        "cpu_s": time.process_time() - cpu_started,
+        # ru_maxrss в Linux — килобайты.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def scenario_options(name: str, args: argparse.Namespace) -> dict:
+    options = {"latency": args.latency, "error_rate": args.error_rate, "points": 0, "tags": 1}
+    if name == "write":
+        options.update(tags=args.tags, rounds=args.rounds, points_per_round=args.points_per_round)
+    elif name == "read":
+        options.update(tags=args.tags_per_read, points=args.read_points, rounds=args.read_rounds,
+                       tags_per_read=args.tags_per_read)
+    else:
+        options.update(tags=args.async_tags, rounds=args.rounds,
+                       points_per_round=args.points_per_round, clients=args.clients)
+    return options
+
+
+def measure(name: str, args: argparse.Namespace) -> dict:
+    context = multiprocessing.get_context("spawn")
+    options = scenario_options(name, args)
+    receiver, sender = context.Pipe(duplex=False)
+    stop = context.Event()
+    server = context.Process(target=serve, args=(options, sender, stop), daemon=True)
+    server.start()
+    try:
+        base_url = receiver.recv()
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(run_scenario, name, base_url, options).result()
+        stop.set()
+        # Процессорное время заглушки: если оно близко к времени сценария, узкое место — заглушка.
+        result["server_cpu_s"] = receiver.recv()
+        return result
+    finally:
+        stop.set()
+        server.join(5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочные сценарии клиента")
+    parser.add_argument("scenarios", nargs="*", help="сценарии: write, read, async (по умолчанию — все)")
+    parser.add_argument("--latency", type=float, default=0.0, help="задержка ответа заглушки, с")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="доля ответов 503")
+    parser.add_argument("--tags", type=int, default=1000, help="тегов в сценарии write")
+    parser.add_argument("--rounds", type=int, default=50, help="раундов set_data на клиента")
+    parser.add_argument("--points-per-round", type=int, default=10, help="точек на тег за раунд")
+    parser.add_argument("--read-points", type=int, default=20_000, help="точек на тег в get_data")
+    parser.add_argument("--tags-per-read", type=int, default=10, help="тегов в запросе get_data")
+    parser.add_argument("--read-rounds", type=int, default=20, help="запросов get_data")
+    parser.add_argument("--clients", type=int, default=32, help="клиентов в сценарии async")
+    parser.add_argument("--async-tags", type=int, default=100, help="тегов на клиента в async")
+    parser.add_argument("--json", help="файл для сохранения результатов")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"неизвестные сценарии: {', '.join(sorted(unknown))}")
+
+    results = [measure(name, args) for name in args.scenarios or SCENARIOS]
+    print(
+        f"{'сценарий':>8} {'вызовов':>8} {'ошибок':>7} {'p50, мс':>9} {'p99, мс':>9}"
+        f" {'точек/с':>11} {'CPU, с':>7} {'RSS, МБ':>8} {'CPU заглушки, с':>16}"
+    )
+    for result in results:
+        print(
+            f"{result['scenario']:>8} {result['calls']:>8} {result['failures']:>7}"
+            f" {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f}"
+            f" {result['points_per_s']:>11.0f} {result['cpu_s']:>7.2f} {result['peak_rss_mb']:>8.1f}"
+            f" {result['server_cpu_s']:>16.2f}"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Время connect для источника с большим числом тегов через локальную заглушку платформы:
+без кеша метаданных, с проверкой сохраненных метаданных по ETag (ответ 304)
+и «холодный» старт нового процесса с метаданными на диске (MetadataCache с max_age).
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_metadata_cache [количество тегов]
+"""
+import sys
+import tempfile
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from data_interaction_client import DataInteractionClient
+from metadata.metadata_cache import MetadataCache
+from tests.stub_platform import StubPlatform
+
+ETAG = '"v1"'
+
+
+def make_route(count: int):
+    payload = {
+        "error": {"id": 0},
+        "attributes": {"smtActive": True},
+        "tags": [
+            {"id": f"tag{i}", "attributes": {"smtTagValueTypeCode": 1, "smtTagValueScale": 1}}
+            for i in range(count)
+        ],
+    }
+
+    def route(handler, body):
+        if handler.headers.get("If-None-Match") == ETAG:
+            return 304, None, {"ETag": ETAG}
+        return 200, payload, {"ETag": ETAG}
+
+    return route
+
+
+def timed_connect(base_url: str, cache=None) -> float:
+    with DataInteractionClient(base_url=base_url, metadata_cache=cache) as client:
+        started = time.perf_counter()
+        client.connect("source")
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with StubPlatform({"/smt/dataSources/connect": make_route(count)}) as platform, \
+            tempfile.TemporaryDirectory() as directory:
+        url = platform.base_url
+        results = {"без кеша": timed_connect(url)}
+        cache = MetadataCache(directory)
+        timed_connect(url, cache)
+        results["проверка ETag"] = timed_connect(url, cache)
+        results["диск, max_age"] = timed_connect(url, MetadataCache(directory, max_age=3600))
+    print(f"{'способ':>14} {'время, мс':>10}")
+    for name, seconds in results.items():
+        print(f"{name:>14} {seconds * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Сравнение пропускной способности запросов с повторным использованием соединений и без него.
+Оба варианта выполняют один и тот же запрос connect одним клиентом DataInteractionClient
+с одинаковыми таймаутами и кодированием параметров; различается только пул: без пула
+keep-alive соединения не сохраняются (max_keepalive_connections=0), и каждый запрос
+устанавливает новое TCP-соединение. Приводится медиана нескольких повторов.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_pooling [количество запросов] [повторов]
+"""
+import statistics
+import sys
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from data_interaction_client import DataInteractionClient
+from models.transport_config import TransportConfig
+from tests.stub_platform import StubPlatform
+
+CONNECT_PATH = "/smt/dataSources/connect"
+
+
+def measure(base_url: str, transport: TransportConfig, count: int) -> float:
+    with DataInteractionClient(base_url=base_url, transport=transport) as client:
+        client.connect("1")  # Разогрев: создание httpx.Client вне измерения.
+        started = time.perf_counter()
+        for _ in range(count):
+            client.connect("1")
+        return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    variants = (
+        ("без пула", TransportConfig(max_keepalive_connections=0)),
+        ("с пулом", TransportConfig()),
+    )
+    results = {}
+    with StubPlatform() as platform:
+        for name, transport in variants:
+            before = platform.requests.get(CONNECT_PATH, 0)
+            results[name] = statistics.median(
+                measure(platform.base_url, transport, count) for _ in range(repeats)
+            )
+            sent = platform.requests.get(CONNECT_PATH, 0) - before
+            assert sent == repeats * (count + 1), f"{name}: {sent} запросов к платформе"
+    for name, rate in results.items():
+        print(f"{name + ':':10} {rate:10.1f} запросов/с")
+    print(f"ускорение: {results['с пулом'] / results['без пула']:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Пропускная способность при перегрузке платформы: много сопрограмм в нескольких
+AsyncDataInteractionClient одновременно вызывают get_data у заглушки платформы
+(tests/stub_platform.py), которая обрабатывает не более capacity запросов одновременно
+и на остальные сразу отвечает 503. Сравниваются клиенты без ограничителя (только повторы)
+и с общим RateLimiter (AIMD). Приводятся успешные вызовы в секунду, доля ответов 503
+среди попыток, вызовы, завершившиеся ошибкой, p99 длительности вызова и итоговое
+ограничение количества одновременных запросов.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_rate_limit [сопрограмм] [capacity] [длительность, с]
+"""
+import asyncio
+import sys
+import time
+from typing import Optional
+
+sys.path.append("DataInteractionClient/")
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from models.retry_policy import RetryPolicy
+from resilience.rate_limiter import RateLimiter
+from tests.stub_platform import StubPlatform
+
+CLIENTS = 4
+LATENCY = 0.005
+RETRY = RetryPolicy(max_attempts=5, backoff_initial=0.01, backoff_max=0.2)
+
+
+async def worker(client: AsyncDataInteractionClient, until: float, result: dict) -> None:
+    while time.monotonic() < until:
+        started = time.perf_counter()
+        try:
+            await client.get_data(tag_id="tag1")
+        except Exception:
+            result["failures"] += 1
+        else:
+            result["calls"] += 1
+        result["latencies"].append(time.perf_counter() - started)
+
+
+async def run(
+    limiter: Optional[RateLimiter], coroutines: int, capacity: int, duration: float
+) -> dict:
+    result = {"calls": 0, "failures": 0, "latencies": []}
+    with StubPlatform(latency=LATENCY, capacity=capacity) as platform:
+        clients = [
+            AsyncDataInteractionClient(base_url=platform.base_url, retry=RETRY, rate_limiter=limiter)
+            for _ in range(CLIENTS)
+        ]
+        until = time.monotonic() + duration
+        await asyncio.gather(*(
+            worker(clients[i % CLIENTS], until, result) for i in range(coroutines)
+        ))
+        for client in clients:
+            await client.aclose()
+    attempts = platform.requests.get("/smt/data/get", 0)
+    latencies = sorted(result["latencies"])
+    return {
+        "calls_per_s": result["calls"] / duration,
+        "rejected_share": platform.errors / attempts if attempts else 0.0,
+        "failures": result["failures"],
+        "p99_ms": latencies[min(int(0.99 * len(latencies)), len(latencies) - 1)] * 1e3,
+        "concurrency": "-" if limiter is None else str(limiter.concurrency),
+    }
+
+
+def main() -> None:
+    coroutines = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    print(f"сопрограмм: {coroutines}, клиентов: {CLIENTS}, capacity: {capacity}")
+    print(f"{'вариант':>13} {'вызовов/с':>10} {'доля 503':>9} {'ошибок':>7} {'p99, мс':>9} {'ограничение':>12}")
+    for name, limiter in (("без лимита", None), ("RateLimiter", RateLimiter())):
+        result = asyncio.run(run(limiter, coroutines, capacity, duration))
+        print(
+            f"{name:>13} {result['calls_per_s']:>10.0f} {result['rejected_share']:>9.1%}"
+            f" {result['failures']:>7} {result['p99_ms']:>9.1f} {result['concurrency']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
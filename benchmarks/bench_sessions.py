@@ -0,0 +1,81 @@
+"""
+Отправка данных многих источников локальной заглушке платформы: отдельный
+DataInteractionClient на каждый источник и один SessionManager поверх общего клиента.
+Приводятся время подключения и отправки и количество открытых TCP-соединений.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_sessions [источников] [тегов на источник] [точек на тег]
+"""
+import sys
+import threading
+import time
+
+sys.path.append("DataInteractionClient/")
+
+from data_interaction_client import DataInteractionClient
+from sessions.session_manager import SessionManager
+from tests.stub_platform import StubPlatform
+
+
+def routes(tag_count: int):
+    peers = set()
+    lock = threading.Lock()
+
+    def track(handler) -> None:
+        with lock:
+            peers.add(handler.client_address)
+
+    def connect(handler, body):
+        track(handler)
+        tags = [{"id": f"t{i}", "attributes": {}} for i in range(tag_count)]
+        return 200, {"error": {"id": 0}, "attributes": {"smtActive": True}, "tags": tags}
+
+    def set_data(handler, body):
+        track(handler)
+        return 200, {"error": {"id": 0}}
+
+    return {"/smt/dataSources/connect": connect, "/smt/data/set": set_data}, peers
+
+
+def fill(registry, points: int) -> None:
+    for tag in registry:
+        tag.add_many(range(points), [i + 0.5 for i in range(points)])
+
+
+def separate_clients(base_url: str, sources: int, points: int) -> float:
+    started = time.perf_counter()
+    clients = [DataInteractionClient(base_url=base_url) for _ in range(sources)]
+    for i, client in enumerate(clients):
+        registry = client.connect(f"source{i}")
+        fill(registry, points)
+        client.set_data(registry.active())
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        client.close()
+    return elapsed
+
+
+def session_manager(base_url: str, sources: int, points: int) -> float:
+    started = time.perf_counter()
+    with DataInteractionClient(base_url=base_url) as client:
+        with SessionManager(client, min_interval=0.0, poll_interval=0.01) as manager:
+            for i in range(sources):
+                fill(manager.add_source(f"source{i}"), points)
+            manager.flush()
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    sources = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tag_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    points = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    print(f"{'вариант':>22} {'время, с':>9} {'соединений':>11}")
+    for name, run in (("клиент на источник", separate_clients), ("SessionManager", session_manager)):
+        platform_routes, peers = routes(tag_count)
+        with StubPlatform(platform_routes) as platform:
+            elapsed = run(platform.base_url, sources, points)
+        print(f"{name:>22} {elapsed:>9.2f} {len(peers):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Сравнение хранения данных тега списком словарей и колоночным буфером:
+память на точку, скорость add_data/add_many и скорость формирования тела set_data.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_tag_buffer [количество точек]
+"""
+import sys
+import time
+import tracemalloc
+
+sys.path.append("DataInteractionClient/")
+
+from models.tag import Tag
+from models.wire_config import WireConfig
+from serialization.payload import encode_json_body, tag_payload
+
+WIRE = WireConfig(mode="json")
+
+
+def bench(mode: str, points: int) -> dict:
+    xs = [1529000000000000 + i * 1000000 for i in range(points)]
+    ys = [i % 1000 for i in range(points)]
+
+    tag = Tag(id="tag1", attributes={}, buffer_mode=mode)
+    started = time.perf_counter()
+    for x, y in zip(xs, ys):
+        tag.add_data(x, y, 0)
+    add_elapsed = time.perf_counter() - started
+
+    measured = Tag(id="tag1", attributes={}, buffer_mode=mode)
+    tracemalloc.start()
+    for x, y in zip(xs, ys):
+        measured.add_data(x, y, 0)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bulk = Tag(id="tag1", attributes={}, buffer_mode=mode)
+    started = time.perf_counter()
+    bulk.add_many(xs, ys)
+    add_many_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    encode_json_body({"data": [tag_payload(tag.id, tag.drain(), WIRE)]})
+    flush_elapsed = time.perf_counter() - started
+    return {
+        "bytes_per_point": memory / points,
+        "add_data": points / add_elapsed,
+        "add_many": points / add_many_elapsed,
+        "flush": points / flush_elapsed,
+    }
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'режим':>9} {'байт/точку':>11} {'add_data/с':>12} {'add_many/с':>12} {'flush/с':>12}")
+    for mode in ("list", "columnar"):
+        result = bench(mode, points)
+        print(
+            f"{mode:>9} {result['bytes_per_point']:>11.1f} {result['add_data']:>12.0f}"
+            f" {result['add_many']:>12.0f} {result['flush']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Хранение меток времени тега: timestamps="raw" (строки как переданы) и "microseconds"
+(целые микросекунды). Строковые метки добавляются по одной (add_data) и пакетом (add_many),
+часть точек — не по порядку; приводятся время добавления, время drain (с упорядочиванием
+для "microseconds") и время кодирования и объем JSON-тела set_data.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_timestamps [точек] [доля точек не по порядку]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append("DataInteractionClient/")
+
+from models.tag import Tag
+from serialization.payload import encode_json_body, tag_payload
+from models.wire_config import WireConfig
+
+WIRE = WireConfig(mode="json")
+
+
+def make_timestamps(points: int, disorder: float) -> list:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stamps = [(start + timedelta(milliseconds=100 * i)).strftime("%Y-%m-%d %H:%M:%S.%f") for i in range(points)]
+    rng = random.Random(1)
+    for _ in range(int(points * disorder)):
+        i = rng.randrange(points - 1)
+        stamps[i], stamps[i + 1] = stamps[i + 1], stamps[i]
+    return stamps
+
+
+def measure(mode: str, buffer_mode: str, stamps: list, bulk: bool) -> dict:
+    tag = Tag(id="tag1", attributes={}, timestamps=mode, buffer_mode=buffer_mode)
+    values = [i * 0.5 for i in range(len(stamps))]
+    started = time.perf_counter()
+    if bulk:
+        tag.add_many(stamps, values)
+    else:
+        for x, y in zip(stamps, values):
+            tag.add_data(x, y)
+    added = time.perf_counter() - started
+    started = time.perf_counter()
+    snapshot = tag.drain()
+    drained = time.perf_counter() - started
+    started = time.perf_counter()
+    body = encode_json_body({"data": [tag_payload("tag1", snapshot, WIRE)]})
+    encoded = time.perf_counter() - started
+    return {"add": added, "drain": drained, "encode": encoded, "bytes": len(body)}
+
+
+def main() -> None:
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    disorder = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    stamps = make_timestamps(points, disorder)
+    print(f"{'режим':>13} {'буфер':>9} {'добавление':>11} {'add, мс':>9} {'drain, мс':>10} {'encode, мс':>11} {'тело, КБ':>9}")
+    for buffer_mode in ("list", "columnar"):
+        for bulk in (False, True):
+            for mode in ("raw", "microseconds"):
+                result = measure(mode, buffer_mode, stamps, bulk)
+                print(
+                    f"{mode:>13} {buffer_mode:>9} {'add_many' if bulk else 'add_data':>11}"
+                    f" {result['add'] * 1e3:>9.1f} {result['drain'] * 1e3:>10.1f}"
+                    f" {result['encode'] * 1e3:>11.1f} {result['bytes'] / 1024:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
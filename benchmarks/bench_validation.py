@@ -0,0 +1,75 @@
+"""
+Затраты на проверку аргументов (validation="strict" / "boundary" / "off") на один вызов
+set_data с 1000 тегов и get_data с 1000 тегов. Выполнение сценария (_run: кодирование тела,
+запрос, разбор ответа) заменено заглушкой, поэтому измеряется только обертка validated
+и создание сценария. Каждое значение — время одного вызова по серии из number вызовов;
+приводятся минимум и медиана по повторам, издержки — относительно режима "off".
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_validation [количество тегов] [вызовов в серии] [повторы]
+"""
+import statistics
+import sys
+import timeit
+from unittest.mock import patch
+
+sys.path.append("DataInteractionClient/")
+
+from data_interaction_client import DataInteractionClient
+from models.tag import Tag
+
+MODES = ("strict", "boundary", "off")
+
+
+def skip_flow(self, flow):
+    """Заглушка _run: сценарий создается, но не выполняется."""
+    flow.close()
+
+
+def measure(tags, number: int, repeats: int) -> dict:
+    clients = {
+        mode: DataInteractionClient(base_url="http://localhost", validation=mode) for mode in MODES
+    }
+    tag_ids = [tag.id for tag in tags]
+    calls = {
+        "set_data": lambda client: client.set_data(tags),
+        "get_data": lambda client: client.get_data(tag_ids, from_time=0, to_time=1),
+    }
+    times = {mode: {name: [] for name in calls} for mode in MODES}
+    with patch.object(DataInteractionClient, "_run", skip_flow):
+        # Режимы чередуются в каждом повторе, чтобы прогрев и сборка мусора влияли одинаково.
+        for _ in range(repeats):
+            for mode, client in clients.items():
+                for name, call in calls.items():
+                    elapsed = timeit.timeit(lambda: call(client), number=number)
+                    times[mode][name].append(elapsed / number)
+    return {
+        mode: {
+            name: (min(values), statistics.median(values)) for name, values in by_call.items()
+        }
+        for mode, by_call in times.items()
+    }
+
+
+def main() -> None:
+    tag_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    number = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    tags = [Tag(id=f"tag{i}", attributes={}) for i in range(tag_count)]
+    results = measure(tags, number, repeats)
+    base = results["off"]
+    print(
+        f"{'режим':>9} {'вызов':>9} {'мин, мкс':>10} {'медиана, мкс':>13}"
+        f" {'издержки мин, мкс':>18} {'издержки мед., мкс':>19}"
+    )
+    for mode in MODES:
+        for name, (low, median) in results[mode].items():
+            base_low, base_median = base[name]
+            print(
+                f"{mode:>9} {name:>9} {low * 1e6:>10.1f} {median * 1e6:>13.1f}"
+                f" {(low - base_low) * 1e6:>18.1f} {(median - base_median) * 1e6:>19.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Сравнение времени кодирования и объема данных на проводе для режимов передачи set_data:
+строка запроса URL, JSON-тело и сжатое JSON-тело.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_wire_format
+"""
+import sys
+import time
+
+sys.path.append("DataInteractionClient/")
+
+import httpx
+
+from models.wire_config import WireConfig
+from serialization.payload import build_request_kwargs
+
+URL = "http://127.0.0.1:8000/smt/data/set"
+MODES = {
+    "query": WireConfig(mode="query"),
+    "json": WireConfig(mode="json"),
+    "json+gzip": WireConfig(mode="json", compress_threshold=0),
+    "json+deflate": WireConfig(
+        mode="json", compress_threshold=0, compress_encoding="deflate"
+    ),
+}
+
+
+def make_params(points: int) -> dict:
+    data = [
+        {"x": 1529000000000000 + i * 1000000, "y": i * 0.5, "q": 0}
+        for i in range(points)
+    ]
+    return {"data": [{"tagId": "tag1", "data": data}]}
+
+
+def measure(params: dict, wire: WireConfig) -> tuple:
+    started = time.perf_counter()
+    kwargs = build_request_kwargs(params, wire)
+    if wire.mode == "query":
+        # httpx отклоняет URL с query длиннее 64 КБ, поэтому кодируем строку запроса напрямую.
+        query = str(httpx.QueryParams(kwargs["params"]))
+        elapsed = time.perf_counter() - started
+        return elapsed, len(URL) + 1 + len(query)
+    request = httpx.Request("POST", URL, **kwargs)
+    elapsed = time.perf_counter() - started
+    return elapsed, len(str(request.url)) + len(request.content)
+
+
+def main() -> None:
+    print(f"{'точек':>8} {'режим':>14} {'кодирование, мс':>16} {'байт':>12}")
+    for points in (1_000, 10_000, 100_000):
+        params = make_params(points)
+        for name, wire in MODES.items():
+            elapsed, wire_bytes = measure(params, wire)
+            print(f"{points:>8} {name:>14} {elapsed * 1000:>16.2f} {wire_bytes:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,15 @@ setup(
         'pydantic==1.8.2',
         'asyncio==3.4.3',
     ],
+    extras_require={
+        'http2': ['httpx[http2]==0.27.0'],
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+        'orjson': ['orjson>=3.9.16'],
+        'msgspec': ['msgspec'],
+        'opentelemetry': ['opentelemetry-api'],
+    },
     classifiers=[
         'License :: Other/Proprietary License',
         'Programming Language :: Python :: 3.10.14',
@@ -0,0 +1,197 @@
+import gzip
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+
+class _StubPlatformHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0]
+        handler = self.server.routes.get(path)
+        if handler is None:
+            self._send(404, {"error": {"id": 404, "message": "not found"}})
+            return
+        platform = self.server.platform
+        with platform._lock:
+            platform.requests[path] = platform.requests.get(path, 0) + 1
+            platform.active += 1
+            platform.peak = max(platform.peak, platform.active)
+            overloaded = platform.capacity is not None and platform.active > platform.capacity
+            failed = overloaded or (
+                platform.error_rate and platform._random.random() < platform.error_rate
+            )
+            if failed:
+                platform.errors += 1
+        try:
+            if platform.latency and not overloaded:
+                time.sleep(platform.latency)
+            if failed:
+                self._send(platform.error_status, {"error": {"id": 1, "message": "injected error"}})
+                return
+            self._send(*handler(self, body))
+        finally:
+            with platform._lock:
+                platform.active -= 1
+
+    def _send(self, status: int, payload: Optional[dict], headers: Optional[dict] = None) -> None:
+        raw = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Очередь входящих соединений для нагрузочных бенчмарков с множеством клиентов.
+    request_queue_size = 256
+
+
+def _connect(handler: BaseHTTPRequestHandler, body: bytes):
+    return 200, {
+        "error": {"id": 0},
+        "attributes": {"smtActive": True},
+        "tags": [{"id": "tag1", "attributes": {}}],
+    }
+
+
+def _set_data(handler: BaseHTTPRequestHandler, body: bytes):
+    return 200, {"error": {"id": 0}}
+
+
+def _get_data(handler: BaseHTTPRequestHandler, body: bytes):
+    return 200, {"error": {"id": 0}, "data": []}
+
+
+def _requested_tags(handler: BaseHTTPRequestHandler, body: bytes) -> List[str]:
+    """Идентификаторы тегов запроса get_data в JSON-теле; для строки запроса URL — ["tag1"]."""
+    if not body:
+        return ["tag1"]
+    encoding = handler.headers.get("Content-Encoding")
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+    tag_id = json.loads(body)["params"].get("tagId", "tag1")
+    return tag_id if isinstance(tag_id, list) else [tag_id]
+
+
+def load_routes(tags: int = 1, points: int = 0) -> Dict[str, Callable]:
+    """
+    Создает обработчики платформы для нагрузочных бенчмарков: connect возвращает
+    tags тегов ("tag1" ... "tag<tags>"), get_data — по points точек на каждый запрошенный тег.
+
+    Параметры:
+    ----------
+    tags (int): количество тегов источника данных. По умолчанию — 1.
+    points (int): количество точек на тег в ответе get_data. По умолчанию — 0.
+
+    Возвращает:
+    ----------
+    Dict[str, Callable]: обработчики путей для StubPlatform.
+    """
+    tag_list = [{"id": f"tag{i + 1}", "attributes": {}} for i in range(tags)]
+    series = [{"x": 1_700_000_000_000_000 + i * 1000, "y": i * 0.5, "q": 0} for i in range(points)]
+
+    def connect(handler: BaseHTTPRequestHandler, body: bytes):
+        return 200, {"error": {"id": 0}, "attributes": {"smtActive": True}, "tags": tag_list}
+
+    def get_data(handler: BaseHTTPRequestHandler, body: bytes):
+        data = [{"tagId": tag_id, "data": series} for tag_id in _requested_tags(handler, body)]
+        return 200, {"error": {"id": 0}, "data": data}
+
+    return {
+        "/smt/dataSources/connect": connect,
+        "/smt/data/set": _set_data,
+        "/smt/data/get": get_data,
+    }
+
+
+class StubPlatform:
+    """
+    Локальный HTTP-сервер, имитирующий эндпоинты платформы для тестов и бенчмарков.
+
+    Атрибуты
+    ----------
+    routes : Dict[str, Callable]
+        Обработчики путей. Обработчик принимает (handler, body) и возвращает (status, payload)
+        или (status, payload, headers); payload None — ответ без тела.
+    latency : float
+        Задержка перед каждым ответом, секунды. По умолчанию — 0.
+    error_rate : float
+        Доля запросов (0..1), на которые возвращается ошибка error_status. По умолчанию — 0.
+    error_status : int
+        HTTP-статус внесенных ошибок. По умолчанию — 503.
+    capacity : Optional[int]
+        Количество одновременно обрабатываемых запросов; на запросы сверх него сразу
+        возвращается ошибка error_status (перегрузка). None — без ограничения. По умолчанию — None.
+    peak : int
+        Наибольшее количество одновременно обрабатываемых запросов.
+    requests : Dict[str, int]
+        Количество полученных запросов по путям.
+    errors : int
+        Количество внесенных ошибок.
+    base_url : str
+        Базовый URL запущенного сервера.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, Callable]] = None,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        capacity: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.capacity = capacity
+        self.active = 0
+        self.peak = 0
+        self.requests: Dict[str, int] = {}
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.routes = {
+            "/smt/dataSources/connect": _connect,
+            "/smt/data/set": _set_data,
+            "/smt/data/get": _get_data,
+        }
+        self.routes.update(routes or {})
+        self._server = _StubServer(("127.0.0.1", 0), _StubPlatformHandler)
+        self._server.routes = self.routes
+        self._server.platform = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubPlatform":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -53,3 +53,12 @@ async def test_connect_request_error():
 
     with pytest.raises(httpx.RequestError):
         await client.connect(data_source_id="source3")
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_http_client():
+    async with AsyncDataInteractionClient(base_url="http://example.com") as client:
+        http_client = client._get_http_client()
+        assert client._get_http_client() is http_client
+    assert http_client.is_closed
+    assert client._http_client is None
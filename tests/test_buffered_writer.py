@@ -0,0 +1,213 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.tag import Tag
+from writers.async_buffered_writer import AsyncBufferedWriter
+from writers.buffered_writer import BufferedWriter
+
+
+def make_client(side_effect=None):
+    client = DataInteractionClient(base_url="https://example.com")
+    sent = []
+
+    def set_data(tags):
+        if side_effect is not None:
+            side_effect()
+        sent.append({tag.id: list(tag.data) for tag in tags})
+
+    patcher = patch.object(DataInteractionClient, "set_data", side_effect=set_data)
+    patcher.start()
+    return client, sent
+
+
+@pytest.fixture(autouse=True)
+def stop_patches():
+    yield
+    patch.stopall()
+
+
+def test_flush_on_size_coalesces_tags():
+    client, sent = make_client()
+    tag1 = Tag(id="tag1", attributes={})
+    tag2 = Tag(id="tag2", attributes={})
+    with BufferedWriter(client, max_batch_points=3, max_age=60) as writer:
+        writer.add_data(tag1, 1, 10)
+        writer.add_data(tag2, 1, 20)
+        writer.add_data(tag1, 2, 11)
+        assert writer.flush(timeout=5)
+    assert sent == [
+        {
+            "tag1": [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 11, "q": 0}],
+            "tag2": [{"x": 1, "y": 20, "q": 0}],
+        }
+    ]
+    assert tag1.data is None
+
+
+def test_attached_tags_are_flushed_from_tag_add_data():
+    client, sent = make_client()
+    tag1 = Tag(id="tag1", attributes={})
+    tag2 = Tag(id="tag2", attributes={})
+    tag1.add_data(1, 10)
+    with BufferedWriter(client, max_age=60) as writer:
+        writer.attach([tag1, tag2])
+        writer.add_data(tag2, 1, 20)
+        tag1.add_data(2, 11)
+        assert writer.flush(timeout=5)
+        tag2.add_data(2, 21)
+        assert writer.flush(timeout=5)
+    assert sent == [
+        {
+            "tag2": [{"x": 1, "y": 20, "q": 0}],
+            "tag1": [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 11, "q": 0}],
+        },
+        {"tag2": [{"x": 2, "y": 21, "q": 0}]},
+    ]
+    assert not tag1.has_data() and not tag2.has_data()
+    tag1.add_data(3, 12)
+    assert tag1.data == [{"x": 3, "y": 12, "q": 0}]
+
+
+def test_flush_on_age():
+    client, sent = make_client()
+    tag = Tag(id="tag1", attributes={})
+    with BufferedWriter(client, max_age=0.05) as writer:
+        writer.add_data(tag, 1, 10)
+        with writer._condition:
+            assert writer._condition.wait_for(writer._buffer.is_empty, 5)
+    assert sent == [{"tag1": [{"x": 1, "y": 10, "q": 0}]}]
+
+
+def test_failed_batch_is_retried():
+    failures = iter([True, False])
+
+    def fail_once():
+        if next(failures):
+            raise RuntimeError("platform down")
+
+    client, sent = make_client(side_effect=fail_once)
+    errors = []
+    tag = Tag(id="tag1", attributes={})
+    with BufferedWriter(
+        client, retry_interval=0.01, on_error=errors.append
+    ) as writer:
+        writer.add_data(tag, 1, 10)
+        assert writer.flush(timeout=5)
+    assert len(errors) == 1
+    assert sent == [{"tag1": [{"x": 1, "y": 10, "q": 0}]}]
+
+
+def test_drop_oldest_bounds_memory():
+    release = threading.Event()
+    client, sent = make_client(side_effect=lambda: release.wait(5))
+    tag = Tag(id="tag1", attributes={})
+    writer = BufferedWriter(
+        client, max_batch_points=1000, max_age=60, max_pending_points=3,
+        overflow="drop_oldest",
+    )
+    for x in range(5):
+        writer.add_data(tag, x, x)
+    assert writer.pending_points == 3
+    assert writer.dropped_points == 2
+    release.set()
+    writer.close(timeout=5)
+    assert [point["x"] for point in sent[0]["tag1"]] == [2, 3, 4]
+
+
+def test_spill_receives_oldest_data():
+    spilled = []
+    client, sent = make_client()
+    tag = Tag(id="tag1", attributes={})
+    writer = BufferedWriter(
+        client, max_batch_points=1000, max_age=60, max_pending_points=2,
+        overflow="spill", spill=spilled.append,
+    )
+    for x in range(3):
+        writer.add_data(tag, x, x)
+    writer.close(timeout=5)
+    assert [point["x"] for point in spilled[0][0].data] == [0, 1]
+    assert [point["x"] for point in sent[0]["tag1"]] == [2]
+    assert writer.spilled_points == 2
+
+
+def test_spill_requires_handler():
+    client, _ = make_client()
+    with pytest.raises(ValueError):
+        BufferedWriter(client, overflow="spill")
+
+
+def test_add_after_close_raises():
+    client, _ = make_client()
+    writer = BufferedWriter(client)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.add_data(Tag(id="tag1", attributes={}), 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_writer_flushes_on_size():
+    client = AsyncDataInteractionClient(base_url="http://example.com")
+    sent = []
+
+    async def set_data(tags):
+        sent.append({tag.id: list(tag.data) for tag in tags})
+
+    patch.object(AsyncDataInteractionClient, "set_data", AsyncMock(side_effect=set_data)).start()
+    tag = Tag(id="tag1", attributes={})
+    async with AsyncBufferedWriter(client, max_batch_points=2, max_age=60) as writer:
+        await writer.add_data(tag, 1, 10)
+        await writer.add_data(tag, 2, 11)
+        assert await writer.flush(timeout=5)
+    assert sent == [{"tag1": [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 11, "q": 0}]}]
+
+
+@pytest.mark.asyncio
+async def test_async_writer_flushes_attached_tags_by_age():
+    client = AsyncDataInteractionClient(base_url="http://example.com")
+    sent = []
+
+    async def set_data(tags):
+        sent.append({tag.id: list(tag.data) for tag in tags})
+
+    patch.object(AsyncDataInteractionClient, "set_data", AsyncMock(side_effect=set_data)).start()
+    tag = Tag(id="tag1", attributes={})
+    async with AsyncBufferedWriter(client, max_age=0.05) as writer:
+        writer.attach([tag])
+        producer = threading.Thread(target=tag.add_data, args=(1, 10))
+        producer.start()
+        producer.join()
+        for _ in range(100):
+            if sent:
+                break
+            await asyncio.sleep(0.01)
+    assert sent == [{"tag1": [{"x": 1, "y": 10, "q": 0}]}]
+
+
+@pytest.mark.asyncio
+async def test_async_writer_retries_after_error():
+    client = AsyncDataInteractionClient(base_url="http://example.com")
+    set_data = AsyncMock(side_effect=[RuntimeError("platform down"), None])
+    patch.object(AsyncDataInteractionClient, "set_data", set_data).start()
+    async with AsyncBufferedWriter(client, retry_interval=0.01) as writer:
+        await writer.add_data(Tag(id="tag1", attributes={}), 1, 10)
+        assert await writer.flush(timeout=5)
+        assert isinstance(writer.last_error, RuntimeError)
+    assert set_data.await_count == 2
+
+
+def test_block_waits_for_flush():
+    client, sent = make_client()
+    tag = Tag(id="tag1", attributes={})
+    with BufferedWriter(
+        client, max_batch_points=1000, max_age=60, max_pending_points=2
+    ) as writer:
+        for x in range(5):
+            writer.add_data(tag, x, x)
+    assert [point["x"] for batch in sent for point in batch["tag1"]] == [0, 1, 2, 3, 4]
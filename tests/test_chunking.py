@@ -0,0 +1,110 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from buffers.columnar_buffer import ColumnarBuffer
+from data_interaction_client import DataInteractionClient
+from exceptions.chunk_send_exception import ChunkSendException
+from models.chunking_config import ChunkingConfig
+from models.tag import Tag
+from serialization.chunking import split_chunks
+
+
+def make_tag(tag_id, points, buffer_mode="list"):
+    tag = Tag(id=tag_id, attributes={}, buffer_mode=buffer_mode)
+    tag.add_many(range(points), range(points))
+    return tag
+
+
+def test_split_disabled_returns_single_chunk():
+    tag = make_tag("tag1", 10)
+    snapshots = [(tag, tag.drain())]
+    assert split_chunks(snapshots, ChunkingConfig()) == [snapshots]
+
+
+def test_split_by_points_keeps_order():
+    tag1, tag2 = make_tag("tag1", 5), make_tag("tag2", 3, "columnar")
+    chunks = split_chunks(
+        [(tag1, tag1.drain()), (tag2, tag2.drain())], ChunkingConfig(max_points=3)
+    )
+    assert [[(tag.id, len(data)) for tag, data in chunk] for chunk in chunks] == [
+        [("tag1", 3)],
+        [("tag1", 2), ("tag2", 1)],
+        [("tag2", 2)],
+    ]
+    assert [point["x"] for point in chunks[1][0][1]] == [3, 4]
+    assert isinstance(chunks[2][0][1], ColumnarBuffer)
+    assert list(chunks[2][0][1].xs) == [1, 2]
+
+
+def test_split_by_bytes():
+    tag = make_tag("tag1", 100)
+    chunks = split_chunks([(tag, tag.drain())], ChunkingConfig(max_bytes=500))
+    assert len(chunks) > 1
+    assert sum(len(data) for chunk in chunks for _, data in chunk) == 100
+
+
+def test_failed_chunks_are_requeued():
+    client = DataInteractionClient(
+        base_url="https://example.com", chunking=ChunkingConfig(max_points=2)
+    )
+    tag = make_tag("tag1", 6)
+
+    def make_request(url, params):
+        xs = [point["x"] for point in params["data"][0]["data"]]
+        if xs == [2, 3]:
+            raise RuntimeError("platform down")
+        return {"error": {"id": 0}}
+
+    with patch.object(DataInteractionClient, "_make_request", side_effect=make_request):
+        with pytest.raises(ChunkSendException) as error:
+            client.set_data([tag])
+    report = error.value.report
+    assert [chunk.ok for chunk in report.chunks] == [True, False, True]
+    assert report.points_sent == 4 and report.points_failed == 2
+    assert [point["x"] for point in tag.data] == [2, 3]
+
+    with patch.object(DataInteractionClient, "_make_request", return_value={}):
+        report = client.set_data([tag])
+    assert report.ok and len(report.chunks) == 1
+    assert tag.data is None
+    client.close()
+
+
+def test_single_chunk_error_is_raised_as_is():
+    client = DataInteractionClient(base_url="https://example.com")
+    tag = make_tag("tag1", 3)
+    with patch.object(
+        DataInteractionClient, "_make_request", side_effect=RuntimeError("down")
+    ):
+        with pytest.raises(RuntimeError):
+            client.set_data([tag])
+    assert len(tag.data) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_chunks_respect_parallel_limit():
+    client = AsyncDataInteractionClient(
+        base_url="http://example.com",
+        chunking=ChunkingConfig(max_points=1, max_parallel=2),
+    )
+    tag = make_tag("tag1", 6)
+    in_flight = 0
+    peak = 0
+
+    async def make_request(url, params):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"error": {"id": 0}}
+
+    with patch.object(AsyncDataInteractionClient, "_make_request", side_effect=make_request):
+        report = await client.set_data([tag])
+    assert len(report.chunks) == 6 and report.ok
+    assert peak == 2
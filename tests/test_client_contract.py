@@ -0,0 +1,171 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import inspect
+import json
+
+import httpx
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from exceptions.chunk_send_exception import ChunkSendException
+from exceptions.data_source_not_active_exception import \
+    DataSourceNotActiveException
+from exceptions.no_data_to_send_exception import NoDataToSendException
+from exceptions.server_response_error_exception import \
+    ServerResponseErrorException
+from models.chunking_config import ChunkingConfig
+from models.tag import Tag
+from models.wire_config import WireConfig
+from tests.stub_platform import StubPlatform
+
+CLIENTS = [DataInteractionClient, AsyncDataInteractionClient]
+
+
+class Adapter:
+    """Вызывает методы синхронного и асинхронного клиента одинаково: await adapter.call(...)."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+
+    async def call(self, name: str, *args, **kwargs):
+        result = getattr(self.client, name)(*args, **kwargs)
+        return await result if inspect.isawaitable(result) else result
+
+    async def close(self) -> None:
+        await self.call("aclose" if hasattr(self.client, "aclose") else "close")
+
+
+def recording_routes(set_status=200, get_error=None):
+    received = []
+
+    def set_data(handler, body):
+        received.append(json.loads(body)["data"])
+        if set_status != 200:
+            return set_status, {"error": {"id": set_status}}
+        return 200, {"error": {"id": 0}}
+
+    def get_data(handler, body):
+        if get_error is not None:
+            return 200, {"error": {"id": get_error, "message": "bad request"}}
+        tag_ids = json.loads(body)["params"]["tagId"]
+        tag_ids = tag_ids if isinstance(tag_ids, list) else [tag_ids]
+        return 200, {"error": {"id": 0}, "data": [
+            {"tagId": tag_id, "data": [{"x": 1, "y": 2, "q": 0}]} for tag_id in tag_ids
+        ]}
+
+    return {"/smt/data/set": set_data, "/smt/data/get": get_data}, received
+
+
+@pytest.fixture(params=CLIENTS, ids=["sync", "async"])
+def client_class(request):
+    return request.param
+
+
+@pytest.mark.asyncio
+async def test_connect_returns_registry(client_class):
+    with StubPlatform() as platform:
+        client = Adapter(client_class(base_url=platform.base_url))
+        tags = await client.call("connect", "source")
+        await client.close()
+    assert tags.ids == ["tag1"]
+
+
+@pytest.mark.asyncio
+async def test_connect_inactive_source(client_class):
+    def connect(handler, body):
+        return 200, {"error": {"id": 0}, "attributes": {"smtActive": False}, "tags": []}
+
+    with StubPlatform({"/smt/dataSources/connect": connect}) as platform:
+        client = Adapter(client_class(base_url=platform.base_url))
+        with pytest.raises(DataSourceNotActiveException):
+            await client.call("connect", "source")
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_set_data_sends_chunks_and_reports(client_class):
+    routes, received = recording_routes()
+    tag = Tag(id="tag", attributes={})
+    tag.add_many(range(5), range(5))
+    with StubPlatform(routes) as platform:
+        client = Adapter(client_class(
+            base_url=platform.base_url, wire=WireConfig(mode="json"),
+            chunking=ChunkingConfig(max_points=2),
+        ))
+        report = await client.call("set_data", [tag])
+        with pytest.raises(NoDataToSendException):
+            await client.call("set_data", [tag])
+        await client.close()
+    assert report.ok and report.points_sent == 5 and len(report.chunks) == 3
+    assert sorted(point["x"] for chunk in received for point in chunk[0]["data"]) == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_set_data_http_error_requeues_data(client_class):
+    routes, _ = recording_routes(set_status=400)
+    tag = Tag(id="tag", attributes={})
+    tag.add_data(1, 1)
+    with StubPlatform(routes) as platform:
+        client = Adapter(client_class(base_url=platform.base_url, wire=WireConfig(mode="json")))
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.call("set_data", [tag])
+        await client.close()
+    assert tag.data == [{"x": 1, "y": 1, "q": 0}]
+
+
+@pytest.mark.asyncio
+async def test_partial_chunk_failure_raises_report(client_class):
+    tag = Tag(id="tag", attributes={})
+    tag.add_many(range(4), range(4))
+    calls = []
+
+    def set_data(handler, body):
+        calls.append(body)
+        status = 400 if len(calls) == 1 else 200
+        return status, {"error": {"id": 0}}
+
+    with StubPlatform({"/smt/data/set": set_data}) as platform:
+        client = Adapter(client_class(
+            base_url=platform.base_url, chunking=ChunkingConfig(max_points=2, max_parallel=1),
+        ))
+        with pytest.raises(ChunkSendException) as error:
+            await client.call("set_data", [tag])
+        await client.close()
+    assert error.value.report.points_failed == 2 and len(tag.data) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_data_records_and_columnar(client_class):
+    routes, _ = recording_routes()
+    with StubPlatform(routes) as platform:
+        client = Adapter(client_class(base_url=platform.base_url, wire=WireConfig(mode="json")))
+        records = await client.call("get_data", ["a", "b"], from_time=0, to_time=10)
+        columnar = await client.call(
+            "get_data", "a", from_time=0, to_time=10, result_format="columnar"
+        )
+        await client.close()
+    assert records == [
+        {"tagId": "a", "data": [{"x": 1, "y": 2, "q": 0}]},
+        {"tagId": "b", "data": [{"x": 1, "y": 2, "q": 0}]},
+    ]
+    assert list(columnar["a"].xs) == [1]
+
+
+@pytest.mark.asyncio
+async def test_platform_error_is_raised(client_class):
+    routes, _ = recording_routes(get_error=7)
+    with StubPlatform(routes) as platform:
+        client = Adapter(client_class(base_url=platform.base_url, wire=WireConfig(mode="json")))
+        with pytest.raises(ServerResponseErrorException):
+            await client.call("get_data", "a")
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_transport_error_is_raised(client_class):
+    client = Adapter(client_class(base_url="http://127.0.0.1:1"))
+    with pytest.raises(httpx.ConnectError) as error:
+        await client.call("get_data", "a")
+    assert error.value.request.url.path == "/smt/data/get"
+    await client.close()
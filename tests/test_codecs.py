@@ -0,0 +1,97 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+
+import pytest
+
+from buffers.columnar_buffer import ColumnarBuffer
+from data_interaction_client import DataInteractionClient
+from models.wire_config import WireConfig
+from serialization import codecs
+from serialization.codecs import JsonCodec, get_codec
+from serialization.payload import build_request_kwargs
+from tests.stub_platform import StubPlatform
+
+AVAILABLE = ["json"] + [name for name in ("orjson", "msgspec") if getattr(codecs, name) is not None]
+
+
+def sample_params():
+    buffer = ColumnarBuffer()
+    buffer.extend([1, 2], [1.5, 2.5], [0, 0])
+    return {"data": [
+        {"tagId": "tag1", "data": buffer},
+        {"tagId": {"name": "Тег", "id": "5"}, "data": [{"x": 3, "y": "строка", "q": 0}]},
+    ]}
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_codec_embeds_columnar_fragments(name):
+    codec = get_codec(name)
+    body = codec.dumps(sample_params())
+    assert codec.loads(body) == {"data": [
+        {"tagId": "tag1", "data": [{"x": 1, "y": 1.5, "q": 0}, {"x": 2, "y": 2.5, "q": 0}]},
+        {"tagId": {"name": "Тег", "id": "5"}, "data": [{"x": 3, "y": "строка", "q": 0}]},
+    ]}
+    assert body == JsonCodec().dumps(sample_params())
+
+
+def test_json_codec_keeps_strings_that_look_like_placeholders():
+    buffer = ColumnarBuffer()
+    buffer.append(1, 2)
+    params = {
+        "\ue0000\ue000": "\ue0000\ue000",
+        1: [{"tagId": "\ue0000\ue000", "data": buffer}, ["\ue0001\ue000", None]],
+    }
+    assert json.loads(JsonCodec().dumps(params)) == {
+        "\ue0000\ue000": "\ue0000\ue000",
+        "1": [
+            {"tagId": "\ue0000\ue000", "data": [{"x": 1, "y": 2, "q": 0}]},
+            ["\ue0001\ue000", None],
+        ],
+    }
+
+
+@pytest.mark.parametrize("module", ["orjson", "msgspec"])
+def test_optional_codec_matches_json_codec(module):
+    pytest.importorskip(module)
+    codec = get_codec(module)
+    assert codec.name == module
+    assert codec.dumps(sample_params()) == JsonCodec().dumps(sample_params())
+    assert codec.loads(codec.dumps({"a": "ü"})) == {"a": "ü"}
+    with pytest.raises(TypeError):
+        codec.dumps({"x": object()})
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_codec_rejects_unknown_objects(name):
+    with pytest.raises(TypeError):
+        get_codec(name).dumps({"data": [{"x": object(), "y": 1, "q": 0}]})
+
+
+def test_auto_prefers_installed_codec():
+    expected = AVAILABLE[1] if len(AVAILABLE) > 1 else "json"
+    assert get_codec("auto").name == expected
+    assert get_codec("auto") is get_codec("auto")
+
+
+@pytest.mark.skipif(codecs.orjson is not None, reason="orjson установлен")
+def test_missing_codec_raises():
+    with pytest.raises(ImportError):
+        get_codec("orjson")
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_request_and_response_use_codec(name):
+    received = []
+
+    def route(handler, body):
+        received.append(json.loads(body))
+        return 200, {"error": {"id": 0}, "data": [{"tagId": "tag1", "data": [{"x": 1, "y": "ü", "q": 0}]}]}
+
+    wire = WireConfig(mode="json", codec=name)
+    assert json.loads(build_request_kwargs({"a": "ü"}, wire)["content"]) == {"a": "ü"}
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=wire) as client:
+            entries = client.get_data("tag1", from_time=0, to_time=1)
+    assert entries[0]["data"][0]["y"] == "ü"
+    assert received[0]["params"]["tagId"] == "tag1"
@@ -0,0 +1,99 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+from array import array
+
+import pytest
+
+from buffers.columnar_buffer import ColumnarBuffer
+from models.tag import Tag
+from models.wire_config import WireConfig
+from serialization.payload import encode_json_body, tag_payload
+
+
+def test_append_keeps_integer_columns():
+    buffer = ColumnarBuffer()
+    buffer.append(1, 2, 0)
+    buffer.append(2, 3)
+    assert isinstance(buffer.xs, array) and buffer.xs.typecode == "q"
+    assert buffer.to_records() == [{"x": 1, "y": 2, "q": 0}, {"x": 2, "y": 3, "q": 0}]
+    assert buffer.nbytes() == 6 * 8
+
+
+def test_columns_are_promoted():
+    buffer = ColumnarBuffer()
+    buffer.append(1, 2, 0)
+    buffer.append("2018-06-26 17:16:00", 2.5, 0)
+    assert isinstance(buffer.xs, list)
+    assert buffer.ys.typecode == "d"
+    assert buffer.to_records()[1] == {"x": "2018-06-26 17:16:00", "y": 2.5, "q": 0}
+
+
+def test_extend_rolls_back_partial_append():
+    buffer = ColumnarBuffer()
+    buffer.extend([1, 2, "3"], [1, 2, 3])
+    assert list(buffer.xs) == [1, 2, "3"]
+    assert list(buffer.qs) == [0, 0, 0]
+    with pytest.raises(ValueError):
+        buffer.extend([1], [1, 2])
+
+
+def test_to_json_matches_records():
+    buffer = ColumnarBuffer()
+    buffer.extend([1, "2018-06-26 17:16:00"], [1.5, 2], [0, 192])
+    assert json.loads(buffer.to_json()) == buffer.to_records()
+
+
+def test_to_json_writes_non_finite_values_as_null():
+    buffer = ColumnarBuffer()
+    buffer.extend([1, 2, 3], [1.5, float("nan"), float("-inf")])
+    assert json.loads(buffer.to_json(), parse_constant=pytest.fail) == [
+        {"x": 1, "y": 1.5, "q": 0}, {"x": 2, "y": None, "q": 0}, {"x": 3, "y": None, "q": 0},
+    ]
+    buffer.append("2018-06-26 17:16:00", float("inf"))
+    assert json.loads(buffer.to_json(), parse_constant=pytest.fail)[-1]["y"] is None
+
+
+def test_tag_columnar_mode():
+    tag = Tag(id="tag1", attributes={}, buffer_mode="columnar")
+    assert not tag.has_data()
+    tag.add_data(x=1, y=5, q=0)
+    tag.add_many([2, 3], [6, 7], [0, 1])
+    assert tag.data is None
+    assert len(tag.buffer) == 3
+    tag.clear_data()
+    assert tag.buffer is None
+
+
+def test_columnar_payload_encoding():
+    tag = Tag(id="tag1", attributes={}, buffer_mode="columnar")
+    tag.add_many([1, 2], [5, 6])
+    records = [{"x": 1, "y": 5, "q": 0}, {"x": 2, "y": 6, "q": 0}]
+    body = encode_json_body({"data": [tag_payload(tag.id, tag.buffer, WireConfig(mode="json"))]})
+    assert json.loads(body) == {"data": [{"tagId": "tag1", "data": records}]}
+    assert tag_payload(tag.id, tag.buffer, WireConfig())["data"] == records
+
+
+@pytest.mark.parametrize("add", ["add_data", "add_many"])
+def test_bool_values_are_sent_as_in_list_mode(add):
+    bodies = []
+    for mode in ("list", "columnar"):
+        tag = Tag(id="tag1", attributes={}, buffer_mode=mode)
+        if add == "add_data":
+            for x, y in enumerate([1, True, 2, False]):
+                tag.add_data(x, y)
+        else:
+            tag.add_many([0, 1], [1, True])
+            tag.add_many([2, 3], [2, False])
+        data = tag.data if mode == "list" else tag.buffer
+        bodies.append(encode_json_body({"data": [tag_payload(tag.id, data, WireConfig(mode="json"))]}))
+    assert bodies[0] == bodies[1]
+    assert [point["y"] for point in json.loads(bodies[1])["data"][0]["data"]] == [1, True, 2, False]
+
+
+def test_bool_column_is_kept_on_concat():
+    first, second = ColumnarBuffer(), ColumnarBuffer()
+    first.append(1, 5)
+    second.append(2, True)
+    first.concat(second)
+    assert first.ys == [5, True]
@@ -0,0 +1,133 @@
+import sys
+sys.path.append("DataInteractionClient/")
+from datetime import timedelta, timezone
+
+import pytest
+
+from data_interaction_client import DataInteractionClient
+from models.wire_config import WireConfig
+from reading.columnar_result import decode_columnar
+from serialization.timestamps import parse_iso, to_microseconds
+from tests.stub_platform import StubPlatform
+
+
+def response_entries():
+    return [
+        {"tagId": "t1", "data": [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 10.5, "q": 192}]},
+        {"tagId": {"name": "t2"}, "data": [{"x": 3, "y": "on", "q": 0}]},
+        {"tagId": "t3", "data": []},
+    ]
+
+
+def test_decode_columnar():
+    result = decode_columnar(response_entries())
+    assert len(result) == 3 and result.points == 3
+    assert list(result["t1"].xs) == [1, 2]
+    assert list(result["t1"].ys) == [10.0, 10.5]
+    assert result["t1"].xs.typecode == "q"
+    assert result[{"name": "t2"}].ys == ["on"]
+    assert len(result["t3"]) == 0
+
+
+def test_decode_keeps_bool_values():
+    entries = [{"tagId": "t1", "data": [{"x": 1, "y": True, "q": 0}, {"x": 2, "y": 3, "q": 0}]}]
+    ys = decode_columnar(entries)["t1"].ys
+    assert ys == [True, 3] and ys[0] is True
+
+
+def test_decode_iso_timestamps():
+    entries = [{"tagId": "t1", "data": [
+        {"x": "1970-01-01T03:00:01.5+03:00", "y": 1, "q": 0},
+        {"x": "1970-01-01T00:00:02Z", "y": 2, "q": 0},
+    ]}]
+    assert list(decode_columnar(entries)["t1"].xs) == [1_500_000, 2_000_000]
+
+
+def test_decode_naive_timestamps_in_configured_timezone():
+    def entries():
+        return [{"tagId": "t1", "data": [
+            {"x": "1970-01-01T03:00:01", "y": 1, "q": 0},
+            {"x": "1970-01-01 03:00:02.25", "y": 2, "q": 0},
+        ]}]
+
+    moscow = timezone(timedelta(hours=3))
+    assert list(decode_columnar(entries())["t1"].xs) == [10_801_000_000, 10_802_250_000]
+    xs = list(decode_columnar(entries(), moscow)["t1"].xs)
+    assert xs == [1_000_000, 2_250_000]
+    assert xs[0] == to_microseconds("1970-01-01T03:00:01", moscow)
+    # Кеш начала строки общий для вызовов, но разделен по часовым поясам.
+    assert parse_iso("1970-01-01T03:00:01", moscow) == 1_000_000
+    assert parse_iso("1970-01-01T03:00:01") == 10_801_000_000
+
+
+def test_naive_timezone_is_per_client():
+    def route(handler, body):
+        return 200, {"error": {"id": 0}, "data": [
+            {"tagId": "t1", "data": [{"x": "1970-01-01T03:00:01", "y": 1, "q": 0}]},
+        ]}
+
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url, wire=WireConfig(mode="json"),
+            naive_timezone=timezone(timedelta(hours=3)),
+        ) as local, DataInteractionClient(
+            base_url=platform.base_url, wire=WireConfig(mode="json")
+        ) as utc:
+            assert list(local.get_data("t1", result_format="columnar")["t1"].xs) == [1_000_000]
+            assert list(utc.get_data("t1", result_format="columnar")["t1"].xs) == [10_801_000_000]
+            tags = local._make_tags_list([{"id": "t1", "attributes": {}}])
+    assert tags[0].naive_timezone == timezone(timedelta(hours=3))
+
+
+def test_get_data_columnar_result_format():
+    def route(handler, body):
+        return 200, {"error": {"id": 0}, "data": response_entries()}
+
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=WireConfig(mode="json")) as client:
+            result = client.get_data(["t1", "t3"], result_format="columnar")
+    assert list(result["t1"].qs) == [0, 192]
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgspec"])
+def test_columns_are_built_while_parsing(codec):
+    if codec != "json":
+        pytest.importorskip(codec)
+
+    def route(handler, body):
+        return 200, {"error": {"id": 0}, "data": response_entries() + [
+            {"tagId": "t4", "data": [{"x": "1970-01-01T03:00:01", "y": 1}]},
+        ]}
+
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url, wire=WireConfig(mode="json", codec=codec),
+            naive_timezone=timezone(timedelta(hours=3)),
+        ) as client:
+            result = client.get_data(["t1", "t3", "t4"], result_format="columnar")
+            records = client.get_data(["t1", "t3", "t4"])
+    assert result.tag_ids == [entry["tagId"] for entry in records]
+    assert list(result["t1"].xs) == [1, 2] and list(result["t1"].qs) == [0, 192]
+    assert result[{"name": "t2"}].ys == ["on"]
+    assert len(result["t3"]) == 0
+    assert list(result["t4"].xs) == [1_000_000] and list(result["t4"].qs) == [0]
+
+
+def test_to_pandas():
+    pd = pytest.importorskip("pandas")
+    frame = decode_columnar(response_entries()[:1]).to_pandas()
+    assert list(frame["y"]) == [10.0, 10.5]
+    assert frame["x"].iloc[0] == pd.Timestamp(1, unit="us", tz="UTC")
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = decode_columnar(response_entries()[:1]).to_arrow()
+    assert table.num_rows == 2
+    assert table.column("q").to_pylist() == [0, 192]
+
+
+def test_to_numpy():
+    pytest.importorskip("numpy")
+    arrays = decode_columnar(response_entries()[:1]).to_numpy()
+    assert arrays["t1"]["x"].tolist() == [1, 2]
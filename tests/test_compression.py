@@ -0,0 +1,89 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import math
+
+from compression.point_compressor import PointCompressor
+from models.compression_config import CompressionConfig
+from models.tag import Tag
+from models.tag_registry import TagRegistry
+
+
+def run(config, points):
+    compressor = PointCompressor(config)
+    out = [point for x, y, q in points for point in compressor.feed(x, y, q)]
+    out.extend(compressor.release())
+    return [(x, y, q) for x, y, q, _ in out], compressor
+
+
+def test_absolute_and_percent_deadband():
+    points = [(i, y, 0) for i, y in enumerate([10, 10.4, 10.9, 11.2, 11.3, 20])]
+    kept, compressor = run(CompressionConfig(deadband=0.5), points)
+    assert [y for _, y, _ in kept] == [10, 10.9, 20]
+    kept, _ = run(CompressionConfig(deadband_percent=10), points)
+    assert [y for _, y, _ in kept] == [10, 11.2, 20]
+    assert compressor.ratio == 2.0
+
+
+def test_quality_change_always_passes():
+    points = [(0, 5, 0), (1, 5, 1), (2, 5, 1), (3, 5, 0)]
+    kept, _ = run(CompressionConfig(deadband=100, min_interval=10), points)
+    assert kept == [(0, 5, 0), (1, 5, 1), (3, 5, 0)]
+
+
+def test_min_and_max_interval():
+    points = [(x, x, 0) for x in range(0, 100, 10)]
+    kept, _ = run(CompressionConfig(min_interval=25), points)
+    assert [x for x, _, _ in kept] == [0, 30, 60, 90]
+    flat = [(x, 1, 0) for x in range(0, 100, 10)]
+    kept, _ = run(CompressionConfig(deadband=1, max_interval=40), flat)
+    assert [x for x, _, _ in kept] == [0, 40, 80]
+
+
+def test_swinging_door_keeps_interpolation_within_deviation():
+    deviation = 0.5
+    points = [(x, math.sin(x / 20) * 10 + (0.2 if x % 2 else -0.2), 0) for x in range(400)]
+    kept, compressor = run(CompressionConfig(swinging_door=deviation), points)
+    assert compressor.ratio > 5
+    assert kept[0] == points[0] and kept[-1] == points[-1]
+    for x, y, _ in points:
+        right = next(i for i, point in enumerate(kept) if point[0] >= x)
+        (x0, y0, _), (x1, y1, _) = kept[max(right - 1, 0)], kept[right]
+        estimate = y1 if x1 == x0 else y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+        assert abs(estimate - y) <= deviation + 1e-9
+
+
+def test_non_numeric_values_pass_on_change():
+    points = [(0, "on", 0), (1, "on", 0), (2, "off", 0), (3, True, 0), (4, True, 0)]
+    kept, _ = run(CompressionConfig(deadband=1), points)
+    assert [y for _, y, _ in kept] == ["on", "off", True]
+
+
+def test_tag_reads_compression_from_attributes_and_releases_on_drain():
+    tag = Tag(id="tag", attributes={"compression": {"swinging_door": 0.1}}, buffer_mode="columnar")
+    tag.add_many(range(100), [x * 2.0 for x in range(100)])
+    assert tag.has_data()
+    snapshot = tag.drain()
+    assert snapshot.to_records() == [{"x": 0, "y": 0.0, "q": 0}, {"x": 99, "y": 198.0, "q": 0}]
+    assert tag.compressor.ratio == 50.0
+    assert not tag.has_data()
+
+
+def test_code_overrides_attributes_and_registry_reports_ratio():
+    tag = Tag(
+        id="tag", attributes={"compression": {"deadband": 100}},
+        compression=CompressionConfig(deadband=0.5),
+    )
+    tag.add_many(range(4), [1, 1.2, 2, 2.1])
+    assert [point["y"] for point in tag.data] == [1, 2]
+    tag.set_compression(None)
+    tag.add_data(4, 2.1)
+    assert len(tag.data) == 3
+
+    registry = TagRegistry([
+        {"id": "a", "attributes": {"compression": {"deadband": 1}}},
+        {"id": "b", "attributes": {}},
+    ])
+    registry.get("a").add_many(range(10), [0] * 10)
+    registry.get("b").add_many(range(10), [0] * 10)
+    assert registry.compression_ratio() == 10.0
+    assert registry.get("b").compressor is None
@@ -1,5 +1,6 @@
 import sys
 sys.path.append("DataInteractionClient/")
+import json
 from unittest.mock import patch
 
 import pytest
@@ -8,6 +9,13 @@ import httpx
 from data_interaction_client import DataInteractionClient
 from exceptions.data_source_not_active_exception import \
     DataSourceNotActiveException
+from models.transport_config import TransportConfig
+
+
+def respond(mock_post, payload):
+    # Кодеки orjson и msgspec разбирают response.content, json — response.json().
+    mock_post.return_value.json.return_value = payload
+    mock_post.return_value.content = json.dumps(payload).encode("utf-8")
 
 
 def test_connect_valid_id():
@@ -30,8 +38,8 @@ def test_connect_valid_id():
             }
         ],
     }
-    with patch("httpx.post") as mock_post:
-        mock_post.return_value.json.return_value = mock_response
+    with patch("httpx.Client.post") as mock_post:
+        respond(mock_post, mock_response)
         tags = client.connect(data_source_id="valid_id")
         assert len(tags) == 1
         assert tags[0].id == "tagId"
@@ -47,10 +55,38 @@ def test_connect_invalid_id():
             "smtJsonConfigString": "some json string with connect parameters",
         },
     }
-    with patch("httpx.post") as mock_post:
-        mock_post.return_value.json.return_value = mock_response
+    with patch("httpx.Client.post") as mock_post:
+        respond(mock_post, mock_response)
         with pytest.raises(DataSourceNotActiveException):
             client.connect(data_source_id="45345434")
 
 
+def test_http_client_is_reused_between_requests():
+    client = DataInteractionClient(base_url="https://example.com")
+    with patch("httpx.Client.post") as mock_post:
+        respond(mock_post, {"error": {"id": 0}, "data": []})
+        client.get_data(tag_id="tagId")
+        http_client = client._http_client
+        client.get_data(tag_id="tagId")
+        assert client._http_client is http_client
+        assert mock_post.call_count == 2
+
+
+def test_context_manager_closes_http_client():
+    with DataInteractionClient(base_url="https://example.com") as client:
+        http_client = client._get_http_client()
+    assert http_client.is_closed
+    assert client._http_client is None
+
+
+def test_transport_config_is_applied():
+    transport = TransportConfig(read_timeout=30, max_connections=7)
+    with DataInteractionClient(
+        base_url="https://example.com", transport=transport
+    ) as client:
+        http_client = client._get_http_client()
+        assert http_client.timeout.read == 30
+        assert http_client.timeout.connect == 5
+
+
 #... and so on for the rest of the test cases
\ No newline at end of file
@@ -0,0 +1,97 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+import threading
+import time
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.wire_config import WireConfig
+from reading.fan_out import plan_queries
+from tests.stub_platform import StubPlatform
+
+SECOND = 1_000_000
+JSON_WIRE = WireConfig(mode="json")
+
+
+def many_route(failing=(), delay=0.0):
+    """Отвечает точкой на каждую секунду окна; запросы с тегами из failing завершаются ошибкой 500."""
+    state = {"active": 0, "peak": 0, "requests": 0}
+    lock = threading.Lock()
+
+    def route(handler, body):
+        params = json.loads(body)["params"]
+        with lock:
+            state["requests"] += 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+        if any(tag_id in failing for tag_id in params["tagId"]):
+            return 500, {"error": {"id": 1, "message": "fail"}}
+        xs = range(params["from"], params["to"] + 1, SECOND)
+        data = [
+            {"tagId": tag_id, "data": [{"x": x, "y": 1, "q": 0} for x in xs]}
+            for tag_id in params["tagId"]
+        ]
+        return 200, {"error": {"id": 0}, "data": data}
+
+    return route, state
+
+
+def test_plan_queries_splits_by_groups_and_windows():
+    queries = plan_queries(["a", "b", "c"], 0, 9, tags_per_request=2, window=5)
+    assert [(q.tag_ids, q.from_time, q.to_time) for q in queries] == [
+        (["a", "b"], 0, 4), (["c"], 0, 4), (["a", "b"], 5, 9), (["c"], 5, 9),
+    ]
+
+
+def test_get_data_many_merges_series_in_time_order():
+    route, state = many_route(delay=0.01)
+    tag_ids = [f"t{i}" for i in range(10)]
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            result = client.get_data_many(
+                tag_ids, from_time=0, to_time=29 * SECOND, tags_per_request=3,
+                window=10 * SECOND, max_parallel=3,
+            )
+    assert result.ok
+    assert [series.tag_id for series in result.series] == tag_ids
+    assert [point["x"] for point in result.get("t9").data] == [x * SECOND for x in range(30)]
+    assert state["requests"] == 12
+    assert 1 < state["peak"] <= 3
+
+
+def test_get_data_many_reports_errors_per_tag():
+    route, _ = many_route(failing={"bad"})
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            result = client.get_data_many(
+                ["good", "bad"], from_time=0, to_time=SECOND, tags_per_request=1,
+            )
+    assert not result.ok
+    assert [series.tag_id for series in result.failed] == ["bad"]
+    assert len(result.get("good").data) == 2
+
+
+def test_window_requires_from_time():
+    client = DataInteractionClient(base_url="http://example.com")
+    with pytest.raises(ValueError):
+        client.get_data_many(["t1"], window=SECOND)
+
+
+@pytest.mark.asyncio
+async def test_async_get_data_many_respects_limit():
+    route, state = many_route(delay=0.02)
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        async with AsyncDataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            result = await client.get_data_many(
+                [f"t{i}" for i in range(8)], from_time=0, to_time=4 * SECOND,
+                tags_per_request=1, max_parallel=2,
+            )
+    assert result.ok
+    assert all(len(series.data) == 5 for series in result.series)
+    assert state["peak"] <= 2
@@ -0,0 +1,202 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from exceptions.server_response_error_exception import \
+    ServerResponseErrorException
+from instrumentation.client_metrics import ClientMetrics, Histogram
+from instrumentation.instrumentation import (Instrumentation,
+                                             InstrumentationListener)
+from instrumentation.opentelemetry_tracer import OpenTelemetryTracer
+from instrumentation.prometheus import render_prometheus
+from models.retry_policy import RetryPolicy
+from models.tag import Tag
+from models.wire_config import WireConfig
+from tests.stub_platform import StubPlatform
+from writers.buffered_writer import BufferedWriter
+
+FAST_RETRY = RetryPolicy(max_attempts=3, backoff_initial=0.001, jitter="none")
+
+
+class Recorder(InstrumentationListener):
+    def __init__(self):
+        self.events = []
+
+    def request_started(self, event):
+        self.events.append(("started", event.operation))
+
+    def request_finished(self, event):
+        self.events.append(("finished", event.operation, event.ok, event.points))
+
+
+def get_data_route(handler, body):
+    return 200, {"error": {"id": 0}, "data": [{"tagId": "tag1", "data": [{"x": 1, "y": 1}] * 3}]}
+
+
+def test_hooks_and_metrics_for_every_call():
+    recorder, metrics = Recorder(), ClientMetrics()
+    with StubPlatform({"/smt/data/get": get_data_route}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url,
+            wire=WireConfig(mode="json"),
+            instrumentation=Instrumentation([recorder, metrics]),
+        ) as client:
+            tags = client.connect("source")
+            tags.get("tag1").add_data(1, 10)
+            tags.get("tag1").add_data(2, 11)
+            client.set_data(tags.active())
+            client.get_data(tag_id="tag1")
+    assert recorder.events == [
+        ("started", "connect"), ("finished", "connect", True, None),
+        ("started", "set_data"), ("finished", "set_data", True, 2),
+        ("started", "get_data"), ("finished", "get_data", True, 3),
+    ]
+    assert metrics.requests.value(("set_data", "ok")) == 1
+    assert metrics.latency.count(("connect",)) == 1
+    assert metrics.points.count(("set_data",)) == 1
+    assert metrics.request_bytes.count(("set_data",)) == 1
+    assert metrics.response_bytes.count(("get_data",)) == 1
+
+
+def test_errors_and_retries_are_counted():
+    calls = []
+
+    def failing(handler, body):
+        calls.append(body)
+        if len(calls) == 1:
+            return 503, {"error": {"id": 1}}
+        return 200, {"error": {"id": 5, "message": "bad"}}
+
+    metrics = ClientMetrics()
+    with StubPlatform({"/smt/data/get": failing}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url,
+            retry=FAST_RETRY,
+            instrumentation=Instrumentation([metrics]),
+        ) as client:
+            with pytest.raises(ServerResponseErrorException):
+                client.get_data(tag_id="tag1")
+    assert metrics.requests.value(("get_data", "error")) == 2
+    assert metrics.errors.value(("get_data", "HTTPStatusError")) == 1
+    assert metrics.errors.value(("get_data", "ServerResponseErrorException")) == 1
+    assert metrics.retries.value(("HTTPStatusError",)) == 1
+
+
+def test_async_client_reports_events():
+    recorder = Recorder()
+
+    async def scenario(base_url):
+        async with AsyncDataInteractionClient(
+            base_url=base_url, instrumentation=Instrumentation([recorder])
+        ) as client:
+            await client.connect("source")
+
+    with StubPlatform() as platform:
+        asyncio.run(scenario(platform.base_url))
+    assert recorder.events == [("started", "connect"), ("finished", "connect", True, None)]
+
+
+def test_writer_reports_buffer_depth_and_queue_age():
+    metrics = ClientMetrics()
+    with StubPlatform() as platform:
+        client = DataInteractionClient(
+            base_url=platform.base_url, instrumentation=Instrumentation([metrics])
+        )
+        tag = Tag(id="tag1", attributes={})
+        with BufferedWriter(client, max_age=60) as writer:
+            writer.add_data(tag, 1, 10)
+            writer.add_data(tag, 2, 11)
+            assert writer.flush(timeout=5)
+        client.close()
+    assert metrics.batches.value(("ok",)) == 1
+    assert metrics.buffer_depth.value() == 0
+    assert metrics.queue_age.count() == 1
+
+
+def test_histogram_buckets_and_quantile():
+    histogram = Histogram("h", "help", (1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.observe(value)
+    [(labels, sample)] = histogram.samples()
+    assert sample.buckets == [1, 2, 1, 1]
+    assert sample.count == 5 and sample.sum == 560.5
+    assert histogram.quantile(0.5) == 10
+    assert histogram.quantile(1.0) == float("inf")
+    assert Histogram("e", "help", (1,)).quantile(0.5) is None
+
+
+def test_render_prometheus():
+    metrics = ClientMetrics(namespace="dic")
+    metrics.requests.inc(("set_data", "ok"), 3)
+    metrics.latency.observe(0.02, ("set_data",))
+    metrics.buffer_depth.set(7)
+    text = render_prometheus(metrics)
+    assert "# TYPE dic_requests_total counter" in text
+    assert 'dic_requests_total{operation="set_data",outcome="ok"} 3' in text
+    assert 'dic_request_duration_seconds_bucket{operation="set_data",le="0.01"} 0' in text
+    assert 'dic_request_duration_seconds_bucket{operation="set_data",le="0.025"} 1' in text
+    assert 'dic_request_duration_seconds_bucket{operation="set_data",le="+Inf"} 1' in text
+    assert 'dic_request_duration_seconds_count{operation="set_data"} 1' in text
+    assert "dic_writer_pending_points 7" in text
+    assert text.endswith("\n")
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+def test_opentelemetry_tracer_spans():
+    tracer = FakeTracer()
+
+    def failing(handler, body):
+        return 200, {"error": {"id": 5, "message": "bad"}}
+
+    with StubPlatform({"/smt/data/get": failing}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url,
+            instrumentation=Instrumentation([OpenTelemetryTracer(tracer)]),
+        ) as client:
+            client.connect("source")
+            with pytest.raises(ServerResponseErrorException):
+                client.get_data(tag_id="tag1")
+    connect, get_data = tracer.spans
+    assert connect.name == "platform.connect" and connect.ended
+    assert connect.attributes["http.response.status_code"] == 200
+    assert get_data.ended and get_data.attributes["error.type"] == "ServerResponseErrorException"
+    assert len(get_data.exceptions) == 1
+
+
+def test_disabled_instrumentation_creates_no_events():
+    client = DataInteractionClient(base_url="https://example.com")
+    assert client.instrumentation is None
+    assert client.retryer.listeners == []
@@ -0,0 +1,106 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.wire_config import WireConfig
+from reading.window_planner import WindowPlanner
+from serialization.timestamps import to_microseconds
+from tests.stub_platform import StubPlatform
+
+SECOND = 1_000_000
+JSON_WIRE = WireConfig(mode="json")
+
+
+def history_route(step=SECOND):
+    """Отвечает точками тегов с шагом step в пределах запрошенного окна, не более maxCount."""
+    requests = []
+
+    def route(handler, body):
+        params = json.loads(body)["params"]
+        requests.append(params)
+        tag_ids = params["tagId"] if isinstance(params["tagId"], list) else [params["tagId"]]
+        start = -(-params["from"] // step) * step
+        xs = list(range(start, params["to"] + 1, step))[: params.get("maxCount")]
+        data = [
+            {"tagId": tag_id, "data": [{"x": x, "y": x // step, "q": 0} for x in xs]}
+            for tag_id in tag_ids
+        ]
+        return 200, {"error": {"id": 0}, "data": data}
+
+    return route, requests
+
+
+def test_to_microseconds():
+    assert to_microseconds(5) == 5
+    assert to_microseconds("5") == 5
+    assert to_microseconds("1970-01-01T00:00:01Z") == SECOND
+    assert to_microseconds("1970-01-01T03:00:01+03:00") == SECOND
+
+
+def test_planner_shrinks_window_on_truncated_response():
+    planner = WindowPlanner(0, 100, window=100, max_count=2)
+    bounds = planner.peek()
+    entries = planner.accept(bounds, [
+        {"tagId": "a", "data": [{"x": 0}, {"x": 10}]},
+        {"tagId": "b", "data": [{"x": 5}, {"x": 50}]},
+    ])
+    assert entries == [
+        {"tagId": "a", "data": [{"x": 0}, {"x": 10}]},
+        {"tagId": "b", "data": [{"x": 5}]},
+    ]
+    assert planner.start == 11 and planner.window == 11
+
+
+def test_iter_data_reads_whole_range_without_gaps():
+    route, requests = history_route()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            points = list(client.iter_data(
+                ["t1", "t2"], from_time=0, to_time=99 * SECOND, window=10 * SECOND, max_count=7,
+            ))
+    assert [point["x"] for tag_id, point in points if tag_id == "t1"] == [
+        x * SECOND for x in range(100)
+    ]
+    assert len(points) == 200
+    assert all(request["maxCount"] == 7 for request in requests)
+
+
+def test_iter_data_grows_window_for_sparse_data():
+    route, requests = history_route(step=100 * SECOND)
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            blocks = list(client.iter_data(
+                "t1", from_time=0, to_time=10_000 * SECOND, window=SECOND, max_count=100,
+                blocks=True,
+            ))
+    assert sum(len(block[0]["data"]) for block in blocks) == 101
+    assert len(requests) < 20
+
+
+def test_iter_data_prefetch():
+    route, _ = history_route()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            xs = [point["x"] for _, point in client.iter_data(
+                "t1", from_time=0, to_time=49 * SECOND, window=10 * SECOND, prefetch=True,
+            )]
+    assert xs == [x * SECOND for x in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_aiter_data_with_prefetch():
+    route, _ = history_route()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        async with AsyncDataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE) as client:
+            xs = [
+                point["x"]
+                async for _, point in client.aiter_data(
+                    "t1", from_time=0, to_time=29 * SECOND, window=5 * SECOND,
+                    max_count=3, prefetch=True,
+                )
+            ]
+    assert xs == [x * SECOND for x in range(30)]
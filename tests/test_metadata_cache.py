@@ -0,0 +1,106 @@
+import sys
+sys.path.append("DataInteractionClient/")
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from exceptions.data_source_not_active_exception import \
+    DataSourceNotActiveException
+from metadata.metadata_cache import MetadataCache
+from tests.stub_platform import StubPlatform
+
+CONNECT = "/smt/dataSources/connect"
+
+
+def metadata_route(tag_ids, etag=None, active=True):
+    """Отвечает метаданными источника; при совпадении If-None-Match с etag — 304."""
+    state = {"tag_ids": tag_ids, "etag": etag, "active": active, "full": 0, "requests": 0}
+
+    def route(handler, body):
+        state["requests"] += 1
+        headers = {} if state["etag"] is None else {"ETag": state["etag"]}
+        if state["etag"] is not None and handler.headers.get("If-None-Match") == state["etag"]:
+            return 304, None, headers
+        state["full"] += 1
+        return 200, {
+            "error": {"id": 0},
+            "attributes": {"smtActive": state["active"]},
+            "tags": [{"id": tag_id, "attributes": {"name": tag_id}} for tag_id in state["tag_ids"]],
+        }, headers
+
+    return route, state
+
+
+def test_connect_revalidates_with_etag_and_keeps_registry():
+    route, state = metadata_route(["t1", "t2"], etag='"v1"')
+    cache = MetadataCache()
+    with StubPlatform({CONNECT: route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, metadata_cache=cache) as client:
+            tags = client.connect("source")
+            tags.get("t1").add_data(1, 2)
+            again = client.connect("source")
+    assert again is tags
+    assert again.get("t1").data == [{"x": 1, "y": 2, "q": 0}]
+    assert (state["requests"], state["full"]) == (2, 1)
+    assert (cache.misses, cache.revalidated) == (1, 1)
+
+
+def test_changed_tags_are_applied_as_delta():
+    route, state = metadata_route(["t1", "t2"])
+    changes = []
+    cache = MetadataCache(on_change=lambda source, added, removed: changes.append((added, removed)))
+    with StubPlatform({CONNECT: route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, metadata_cache=cache) as client:
+            tags = client.connect("source")
+            tag = tags.get("t1")
+            tag.add_data(1, 2)
+            assert client.connect("source") is tags
+            state["tag_ids"] = ["t1", "t3"]
+            updated = client.connect("source")
+    assert updated is tags
+    assert updated.get("t1") is tag and tag.has_data()
+    assert updated.ids == ["t1", "t3"]
+    assert "t2" not in updated
+    assert changes == [(["t3"], ["t2"])]
+    assert (cache.misses, cache.revalidated, cache.refreshed) == (1, 1, 1)
+
+
+def test_warm_disk_cache_skips_platform(tmp_path):
+    route, state = metadata_route([f"t{i}" for i in range(100)])
+    with StubPlatform({CONNECT: route}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url, metadata_cache=MetadataCache(str(tmp_path))
+        ) as client:
+            client.connect("source")
+        cache = MetadataCache(str(tmp_path), max_age=60)
+        with DataInteractionClient(base_url=platform.base_url, metadata_cache=cache) as client:
+            tags = client.connect("source")
+    assert state["requests"] == 1
+    assert len(tags) == 100 and tags.attributes("t5") == {"name": "t5"}
+    assert cache.hits == 1
+
+
+def test_inactive_source_invalidates_cache(tmp_path):
+    route, state = metadata_route(["t1"])
+    cache = MetadataCache(str(tmp_path))
+    with StubPlatform({CONNECT: route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, metadata_cache=cache) as client:
+            client.connect("source")
+            state["active"] = False
+            state["tag_ids"] = []
+            with pytest.raises(DataSourceNotActiveException):
+                client.connect("source")
+    assert cache.get("source") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_async_connect_uses_cache():
+    route, state = metadata_route(["t1"], etag='"v1"')
+    cache = MetadataCache()
+    with StubPlatform({CONNECT: route}) as platform:
+        async with AsyncDataInteractionClient(base_url=platform.base_url, metadata_cache=cache) as client:
+            tags = await client.connect("source")
+            assert await client.connect("source") is tags
+    assert state["full"] == 1
@@ -0,0 +1,126 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import gzip
+import json
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.retry_policy import RetryPolicy
+from models.tag import Tag
+from models.wire_config import WireConfig
+from serialization import payload_encoder
+from serialization.payload import build_request_kwargs, compress_body
+from serialization.payload_encoder import PayloadEncoder
+from tests.stub_platform import StubPlatform
+
+
+def test_query_mode_passes_params():
+    params = {"data": [{"tagId": "tag1", "data": [{"x": 1, "y": 2, "q": 0}]}]}
+    assert build_request_kwargs(params, WireConfig()) == {"params": params}
+
+
+def test_json_mode_encodes_body():
+    params = {"data": [{"tagId": "tag1", "data": [{"x": 1, "y": 2, "q": 0}]}]}
+    kwargs = build_request_kwargs(params, WireConfig(mode="json"))
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    assert json.loads(kwargs["content"]) == params
+
+
+def test_json_mode_compresses_above_threshold():
+    params = {"data": [{"tagId": "tag1", "data": [{"x": i, "y": i, "q": 0} for i in range(100)]}]}
+    kwargs = build_request_kwargs(
+        params, WireConfig(mode="json", compress_threshold=100)
+    )
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["content"])) == params
+
+    small = build_request_kwargs({"id": "1"}, WireConfig(mode="json", compress_threshold=100))
+    assert "Content-Encoding" not in small["headers"]
+
+
+def test_compress_body_deflate():
+    assert zlib.decompress(compress_body(b"payload", "deflate")) == b"payload"
+    with pytest.raises(ValueError):
+        compress_body(b"payload", "br")
+
+
+def test_set_data_sends_json_body():
+    received = {}
+
+    def set_data(handler, body):
+        received["path"] = handler.path
+        received["encoding"] = handler.headers.get("Content-Encoding")
+        received["body"] = json.loads(gzip.decompress(body))
+        return 200, {"error": {"id": 0}}
+
+    tag = Tag(id="tag1", attributes={})
+    tag.add_data(x=1, y=5, q=0)
+    wire = WireConfig(mode="json", compress_threshold=0)
+    with StubPlatform({"/smt/data/set": set_data}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=wire) as client:
+            client.set_data([tag])
+    assert received["path"] == "/smt/data/set"
+    assert received["encoding"] == "gzip"
+    assert received["body"] == {"data": [{"tagId": "tag1", "data": [{"x": 1, "y": 5, "q": 0}]}]}
+
+
+def test_payload_encoder_offloads_large_json_bodies():
+    encoder = PayloadEncoder(min_points=3)
+    params = {"data": [{"tagId": "tag1", "data": [{"x": 1, "y": 1, "q": 0}] * 2}]}
+    assert not encoder.wants(params, WireConfig(mode="json"))
+    params["data"].append({"tagId": "tag2", "data": [{"x": 1, "y": 1, "q": 0}]})
+    assert encoder.wants(params, WireConfig(mode="json"))
+    assert not encoder.wants(params, WireConfig(mode="query"))
+    assert not encoder.wants({"id": "1"}, WireConfig(mode="json"))
+    assert encoder.encode(params, WireConfig(mode="json")) == build_request_kwargs(
+        params, WireConfig(mode="json")
+    )
+    encoder.close()
+
+
+def test_offloaded_body_is_encoded_once_for_all_attempts():
+    tag = Tag(id="tag1", attributes={})
+    tag.add_many([1, 2], [5, 6])
+    encoder = PayloadEncoder(min_points=1)
+    policy = RetryPolicy(max_attempts=20, backoff_initial=0.001, jitter="none")
+    wire = WireConfig(mode="json", compress_threshold=0)
+    with patch.object(
+        payload_encoder, "build_request_kwargs", wraps=build_request_kwargs
+    ) as encode:
+        with StubPlatform(error_rate=0.5, seed=3) as platform:
+            with DataInteractionClient(
+                base_url=platform.base_url, wire=wire, retry=policy, encoder=encoder
+            ) as client:
+                assert client.set_data([tag]).points_sent == 2
+    encoder.close()
+    assert platform.errors > 0
+    assert encode.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_set_data_awaits_body_from_process_pool():
+    received = []
+
+    def set_data(handler, body):
+        received.append(json.loads(gzip.decompress(body)))
+        return 200, {"error": {"id": 0}}
+
+    tag = Tag(id="tag1", attributes={}, buffer_mode="columnar")
+    tag.add_many([1, 2, 3], [1.5, 2.5, 3.5])
+    wire = WireConfig(mode="json", compress_threshold=0)
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        with StubPlatform({"/smt/data/set": set_data}) as platform:
+            async with AsyncDataInteractionClient(
+                base_url=platform.base_url, wire=wire,
+                encoder=PayloadEncoder(pool, min_points=1),
+            ) as client:
+                await client.set_data([tag])
+    assert received == [{"data": [{"tagId": "tag1", "data": [
+        {"x": 1, "y": 1.5, "q": 0}, {"x": 2, "y": 2.5, "q": 0}, {"x": 3, "y": 3.5, "q": 0},
+    ]}]}]
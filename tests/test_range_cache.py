@@ -0,0 +1,144 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+import time
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.wire_config import WireConfig
+from reading.range_cache import RangeCache
+from tests.stub_platform import StubPlatform
+
+SECOND = 1_000_000
+JSON_WIRE = WireConfig(mode="json")
+
+
+def counting_route():
+    """Отвечает точкой на каждую секунду окна и запоминает запрошенные окна."""
+    windows = []
+
+    def route(handler, body):
+        params = json.loads(body)["params"]
+        windows.append((params["tagId"], params["from"], params["to"]))
+        start = -(-params["from"] // SECOND) * SECOND
+        data = [
+            {"tagId": tag_id, "data": [
+                {"x": x, "y": 1, "q": 0} for x in range(start, params["to"] + 1, SECOND)
+            ]}
+            for tag_id in params["tagId"]
+        ]
+        return 200, {"error": {"id": 0}, "data": data}
+
+    return route, windows
+
+
+def xs(entries):
+    return [point["x"] // SECOND for point in entries[0]["data"]]
+
+
+def test_cache_fetches_only_missing_intervals():
+    route, windows = counting_route()
+    cache = RangeCache()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=cache) as client:
+            assert xs(client.get_data(["t1"], from_time=0, to_time=9 * SECOND, actual=True)) == list(range(10))
+            assert xs(client.get_data(["t1"], from_time=5 * SECOND, to_time=14 * SECOND, actual=True)) == list(range(5, 15))
+            assert xs(client.get_data(["t1"], from_time=2 * SECOND, to_time=12 * SECOND, actual=True)) == list(range(2, 13))
+    assert windows == [(["t1"], 0, 9 * SECOND), (["t1"], 9 * SECOND + 1, 14 * SECOND)]
+    assert (cache.misses, cache.partial_hits, cache.hits) == (1, 1, 1)
+    assert cache.bytes_saved > 0
+
+
+def test_cache_groups_tags_and_separates_options():
+    route, windows = counting_route()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=RangeCache()) as client:
+            client.get_data(["t1", "t2"], from_time=0, to_time=SECOND, actual=True)
+            client.get_data(["t1", "t2"], from_time=0, to_time=SECOND, actual=True)
+            client.get_data(["t1"], from_time=0, to_time=SECOND, actual=True, format_param=True)
+            client.get_data(["t1"], from_time=0, to_time=SECOND, max_count=1, actual=True)
+    assert len(windows) == 3
+    assert windows[0][0] == ["t1", "t2"]
+
+
+def test_interpolated_requests_bypass_cache():
+    windows = []
+
+    def route(handler, body):
+        params = json.loads(body)["params"]
+        windows.append(params["from"])
+        points = [
+            {"x": x, "y": 1, "q": 0}
+            for x in range(params["from"], params["to"] + 1, params["timeStep"])
+        ]
+        return 200, {"error": {"id": 0}, "data": [{"tagId": "t1", "data": points}]}
+
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=RangeCache()) as client:
+            first = client.get_data(["t1"], from_time=0, to_time=10 * SECOND, time_step=2 * SECOND)
+            second = client.get_data(["t1"], from_time=SECOND, to_time=9 * SECOND, time_step=2 * SECOND)
+    assert xs(first) == [0, 2, 4, 6, 8, 10]
+    assert xs(second) == [1, 3, 5, 7, 9]
+    assert windows == [0, SECOND]
+
+
+def test_non_actual_requests_bypass_cache():
+    windows = []
+
+    def route(handler, body):
+        params = json.loads(body)["params"]
+        windows.append((params["from"], params["to"]))
+        # Интерполированное значение на границах запроса зависит от самих границ.
+        points = [{"x": params["from"], "y": params["from"] % 7, "q": 0},
+                  {"x": params["to"], "y": params["to"] % 7, "q": 0}]
+        return 200, {"error": {"id": 0}, "data": [{"tagId": "t1", "data": points}]}
+
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=RangeCache()) as client:
+            client.get_data(["t1"], from_time=0, to_time=10 * SECOND)
+            second = client.get_data(["t1"], from_time=3, to_time=8 * SECOND)
+            client.get_data(["t1"], from_time=0, to_time=10 * SECOND)
+    assert xs(second) == [0, 8]
+    assert second[0]["data"][0]["x"] == 3
+    assert windows == [(0, 10 * SECOND), (3, 8 * SECOND), (0, 10 * SECOND)]
+
+
+def test_recent_tail_expires():
+    route, windows = counting_route()
+    cache = RangeCache(recent_window=60 * SECOND, recent_ttl=0.05)
+    now = time.time_ns() // 1000 // SECOND * SECOND
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=cache) as client:
+            client.get_data(["t1"], from_time=now - 120 * SECOND, to_time=now, actual=True)
+            client.get_data(["t1"], from_time=now - 120 * SECOND, to_time=now, actual=True)
+            time.sleep(0.1)
+            client.get_data(["t1"], from_time=now - 120 * SECOND, to_time=now, actual=True)
+    assert len(windows) == 2
+    assert windows[1][1] > now - 120 * SECOND
+
+
+def test_lru_eviction_by_bytes():
+    route, _ = counting_route()
+    cache = RangeCache(max_bytes=15 * 240)
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=JSON_WIRE, cache=cache) as client:
+            client.get_data(["t1"], from_time=0, to_time=9 * SECOND, actual=True)
+            entries = client.get_data(["t2"], from_time=0, to_time=9 * SECOND, actual=True)
+    assert len(entries[0]["data"]) == 10
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_cache():
+    route, windows = counting_route()
+    with StubPlatform({"/smt/data/get": route}) as platform:
+        async with AsyncDataInteractionClient(
+            base_url=platform.base_url, wire=JSON_WIRE, cache=RangeCache()
+        ) as client:
+            await client.get_data("t1", from_time=0, to_time=4 * SECOND, actual=True)
+            entries = await client.get_data("t1", from_time=0, to_time=4 * SECOND, actual=True)
+    assert xs(entries) == list(range(5))
+    assert len(windows) == 1
@@ -0,0 +1,167 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from exceptions.rate_limit_exceeded_exception import RateLimitExceededException
+from models.rate_limit_config import RateLimitConfig
+from models.retry_policy import RetryPolicy
+from resilience.rate_limiter import BASELINE_DRIFT, RateLimiter
+from tests.stub_platform import StubPlatform
+
+
+def test_aimd_increases_at_full_load_and_halves_on_overload():
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=2, max_concurrency=3))
+    for _ in range(2):
+        limiter.acquire()
+    limiter.release(0.01)
+    limiter.release(0.01)
+    assert limiter.limit == pytest.approx(2.5)
+    limiter.acquire()
+    limiter.release(0.01)
+    assert limiter.limit == pytest.approx(2.5)
+
+    limiter.acquire()
+    limiter.release(0.01, overloaded=True)
+    assert limiter.limit == pytest.approx(1.25)
+    limiter.acquire()
+    limiter.release(0.5)
+    # Второй признак перегрузки в пределах длительности запроса ограничение не снижает.
+    assert limiter.concurrency == 1
+    assert limiter.overloads == 2
+    # Наименьшая длительность смещается к долгому запросу на BASELINE_DRIFT разницы.
+    assert limiter.min_latency == pytest.approx(0.01 + 0.49 * BASELINE_DRIFT)
+
+
+def test_token_bucket_limits_rate():
+    limiter = RateLimiter(RateLimitConfig(rate=50, burst=1, initial_concurrency=10))
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release()
+    assert time.monotonic() - started >= 0.07
+    assert limiter.throttled == 4
+
+
+def test_concurrency_limit_is_shared_by_threads_and_coroutines():
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=3, max_concurrency=3))
+    state = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def enter():
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+
+    def leave():
+        with lock:
+            state["now"] -= 1
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+            enter()
+            time.sleep(0.002)
+            leave()
+            limiter.release(0.002)
+
+    async def coroutine():
+        for _ in range(5):
+            await limiter.aacquire()
+            enter()
+            await asyncio.sleep(0.002)
+            leave()
+            limiter.release(0.002)
+
+    async def main():
+        await asyncio.gather(*(coroutine() for _ in range(6)))
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(main())
+    for thread in threads:
+        thread.join()
+    assert state["peak"] == 3
+    assert limiter.in_flight == 0
+
+
+def test_max_wait_raises():
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=1, max_wait=0.01))
+    limiter.acquire()
+    with pytest.raises(RateLimitExceededException):
+        limiter.acquire()
+    with pytest.raises(RateLimitExceededException):
+        asyncio.run(limiter.aacquire())
+    limiter.release()
+    limiter.acquire()
+    assert limiter.rejected == 2
+
+
+@pytest.mark.parametrize("give_up", ["timeout", "cancel"])
+def test_abandoned_async_waiter_wakes_threads_queued_behind_it(give_up):
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=1, max_concurrency=2, max_wait=0.1))
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        acquired.set()
+
+    async def main():
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0.01)
+        limiter.config = RateLimitConfig(initial_concurrency=1, max_concurrency=2, max_wait=5)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        await asyncio.sleep(0.01)
+        # Место освобождается без передачи ожиданиям: поток ждет только из-за очереди.
+        with limiter._lock:
+            limiter.limit = 2.0
+        if give_up == "cancel":
+            waiter.cancel()
+        with pytest.raises((asyncio.CancelledError, RateLimitExceededException)):
+            await waiter
+        assert await asyncio.to_thread(acquired.wait, 1)
+        thread.join()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 2
+
+
+def test_retried_unavailability_reduces_client_limit():
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=8))
+    policy = RetryPolicy(max_attempts=3, backoff_initial=0.001, jitter="none")
+    with StubPlatform(error_rate=1.0) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url, retry=policy, rate_limiter=limiter
+        ) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get_data(tag_id="tag1")
+    assert limiter.overloads == 3
+    assert limiter.limit < 8
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_shared_by_async_clients_keeps_platform_within_capacity():
+    limiter = RateLimiter(RateLimitConfig(initial_concurrency=2, max_concurrency=2))
+    with StubPlatform(latency=0.01, capacity=2) as platform:
+        clients = [
+            AsyncDataInteractionClient(base_url=platform.base_url, rate_limiter=limiter)
+            for _ in range(3)
+        ]
+        await asyncio.gather(*(
+            client.get_data(tag_id="tag1") for client in clients for _ in range(4)
+        ))
+        for client in clients:
+            await client.aclose()
+    assert platform.errors == 0
+    assert platform.peak == 2
+    assert platform.requests["/smt/data/get"] == 12
@@ -0,0 +1,151 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from exceptions.circuit_open_exception import CircuitOpenException
+from exceptions.server_response_error_exception import \
+    ServerResponseErrorException
+from models.circuit_breaker_config import CircuitBreakerConfig
+from models.retry_policy import RetryPolicy
+from models.tag import Tag
+from resilience.circuit_breaker import CircuitBreaker
+from resilience.retryer import Retryer
+from tests.stub_platform import StubPlatform
+
+FAST_RETRY = RetryPolicy(max_attempts=3, backoff_initial=0.001, jitter="none")
+
+
+def failing_route(statuses):
+    """Отвечает статусами из statuses по очереди, затем успешно."""
+    calls = []
+
+    def route(handler, body):
+        calls.append(time.monotonic())
+        if len(calls) <= len(statuses):
+            status = statuses[len(calls) - 1]
+            return status, {"error": {"id": 0}}
+        return 200, {"error": {"id": 0}}
+
+    return route, calls
+
+
+def make_tag():
+    tag = Tag(id="tag1", attributes={})
+    tag.add_data(x=1, y=1)
+    return tag
+
+
+def test_retries_transient_status_until_success():
+    route, calls = failing_route([503, 502])
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, retry=FAST_RETRY) as client:
+            retries = []
+            client.retryer.listeners.append(lambda attempt, error, delay: retries.append(attempt))
+            client.set_data([make_tag()])
+    assert len(calls) == 3
+    assert retries == [1, 2]
+    assert client.retryer.retries == 2
+
+
+def test_non_retryable_status_is_raised():
+    route, calls = failing_route([400])
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, retry=FAST_RETRY) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.set_data([make_tag()])
+    assert len(calls) == 1
+
+
+def test_gives_up_after_max_attempts():
+    route, calls = failing_route([503] * 10)
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, retry=FAST_RETRY) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.set_data([make_tag()])
+    assert len(calls) == 3
+    assert client.retryer.exhausted == 1
+
+
+def test_retry_error_ids():
+    policy = RetryPolicy(retry_error_ids=[7])
+    assert policy.is_retryable(ServerResponseErrorException("busy", error_id=7))
+    assert not policy.is_retryable(ServerResponseErrorException("bad", error_id=3))
+
+
+def test_backoff_jitter_bounds():
+    policy = RetryPolicy(backoff_initial=1, backoff_multiplier=2, backoff_max=5)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+    assert RetryPolicy(jitter="none", backoff_initial=1, backoff_max=5).backoff(10) == 5
+    equal = RetryPolicy(jitter="equal", backoff_initial=2)
+    assert all(1 <= equal.backoff(1) <= 2 for _ in range(100))
+
+
+def test_deadline_stops_retries():
+    policy = RetryPolicy(max_attempts=100, backoff_initial=0.05, jitter="none", deadline=0.12)
+    route, calls = failing_route([503] * 100)
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        with DataInteractionClient(base_url=platform.base_url, retry=policy) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.set_data([make_tag()])
+    assert 2 <= len(calls) <= 3
+
+
+def test_circuit_breaker_opens_and_recovers():
+    route, calls = failing_route([503, 503])
+    breaker = CircuitBreakerConfig(failure_threshold=2, reset_timeout=0.05)
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        with DataInteractionClient(
+            base_url=platform.base_url, circuit_breaker=breaker
+        ) as client:
+            transitions = []
+            client.retryer.breaker.listeners.append(
+                lambda old, new: transitions.append(new)
+            )
+            tag = make_tag()
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    client.set_data([tag])
+            with pytest.raises(CircuitOpenException):
+                client.set_data([tag])
+            assert len(calls) == 2
+            time.sleep(0.06)
+            client.set_data([tag])
+    assert transitions == ["open", "half_open", "closed"]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_retries_transient_status():
+    route, calls = failing_route([503])
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        async with AsyncDataInteractionClient(
+            base_url=platform.base_url, retry=FAST_RETRY
+        ) as client:
+            await client.set_data([make_tag()])
+    assert len(calls) == 2
+    assert client.retryer.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_releases_its_slot():
+    breaker = CircuitBreaker(
+        CircuitBreakerConfig(failure_threshold=1, reset_timeout=0.01, half_open_max_calls=1)
+    )
+    retryer = Retryer(RetryPolicy(max_attempts=1), breaker)
+    breaker.record_failure()
+    await asyncio.sleep(0.02)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(retryer.acall(lambda: asyncio.sleep(1)), 0.01)
+    assert breaker.state == "half_open"
+
+    async def ok():
+        return "ok"
+
+    assert await retryer.acall(ok) == "ok"
+    assert breaker.state == "closed"
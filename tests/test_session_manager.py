@@ -0,0 +1,142 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import json
+import threading
+import time
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.retry_policy import RetryPolicy
+from models.tag_registry import TagRegistry
+from models.wire_config import WireConfig
+from sessions.async_session_manager import AsyncSessionManager
+from sessions.flush_scheduler import FlushScheduler
+from sessions.session_manager import SessionManager
+from tests.stub_platform import StubPlatform
+
+WIRE = WireConfig(mode="json")
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def platform_routes(fail_sources=()):
+    """Отвечает тегами '<источник>.t1', '<источник>.t2' и запоминает отправленные теги."""
+    sent = []
+    lock = threading.Lock()
+
+    def connect(handler, body):
+        source = json.loads(body)["id"]
+        tags = [{"id": f"{source}.t{i}", "attributes": {}} for i in (1, 2)]
+        return 200, {"error": {"id": 0}, "attributes": {"smtActive": True}, "tags": tags}
+
+    def set_data(handler, body):
+        tag_ids = [item["tagId"] for item in json.loads(body)["data"]]
+        if any(tag_id.split(".")[0] in fail_sources for tag_id in tag_ids):
+            return 500, {"error": {"id": 500}}
+        with lock:
+            sent.append(tag_ids)
+        return 200, {"error": {"id": 0}}
+
+    return {"/smt/dataSources/connect": connect, "/smt/data/set": set_data}, sent
+
+
+def test_scheduler_is_fair_and_rate_limited():
+    scheduler = FlushScheduler(min_interval=10)
+    states = {}
+    for source in ("a", "b", "c"):
+        states[source] = scheduler.add(source, TagRegistry([{"id": "t", "attributes": {}}]))
+        states[source].registry[0].add_data(1, 1)
+    first = scheduler.take(now=0, limit=2)
+    assert [state.source_id for state in first] == ["a", "b"]
+    for state in first:
+        scheduler.complete(state, 1, now=1)
+    assert [state.source_id for state in scheduler.take(now=2, limit=2)] == ["c"]
+    assert scheduler.take(now=5, limit=2) == []
+    assert scheduler.wait_timeout(5) == scheduler.poll_interval
+    scheduler.request_flush()
+    assert {state.source_id for state in scheduler.take(now=5, limit=3)} == {"a", "b"}
+
+
+def test_scheduler_backs_off_after_failures():
+    scheduler = FlushScheduler(min_interval=1, retry_interval=2, max_retry_interval=5)
+    state = scheduler.add("a", TagRegistry([{"id": "t", "attributes": {}}]))
+    state.registry[0].add_data(1, 1)
+    for expected in (2, 4, 5):
+        taken, = scheduler.take(now=100, limit=1)
+        scheduler.fail(taken, RuntimeError(), now=100)
+        assert state.next_at == 100 + expected
+        state.next_at = 0
+    assert scheduler.health().failing[0].consecutive_failures == 3
+
+
+def test_manager_sends_each_source_over_shared_client():
+    routes, sent = platform_routes()
+    with StubPlatform(routes) as platform:
+        client = DataInteractionClient(base_url=platform.base_url, wire=WIRE)
+        with SessionManager(client, min_interval=0.05, poll_interval=0.01) as manager:
+            for source in ("s1", "s2", "s3"):
+                manager.add_source(source)
+            manager.tags("s1").get("s1.t1").add_data(1, 1)
+            manager.tags("s3").get("s3.t2").add_data(2, 2)
+            assert manager.flush(timeout=5)
+            health = manager.health()
+        client.close()
+    assert sorted(sent) == [["s1.t1"], ["s3.t2"]]
+    assert health.ok and health.points_sent == 2
+    assert health.get("s1").flushes == 1 and health.get("s2").flushes == 0
+    assert health.circuit_state is None
+
+
+def test_manager_reports_failing_source_and_keeps_its_data():
+    routes, sent = platform_routes(fail_sources={"bad"})
+    errors = []
+    with StubPlatform(routes) as platform:
+        client = DataInteractionClient(base_url=platform.base_url, wire=WIRE, retry=NO_RETRY)
+        manager = SessionManager(
+            client, poll_interval=0.01, on_error=lambda source, e: errors.append(source)
+        )
+        manager.add_source("good").get("good.t1").add_data(1, 1)
+        bad = manager.add_source("bad")
+        bad.get("bad.t1").add_data(1, 1)
+        assert not manager.flush(timeout=5)
+        health = manager.health()
+        assert not manager.close(timeout=5)
+        client.close()
+    assert sent == [["good.t1"]]
+    assert errors[0] == "bad"
+    assert not health.ok and [source.source_id for source in health.failing] == ["bad"]
+    assert bad.get("bad.t1").data == [{"x": 1, "y": 1, "q": 0}]
+
+
+def test_remove_source_flushes_remaining_data():
+    routes, sent = platform_routes()
+    with StubPlatform(routes) as platform:
+        client = DataInteractionClient(base_url=platform.base_url, wire=WIRE)
+        with SessionManager(client, min_interval=60) as manager:
+            manager.add_source("s1").get("s1.t1").add_data(1, 1)
+            manager.flush()
+            manager.tags("s1").get("s1.t2").add_data(1, 1)
+            time.sleep(0.2)
+            assert sent == [["s1.t1"]]
+            registry = manager.remove_source("s1")
+            assert manager.sources == []
+        client.close()
+    assert sent == [["s1.t1"], ["s1.t2"]] and not registry.active()
+
+
+@pytest.mark.asyncio
+async def test_async_manager_flushes_sources():
+    routes, sent = platform_routes()
+    with StubPlatform(routes) as platform:
+        client = AsyncDataInteractionClient(base_url=platform.base_url, wire=WIRE)
+        async with AsyncSessionManager(client, poll_interval=0.01) as manager:
+            for source in ("s1", "s2"):
+                registry = await manager.add_source(source)
+                registry.get(f"{source}.t1").add_data(1, 1)
+            assert await manager.flush(timeout=5)
+            assert manager.health().points_sent == 2
+            refreshed = await manager.refresh("s1")
+            assert manager.tags("s1") is refreshed
+        await client.aclose()
+    assert sorted(sent) == [["s1.t1"], ["s2.t1"]]
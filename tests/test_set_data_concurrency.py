@@ -0,0 +1,59 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import random
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from data_interaction_client import DataInteractionClient
+from exceptions.no_data_to_send_exception import NoDataToSendException
+from models.tag import Tag
+
+PRODUCERS = 8
+POINTS_PER_PRODUCER = 5000
+
+
+@pytest.mark.parametrize("buffer_mode", ["list", "columnar"])
+def test_concurrent_add_data_and_set_data_lose_nothing(buffer_mode):
+    client = DataInteractionClient(base_url="https://example.com")
+    tags = [Tag(id=f"tag{i}", attributes={}, buffer_mode=buffer_mode) for i in range(4)]
+    received = []
+    lock = threading.Lock()
+
+    def make_request(url, params):
+        time.sleep(0.001)
+        if random.random() < 0.2:
+            raise RuntimeError("platform down")
+        with lock:
+            for item in params["data"]:
+                received.extend((item["tagId"], point["x"]) for point in item["data"])
+        return {"error": {"id": 0}}
+
+    def produce(producer):
+        for i in range(POINTS_PER_PRODUCER):
+            tags[i % len(tags)].add_data(x=producer * POINTS_PER_PRODUCER + i, y=i)
+
+    with patch.object(DataInteractionClient, "_make_request", side_effect=make_request):
+        producers = [threading.Thread(target=produce, args=(p,)) for p in range(PRODUCERS)]
+        for thread in producers:
+            thread.start()
+        while any(thread.is_alive() for thread in producers):
+            try:
+                client.set_data(tags)
+            except (RuntimeError, NoDataToSendException):
+                pass
+        while any(tag.has_data() for tag in tags):
+            try:
+                client.set_data(tags)
+            except RuntimeError:
+                pass
+
+    expected = {
+        (f"tag{i % len(tags)}", producer * POINTS_PER_PRODUCER + i)
+        for producer in range(PRODUCERS)
+        for i in range(POINTS_PER_PRODUCER)
+    }
+    assert len(received) == len(expected)
+    assert set(received) == expected
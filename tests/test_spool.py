@@ -0,0 +1,210 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from models.retry_policy import RetryPolicy
+from models.tag import Tag
+from spool.disk_spool import DiskSpool
+from spool.spool_replayer import SpoolReplayer
+from tests.stub_platform import StubPlatform
+from writers.buffered_writer import BufferedWriter
+
+
+def make_tag(tag_id, xs, buffer_mode="list"):
+    tag = Tag(id=tag_id, attributes={}, buffer_mode=buffer_mode)
+    tag.add_many(xs, [x * 10 for x in xs])
+    return tag
+
+
+def recording_route():
+    bodies = []
+
+    def route(handler, body):
+        bodies.append(json.loads(body))
+        return 200, {"error": {"id": 0}}
+
+    return route, bodies
+
+
+def test_append_and_read_round_trip(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append_tags([make_tag("tag1", [1, 2]), make_tag("tag2", [3], "columnar")])
+    [record] = spool.pending()
+    assert record.points == 3
+    assert spool.read(record) == {
+        "data": [
+            {"tagId": "tag1", "data": [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 20, "q": 0}]},
+            {"tagId": "tag2", "data": [{"x": 3, "y": 30, "q": 0}]},
+        ]
+    }
+
+
+def test_pending_is_ordered_by_timestamp(tmp_path):
+    spool = DiskSpool(str(tmp_path), segment_bytes=100)
+    spool.append_tags([make_tag("tag1", [30, 31])])
+    spool.append_tags([make_tag("tag1", [10])])
+    spool.append_tags([make_tag("tag1", [20])])
+    assert [record.sort_key for record in spool.pending()] == [10, 20, 30]
+
+
+def test_torn_tail_is_discarded_on_reopen(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append_tags([make_tag("tag1", [1])])
+    record = spool.append_tags([make_tag("tag1", [2])])
+    spool.close()
+    path = os.path.join(str(tmp_path), f"{record.segment:012d}.seg")
+    with open(path, "r+b") as f:
+        f.truncate(record.offset + record.size - 3)
+    reopened = DiskSpool(str(tmp_path))
+    assert [reopened.read(r)["data"][0]["data"][0]["x"] for r in reopened.pending()] == [1]
+    assert os.path.getsize(path) == record.offset
+
+
+def test_acks_survive_reopen_and_compaction_reclaims_space(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    for x in range(4):
+        spool.append_tags([make_tag("tag1", [x])])
+    first, second = spool.pending()[:2]
+    spool.ack(first)
+    spool.ack(second)
+    spool.close()
+    reopened = DiskSpool(str(tmp_path))
+    assert reopened.pending_records == 2
+    size = reopened.size_bytes
+    assert reopened.compact() > 0
+    assert reopened.size_bytes < size
+    assert [r.sort_key for r in reopened.pending()] == [2, 3]
+    assert [reopened.read(r)["data"][0]["data"][0]["x"] for r in reopened.pending()] == [2, 3]
+
+
+def test_failed_compaction_keeps_unsent_records(tmp_path, monkeypatch):
+    spool = DiskSpool(str(tmp_path))
+    for x in range(3):
+        spool.append_tags([make_tag("tag1", [x])])
+    spool.ack(spool.pending()[0])
+
+    def fail(fd):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError):
+        spool.compact()
+    monkeypatch.undo()
+    assert [r.sort_key for r in spool.pending()] == [1, 2]
+    spool.close()
+    reopened = DiskSpool(str(tmp_path))
+    assert [reopened.read(r)["data"][0]["data"][0]["x"] for r in reopened.pending()] == [1, 2]
+    assert reopened.compact() > 0
+    assert [r.sort_key for r in reopened.pending()] == [1, 2]
+
+
+def test_size_cap_drops_oldest_segments(tmp_path):
+    record_size = DiskSpool(str(tmp_path / "probe")).append_tags([make_tag("tag1", [1])]).size
+    spool = DiskSpool(str(tmp_path / "spool"), max_bytes=3 * record_size, segment_bytes=record_size)
+    for x in range(1, 6):
+        spool.append_tags([make_tag("tag1", [x])])
+    assert spool.size_bytes <= 3 * record_size
+    assert spool.dropped_records == 2
+    assert [r.sort_key for r in spool.pending()] == [3, 4, 5]
+
+
+def test_set_data_spools_when_platform_unreachable(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    client = DataInteractionClient(
+        base_url="http://127.0.0.1:9", spool=spool, retry=RetryPolicy(max_attempts=1)
+    )
+    tag = make_tag("tag1", [1, 2])
+    report = client.set_data([tag])
+    assert report.ok and report.points_spooled == 2 and report.points_sent == 0
+    assert tag.data is None
+    assert spool.pending_points == 2
+
+
+@pytest.mark.asyncio
+async def test_async_set_data_spools_without_blocking_the_loop(tmp_path, monkeypatch):
+    spool = DiskSpool(str(tmp_path))
+    append_snapshots = spool.append_snapshots
+
+    def slow_append(chunk):
+        time.sleep(0.3)  # Запись с fsync на медленном диске.
+        return append_snapshots(chunk)
+
+    monkeypatch.setattr(spool, "append_snapshots", slow_append)
+    gaps = []
+
+    async def ticker():
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.monotonic()
+            gaps.append(now - last)
+            last = now
+
+    ticks = asyncio.ensure_future(ticker())
+    async with AsyncDataInteractionClient(
+        base_url="http://127.0.0.1:9", spool=spool, retry=RetryPolicy(max_attempts=1)
+    ) as client:
+        report = await client.set_data([make_tag("tag1", [1, 2])])
+    ticks.cancel()
+    assert report.points_spooled == 2 and spool.pending_points == 2
+    assert max(gaps) < 0.2
+
+
+def test_replayer_sends_in_order_and_acks(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append_tags([make_tag("tag1", [20])])
+    spool.append_tags([make_tag("tag1", [10])])
+    route, bodies = recording_route()
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        # Записи спула передаются в теле запроса и при wire.mode="query".
+        with DataInteractionClient(base_url=platform.base_url) as client:
+            replayer = SpoolReplayer(spool, client, max_points_per_second=1000)
+            assert replayer.replay() == 2
+    assert [body["data"][0]["data"][0]["x"] for body in bodies] == [10, 20]
+    assert spool.pending_records == 0
+
+
+def test_replay_stops_on_error_and_keeps_records(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append_tags([make_tag("tag1", [1])])
+    client = DataInteractionClient(base_url="http://127.0.0.1:9")
+    with pytest.raises(Exception):
+        SpoolReplayer(spool, client).replay()
+    assert spool.pending_records == 1
+
+
+@pytest.mark.asyncio
+async def test_async_replay(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    spool.append_tags([make_tag("tag1", [1, 2])])
+    route, bodies = recording_route()
+    with StubPlatform({"/smt/data/set": route}) as platform:
+        async with AsyncDataInteractionClient(base_url=platform.base_url) as client:
+            replayer = SpoolReplayer(spool, client)
+            assert await replayer.areplay() == 2
+            spool.append_tags([make_tag("tag1", [3])])
+            replayer.stop()
+            assert await replayer.areplay() == 0
+    assert len(bodies) == 1
+    assert spool.pending_records == 1
+
+
+def test_writer_spills_to_spool(tmp_path):
+    spool = DiskSpool(str(tmp_path))
+    client = DataInteractionClient(base_url="http://127.0.0.1:9")
+    tag = Tag(id="tag1", attributes={})
+    writer = BufferedWriter(
+        client, max_batch_points=1000, max_age=60, max_pending_points=2,
+        overflow="spill", spill=spool.append_tags,
+    )
+    for x in range(3):
+        writer.add_data(tag, x, x)
+    assert spool.pending_points == 2
+    writer.close(timeout=0)
@@ -0,0 +1,42 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import time
+
+import httpx
+import pytest
+
+from data_interaction_client import DataInteractionClient
+from models.retry_policy import RetryPolicy
+from models.wire_config import WireConfig
+from tests.stub_platform import StubPlatform, load_routes
+
+
+def test_load_routes_response_sizes():
+    with StubPlatform(load_routes(tags=5, points=7)) as platform:
+        with DataInteractionClient(base_url=platform.base_url, wire=WireConfig(mode="json")) as client:
+            registry = client.connect("source")
+            data = client.get_data(tag_id=["tag2", "tag5"], from_time=0)
+    assert len(registry) == 5
+    assert [entry["tagId"] for entry in data] == ["tag2", "tag5"]
+    assert all(len(entry["data"]) == 7 for entry in data)
+    assert platform.requests == {"/smt/dataSources/connect": 1, "/smt/data/get": 1}
+
+
+def test_error_injection_and_latency():
+    with StubPlatform(latency=0.02, error_rate=1.0) as platform:
+        with DataInteractionClient(base_url=platform.base_url) as client:
+            started = time.monotonic()
+            with pytest.raises(httpx.HTTPStatusError):
+                client.connect("source")
+            assert time.monotonic() - started >= 0.02
+    assert platform.errors == 1
+
+
+def test_injected_errors_are_retried():
+    policy = RetryPolicy(max_attempts=20, backoff_initial=0.001, jitter="none")
+    with StubPlatform(error_rate=0.5, seed=1) as platform:
+        with DataInteractionClient(base_url=platform.base_url, retry=policy) as client:
+            for _ in range(10):
+                client.get_data(tag_id="tag1")
+    assert platform.errors > 0
+    assert platform.requests["/smt/data/get"] == 10 + platform.errors
@@ -1,8 +1,11 @@
 import sys
 sys.path.append("DataInteractionClient/")
+import threading
+from datetime import timedelta, timezone
 
 import pytest
 
+from models.compression_config import CompressionConfig
 from models.tag import Tag
 
 
@@ -47,3 +50,152 @@ def test_clear_data():
     tag.add_data(x="563", y=1, q=0)
     tag.clear_data()
     assert tag.data is None
+
+
+def test_add_many():
+    tag = Tag(id="tag7", attributes={})
+    tag.add_many(xs=[1, 2], ys=[10, 20])
+    assert tag.data == [{"x": 1, "y": 10, "q": 0}, {"x": 2, "y": 20, "q": 0}]
+    assert tag.has_data()
+
+
+def test_drain_detaches_data():
+    tag = Tag(id="tag8", attributes={})
+    tag.add_data(x=1, y=1)
+    snapshot = tag.drain()
+    tag.add_data(x=2, y=2)
+    assert snapshot == [{"x": 1, "y": 1, "q": 0}]
+    assert tag.data == [{"x": 2, "y": 2, "q": 0}]
+    assert Tag(id="tag9", attributes={}).drain() is None
+
+
+def test_requeue_puts_snapshot_first():
+    for mode in ("list", "columnar"):
+        tag = Tag(id="tag10", attributes={}, buffer_mode=mode)
+        tag.add_data(x=1, y=1)
+        snapshot = tag.drain()
+        tag.add_data(x=2, y=2)
+        tag.requeue(snapshot)
+        data = tag.data if mode == "list" else tag.buffer.to_records()
+        assert [point["x"] for point in data] == [1, 2]
+
+
+def test_microseconds_timestamps_are_normalized_once():
+    tag = Tag(id="tag5", attributes={}, timestamps="microseconds")
+    tag.add_data(x="1970-01-01 00:00:01", y=1)
+    tag.add_many(["1970-01-01T00:00:02.5Z", 3_000_000], [2, 3])
+    assert [point["x"] for point in tag.data] == [1_000_000, 2_500_000, 3_000_000]
+    assert tag.ordered
+
+
+def test_naive_timestamps_use_tag_timezone():
+    tag = Tag(
+        id="tag5", attributes={}, timestamps="microseconds",
+        naive_timezone=timezone(timedelta(hours=3)),
+    )
+    tag.add_data(x="1970-01-01 03:00:01", y=1)
+    tag.add_many(["1970-01-01T03:00:02", "1970-01-01T00:00:03Z"], [2, 3])
+    assert [point["x"] for point in tag.data] == [1_000_000, 2_000_000, 3_000_000]
+
+
+@pytest.mark.parametrize("buffer_mode", ["list", "columnar"])
+def test_out_of_order_and_duplicate_points_are_merged_on_drain(buffer_mode):
+    tag = Tag(id="tag6", attributes={}, timestamps="microseconds", buffer_mode=buffer_mode)
+    tag.add_many([10, 20, 30], [1, 2, 3])
+    assert tag.ordered
+    tag.add_data(x=15, y=4)
+    tag.add_data(x=20, y=5)
+    assert not tag.ordered
+    snapshot = tag.drain()
+    records = snapshot if buffer_mode == "list" else snapshot.to_records()
+    assert records == [
+        {"x": 10, "y": 1, "q": 0},
+        {"x": 15, "y": 4, "q": 0},
+        {"x": 20, "y": 5, "q": 0},
+        {"x": 30, "y": 3, "q": 0},
+    ]
+    assert tag.ordered
+
+
+def test_requeue_keeps_order_flag():
+    tag = Tag(id="tag7", attributes={}, timestamps="microseconds")
+    tag.add_many([1, 2], [1, 2])
+    snapshot = tag.drain()
+    tag.add_data(x=3, y=3)
+    tag.requeue(snapshot)
+    assert tag.ordered
+    tag.requeue([{"x": 5, "y": 5, "q": 0}])
+    assert not tag.ordered
+    assert [point["x"] for point in tag.drain()] == [1, 2, 3, 5]
+
+
+@pytest.mark.parametrize("buffer_mode", ["list", "columnar"])
+def test_sharded_ingest_merges_thread_buffers_on_drain(buffer_mode):
+    tag = Tag(
+        id="tag8", attributes={}, timestamps="microseconds",
+        buffer_mode=buffer_mode, ingest="sharded",
+    )
+    threads = 8
+    points = 500
+    start = threading.Barrier(threads)
+
+    def produce(offset):
+        start.wait()
+        for i in range(points):
+            tag.add_data(x=i * threads + offset, y=offset)
+
+    workers = [threading.Thread(target=produce, args=(n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    drained = []
+    while any(worker.is_alive() for worker in workers):
+        snapshot = tag.drain()
+        if snapshot:
+            drained.append(snapshot if buffer_mode == "list" else snapshot.to_records())
+    for worker in workers:
+        worker.join()
+    snapshot = tag.drain()
+    if snapshot:
+        drained.append(snapshot if buffer_mode == "list" else snapshot.to_records())
+    xs = sorted(point["x"] for snapshot in drained for point in snapshot)
+    assert xs == list(range(threads * points))
+    assert all(
+        [point["x"] for point in snapshot] == sorted(point["x"] for point in snapshot)
+        for snapshot in drained
+    )
+    assert not tag.has_data()
+
+
+def test_sharded_ingest_drops_queues_of_finished_threads():
+    tag = Tag(id="tag10", attributes={}, ingest="sharded")
+    for batch in range(20):
+        workers = [
+            threading.Thread(target=tag.add_data, args=(batch * 4 + n, n)) for n in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert len(tag.drain()) == 4
+    tag.add_data(x=100, y=1)
+    tag.drain()
+    # Остается только очередь живого (текущего) потока.
+    assert tag._shards.shards == 1
+    tag.add_data(x=101, y=1)
+    assert tag.drain() == [{"x": 101, "y": 1, "q": 0}]
+
+
+def test_sharded_ingest_compresses_on_drain():
+    tag = Tag(
+        id="tag9", attributes={}, timestamps="microseconds", ingest="sharded",
+        compression=CompressionConfig(deadband=1.0),
+    )
+    worker = threading.Thread(target=tag.add_many, args=([4, 2, 3], [11.5, 10.0, 10.2]))
+    worker.start()
+    worker.join()
+    tag.add_data(x=1, y=10.0)
+    assert tag.data is None
+    assert tag.drain() == [{"x": 1, "y": 10.0, "q": 0}, {"x": 4, "y": 11.5, "q": 0}]
+    tag.add_data(x=5, y=20.0)
+    tag.clear_data()
+    assert not tag.has_data()
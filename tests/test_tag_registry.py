@@ -0,0 +1,134 @@
+import sys
+sys.path.append("DataInteractionClient/")
+import threading
+from unittest.mock import patch
+
+from data_interaction_client import DataInteractionClient
+from models.compression_config import CompressionConfig
+from models.tag import Tag
+from models.tag_registry import TagRegistry
+
+DICT_ID = {"tagName": "tag", "parentObjectId": "object"}
+
+
+def make_registry(count=10, stripes=4):
+    tags_data = [{"id": f"t{i}", "attributes": {"n": i}} for i in range(count)]
+    tags_data.append({"id": DICT_ID, "attributes": {}})
+    return TagRegistry(tags_data, stripes=stripes)
+
+
+def test_registry_materializes_tags_lazily():
+    registry = make_registry()
+    assert len(registry) == 11
+    assert registry.materialized == 0
+    assert registry.attributes("t3") == {"n": 3}
+    tag = registry.get("t3")
+    assert isinstance(tag, Tag) and tag.id == "t3"
+    assert registry.get("t3") is tag
+    assert registry[3] is tag
+    assert registry.materialized == 1
+    assert registry.get("missing") is None
+
+
+def test_registry_indexes_dict_ids_by_content():
+    registry = make_registry()
+    key = {"parentObjectId": "object", "tagName": "tag"}
+    assert key in registry
+    assert registry.index(key) == 10
+    assert registry.get(key).id == DICT_ID
+    assert registry[-1] is registry.get(key)
+
+
+def test_striped_locks_keep_tag_data_separate():
+    registry = make_registry(count=8, stripes=2)
+    tags = list(registry)
+
+    def produce(tag):
+        for i in range(1000):
+            tag.add_data(i, i)
+
+    threads = [threading.Thread(target=produce, args=(tag,)) for tag in tags]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(len(tag.data) == 1000 for tag in tags)
+    assert registry.active() == tags
+    registry.clear_data()
+    assert registry.active() == []
+
+
+def test_connect_returns_registry_usable_with_set_data():
+    client = DataInteractionClient(base_url="https://example.com")
+    response = {
+        "error": {"id": 0},
+        "attributes": {"smtActive": True},
+        "tags": [{"id": f"t{i}", "attributes": {}} for i in range(1000)],
+    }
+    with patch.object(DataInteractionClient, "_make_request", return_value=response):
+        registry = client.connect(data_source_id="source")
+    assert isinstance(registry, TagRegistry)
+    registry.get("t7").add_data(1, 2)
+    with patch.object(DataInteractionClient, "_make_request", return_value={"error": {"id": 0}}) as request:
+        client.set_data(registry.active())
+    assert request.call_args.args[1] == {"data": [{"tagId": "t7", "data": [{"x": 1, "y": 2, "q": 0}]}]}
+    assert registry.materialized == 1
+
+
+def test_registry_passes_timestamp_mode_to_tags():
+    registry = TagRegistry([{"id": "t0", "attributes": {}}], timestamps="microseconds")
+    tag = registry.get("t0")
+    tag.add_data("1970-01-01T00:00:01Z", 1)
+    assert tag.timestamps == "microseconds"
+    assert tag.data == [{"x": 1_000_000, "y": 1, "q": 0}]
+
+
+def test_registry_sharded_tags_report_pending_points():
+    registry = TagRegistry(
+        [{"id": "t0", "attributes": {}}, {"id": "t1", "attributes": {}}], ingest="sharded"
+    )
+    registry.get("t1").add_data(1, 1)
+    registry.get("t0")
+    assert registry.active() == [registry.get("t1")]
+    assert registry.get("t1").drain() == [{"x": 1, "y": 1, "q": 0}]
+
+
+def test_registry_tracks_tags_with_data_without_scanning():
+    registry = make_registry(count=1000)
+    tags = list(registry)
+    tags[500].add_data(1, 1)
+    tags[7].add_many([1, 2], [1, 2])
+    with patch.object(Tag, "has_data", autospec=True, side_effect=Tag.has_data) as has_data:
+        assert registry.active() == [tags[7], tags[500]]
+        assert registry.pending() == 2
+    assert has_data.call_count == 4
+    tags[7].drain()
+    assert registry.active() == [tags[500]]
+    tags[7].add_data(3, 3)
+    registry.apply([{"id": "t7", "attributes": {}}])
+    assert registry.active() == [tags[7]]
+    tags[500].add_data(2, 2)
+    assert registry.pending() == 1
+
+
+def test_apply_rebuilds_compression_when_attribute_changes():
+    registry = TagRegistry([
+        {"id": "t1", "attributes": {"compression": {"deadband": 1}}},
+        {"id": "t2", "attributes": {"compression": {"deadband": 1}}},
+    ])
+    first, second = registry.get("t1"), registry.get("t2")
+    first.add_many([1, 2], [10, 10.5])
+    second.set_compression(CompressionConfig(deadband=5))
+    registry.apply([
+        {"id": "t1", "attributes": {"compression": {"deadband": 0.1}}},
+        {"id": "t2", "attributes": {"compression": {"deadband": 1}, "unit": "m"}},
+    ])
+    assert registry.get("t1") is first
+    assert first.compression == CompressionConfig(deadband=0.1)
+    # Отклонение 0.7 меньше прежней зоны нечувствительности, но больше новой.
+    first.add_data(3, 10.7)
+    assert [point["y"] for point in first.data] == [10, 10.7]
+    # Настройки из кода не заменяются, пока атрибут "compression" не меняется.
+    assert second.compression == CompressionConfig(deadband=5)
+    registry.apply([{"id": "t2", "attributes": {}}])
+    assert second.compression is None and second.compressor is None
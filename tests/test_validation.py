@@ -0,0 +1,51 @@
+import sys
+sys.path.append("DataInteractionClient/")
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from async_data_interaction_client import AsyncDataInteractionClient
+from data_interaction_client import DataInteractionClient
+from validation.validated_call import internal_call
+
+ACTIVE = {"error": {"id": 0}, "attributes": {"smtActive": True}, "tags": []}
+
+
+def test_boundary_mode_checks_public_methods_only():
+    client = DataInteractionClient(base_url="https://example.com")
+    with pytest.raises(ValidationError):
+        client.connect(data_source_id=123)
+    with pytest.raises(TypeError):
+        client._make_tags_list("tags")
+
+
+def test_strict_mode_checks_internal_methods():
+    client = DataInteractionClient(base_url="https://example.com", validation="strict")
+    with pytest.raises(ValidationError):
+        client._make_tags_list("tags")
+    with pytest.raises(ValidationError):
+        with internal_call():
+            client.connect(data_source_id=123)
+
+
+@pytest.mark.parametrize("validation", ["off", "boundary"])
+def test_unchecked_calls_pass_arguments_as_is(validation):
+    client = DataInteractionClient(base_url="https://example.com", validation=validation)
+    with patch.object(DataInteractionClient, "_make_request", return_value=ACTIVE) as request:
+        if validation == "off":
+            client.connect(data_source_id=123)
+        else:
+            with internal_call():
+                client.connect(data_source_id=123)
+    assert request.call_args.args[1] == {"id": 123}
+
+
+@pytest.mark.asyncio
+async def test_async_client_respects_mode():
+    client = AsyncDataInteractionClient(base_url="https://example.com")
+    with pytest.raises(ValidationError):
+        await client.connect(data_source_id=123)
+    client = AsyncDataInteractionClient(base_url="https://example.com", validation="off")
+    with patch.object(AsyncDataInteractionClient, "_make_request", AsyncMock(return_value=ACTIVE)):
+        assert len(await client.connect(data_source_id=123)) == 0